@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+blast_radius.py — Expands a spec diff (diff_spec.py report) to every generated
+item it affects: the structs, union enums and Bot methods whose generated
+code, and so serde behaviour, changes with it.
+
+Usage:
+    python3 blast_radius.py api.json diff_report.json [--shard] [--borrowed]
+    python3 blast_radius.py api.json diff_report.json --markdown >> $GITHUB_STEP_SUMMARY
+    python3 blast_radius.py api.json diff_report.json --json > blast_radius.json
+
+A reverse dependency index of the (new) spec maps each type to the types
+that hold it in a field or as a union variant and to the methods that take
+or return it. A changed or added type affects its dependents transitively;
+a method affects only itself. Entries whose only change is a description
+affect only their own doc comments, not their dependents.
+
+The report lists, per diff entry, its dependent types and methods, then the
+generated items to regenerate, recompile and re-benchmark, and the files
+(gen_types.rs / gen_methods.rs, with --shard the gen_types/ and gen_methods/
+modules, with --borrowed gen_borrowed.rs) that hold them.
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "codegen"))
+from codegen import SKIP_TYPES, base_type, borrowed_types, shard_of  # noqa: E402
+from spec_model import load_spec, method_params_struct, snake_case  # noqa: E402
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reverse dependency index
+# ─────────────────────────────────────────────────────────────────────────────
+
+def reverse_index(spec):
+    """({type: types that reference it}, {type: methods that reference it})."""
+    types_map = spec["types"]
+    type_users = {name: set() for name in types_map}
+    method_users = {name: set() for name in types_map}
+    for name, tg_type in types_map.items():
+        refs = set(tg_type.get("subtypes", []))
+        refs.update(base_type(t) for field in tg_type.get("fields", []) for t in field["types"])
+        for ref in refs:
+            if ref in type_users and ref != name:
+                type_users[ref].add(name)
+    for name, method in spec["methods"].items():
+        refs = {base_type(t) for t in method.get("returns", [])}
+        refs.update(base_type(t) for field in method.get("fields", []) for t in field["types"])
+        for ref in refs:
+            if ref in method_users:
+                method_users[ref].add(name)
+    return type_users, method_users
+
+
+def dependents(index, type_names):
+    """(types, methods) that depend on any of `type_names`, transitively; the roots excluded."""
+    type_users, method_users = index
+    seen = set(type_names)
+    stack = list(type_names)
+    while stack:
+        for user in type_users.get(stack.pop(), ()):
+            if user not in seen:
+                seen.add(user)
+                stack.append(user)
+    methods = set()
+    for name in seen:
+        methods.update(method_users.get(name, ()))
+    return seen - set(type_names), methods
+
+
+def structural(changes):
+    """False if a changed entry's diff only touches descriptions."""
+    return any(key != "[description]" and value != "description updated"
+               for key, value in changes.items())
+
+
+def diff_entries(report):
+    """(kind, name, change, structural) of every entry of a diff_spec.py report."""
+    for kind in ("types", "methods"):
+        singular = kind[:-1]
+        for name in report.get(f"added_{kind}", []):
+            yield singular, name, "added", True
+        for name, changes in report.get(f"changed_{kind}", {}).items():
+            yield singular, name, "changed", structural(changes)
+        for name in report.get(f"removed_{kind}", []):
+            yield singular, name, "removed", True
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Generated items
+# ─────────────────────────────────────────────────────────────────────────────
+
+def type_file(name, sharded):
+    return f"gen_types/{shard_of(name)}.rs" if sharded else "gen_types.rs"
+
+
+def method_file(name, sharded):
+    return f"gen_methods/{shard_of(name)}.rs" if sharded else "gen_methods.rs"
+
+
+def generated_items(spec, types, methods, sharded=False, borrowed=False):
+    """[(file, Rust item)] generated for `types` and `methods`, sorted."""
+    types_map = spec["types"]
+    mirrored = borrowed_types(types_map) if borrowed else set()
+    items = set()
+    for name in types:
+        if name in SKIP_TYPES or name not in types_map:
+            continue
+        items.add((type_file(name, sharded), name))
+        # Each types file ends with a size test covering all of its types.
+        items.add((type_file(name, sharded), "layout_tests"))
+        if name in mirrored:
+            items.add(("gen_borrowed.rs", f"{name}<'a>"))
+    for name in methods:
+        method = spec["methods"].get(name)
+        if method is None:
+            continue
+        items.add((method_file(name, sharded), f"Bot::{snake_case(name)}"))
+        if any(not field["required"] for field in method.get("fields", [])):
+            items.add((method_file(name, sharded), method_params_struct(name)))
+    return sorted(items)
+
+
+def blast_radius(spec, report, sharded=False, borrowed=False):
+    """Per-entry dependents of a diff report and the generated items and files they touch."""
+    index = reverse_index(spec)
+    entries = []
+    all_types, all_methods, removed = set(), set(), []
+    for kind, name, change, is_structural in diff_entries(report):
+        if change == "removed":
+            place = type_file(name, sharded) if kind == "type" else method_file(name, sharded)
+            removed.append({"kind": kind, "name": name, "file": place})
+            entries.append({"kind": kind, "name": name, "change": change, "types": [], "methods": []})
+            continue
+        types, methods = set(), set()
+        if kind == "type" and is_structural:
+            types, methods = dependents(index, [name])
+        entries.append({"kind": kind, "name": name, "change": change,
+                        "types": sorted(types), "methods": sorted(methods)})
+        (all_types if kind == "type" else all_methods).add(name)
+        all_types |= types
+        all_methods |= methods
+    items = generated_items(spec, all_types, all_methods, sharded, borrowed)
+    files = {place for place, _ in items} | {entry["file"] for entry in removed}
+    if sharded:
+        # An added or removed entry can add or empty a shard, which its mod.rs declares.
+        for kind, directory in (("types", "gen_types"), ("methods", "gen_methods")):
+            if report.get(f"added_{kind}") or report.get(f"removed_{kind}"):
+                files.add(f"{directory}/mod.rs")
+    return {
+        "entries": entries,
+        "types": sorted(all_types),
+        "methods": sorted(all_methods),
+        "items": [{"file": place, "item": item} for place, item in items],
+        "removed": removed,
+        "files": sorted(files),
+        # Adding or removing a type changes codegen's spec context (spec_context),
+        # so the next run re-renders every item even though only `files` change.
+        "context_changed": bool(report.get("added_types") or report.get("removed_types")),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Output
+# ─────────────────────────────────────────────────────────────────────────────
+
+def preview(names, limit=8):
+    shown = ", ".join(names[:limit])
+    return shown + (f", ... (+{len(names) - limit})" if len(names) > limit else "")
+
+
+def render_text(radius):
+    lines = [f"💥 Blast radius: {len(radius['entries'])} diff entries → {len(radius['types'])} types, "
+             f"{len(radius['methods'])} methods, {len(radius['items'])} generated items "
+             f"in {len(radius['files'])} files"]
+    for entry in radius["entries"]:
+        lines.append(f"  {entry['change']:<8} {entry['kind']:<7} {entry['name']}: "
+                     f"{len(entry['types'])} dependent types, {len(entry['methods'])} methods")
+        if entry["types"]:
+            lines.append(f"      types:   {preview(entry['types'])}")
+        if entry["methods"]:
+            lines.append(f"      methods: {preview(entry['methods'])}")
+    lines.append("\nFiles to regenerate:")
+    for place in radius["files"]:
+        count = sum(item["file"] == place for item in radius["items"])
+        lines.append(f"  {place}  ({count} items)")
+    if radius["context_changed"]:
+        lines.append("\nTypes were added or removed: codegen re-renders every item (its cache key changed).")
+    return "\n".join(lines)
+
+
+def render_markdown(radius):
+    lines = ["## 💥 Blast radius\n",
+             f"**{len(radius['types'])}** types and **{len(radius['methods'])}** methods affected — "
+             f"**{len(radius['items'])}** generated items in **{len(radius['files'])}** files.\n",
+             "| Change | Entry | Dependent types | Dependent methods |",
+             "|--------|-------|----------------:|------------------:|"]
+    for entry in radius["entries"]:
+        lines.append(f"| {entry['change']} | `{entry['name']}` | {len(entry['types'])} | {len(entry['methods'])} |")
+    lines += ["\n### Files to regenerate\n", "```"]
+    lines += [f"  {place}" for place in radius["files"]]
+    lines.append("```")
+    return "\n".join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    flags = {arg for arg in args if arg.startswith("--")}
+    args = [arg for arg in args if not arg.startswith("--")]
+    unknown = flags - {"--shard", "--borrowed", "--markdown", "--json"}
+    if len(args) != 2 or unknown or {"--markdown", "--json"} <= flags:
+        print("Usage: blast_radius.py <api.json> <diff_report.json> [--shard] [--borrowed] "
+              "[--markdown | --json]")
+        sys.exit(2)
+
+    spec = load_spec(args[0])
+    with open(args[1], encoding="utf-8") as f:
+        report = json.load(f)
+    radius = blast_radius(spec, report, "--shard" in flags, "--borrowed" in flags)
+
+    if "--json" in flags:
+        print(json.dumps(radius, indent=2))
+    elif "--markdown" in flags:
+        print(render_markdown(radius))
+    else:
+        print(render_text(radius))
+
+
+if __name__ == "__main__":
+    main()
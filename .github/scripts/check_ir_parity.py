@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+check_ir_parity.py — Checks that the Rust generator (codegen/src/main.rs)
+writes the same gen_types.rs and gen_methods.rs as codegen.py.
+
+Usage:
+    python3 codegen/codegen.py api.json /tmp/codegen_out --emit-ir /tmp/api.ir
+    cargo run -p codegen -- /tmp/api.ir /tmp/rust_out
+    python3 check_ir_parity.py /tmp/codegen_out /tmp/rust_out
+
+The Rust generator writes unformatted source; each of its files is run
+through rustfmt and must then be byte-identical to the file codegen.py
+wrote from the same spec and options (hot structs' Deserialize impls,
+UpdateKind and RawUpdate included). The first differing line of each file
+is printed.
+"""
+
+import os
+import subprocess
+import sys
+
+FILES = ("gen_types.rs", "gen_methods.rs")
+
+
+def rustfmt(source):
+    result = subprocess.run(
+        ["rustfmt", "--edition", "2021", "--emit", "stdout"],
+        input=source, capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def first_difference(expected, actual):
+    """(line number, expected line, actual line) of the first difference, or None."""
+    expected_lines = expected.split("\n")
+    actual_lines = actual.split("\n")
+    for i, (want, got) in enumerate(zip(expected_lines, actual_lines), 1):
+        if want != got:
+            return i, want, got
+    if len(expected_lines) != len(actual_lines):
+        i = min(len(expected_lines), len(actual_lines)) + 1
+        want = expected_lines[i - 1] if i <= len(expected_lines) else "<end of file>"
+        got = actual_lines[i - 1] if i <= len(actual_lines) else "<end of file>"
+        return i, want, got
+    return None
+
+
+def read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: check_ir_parity.py <codegen_py_out_dir> <rust_out_dir>")
+        sys.exit(2)
+    python_dir, rust_dir = sys.argv[1:]
+
+    failed = False
+    for name in FILES:
+        expected = read(os.path.join(python_dir, name))
+        actual = read(os.path.join(rust_dir, name))
+        if expected is None or actual is None:
+            side = "codegen.py" if expected is None else "the Rust generator"
+            print(f"❌ {name}: not generated by {side}")
+            failed = True
+            continue
+        diff = first_difference(expected, rustfmt(actual))
+        if diff is None:
+            print(f"✅ {name}: identical ({len(expected)} bytes)")
+            continue
+        line, want, got = diff
+        print(f"❌ {name}: differs at line {line}")
+        print(f"   codegen.py: {want}")
+        print(f"   main.rs:    {got}")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("\n✅ Both generators agree")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,40 @@
 #!/usr/bin/env python3
+"""
+coverage_report.py — Coverage of the Telegram Bot API by the generated code,
+down to struct fields and method parameters.
+
+Usage:
+    python3 coverage_report.py api.json gen_types.rs gen_methods.rs
+    python3 coverage_report.py api.json gen_types/ gen_methods/ --markdown   (codegen --shard)
+    python3 coverage_report.py api.json gen_types.rs gen_methods.rs --json > coverage.json
+
+The generated sources are indexed once (rust_index.py) and every type,
+field, method and parameter of the spec is looked up in that index. Each
+field and parameter gets a row of the coverage matrix:
+
+    present           — found under its JSON name
+    type_matches      — the Rust type can hold the spec's types
+    optional_matches  — Option<...> exactly when the spec marks it optional
+    renamed           — the Rust name differs from the JSON name
+
+--json prints the whole matrix; the text and Markdown forms print the
+totals and what is missing or mismatched. The exit status is 1 when a type,
+method, field or parameter is missing.
+
+The functions are importable:
+
+    matrix = coverage_matrix(load_spec("api.json"), RustIndex.from_paths([...]))
+    print(render_markdown(matrix))
+"""
 
 import json
-import re
+import os
 import sys
-from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "codegen"))
+from rust_index import RustIndex, unwrap_type  # noqa: E402
+from spec_model import load_spec, method_params_struct, safe_field_name, snake_case  # noqa: E402
+from validate_generated import type_matches  # noqa: E402
 
 # -------------------------------------------------
 # Telegram abstract / conceptual types
@@ -13,129 +44,271 @@ IGNORED_TYPES = {
     "InputMedia",
 }
 
+# Columns of a field / parameter row, in report order.
+COLUMNS = ("present", "type_matches", "optional_matches", "renamed")
+
+# How many mismatches the text and Markdown forms list before eliding.
+LIST_LIMIT = 20
+
+
 # -------------------------------------------------
-# Helpers
+# Matrix
 # -------------------------------------------------
-def read(path: str) -> str:
-    return Path(path).read_text(encoding="utf-8")
+def field_row(field, rust_name, rust_type, index):
+    """Coverage row of one spec field or parameter; `rust_type` is None when it is missing."""
+    if rust_type is None:
+        return {"rust": None, "type": None, "present": False, "type_matches": False,
+                "optional_matches": False, "renamed": False}
+    optional, depth, base = unwrap_type(rust_type)
+    return {
+        "rust": rust_name,
+        "type": rust_type,
+        "present": True,
+        "type_matches": type_matches(field["types"], depth, base, index),
+        "optional_matches": optional != field["required"],
+        "renamed": rust_name.removeprefix("r#") != field["name"],
+    }
 
 
-def snake_case(name: str) -> str:
-    s = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
-    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-    return s.lower()
+def type_coverage(name, info, index):
+    """Coverage entry of one spec type."""
+    if name in IGNORED_TYPES:
+        return {"kind": "ignored", "present": True}
+    subtypes = info.get("subtypes")
+    if subtypes:
+        variants = index.enums.get(name)
+        return {
+            "kind": "enum",
+            "present": variants is not None,
+            "variants": {v: variants is not None and variants.get(v) == v for v in subtypes},
+        }
+    fields = index.structs.get(name)
+    entry = {"kind": "struct", "present": fields is not None, "fields": {}}
+    for field in info.get("fields", []):
+        rust = fields.get(field["name"]) if fields is not None else None
+        entry["fields"][field["name"]] = field_row(
+            field, rust and rust.rust, rust and rust.type, index)
+    return entry
 
 
-# -------------------------------------------------
-# Args  — accepts an optional --markdown flag
-# -------------------------------------------------
-args = sys.argv[1:]
-markdown = "--markdown" in args
-args = [a for a in args if a != "--markdown"]
+def method_coverage(name, info, index):
+    """Coverage entry of one spec method: its fn, parameters and return type."""
+    fn_name = snake_case(name)
+    fn = index.fns.get(fn_name)
+    entry = {"fn": fn_name, "present": fn is not None, "params": {}, "returns_matches": False}
+    if fn is None:
+        for field in info.get("fields", []):
+            entry["params"][field["name"]] = field_row(field, None, None, index)
+        return entry
+    options = index.structs.get(method_params_struct(name), {})
+    for field in info.get("fields", []):
+        if field["required"]:
+            rust_name = safe_field_name(field["name"])
+            row = field_row(field, rust_name, fn.params.get(rust_name), index)
+        else:
+            rust = options.get(field["name"])
+            row = field_row(field, rust and rust.rust, rust and rust.type, index)
+        entry["params"][field["name"]] = row
+    returns = info.get("returns")
+    if returns:
+        _, depth, base = unwrap_type(fn.returns)
+        entry["returns_matches"] = type_matches(returns, depth, base, index)
+    else:
+        entry["returns_matches"] = fn.returns == "bool"
+    return entry
 
-if len(args) != 3:
-    print("Usage: coverage_report.py api.json gen_types.rs gen_methods.rs [--markdown]")
-    sys.exit(2)
 
-api_path, types_path, methods_path = args
+def totals(rows):
+    """Count of rows, and of rows with each column set."""
+    rows = list(rows)
+    counts = {"total": len(rows)}
+    for column in COLUMNS:
+        counts[column] = sum(row[column] for row in rows)
+    return counts
 
-api        = json.loads(read(api_path))
-types_src  = read(types_path)
-methods_src = read(methods_path)
 
-all_types   = api.get("types", {})
-all_methods = api.get("methods", {})
+def percent(covered, total):
+    return int(covered / total * 100) if total else 100
 
-implemented_types  = []
-missing_types      = []
-implemented_methods = []
-missing_methods    = []
 
-# -------------------------------------------------
-# Type coverage
-# -------------------------------------------------
-for name, info in all_types.items():
-    if name in IGNORED_TYPES:
-        implemented_types.append(name)
-        continue
+def coverage_matrix(spec, index):
+    """The full coverage matrix of `spec` against the indexed Rust sources."""
+    types = {name: type_coverage(name, info, index) for name, info in spec["types"].items()}
+    methods = {name: method_coverage(name, info, index) for name, info in spec["methods"].items()}
+    types_covered = sum(entry["present"] for entry in types.values())
+    methods_covered = sum(entry["present"] for entry in methods.values())
+    return {
+        "version": spec.version,
+        "summary": {
+            "types": {"covered": types_covered, "total": len(types),
+                      "percent": percent(types_covered, len(types))},
+            "methods": {"covered": methods_covered, "total": len(methods),
+                        "percent": percent(methods_covered, len(methods))},
+            "fields": totals(row for entry in types.values() for row in entry.get("fields", {}).values()),
+            "params": totals(row for entry in methods.values() for row in entry["params"].values()),
+        },
+        "types": types,
+        "methods": methods,
+    }
 
-    is_union = bool(info.get("subtypes"))
-    pattern  = f"pub enum {name}" if is_union else f"pub struct {name}"
 
-    if pattern in types_src:
-        implemented_types.append(name)
-    else:
-        missing_types.append(name)
+def problems(matrix):
+    """Lists of what is missing or mismatched, by category."""
+    found = {"types": [], "methods": [], "fields": [], "params": [], "variants": [],
+             "type_mismatches": [], "optional_mismatches": [], "returns": []}
+    for name, entry in matrix["types"].items():
+        if not entry["present"]:
+            found["types"].append(name)
+            continue
+        found["variants"] += [f"{name}::{v}" for v, ok in entry.get("variants", {}).items() if not ok]
+        for field, row in entry.get("fields", {}).items():
+            where = f"{name}.{field}"
+            if not row["present"]:
+                found["fields"].append(where)
+                continue
+            if not row["type_matches"]:
+                found["type_mismatches"].append(f"{where}: {row['type']}")
+            if not row["optional_matches"]:
+                found["optional_mismatches"].append(f"{where}: {row['type']}")
+    for name, entry in matrix["methods"].items():
+        if not entry["present"]:
+            found["methods"].append(name)
+            continue
+        if not entry["returns_matches"]:
+            found["returns"].append(name)
+        for param, row in entry["params"].items():
+            where = f"{name}({param})"
+            if not row["present"]:
+                found["params"].append(where)
+                continue
+            if not row["type_matches"]:
+                found["type_mismatches"].append(f"{where}: {row['type']}")
+            if not row["optional_matches"]:
+                found["optional_mismatches"].append(f"{where}: {row['type']}")
+    return found
 
-# -------------------------------------------------
-# Method coverage
-# Methods are generated as:  pub async fn snake_name
-# e.g. sendMessage -> pub async fn send_message
-# -------------------------------------------------
-gen_fns = set(re.findall(r'pub async fn (\w+)', methods_src))
 
-for name in all_methods:
-    fn_name = snake_case(name)
-    if fn_name in gen_fns:
-        implemented_methods.append(name)
-    else:
-        missing_methods.append(name)
+def incomplete(matrix):
+    """True if a type, method, field or parameter is missing."""
+    summary = matrix["summary"]
+    return (summary["types"]["covered"] < summary["types"]["total"]
+            or summary["methods"]["covered"] < summary["methods"]["total"]
+            or summary["fields"]["present"] < summary["fields"]["total"]
+            or summary["params"]["present"] < summary["params"]["total"])
+
 
 # -------------------------------------------------
-# Compute stats
+# Output — plain text, Markdown or JSON
 # -------------------------------------------------
-total_types   = len(all_types)
-total_methods = len(all_methods)
+PROBLEM_TITLES = {
+    "types": "Missing Types",
+    "methods": "Missing Methods",
+    "fields": "Missing Fields",
+    "params": "Missing Parameters",
+    "variants": "Missing Union Variants",
+    "type_mismatches": "Type Mismatches",
+    "optional_mismatches": "Optionality Mismatches",
+    "returns": "Return Type Mismatches",
+}
 
-types_covered   = len(implemented_types)
-methods_covered = len(implemented_methods)
 
-types_pct   = int((types_covered   / total_types)   * 100) if total_types   else 100
-methods_pct = int((methods_covered / total_methods) * 100) if total_methods else 100
+def matrix_line(counts):
+    """`present/total (pct%) — type matches N, optional matches N, renamed N`."""
+    columns = ", ".join(f"{column.replace('_', ' ')} {counts[column]}" for column in COLUMNS[1:])
+    return f"{counts['present']}/{counts['total']}  ({percent(counts['present'], counts['total'])}%) — {columns}"
+
+
+def elided(items):
+    shown = items[:LIST_LIMIT]
+    if len(items) > LIST_LIMIT:
+        shown.append(f"... and {len(items) - LIST_LIMIT} more")
+    return shown
+
+
+def render_text(matrix):
+    summary = matrix["summary"]
+    lines = [
+        "=" * 60,
+        "📊 tgbotrs API Coverage — Telegram Bot API",
+        "=" * 60,
+        f"  Types:   {summary['types']['covered']}/{summary['types']['total']}  "
+        f"({summary['types']['percent']}%)",
+        f"  Methods: {summary['methods']['covered']}/{summary['methods']['total']}  "
+        f"({summary['methods']['percent']}%)",
+        f"  Fields:  {matrix_line(summary['fields'])}",
+        f"  Params:  {matrix_line(summary['params'])}",
+    ]
+    for key, items in problems(matrix).items():
+        if items:
+            lines.append(f"\n⚠️  {PROBLEM_TITLES[key]} ({len(items)}):")
+            lines += [f"  {item}" for item in elided(items)]
+    return "\n".join(lines)
+
+
+def render_markdown(matrix):
+    summary = matrix["summary"]
+    lines = [
+        "## 📊 tgbotrs API Coverage — Telegram Bot API\n",
+        "| Category | Covered | Total | % |",
+        "|----------|--------:|------:|--:|",
+        f"| Types    | {summary['types']['covered']} | {summary['types']['total']} | {summary['types']['percent']}% |",
+        f"| Methods  | {summary['methods']['covered']} | {summary['methods']['total']} | {summary['methods']['percent']}% |",
+        f"| Fields   | {summary['fields']['present']} | {summary['fields']['total']} | "
+        f"{percent(summary['fields']['present'], summary['fields']['total'])}% |",
+        f"| Params   | {summary['params']['present']} | {summary['params']['total']} | "
+        f"{percent(summary['params']['present'], summary['params']['total'])}% |",
+        "",
+        "| Matrix | Present | Type matches | Optional matches | Renamed |",
+        "|--------|--------:|-------------:|-----------------:|--------:|",
+    ]
+    for category in ("fields", "params"):
+        counts = summary[category]
+        lines.append(f"| {category.capitalize()} | " + " | ".join(str(counts[c]) for c in COLUMNS) + " |")
+    found = problems(matrix)
+    for key, items in found.items():
+        if items:
+            lines += [f"\n### ⚠️ {PROBLEM_TITLES[key]}\n", "```"]
+            lines += [f"  {item}" for item in elided(items)]
+            lines.append("```")
+    if not any(found.values()):
+        lines.append("\n✅ **Full coverage — all types, methods, fields and parameters implemented.**")
+    return "\n".join(lines)
+
+
+def render_json(matrix):
+    return json.dumps(matrix, indent=2, ensure_ascii=False)
 
-# -------------------------------------------------
-# Output — plain text or Markdown
-# -------------------------------------------------
-if markdown:
-    print("## 📊 tgbotrs API Coverage — Telegram Bot API\n")
-    print("| Category | Covered | Total | % |")
-    print("|----------|--------:|------:|--:|")
-    print(f"| Types    | {types_covered} | {total_types} | {types_pct}% |")
-    print(f"| Methods  | {methods_covered} | {total_methods} | {methods_pct}% |")
-
-    if missing_types:
-        print("\n### ⚠️ Missing Types\n")
-        print("```")
-        for t in missing_types:
-            print(f"  {t}")
-        print("```")
-
-    if missing_methods:
-        print("\n### ⚠️ Missing Methods\n")
-        print("```")
-        for m in missing_methods:
-            print(f"  {m}")
-        print("```")
-
-    if not missing_types and not missing_methods:
-        print("\n✅ **Full coverage — all types and methods implemented.**")
-else:
-    print("=" * 60)
-    print("📊 tgbotrs API Coverage — Telegram Bot API")
-    print("=" * 60)
-    print(f"  Types:   {types_covered}/{total_types}  ({types_pct}%)")
-    print(f"  Methods: {methods_covered}/{total_methods}  ({methods_pct}%)")
-
-    if missing_types:
-        print("\n⚠️  Missing Types:")
-        print(" ", missing_types)
-
-    if missing_methods:
-        print("\n⚠️  Missing Methods:")
-        print(" ", missing_methods)
 
 # -------------------------------------------------
-# Strict CI enforcement (both modes must fail hard)
+# Args  — accepts --markdown or --json
 # -------------------------------------------------
-if missing_types or missing_methods:
-    sys.exit(1)
+def main():
+    args = sys.argv[1:]
+    markdown = "--markdown" in args
+    as_json = "--json" in args
+    args = [a for a in args if a not in ("--markdown", "--json")]
+
+    if len(args) != 3 or (markdown and as_json):
+        print("Usage: coverage_report.py api.json <gen_types.rs|dir> <gen_methods.rs|dir> "
+              "[--markdown | --json]")
+        sys.exit(2)
+
+    api_path, types_path, methods_path = args
+    matrix = coverage_matrix(load_spec(api_path), RustIndex.from_paths([types_path, methods_path]))
+
+    if as_json:
+        print(render_json(matrix))
+    elif markdown:
+        print(render_markdown(matrix))
+    else:
+        print(render_text(matrix))
+
+    # -------------------------------------------------
+    # Strict CI enforcement (every mode must fail hard)
+    # -------------------------------------------------
+    if incomplete(matrix):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
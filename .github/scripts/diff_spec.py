@@ -1,72 +1,144 @@
 #!/usr/bin/env python3
 """
-diff_spec.py — Compute a semantic diff between two Telegram Bot API spec files.
-
-Usage: python3 diff_spec.py old_api.json new_api.json output_report.json
+diff_spec.py — Compute a semantic diff between two Telegram Bot API spec files,
+or the timeline of a series of them.
+
+Usage:
+    python3 diff_spec.py old_api.json new_api.json output_report.json
+    python3 diff_spec.py --history api_9.0.json api_9.1.json ... output_timeline.json
+    python3 diff_spec.py --history output_timeline.json --store .spec-store/
+
+Every type and method entry is fingerprinted once per file (a digest of its
+JSON), so entries that are the same in both specs are skipped without
+looking at their fields; only entries whose fingerprints differ are diffed
+field by field.
+
+--history takes the snapshots oldest first and writes one timeline: for each
+release, the types, methods, fields and parameters that were added, changed
+type, became required or optional, or were removed, plus the same events
+grouped per item ("User.username", "sendMessage(chat_id)"). Each file is
+loaded and fingerprinted once, however many releases it is compared across.
+
+--store DIR adds the compared files to a spec_store.py store; `--history
+timeline.json --store DIR` with no files covers every stored version, using
+the store's blob hashes as fingerprints and decoding each blob once.
 """
 
+import hashlib
 import json
+import marshal
+import os
 import sys
-from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "codegen"))
+from spec_model import Spec, load_spec  # noqa: E402
+from spec_store import SpecStore  # noqa: E402
 
 
 def load(path):
     try:
-        return json.load(open(path))
+        return load_spec(path)
     except (FileNotFoundError, json.JSONDecodeError):
-        return {"types": {}, "methods": {}, "version": "unknown", "release_date": ""}
+        return Spec({"types": {}, "methods": {}, "version": "unknown", "release_date": ""})
+
+
+def fingerprint(entry):
+    """Digest of the JSON of a type or method entry: equal fingerprints mean equal entries.
+
+    marshal (format 2, which has no back-references) serialises the decoded
+    JSON several times faster than json.dumps; keys keep their file order, so
+    a reordered entry only costs a field-by-field diff.
+    """
+    return hashlib.sha256(marshal.dumps(entry, 2)).hexdigest()
+
+
+class Snapshot:
+    """A spec with the fingerprint of each of its types and methods."""
+
+    def __init__(self, spec, label=None, prints=None):
+        """`prints` ({"types": {name: digest}, "methods": ...}) skips fingerprinting,
+        e.g. with the blob hashes of a spec_store.py version."""
+        self.spec = spec
+        self.label = label or spec.get("version", "unknown")
+        if prints is not None:
+            self.types, self.methods = prints["types"], prints["methods"]
+            return
+        raw = getattr(spec, "raw", spec)
+        self.types = {name: fingerprint(t) for name, t in raw.get("types", {}).items()}
+        self.methods = {name: fingerprint(m) for name, m in raw.get("methods", {}).items()}
+
+    @classmethod
+    def of(cls, spec):
+        return spec if isinstance(spec, cls) else cls(spec)
+
+    def changed(self, other, kind):
+        """Names of `kind` ("types" / "methods") in both snapshots whose entries differ."""
+        old, new = getattr(other, kind), getattr(self, kind)
+        return [name for name, digest in new.items() if name in old and old[name] != digest]
 
 
 def fields_by_name(fields):
     return {f["name"]: f for f in (fields or [])}
 
 
-def diff_fields(old_fields, new_fields, context_name):
-    """Compare two lists of fields and return human-readable changes."""
+def field_events(old_fields, new_fields):
+    """(field name, event, detail) for each difference between two field lists.
+
+    Events: added (detail: types), removed, type_changed (detail: old, new
+    types), became_required, became_optional, description.
+    """
     old = fields_by_name(old_fields)
     new = fields_by_name(new_fields)
-    changes = {}
+    for name, n in new.items():
+        o = old.get(name)
+        if o is None:
+            yield name, "added", n["types"]
+            continue
+        if o["types"] != n["types"]:
+            yield name, "type_changed", (o["types"], n["types"])
+        if o["required"] != n["required"]:
+            yield name, "became_required" if n["required"] else "became_optional", None
+        if o.get("description") != n.get("description"):
+            yield name, "description", None
+    for name in old:
+        if name not in new:
+            yield name, "removed", None
 
-    for name in set(list(old.keys()) + list(new.keys())):
-        if name not in old:
-            changes[name] = f"**Added** field `{name}` ({', '.join(new[name]['types'])})"
-        elif name not in new:
-            changes[name] = f"**Removed** field `{name}`"
-        else:
-            o, n = old[name], new[name]
-            sub = []
-            if o["types"] != n["types"]:
-                sub.append(f"types changed: `{o['types']}` → `{n['types']}`")
-            if o["required"] != n["required"]:
-                req_str = "required" if n["required"] else "optional"
-                sub.append(f"now **{req_str}**")
-            if o.get("description") != n.get("description"):
-                sub.append("description updated")
-            if sub:
-                changes[name] = "; ".join(sub)
 
+def diff_fields(old_fields, new_fields, context_name):
+    """Compare two lists of fields and return human-readable changes."""
+    changes = {}
+    for name, event, detail in field_events(old_fields, new_fields):
+        if event == "added":
+            text = f"**Added** field `{name}` ({', '.join(detail)})"
+        elif event == "removed":
+            text = f"**Removed** field `{name}`"
+        elif event == "type_changed":
+            text = f"types changed: `{detail[0]}` → `{detail[1]}`"
+        elif event == "description":
+            text = "description updated"
+        else:
+            text = f"now **{'required' if event == 'became_required' else 'optional'}**"
+        changes[name] = f"{changes[name]}; {text}" if name in changes else text
     return changes
 
 
 def diff_specs(old, new):
-    old_types = old.get("types", {})
-    new_types = new.get("types", {})
-    old_methods = old.get("methods", {})
-    new_methods = new.get("methods", {})
-
-    all_type_names = set(list(old_types.keys()) + list(new_types.keys()))
-    all_method_names = set(list(old_methods.keys()) + list(new_methods.keys()))
-
-    added_types = sorted([n for n in all_type_names if n not in old_types])
-    removed_types = sorted([n for n in all_type_names if n not in new_types])
-    added_methods = sorted([n for n in all_method_names if n not in old_methods])
-    removed_methods = sorted([n for n in all_method_names if n not in new_methods])
-
-    # Detailed field-level diffs for existing types
+    """Diff two specs (or Snapshots of them); unchanged entries are skipped by fingerprint."""
+    old, new = Snapshot.of(old), Snapshot.of(new)
+    old_types = old.spec.get("types", {})
+    new_types = new.spec.get("types", {})
+    old_methods = old.spec.get("methods", {})
+    new_methods = new.spec.get("methods", {})
+
+    added_types = sorted(new.types.keys() - old.types.keys())
+    removed_types = sorted(old.types.keys() - new.types.keys())
+    added_methods = sorted(new.methods.keys() - old.methods.keys())
+    removed_methods = sorted(old.methods.keys() - new.methods.keys())
+
+    # Detailed field-level diffs for types whose fingerprint changed
     changed_types = {}
-    for name in all_type_names:
-        if name not in old_types or name not in new_types:
-            continue
+    for name in new.changed(old, "types"):
         old_t = old_types[name]
         new_t = new_types[name]
 
@@ -94,11 +166,9 @@ def diff_specs(old, new):
         if changes:
             changed_types[name] = changes
 
-    # Detailed field-level diffs for existing methods
+    # Detailed field-level diffs for methods whose fingerprint changed
     changed_methods = {}
-    for name in all_method_names:
-        if name not in old_methods or name not in new_methods:
-            continue
+    for name in new.changed(old, "methods"):
         old_m = old_methods[name]
         new_m = new_methods[name]
 
@@ -112,14 +182,18 @@ def diff_specs(old, new):
         if old_m.get("returns") != new_m.get("returns"):
             changes["[returns]"] = f"Return type changed: `{old_m.get('returns')}` → `{new_m.get('returns')}`"
 
+        # Description changes
+        if old_m.get("description") != new_m.get("description"):
+            changes["[description]"] = "Description updated"
+
         if changes:
             changed_methods[name] = changes
 
     return {
-        "old_version": old.get("version", "unknown"),
-        "new_version": new.get("version", "unknown"),
-        "new_date": new.get("release_date", ""),
-        "old_date": old.get("release_date", ""),
+        "old_version": old.spec.get("version", "unknown"),
+        "new_version": new.spec.get("version", "unknown"),
+        "new_date": new.spec.get("release_date", ""),
+        "old_date": old.spec.get("release_date", ""),
 
         "added_types": added_types,
         "removed_types": removed_types,
@@ -138,14 +212,149 @@ def diff_specs(old, new):
     }
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# History (--history)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def entry_events(kind, name, old, new):
+    """(item, item kind, event, detail) between two versions of one type or method entry."""
+    field_kind, item = ("field", "{}.{}") if kind == "types" else ("param", "{}({})")
+    for field, event, detail in field_events(old.get("fields", []), new.get("fields", [])):
+        if event != "description":
+            yield item.format(name, field), field_kind, event, detail
+    if kind == "types":
+        old_subs, new_subs = old.get("subtypes", []), new.get("subtypes", [])
+        for variant in new_subs:
+            if variant not in old_subs:
+                yield f"{name}::{variant}", "variant", "added", None
+        for variant in old_subs:
+            if variant not in new_subs:
+                yield f"{name}::{variant}", "variant", "removed", None
+    elif old.get("returns") != new.get("returns"):
+        yield name, "method", "returns_changed", (old.get("returns"), new.get("returns"))
+
+
+def release_events(old, new):
+    """(item, item kind, event, detail) for every structural change from `old` to `new`."""
+    for kind, item_kind in (("types", "type"), ("methods", "method")):
+        old_entries, new_entries = old.spec.get(kind, {}), new.spec.get(kind, {})
+        old_prints, new_prints = getattr(old, kind), getattr(new, kind)
+        for name in new_prints:
+            if name not in old_prints:
+                yield name, item_kind, "added", None
+        for name in new.changed(old, kind):
+            yield from entry_events(kind, name, old_entries[name], new_entries[name])
+        for name in old_prints:
+            if name not in new_prints:
+                yield name, item_kind, "removed", None
+
+
+def history(snapshots):
+    """Timeline of an iterable of Snapshots, oldest first.
+
+    `releases` lists the events of each snapshot against the one before it;
+    `items` maps each item that changed to its events in release order.
+    """
+    releases = []
+    items = {}
+    old = None
+    for new in snapshots:
+        events = []
+        for item, item_kind, event, detail in release_events(old, new) if old else ():
+            change = {"version": new.label, "event": event}
+            if detail is not None:
+                change["detail"] = detail
+            events.append({"item": item, "kind": item_kind, "event": event, **change})
+            items.setdefault(item, {"kind": item_kind, "events": []})["events"].append(change)
+        old = new
+        releases.append({
+            "version": new.label,
+            "release_date": new.spec.get("release_date", ""),
+            "types": len(new.types),
+            "methods": len(new.methods),
+            "events": events,
+        })
+    return {"releases": releases, "items": items}
+
+
+def snapshot_label(spec, path, seen):
+    """The spec's version, made unique among `seen` with the file name."""
+    label = spec.get("version", "unknown")
+    if label == "unknown" or label in seen:
+        label = f"{label} ({os.path.basename(path)})"
+    seen.add(label)
+    return label
+
+
+def load_snapshots(paths):
+    """A Snapshot of each file in turn, each loaded and fingerprinted once."""
+    seen = set()
+    for path in paths:
+        spec = load(path)
+        yield Snapshot(spec, snapshot_label(spec, path, seen))
+
+
+def stored_snapshots(store):
+    """A Snapshot of each version of a SpecStore, fingerprinted by its blob hashes."""
+    for record in store.versions:
+        spec, hashes = store.load(record["label"])
+        yield Snapshot(spec, record["label"], hashes)
+
+
+def main_history(paths, report_path, store=None):
+    if paths:
+        report = history(load_snapshots(paths))
+    else:
+        report = history(stored_snapshots(store))
+
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"📜 Spec history: {len(report['releases'])} snapshots, {len(report['items'])} items changed")
+    for release in report["releases"][1:]:
+        counts = {}
+        for event in release["events"]:
+            counts[event["event"]] = counts.get(event["event"], 0) + 1
+        summary = ", ".join(f"{n} {event}" for event, n in sorted(counts.items())) or "no changes"
+        print(f"  {release['version']}: {summary}")
+    print(f"  Timeline → {report_path}")
+
+
+def archive(store, paths):
+    """Add the spec files that exist to a SpecStore."""
+    for path in paths:
+        if os.path.exists(path):
+            record, written = store.add(path)
+            print(f"  Stored {record['label']} ({written} new bytes) → {store.root}")
+
+
 def main():
-    if len(sys.argv) < 4:
-        print("Usage: diff_spec.py <old.json> <new.json> <report.json>")
+    args = sys.argv[1:]
+    store = None
+    if "--store" in args:
+        at = args.index("--store")
+        store = SpecStore(*args[at + 1:at + 2])
+        del args[at:at + 2]
+
+    history_ok = len(args) >= 4 or len(args) == 2 and store is not None
+    if args[:1] == ["--history"] and history_ok:
+        paths = args[1:-1]
+        if store is not None:
+            archive(store, paths)
+        main_history(paths, args[-1], store)
+        return
+
+    if len(args) < 3 or args[0] == "--history":
+        print("Usage: diff_spec.py <old.json> <new.json> <report.json> [--store DIR]")
+        print("       diff_spec.py --history <api1.json> <api2.json>... <timeline.json> [--store DIR]")
+        print("       diff_spec.py --history <timeline.json> --store DIR     (every stored version)")
         sys.exit(1)
 
-    old = load(sys.argv[1])
-    new = load(sys.argv[2])
-    report_path = sys.argv[3]
+    if store is not None:
+        archive(store, args[:2])
+    old = load(args[0])
+    new = load(args[1])
+    report_path = args[2]
 
     report = diff_specs(old, new)
 
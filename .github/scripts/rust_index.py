@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+rust_index.py — Index of the items in generated (and hand-written) Rust
+sources, built in one pass per file, for validate_generated.py and
+coverage_report.py.
+
+    index = RustIndex.from_paths(["tgbotrs/src/gen_types.rs", "tgbotrs/src/gen_methods.rs"])
+    index.structs["Message"]["reply_to_message"]   → RustField(rust, json, type, optional)
+    index.enums["ChatMember"]                      → {"Owner": "ChatMemberOwner", ...}
+    index.fns["send_message"]                      → RustFn(params, returns)
+
+Struct fields are keyed by their JSON name (the serde rename, else the Rust
+name without `r#`). Enum variants map to their payload type, None for unit
+variants. Only the top-level items of rustfmt-formatted code are indexed:
+an item starts at column 0 and ends at the first `}` in column 0.
+
+    python3 rust_index.py gen_types.rs gen_methods.rs     # counts of what was indexed
+"""
+
+import glob
+import os
+import re
+import sys
+from collections import namedtuple
+
+RustField = namedtuple("RustField", "rust json type optional")
+RustFn = namedtuple("RustFn", "params returns")
+
+# An item's body is every line up to the first one starting with `}`.
+STRUCT_RE = re.compile(r"^pub struct (\w+)(?:<[^>{]*>)? \{(?:\}|\n((?:[^}\n].*\n|\n)*)\})", re.M)
+ENUM_RE = re.compile(r"^pub enum (\w+)(?:<[^>{]*>)? \{\n((?:[^}\n].*\n|\n)*)\}", re.M)
+FIELD_RE = re.compile(r"((?:^ {4}#\[.*\]\n)*)^ {4}pub ((?:r#)?\w+): (.+),$", re.M)
+RENAME_RE = re.compile(r'#\[serde\(rename = "([^"]+)"\)\]')
+VARIANT_RE = re.compile(r"^ {4}(\w+)(?:\((.+)\)| \{.*\})?,$", re.M)
+WRAPPER_RE = re.compile(r"(Box|Vec|ShortVec)<(.*)>")
+FN_RE = re.compile(r"^ {4}pub async fn (\w+)\(([^{]*?)\) -> Result<([^\n]+), BotError> \{$", re.M)
+
+
+def split_top_level(text, sep=","):
+    """Split at `sep` outside <...> and (...), dropping empty parts."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch in "<(":
+            depth += 1
+        elif ch in ">)":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def unwrap_type(rust):
+    """(optional, array depth, base type) of a Rust field type.
+
+    `Option`, `Box` and `impl Into` wrappers are dropped, `Vec<T>` and
+    `ShortVec<T, N>` count as one array level and a path keeps its last
+    segment: `Option<Vec<ShortVec<types::PhotoSize, 4>>>` → (True, 2, "PhotoSize").
+    """
+    optional = False
+    depth = 0
+    rust = rust.strip()
+    if rust.startswith("impl Into<"):
+        rust = rust[len("impl Into<"):-1]
+    if rust.startswith("Option<"):
+        optional = True
+        rust = rust[len("Option<"):-1]
+    while True:
+        m = WRAPPER_RE.fullmatch(rust)
+        if m is None:
+            break
+        if m.group(1) != "Box":
+            depth += 1
+        inner = m.group(2)
+        rust = split_top_level(inner)[0] if "," in inner else inner
+    return optional, depth, rust.rsplit("::", 1)[-1]
+
+
+class RustIndex:
+    """Structs, enums and `impl Bot` methods of a set of Rust sources."""
+
+    def __init__(self):
+        self.structs = {}  # name → {json name: RustField}
+        self.enums = {}    # name → {variant: payload type or None}
+        self.fns = {}      # fn name → RustFn
+
+    @classmethod
+    def from_paths(cls, paths):
+        """Index files, globs and sharded output directories (every .rs file in them)."""
+        index = cls()
+        for path in paths:
+            if os.path.isdir(path):
+                files = sorted(glob.glob(os.path.join(path, "*.rs")))
+            else:
+                files = sorted(glob.glob(path)) or [path]
+            for name in files:
+                try:
+                    with open(name, encoding="utf-8") as f:
+                        index.add_source(f.read())
+                except OSError:
+                    continue
+        return index
+
+    def add_source(self, src):
+        for m in STRUCT_RE.finditer(src):
+            fields = self.structs.setdefault(m.group(1), {})
+            for attrs, rust, rust_type in FIELD_RE.findall(m.group(2) or ""):
+                rename = RENAME_RE.search(attrs)
+                json_name = rename.group(1) if rename else rust[len("r#"):] if rust.startswith("r#") else rust
+                fields[json_name] = RustField(rust, json_name, rust_type, rust_type.startswith("Option<"))
+        for m in ENUM_RE.finditer(src):
+            variants = self.enums.setdefault(m.group(1), {})
+            for variant, payload in VARIANT_RE.findall(m.group(2)):
+                variants[variant] = unwrap_type(payload)[2] if payload else None
+        for name, params, returns in FN_RE.findall(src):
+            args = {}
+            for param in split_top_level(" ".join(params.split())):
+                if param.endswith("self"):
+                    continue
+                pname, _, ptype = param.partition(":")
+                args[pname.strip()] = ptype.strip()
+            self.fns[name] = RustFn(args, returns)
+
+    def has_type(self, name):
+        return name in self.structs or name in self.enums
+
+    def is_string_enum(self, name):
+        """True for an enum whose variants carry no data except an unknown-value fallback."""
+        variants = self.enums.get(name)
+        return bool(variants) and sum(payload is not None for payload in variants.values()) <= 1
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: rust_index.py <file.rs|dir>...")
+        sys.exit(2)
+    index = RustIndex.from_paths(sys.argv[1:])
+    fields = sum(len(fields) for fields in index.structs.values())
+    print(f"{len(index.structs)} structs ({fields} fields), {len(index.enums)} enums, "
+          f"{len(index.fns)} methods")
+
+
+if __name__ == "__main__":
+    main()
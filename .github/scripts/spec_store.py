@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+spec_store.py — Content-addressed history of Telegram Bot API spec files.
+
+Usage:
+    python3 spec_store.py add api.json [api_older.json ...] [--label LABEL]
+    python3 spec_store.py list
+    python3 spec_store.py get "Bot API 9.4" [out.json]     (byte-for-byte; stdout if no file)
+    python3 spec_store.py which User [username]            (versions containing a type / field)
+    python3 spec_store.py which sendMessage [chat_id]      (or a method / parameter)
+
+All commands take --store DIR (default: .spec-store/ in the repo root).
+diff_spec.py --store DIR archives the specs it compares and runs --history
+over a store.
+
+Layout:
+    objects/ab/cdef...   zlib-compressed blobs, named by the sha256 of their bytes
+    versions.json        the stored versions in the order they were added
+    manifests/SHA.json   per version: the skeleton blob, entry blobs and cut offsets
+    index.json           per type / method and field / parameter: the versions
+                         (positions in versions.json) that contain it
+
+Each type and method entry is stored as the exact text it has in the file,
+so an entry that did not change between releases is one shared blob and N
+versions cost roughly one spec plus their deltas. What remains of the file
+once the entries are cut out (the top-level keys and the whitespace between
+entries) is the skeleton; splicing the entries back into it at the recorded
+offsets gives the original bytes, which `get` checks against the file's
+sha256. `which` only reads index.json.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from json.decoder import scanstring
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "codegen"))
+from spec_model import Spec  # noqa: E402
+
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".spec-store")
+
+# Top-level objects whose members are stored as one blob each.
+SECTIONS = ("types", "methods")
+
+WS_RE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Splitting a spec file into entries
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _skip(text, pos, sep=None):
+    """Position after whitespace, the separator `sep` (if present) and more whitespace."""
+    pos = WS_RE.match(text, pos).end()
+    if sep is not None and text.startswith(sep, pos):
+        pos = WS_RE.match(text, pos + 1).end()
+    return pos
+
+
+def entry_spans(text):
+    """(section, name, start, end, value) of each type and method entry, in file order.
+
+    `text[start:end]` is the entry's JSON exactly as written and `value` its
+    decoded form. The file is scanned once; other top-level values are only
+    skipped over.
+    """
+    spans = []
+    pos = _skip(text, 0)
+    if not text.startswith("{", pos):
+        raise ValueError("a spec file must hold a JSON object")
+    pos = _skip(text, pos + 1)
+    while not text.startswith("}", pos):
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip(text, pos, ":")
+        if key in SECTIONS and text.startswith("{", pos):
+            pos = _skip(text, pos + 1)
+            while not text.startswith("}", pos):
+                name, pos = scanstring(text, pos + 1)
+                pos = _skip(text, pos, ":")
+                value, end = DECODER.raw_decode(text, pos)
+                spans.append((key, name, pos, end, value))
+                pos = _skip(text, end, ",")
+            pos += 1
+        else:
+            _, pos = DECODER.raw_decode(text, pos)
+        pos = _skip(text, pos, ",")
+    return spans
+
+
+def member_names(value):
+    """Field names of a type, or parameter names of a method."""
+    return [field["name"] for field in value.get("fields", [])]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Store
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SpecStore:
+    """A directory of deduplicated spec versions (see the module docstring)."""
+
+    def __init__(self, root=DEFAULT_STORE):
+        self.root = os.path.abspath(root)
+        self.versions = self._read_json("versions.json", [])
+        self._index = None
+        self._values = {}  # blob hash → decoded entry, shared across versions
+
+    # ── files ────────────────────────────────────────────────────────────────
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def _read_json(self, name, default):
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def _write_json(self, name, data):
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def put_blob(self, data):
+        """Store `data` under its hash; returns (hash, bytes written)."""
+        digest = sha256(data)
+        path = self._path("objects", digest[:2], digest[2:])
+        if os.path.exists(path):
+            return digest, 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        packed = zlib.compress(data, 9)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(packed)
+        os.replace(tmp, path)
+        return digest, len(packed)
+
+    def get_blob(self, digest):
+        with open(self._path("objects", digest[:2], digest[2:]), "rb") as f:
+            return zlib.decompress(f.read())
+
+    # ── versions ─────────────────────────────────────────────────────────────
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = self._read_json("index.json", {section: {} for section in SECTIONS})
+        return self._index
+
+    def find(self, label):
+        """The versions.json record of a version label (or file sha256), else None."""
+        for record in self.versions:
+            if label in (record["label"], record["sha256"]):
+                return record
+        return None
+
+    def manifest(self, label):
+        record = self.find(label)
+        if record is None:
+            raise KeyError(f"version not in the store: {label}")
+        return self._read_json(os.path.join("manifests", f"{record['sha256']}.json"), None)
+
+    def add(self, path, label=None):
+        """Store a spec file; returns (record, bytes written). A file already stored is a no-op."""
+        with open(path, "rb") as f:
+            data = f.read()
+        file_hash = sha256(data)
+        for record in self.versions:
+            if record["sha256"] == file_hash:
+                return record, 0
+        text = data.decode("utf-8")
+        spans = entry_spans(text)
+
+        written = 0
+        skeleton, entries, cuts, last, length = [], [], [], 0, 0
+        for section, name, start, end, value in spans:
+            skeleton.append(text[last:start])
+            length += start - last
+            cuts.append(length)
+            digest, size = self.put_blob(text[start:end].encode("utf-8"))
+            written += size
+            entries.append([section, name, digest])
+            last = end
+        skeleton.append(text[last:])
+        skeleton_hash, size = self.put_blob("".join(skeleton).encode("utf-8"))
+        written += size
+
+        top = json.loads(skeleton_top(text, spans))
+        label = label or top.get("version", "unknown")
+        if self.find(label) is not None:
+            label = f"{label} ({file_hash[:8]})"
+        manifest = {"skeleton": skeleton_hash, "entries": entries, "cuts": cuts}
+        self._write_json(os.path.join("manifests", f"{file_hash}.json"), manifest)
+
+        position = len(self.versions)
+        index = self.index
+        for section, name, start, end, value in spans:
+            item = index[section].setdefault(name, {"versions": [], "fields": {}})
+            item["versions"].append(position)
+            for member in member_names(value):
+                item["fields"].setdefault(member, []).append(position)
+        record = {
+            "label": label,
+            "version": top.get("version", "unknown"),
+            "release_date": top.get("release_date", ""),
+            "sha256": file_hash,
+            "size": len(data),
+        }
+        self.versions.append(record)
+        self._write_json("index.json", index)
+        self._write_json("versions.json", self.versions)
+        return record, written
+
+    def read(self, label):
+        """The exact bytes of a stored version, checked against its sha256."""
+        record = self.find(label)
+        manifest = self.manifest(label)
+        skeleton = self.get_blob(manifest["skeleton"]).decode("utf-8")
+        parts, last = [], 0
+        for (_, _, digest), cut in zip(manifest["entries"], manifest["cuts"]):
+            parts.append(skeleton[last:cut])
+            parts.append(self.get_blob(digest).decode("utf-8"))
+            last = cut
+        parts.append(skeleton[last:])
+        data = "".join(parts).encode("utf-8")
+        if sha256(data) != record["sha256"]:
+            raise ValueError(f"stored version {label} does not match its sha256")
+        return data
+
+    def load(self, label):
+        """(Spec, {section: {name: blob hash}}) of a stored version.
+
+        Entries are decoded once per blob, so loading several versions only
+        parses what changed between them; the blob hashes serve as entry
+        fingerprints.
+        """
+        record = self.find(label)
+        manifest = self.manifest(label)
+        raw = {"version": record["version"], "release_date": record["release_date"]}
+        hashes = {section: {} for section in SECTIONS}
+        for section, name, digest in manifest["entries"]:
+            value = self._values.get(digest)
+            if value is None:
+                value = self._values[digest] = json.loads(self.get_blob(digest))
+            raw.setdefault(section, {})[name] = value
+            hashes[section][name] = digest
+        return Spec(raw), hashes
+
+    def which(self, name, member=None):
+        """Labels of the versions containing a type or method, or one of its fields / parameters."""
+        for section in SECTIONS:
+            item = self.index[section].get(name)
+            if item is not None:
+                positions = item["versions"] if member is None else item["fields"].get(member, [])
+                return [self.versions[i]["label"] for i in positions]
+        return []
+
+    def disk_usage(self):
+        total = 0
+        for folder, _, files in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(folder, name)) for name in files)
+        return total
+
+
+def skeleton_top(text, spans):
+    """The file's JSON with every type and method entry replaced by null."""
+    parts, last = [], 0
+    for _, _, start, end, _ in spans:
+        parts.append(text[last:start])
+        parts.append("null")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed history of api.json versions.")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="store directory (default: .spec-store/)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="store spec files")
+    add.add_argument("files", nargs="+")
+    add.add_argument("--label", help="version label (default: the spec's version)")
+    commands.add_parser("list", help="list the stored versions")
+    get = commands.add_parser("get", help="write a stored version byte-for-byte")
+    get.add_argument("label")
+    get.add_argument("output", nargs="?")
+    which = commands.add_parser("which", help="versions containing a type / method or one of its fields")
+    which.add_argument("name")
+    which.add_argument("member", nargs="?")
+    args = parser.parse_args()
+
+    store = SpecStore(args.store)
+    if args.command == "add":
+        if args.label and len(args.files) > 1:
+            parser.error("--label takes a single file")
+        for path in args.files:
+            record, written = store.add(path, args.label)
+            print(f"📦 {record['label']}: {record['size']} bytes, {written} new bytes stored")
+    elif args.command == "list":
+        for record in store.versions:
+            print(f"  {record['label']:<32} {record['release_date']:<20} {record['size']:>9} bytes")
+        specs = sum(record["size"] for record in store.versions)
+        print(f"{len(store.versions)} versions, {specs} bytes of spec in {store.disk_usage()} bytes on disk")
+    elif args.command == "get":
+        data = store.read(args.label)
+        if args.output:
+            with open(args.output, "wb") as f:
+                f.write(data)
+        else:
+            sys.stdout.buffer.write(data)
+    else:
+        labels = store.which(args.name, args.member)
+        item = args.name if args.member is None else f"{args.name}.{args.member}"
+        if not labels:
+            print(f"{item}: in no stored version")
+            sys.exit(1)
+        print(f"{item}: {', '.join(labels)}")
+
+
+if __name__ == "__main__":
+    main()
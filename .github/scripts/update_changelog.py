@@ -20,6 +20,8 @@ Auto-generated API updates use the [Telegram Bot API spec](https://github.com/Pa
 ---
 """
 
+UNRELEASED = "## [Unreleased]\n"
+
 
 def load_diff(path="/tmp/diff_report.json"):
     try:
@@ -90,14 +92,22 @@ def main():
         entry_lines.append("Auto-generated from latest Telegram Bot API spec.")
         entry_lines.append("")
 
+    existing = changelog_path.read_text() if changelog_path.exists() else None
+    # Notes gathered under "## [Unreleased]" ship with this release.
+    if existing and UNRELEASED in existing:
+        start = existing.index(UNRELEASED)
+        end = existing.index("---\n", start) + 4
+        entry_lines.extend(existing[start + len(UNRELEASED):end - 4].strip("\n").split("\n"))
+        entry_lines.append("")
+        existing = existing[:start] + existing[end:].lstrip("\n")
+
     entry_lines.append("---")
     entry_lines.append("")
 
     new_entry = "\n".join(entry_lines)
 
     # Read or initialize changelog
-    if changelog_path.exists():
-        existing = changelog_path.read_text()
+    if existing is not None:
         # Insert after the header separator
         if "---\n" in existing:
             idx = existing.index("---\n") + 4
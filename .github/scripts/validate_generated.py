@@ -5,24 +5,43 @@ are present across the generated AND hand-crafted Rust source files.
 
 Usage:
     python3 validate_generated.py api.json gen_types.rs gen_methods.rs
+    python3 validate_generated.py api.json gen_types/ gen_methods/    (codegen --shard)
+    python3 validate_generated.py api.json gen_types.rs gen_methods.rs --manifest FILE
+    python3 validate_generated.py api.json gen_types.rs gen_methods.rs --methods a,b,...
+    python3 validate_generated.py api.json gen_types.rs gen_methods.rs --ir api.ir
+
+For a lean build (codegen --manifest / --methods) pass the same manifest:
+only the methods it lists and the types reachable from them are expected,
+using the same reachability rules as codegen.py. With the IR written by
+`codegen --emit-ir`, exactly the types and methods it lists are expected,
+under the Rust names it resolved (struct fields included).
 
 How it works:
-    - Generated types    → must appear in gen_types.rs
+    - The Rust files are indexed once (rust_index.py); every check below is
+      a dictionary lookup into that index.
+    - Generated types    → must appear in gen_types.rs, with every field of
+                           the spec under its JSON name and the expected
+                           optionality and type shape (exact with --ir)
     - Hand-crafted types → defined in HAND_CRAFTED_TYPES below; searched in
                            tgbotrs/src/ instead of gen_types.rs
-    - All methods        → must appear in gen_methods.rs
+    - All methods        → must appear in gen_methods.rs, with the required
+                           parameters and return type of the spec
 
 Adding a new hand-crafted type:
     1. Implement it in the appropriate tgbotrs/src/*.rs file
     2. Add its name to HAND_CRAFTED_TYPES below (relative path from repo root)
 """
 
-import glob
-import json
 import os
-import re
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "codegen"))
+from codegen import lean_subset, read_ir, read_manifest  # noqa: E402
+from rust_index import RustIndex, unwrap_type  # noqa: E402
+from spec_model import (  # noqa: E402
+    BASE_TYPE_MAP, load_spec, method_params_struct, safe_field_name, snake_case,
+)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Single source of truth for types implemented manually outside gen_types.rs.
 # Key   = exact Telegram API type name
@@ -37,89 +56,218 @@ HAND_CRAFTED_TYPES = {
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def snake_case(name):
-    s = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
-    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-    return s.lower()
+MULTI_TYPE_RUST = {"ChatId", "InputFileOrString", "ReplyMarkup", "InputMedia"}
+
+
+def base_matches(tg_type, base, index):
+    """True if the Rust type `base` holds values of the spec type `tg_type`."""
+    if base == BASE_TYPE_MAP.get(tg_type, tg_type):
+        return True
+    # Strings may be generated as a closed string enum or a ShortString.
+    return tg_type == "String" and (base == "ShortString" or index.is_string_enum(base))
+
+
+def type_matches(tg_types, depth, base, index):
+    """True if a Rust type of `depth` array levels over `base` holds the spec's `tg_types`."""
+    if not tg_types:
+        return base == "Value"
+    for tg_type in tg_types:
+        arrays = tg_type.count("Array of ")
+        if arrays == depth and base_matches(tg_type.replace("Array of ", ""), base, index):
+            return True
+    return len(tg_types) > 1 and (base in MULTI_TYPE_RUST or base == "Value")
+
+
+def type_problem(tg_types, required, rust_type, index):
+    """Why the Rust type `rust_type` cannot hold a value of the spec's `tg_types`, or None."""
+    optional, depth, base = unwrap_type(rust_type)
+    if optional and required:
+        return f"is optional (`{rust_type}`) but required in the spec"
+    if not optional and not required:
+        return f"is required (`{rust_type}`) but optional in the spec"
+    if type_matches(tg_types, depth, base, index):
+        return None
+    if not tg_types:
+        return f"is `{rust_type}`, expected serde_json::Value"
+    return f"is `{rust_type}`, which cannot hold {' or '.join(tg_types)}"
+
+
+def check_fields(owner, spec_fields, rust_fields, index, ir_fields=None):
+    """(errors, warnings) comparing a struct's fields with its spec (or IR) fields."""
+    errors, warnings = [], []
+    for field in spec_fields:
+        rust = rust_fields.get(field["name"])
+        if rust is None:
+            errors.append(f"❌ Missing field: {owner}.{field['name']}")
+            continue
+        if ir_fields is not None:
+            want = ir_fields.get(field["name"])
+            if want is not None and (rust.rust, rust.type) != (want["rust"], want["type"]):
+                errors.append(f"❌ {owner}.{field['name']}: `{rust.rust}: {rust.type}`, "
+                              f"IR says `{want['rust']}: {want['type']}`")
+            continue
+        problem = type_problem(field["types"], field["required"], rust.type, index)
+        if problem:
+            errors.append(f"❌ {owner}.{field['name']} {problem}")
+    spec_names = {field["name"] for field in spec_fields}
+    for name in rust_fields:
+        if name not in spec_names:
+            warnings.append(f"⚠️  {owner}.{name} is not in the spec")
+    return errors, warnings
+
+
+def check_method(method_name, method, fn, index, ir_method=None):
+    """(errors, warnings) comparing a generated `impl Bot` fn with its spec (or IR) entry."""
+    errors, warnings = [], []
+    fields = method.get("fields", [])
+    required = [field for field in fields if field["required"]]
+    optional = [field for field in fields if not field["required"]]
+    ir_args = {arg["json"]: arg for arg in ir_method["args"]} if ir_method else {}
+    for field in required:
+        name = ir_args[field["name"]]["rust"] if field["name"] in ir_args else safe_field_name(field["name"])
+        rust_type = fn.params.get(name)
+        if rust_type is None:
+            errors.append(f"❌ Missing parameter: {method_name}({field['name']})")
+        elif ir_method:
+            arg = ir_args.get(field["name"])
+            want = f"impl Into<{arg['type']}>" if arg and arg["into"] else arg and arg["type"]
+            if rust_type != want:
+                errors.append(f"❌ {method_name}({field['name']}): `{rust_type}`, IR says `{want}`")
+        else:
+            problem = type_problem(field["types"], True, rust_type, index)
+            if problem:
+                errors.append(f"❌ {method_name}({field['name']}) {problem}")
+
+    params_name = ir_method["params"] if ir_method else method_params_struct(method_name)
+    if optional:
+        if fn.params.get("params") != f"Option<{params_name}>":
+            errors.append(f"❌ {method_name}: expected a `params: Option<{params_name}>` parameter")
+        elif params_name not in index.structs:
+            errors.append(f"❌ Missing params struct: {params_name}")
+        else:
+            ir_fields = {o["json"]: o for o in ir_method["options"]} if ir_method else None
+            more_errors, more_warnings = check_fields(params_name, optional, index.structs[params_name],
+                                                      index, ir_fields)
+            errors += more_errors
+            warnings += more_warnings
 
+    if ir_method:
+        if fn.returns != ir_method["returns"]:
+            errors.append(f"❌ {method_name} returns `{fn.returns}`, IR says `{ir_method['returns']}`")
+    elif method.get("returns"):
+        problem = type_problem(method["returns"], True, fn.returns, index)
+        if problem:
+            errors.append(f"❌ {method_name} result {problem}")
+    elif fn.returns != "bool":
+        errors.append(f"❌ {method_name} returns `{fn.returns}`, expected bool")
+    return errors, warnings
 
-def read(path):
-    """Read a file relative to cwd (repo root) or as absolute path."""
-    for p in [path, os.path.join(os.getcwd(), path)]:
-        if os.path.exists(p):
-            with open(p) as f:
-                return f.read()
-    return ""
 
+def option(args, flag):
+    """Value following `flag` in args, else None."""
+    for name, value in zip(args, args[1:]):
+        if name == flag:
+            return value
+    return None
 
-def find_type_in_sources(type_name, src_globs):
-    """Return True if `pub struct/enum TypeName` appears in any of the given files."""
-    patterns = [f"pub struct {type_name}", f"pub enum {type_name}"]
-    for pattern in src_globs:
-        for filepath in glob.glob(pattern) or [pattern]:
-            src = read(filepath)
-            if any(p in src for p in patterns):
-                return True
-    return False
+
+def lean_methods(args):
+    """Method list of a lean build from `--manifest FILE` / `--methods a,b`, else None."""
+    manifest = option(args, "--manifest")
+    if manifest is not None:
+        return read_manifest(manifest)
+    methods = option(args, "--methods")
+    if methods is not None:
+        return [name for name in methods.split(",") if name]
+    return None
 
 
 def main():
     if len(sys.argv) < 4:
-        print("Usage: validate_generated.py <api.json> <gen_types.rs> <gen_methods.rs>")
+        print("Usage: validate_generated.py <api.json> <gen_types.rs|dir> <gen_methods.rs|dir> "
+              "[--manifest FILE | --methods a,b,...] [--ir FILE]")
         sys.exit(1)
 
-    spec         = json.load(open(sys.argv[1]))
-    types_src    = open(sys.argv[2]).read()
-    methods_src  = open(sys.argv[3]).read()
+    spec         = load_spec(sys.argv[1])
+    index        = RustIndex.from_paths(sys.argv[2:4])
     all_types    = spec["types"]
     all_methods  = spec["methods"]
 
+    methods = lean_methods(sys.argv[4:])
+    if methods is not None:
+        keep_types, keep_methods = lean_subset(spec, methods)
+        # Hand-crafted types are always in the crate, reached or not.
+        keep_types = keep_types | set(HAND_CRAFTED_TYPES)
+        print(f"Lean build: expecting {len(keep_methods)}/{len(all_methods)} methods "
+              f"and the {len(keep_types)}/{len(all_types)} types they reach, hand-crafted ones included")
+        all_types   = {name: t for name, t in all_types.items() if name in keep_types}
+        all_methods = {name: m for name, m in all_methods.items() if name in keep_methods}
+    ir_path = option(sys.argv[4:], "--ir")
+    ir_types, ir_methods = {}, {}
+    if ir_path:
+        ir = read_ir(ir_path)
+        ir_types = {record["name"]: record for record in ir["types"]}
+        ir_methods = {record["name"]: record for record in ir["methods"]}
+        print(f"IR: expecting its {len(ir_methods)} methods and {len(ir_types)} generated types")
+        all_types   = {name: t for name, t in all_types.items() if name in ir_types or name in HAND_CRAFTED_TYPES}
+        all_methods = {name: m for name, m in all_methods.items() if name in ir_methods}
+    hand_crafted = {name: srcs for name, srcs in HAND_CRAFTED_TYPES.items() if name in all_types}
+    hand_index = RustIndex.from_paths(sorted({path for srcs in hand_crafted.values() for path in srcs}))
+    print(f"Indexed {len(index.structs)} structs, {len(index.enums)} enums and {len(index.fns)} methods")
+
     errors   = []
     warnings = []
 
     # ── 1. Types ─────────────────────────────────────────────────────────────
     print(f"\n=== Validating {len(all_types)} types ===")
-    print(f"    ({len(HAND_CRAFTED_TYPES)} hand-crafted, exempt from gen_types.rs check: "
-          f"{list(HAND_CRAFTED_TYPES.keys())})")
+    print(f"    ({len(hand_crafted)} hand-crafted, exempt from gen_types.rs check: "
+          f"{list(hand_crafted.keys())})")
 
     missing_types = []
     for type_name, type_info in all_types.items():
         is_union = bool(type_info.get("subtypes"))
-        gen_pattern = f"pub enum {type_name}" if is_union else f"pub struct {type_name}"
+        kind = "pub enum" if is_union else "pub struct"
 
         if type_name in HAND_CRAFTED_TYPES:
             # Verify it actually exists in its declared hand-crafted source
-            if not find_type_in_sources(type_name, HAND_CRAFTED_TYPES[type_name]):
+            if not hand_index.has_type(type_name):
                 errors.append(
                     f"❌ Hand-crafted type '{type_name}' not found in "
                     f"{HAND_CRAFTED_TYPES[type_name]} — did you forget to implement it?"
                 )
-        else:
-            if gen_pattern not in types_src:
-                missing_types.append(type_name)
-                errors.append(f"❌ Missing generated type: {type_name} (expected '{gen_pattern}')")
-            elif not is_union and type_info.get("fields"):
-                for field in type_info["fields"]:
-                    if field["name"] not in types_src:
-                        warnings.append(f"⚠️  Field '{field['name']}' may be missing from {type_name}")
+        elif type_name not in (index.enums if is_union else index.structs):
+            missing_types.append(type_name)
+            errors.append(f"❌ Missing generated type: {type_name} (expected '{kind} {type_name}')")
+        elif not is_union:
+            ir_fields = None
+            if type_name in ir_types:
+                ir_fields = {field["json"]: field for field in ir_types[type_name]["fields"]}
+            more_errors, more_warnings = check_fields(
+                type_name, type_info.get("fields", []), index.structs[type_name], index, ir_fields)
+            errors += more_errors
+            warnings += more_warnings
 
     if missing_types:
         print(f"❌ Missing types ({len(missing_types)}): {missing_types}")
     else:
         print(f"✅ All {len(all_types)} types are present "
-              f"({len(all_types) - len(HAND_CRAFTED_TYPES)} generated + "
-              f"{len(HAND_CRAFTED_TYPES)} hand-crafted)")
+              f"({len(all_types) - len(hand_crafted)} generated + "
+              f"{len(hand_crafted)} hand-crafted)")
 
     # ── 2. Methods ───────────────────────────────────────────────────────────
     print(f"\n=== Validating {len(all_methods)} methods ===")
 
-    gen_fns = set(re.findall(r'pub async fn (\w+)', methods_src))
     missing_methods = []
-    for method_name in all_methods:
-        fn_name = snake_case(method_name)
-        if fn_name not in gen_fns:
+    for method_name, method in all_methods.items():
+        fn_name = ir_methods[method_name]["fn"] if ir_methods else snake_case(method_name)
+        fn = index.fns.get(fn_name)
+        if fn is None:
             missing_methods.append(method_name)
             errors.append(f"❌ Missing method: {method_name} (expected fn '{fn_name}')")
+            continue
+        more_errors, more_warnings = check_method(method_name, method, fn, index, ir_methods.get(method_name))
+        errors += more_errors
+        warnings += more_warnings
 
     if missing_methods:
         print(f"❌ Missing methods ({len(missing_methods)}): {missing_methods}")
@@ -137,17 +285,18 @@ def main():
 
         if type_name in HAND_CRAFTED_TYPES:
             # For hand-crafted union types, just warn if a variant type is
-            # not referenced anywhere in the declared source file(s)
-            combined = "".join(read(p) for srcs in [HAND_CRAFTED_TYPES[type_name]] for p in srcs)
+            # not carried by any variant of the declared enum
+            payloads = set(hand_index.enums.get(type_name, {}).values())
             for variant in subtypes:
-                if variant not in combined:
+                if variant not in payloads:
                     warnings.append(
                         f"⚠️  Hand-crafted {type_name}: variant '{variant}' not referenced "
                         f"in {HAND_CRAFTED_TYPES[type_name]}"
                     )
-        else:
+        elif type_name in index.enums:
+            variants = index.enums[type_name]
             for variant in subtypes:
-                if f"{variant}({variant})" not in types_src:
+                if variants.get(variant) != variant:
                     errors.append(f"❌ Missing union variant: {type_name}::{variant}")
                     union_errors += 1
 
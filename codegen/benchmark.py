@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+tgbotrs — Benchmarks
+====================
+Times codegen.py and the spec scripts in .github/scripts/ phase by phase,
+on the real api.json and on synthetic specs scaled up from it.
+
+Usage:
+    python3 benchmark.py [api.json] [-o results.json] [--compare BASE.json] [--threshold 0.2]
+                         [--scales 1,10,100] [--phases LIST] [--repeat 5] [--budget 30] [--timeout 300]
+
+Phases:
+    load          read and parse api.json into the spec model
+    resolve       cycle/boxing, string-enum and layout analyses, IR records
+    emit_types    gen_types.rs items (analyses already done)
+    emit_methods  gen_methods.rs items
+    format        rustfmt on every item, in codegen.py's batches (skipped without rustfmt)
+    validate      .github/scripts/validate_generated.py on the generated files
+    coverage      .github/scripts/coverage_report.py on the generated files
+    diff          .github/scripts/diff_spec.py against a slightly edited copy of the spec
+
+A spec scaled N× holds every type and method N times: the copies are named
+NameCopy2, NameCopy3, ... and reference each other the way the originals do,
+so cycles, unions and string enums scale with them.
+
+Each phase runs up to --repeat times (fewer once it has taken --budget
+seconds) and reports the fastest and median run, then once more under
+tracemalloc for its peak Python heap (rustfmt's own memory is not counted).
+The script phases run in a child interpreter, timed around the script alone,
+and are abandoned after --timeout seconds.
+
+Results are written as JSON with -o. --compare reads an earlier results file
+and exits 1 if any phase got more than --threshold slower (fastest run) or
+hungrier (peak), ignoring differences below MIN_DELTA_SECONDS.
+
+No external Python dependencies required.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from codegen import (
+    FORMAT_BATCH, SKIP_TYPES, method_items, method_records, output_plan, rustfmt_fragments,
+    type_items, type_records,
+)
+from spec_model import Spec, is_array, strip_array
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / '.github' / 'scripts'
+
+BENCHMARK_VERSION = 1
+
+PHASES = ('load', 'resolve', 'emit_types', 'emit_methods', 'format', 'validate', 'coverage', 'diff')
+
+# Slowdowns smaller than this are noise, whatever the ratio.
+MIN_DELTA_SECONDS = 0.01
+
+# ─────────────────────────────────────────────────
+# Synthetic specs
+# ─────────────────────────────────────────────────
+
+def clone_entry(entry, name, ref):
+    """A copy of a type or method named `name`, with type references mapped through `ref`."""
+    clone = dict(entry, name=name)
+    if 'fields' in entry:
+        clone['fields'] = [dict(field, types=[ref(t) for t in field['types']]) for field in entry['fields']]
+    for key in ('subtypes', 'subtype_of', 'returns'):
+        if key in entry:
+            clone[key] = [ref(t) for t in entry[key]]
+    return clone
+
+def scaled_spec(raw, factor):
+    """`raw` with every type (but SKIP_TYPES) and method cloned `factor` - 1 times."""
+    types = dict(raw['types'])
+    methods = dict(raw['methods'])
+    for k in range(2, factor + 1):
+        rename = {name: f'{name}Copy{k}' for name in raw['types'] if name not in SKIP_TYPES}
+
+        def ref(t):
+            if is_array(t):
+                return 'Array of ' + ref(strip_array(t))
+            return rename.get(t, t)
+
+        for name, tg_type in raw['types'].items():
+            if name in rename:
+                types[rename[name]] = clone_entry(tg_type, rename[name], ref)
+        for name, method in raw['methods'].items():
+            methods[f'{name}Copy{k}'] = clone_entry(method, f'{name}Copy{k}', ref)
+    return dict(raw, types=types, methods=methods)
+
+def edited_spec(raw):
+    """The next "release" of `raw` for the diff phase: a field added to every
+    7th type, every 11th method re-described and the last type removed."""
+    types = dict(raw['types'])
+    for i, name in enumerate(list(types)):
+        if i % 7 == 0 and 'fields' in types[name]:
+            field = {'name': 'benchmark_field', 'types': ['String'], 'required': False,
+                     'description': 'Added by benchmark.py.'}
+            types[name] = dict(types[name], fields=types[name]['fields'] + [field])
+    types.pop(next(reversed(types)), None)
+    methods = dict(raw['methods'])
+    for i, name in enumerate(list(methods)):
+        if i % 11 == 0:
+            methods[name] = dict(methods[name], description=['Re-described by benchmark.py.'])
+    return dict(raw, version=f"{raw.get('version', 'unknown')} (edited)", types=types, methods=methods)
+
+class Workload:
+    """The files and generated sources one scale of the benchmark runs on."""
+
+    def __init__(self, raw, factor, workdir):
+        self.factor = factor
+        self.dir = Path(workdir) / f'{factor}x'
+        self.dir.mkdir()
+        spec = scaled_spec(raw, factor) if factor > 1 else raw
+        self.spec_path = self.dir / 'api.json'
+        self.text = json.dumps(spec, ensure_ascii=False)
+        self.spec_path.write_text(self.text, encoding='utf-8')
+        self.next_path = self.dir / 'next_api.json'
+        self.next_path.write_text(json.dumps(edited_spec(spec), ensure_ascii=False), encoding='utf-8')
+        self.types = len(spec['types'])
+        self.methods = len(spec['methods'])
+
+        # [(file name, [header, item, ...])] as codegen.py generates them.
+        self.sources = [(fname, [header] + [code for _, _, code in items])
+                        for fname, header, items in output_plan(self.fresh_spec(), False)]
+        self.formatted = None
+
+    def fresh_spec(self):
+        """The spec model with none of its per-field or memoised analyses done yet."""
+        return Spec(json.loads(self.text))
+
+    def write_outputs(self):
+        """Write the generated files for the script phases, formatted if `format` ran."""
+        for fname, fragments in self.formatted or self.sources:
+            (self.dir / fname).write_text('\n'.join(fragments), encoding='utf-8')
+
+# ─────────────────────────────────────────────────
+# Phases
+# ─────────────────────────────────────────────────
+#
+# In-process phases are (setup, run) pairs: `setup(work)` builds the untimed
+# state that `run` takes. Script phases give the script and its arguments.
+
+def setup_resolved(work):
+    spec = work.fresh_spec()
+    list(type_records(spec))
+    list(method_records(spec))
+    return spec
+
+def run_load(work, _):
+    with open(work.spec_path, encoding='utf-8') as f:
+        Spec(json.load(f))
+
+def run_resolve(_, spec):
+    list(type_records(spec))
+    list(method_records(spec))
+
+def run_format(work, _):
+    formatted = []
+    for fname, fragments in work.sources:
+        out = []
+        for i in range(0, len(fragments), FORMAT_BATCH):
+            out += rustfmt_fragments(fragments[i:i + FORMAT_BATCH])
+        formatted.append((fname, out))
+    work.formatted = formatted
+
+IN_PROCESS = {
+    'load': (lambda work: None, run_load),
+    'resolve': (lambda work: work.fresh_spec(), run_resolve),
+    'emit_types': (setup_resolved, lambda work, spec: list(type_items(spec))),
+    'emit_methods': (setup_resolved, lambda work, spec: list(method_items(spec))),
+    'format': (lambda work: None, run_format),
+}
+
+SCRIPT_PHASES = {
+    'validate': lambda work: ('validate_generated.py', work.spec_path,
+                              work.dir / 'gen_types.rs', work.dir / 'gen_methods.rs'),
+    'coverage': lambda work: ('coverage_report.py', work.spec_path,
+                              work.dir / 'gen_types.rs', work.dir / 'gen_methods.rs'),
+    'diff': lambda work: ('diff_spec.py', work.spec_path, work.next_path, work.dir / 'diff.json'),
+}
+
+# Runs in the child interpreter: times one script run (optionally under
+# tracemalloc) and writes {seconds, peak, status} to the file named first.
+SCRIPT_RUNNER = '''
+import json, os, runpy, sys, time, tracemalloc
+out, traced, script, *argv = sys.argv[1:]
+sys.argv = [script] + argv
+sys.path.insert(0, os.path.dirname(script))
+if traced == '1':
+    tracemalloc.start()
+status = 0
+start = time.perf_counter()
+try:
+    runpy.run_path(script, run_name='__main__')
+except SystemExit as e:
+    status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+except Exception as e:
+    status = f'{type(e).__name__}: {e}'
+seconds = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if traced == '1' else None
+with open(out, 'w') as f:
+    json.dump({'seconds': seconds, 'peak': peak, 'status': status}, f)
+'''
+
+def run_script(work, script, args, traced, timeout):
+    """One child run of a script phase: {seconds, peak, status}, or None on timeout."""
+    out = work.dir / 'run.json'
+    command = [sys.executable, '-c', SCRIPT_RUNNER, str(out), '1' if traced else '0',
+               str(SCRIPTS / script)] + [str(arg) for arg in args]
+    try:
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+    return json.loads(out.read_text(encoding='utf-8'))
+
+def measure(work, phase, repeat, budget, timeout):
+    """Time `phase` on `work`; returns its result record."""
+    record = {'scale': work.factor, 'phase': phase, 'status': 'ok', 'runs': []}
+    if phase in IN_PROCESS:
+        setup, run = IN_PROCESS[phase]
+        for _ in range(repeat):
+            state = setup(work)
+            start = time.perf_counter()
+            run(work, state)
+            record['runs'].append(time.perf_counter() - start)
+            if sum(record['runs']) >= budget:
+                break
+        state = setup(work)
+        tracemalloc.start()
+        run(work, state)
+        record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        script, *args = SCRIPT_PHASES[phase](work)
+        for _ in range(repeat):
+            result = run_script(work, script, args, False, timeout)
+            if result is None:
+                record['status'] = f'timeout after {timeout}s'
+                return record
+            record['runs'].append(result['seconds'])
+            if isinstance(result['status'], str):
+                record['status'] = result['status']
+            elif result['status']:
+                record['status'] = f"exit {result['status']}"
+            if sum(record['runs']) >= budget:
+                break
+        result = run_script(work, script, args, True, timeout)
+        record['peak_bytes'] = result and result['peak']
+    record['min'] = min(record['runs'])
+    record['median'] = statistics.median(record['runs'])
+    return record
+
+# ─────────────────────────────────────────────────
+# Reporting
+# ─────────────────────────────────────────────────
+
+def mib(n):
+    return '-' if n is None else f'{n / (1 << 20):.1f}'
+
+def result_line(record):
+    if 'min' not in record:
+        return f"{record['scale']:>4}x {record['phase']:<13} {record['status']}"
+    status = '' if record['status'] == 'ok' else f"  ({record['status']})"
+    return (f"{record['scale']:>4}x {record['phase']:<13} {record['min']:>9.3f} {record['median']:>9.3f} "
+            f"{len(record['runs']):>4} {mib(record.get('peak_bytes')):>9}{status}")
+
+def regressions(base, results, threshold):
+    """Lines describing every phase that regressed against the `base` results."""
+    before = {(r['scale'], r['phase']): r for r in base['results']}
+    lines = []
+    for record in results:
+        old = before.get((record['scale'], record['phase']))
+        if old is None or 'min' not in old:
+            continue
+        name = f"{record['scale']}x {record['phase']}"
+        if 'min' not in record:
+            lines.append(f"{name}: {record['status']} (was {old['min']:.3f}s)")
+            continue
+        if (record['min'] > old['min'] * (1 + threshold)
+                and record['min'] - old['min'] >= MIN_DELTA_SECONDS):
+            lines.append(f"{name}: {old['min']:.3f}s → {record['min']:.3f}s "
+                         f"(+{record['min'] / old['min'] - 1:.0%})")
+        old_peak, peak = old.get('peak_bytes'), record.get('peak_bytes')
+        if old_peak and peak and peak > old_peak * (1 + threshold):
+            lines.append(f'{name}: peak {mib(old_peak)} → {mib(peak)} MiB (+{peak / old_peak - 1:.0%})')
+    return lines
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# ─────────────────────────────────────────────────
+# Main
+# ─────────────────────────────────────────────────
+
+def comma_list(value):
+    return [item for item in value.split(',') if item]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark codegen.py and the spec scripts.')
+    parser.add_argument('spec', nargs='?', default=str(ROOT / 'api.json'), help='path to api.json')
+    parser.add_argument('-o', '--output', help='write the results here as JSON')
+    parser.add_argument('--compare', metavar='BASE',
+                        help='results JSON of an earlier run; exit 1 on regressions against it')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='slowdown or memory growth counted as a regression (default: 0.2 = 20%%)')
+    parser.add_argument('--scales', type=lambda v: [int(n) for n in comma_list(v)], default=[1, 10, 100],
+                        help='spec scale factors to run (default: 1,10,100)')
+    parser.add_argument('--phases', type=comma_list, default=list(PHASES),
+                        help=f"phases to run (default: {','.join(PHASES)})")
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per phase (default: 5)')
+    parser.add_argument('--budget', type=float, default=30,
+                        help='stop repeating a phase once its runs took this many seconds (default: 30)')
+    parser.add_argument('--timeout', type=float, default=300,
+                        help='abandon a script phase run after this many seconds (default: 300)')
+    args = parser.parse_args()
+    unknown = set(args.phases) - set(PHASES)
+    if unknown:
+        parser.error(f"unknown phase(s): {', '.join(sorted(unknown))}")
+
+    with open(args.spec, encoding='utf-8') as f:
+        raw = json.load(f)
+    phases = [phase for phase in PHASES if phase in args.phases]
+    if 'format' in phases and shutil.which('rustfmt') is None:
+        print('rustfmt not found: skipping the format phase')
+        phases.remove('format')
+
+    results = []
+    print(f"{'Scale':>5} {'Phase':<13} {'Min (s)':>9} {'Median':>9} {'Runs':>4} {'Peak MiB':>9}")
+    with tempfile.TemporaryDirectory(prefix='tgbotrs-bench-') as workdir:
+        for factor in args.scales:
+            work = Workload(raw, factor, workdir)
+            print(f'-- {factor}x: {work.types} types, {work.methods} methods')
+            for phase in phases:
+                if phase in SCRIPT_PHASES and not (work.dir / 'gen_types.rs').exists():
+                    work.write_outputs()
+                record = measure(work, phase, args.repeat, args.budget, args.timeout)
+                record.update(types=work.types, methods=work.methods)
+                results.append(record)
+                print(result_line(record))
+
+    report = {
+        'benchmark': BENCHMARK_VERSION,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'spec_version': raw.get('version', 'unknown'),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f'Results written: {args.output}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            base = json.load(f)
+        lines = regressions(base, results, args.threshold)
+        commit = (base.get('commit') or 'unknown')[:12]
+        if lines:
+            print(f'❌ {len(lines)} regression(s) against {args.compare} ({commit}), threshold {args.threshold:.0%}:')
+            for line in lines:
+                print(f'  {line}')
+            sys.exit(1)
+        print(f'✅ No regressions against {args.compare} ({commit})')
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,12 @@ Author:      Ankit Chaubey <ankitchaubey.dev@gmail.com>
 License:     MIT
 
 Usage:
-    python3 codegen.py <api.json> <output_directory>
+    python3 codegen.py <api.json> <output_directory> [--cache-dir DIR] [--no-cache] [--check]
+                       [--jobs N] [--no-fmt]
+                       [--shard] [--borrowed] [--hot-types LIST]
+                       [--methods LIST | --manifest FILE] [--traffic-profile FILE --compact-out FILE]
+                       [--size-budget BYTES] [--layout-report FILE] [--emit-ir FILE] [--watch]
+                       [--profile] [--profile-top N] [--profile-json FILE] [--profile-dump FILE]
 
 Example:
     python3 codegen/codegen.py api.json tgbotrs/src/
@@ -19,15 +24,94 @@ Generates:
     gen_types.rs   — All 285 Telegram Bot API types
     gen_methods.rs — All 165 Telegram Bot API methods
 
-No external dependencies required. Pure Python 3.6+.
+With --shard, gen_types/ and gen_methods/ module directories are generated
+instead, one file per API area (messages, payments, stickers, ...) plus a
+mod.rs that re-exports them, so rustc can compile them as separate units.
+
+With --methods or --manifest, only the listed methods and the types reachable
+from them are generated (a lean build, see lean_subset); pass the same
+manifest to validate_generated.py.
+
+The structs in HOT_TYPES (Message, Update; see --hot-types) get a generated
+Deserialize impl that finds fields by length and first byte instead of
+comparing the key against every name, plus a test checking it against the
+derived impl.
+
+With --borrowed, gen_borrowed.rs is generated as well: lifetime-parameterised
+mirrors of Update and every type it contains, with `Cow<'a, str>` strings
+borrowed from the JSON body (the crate's `borrowed` feature).
+
+Arrays that rarely hold more than a few items and short code/id strings are
+typed ShortVec<T, N> and ShortString (see SHORT_ARRAY_ITEMS and
+SHORT_STRING_PATTERN): Vec and String unless the crate's `small` feature
+is on.
+
+gen_types.rs (each gen_types shard) ends with a test asserting size_of of its
+types against the sizes estimated by type_layouts. --layout-report writes
+those estimates, largest first; with --size-budget, structs bigger than the
+budget have their largest optional by-value fields boxed until they fit.
+
+--emit-ir writes the resolved types and methods (names, Rust types, boxing,
+renames, discriminators, field order, hot struct test samples, update
+kinds) as a versioned, hashed IR file; the Rust generator in
+codegen/src/main.rs renders the same gen_types.rs and gen_methods.rs from it
+(see check_ir_parity.py).
+
+With --traffic-profile, a compact module is written to --compact-out as
+well: mirrors of the structs in an Update that leave the fields rare in the
+profiled traffic undecoded in one `extra` JSON blob. The profile is specific
+to a deployment, so the module belongs in the bot's own crate (it refers to
+tgbotrs by name), not in tgbotrs. Write the profile from a corpus of captured
+updates with traffic_profile.py.
+
+Regeneration is incremental: formatted items are cached in codegen/.cache/
+and files whose content did not change are left untouched. Output is
+streamed to disk item by item; --check only hashes it and exits 1 if any
+file would change. With --jobs N the output files are generated side by side
+and up to N rustfmt batches run at once; the output is the same as with one.
+--no-fmt never runs rustfmt: the emitters already lay their code out as
+rustfmt does (see Layout), so the output is the same, byte for byte.
+
+--watch stays running and regenerates whenever api.json, codegen.py,
+spec_model.py or the manifest/traffic profile changes, keeping every item in
+memory: only items whose generated source changed are formatted, only
+changed files are rewritten, and the added (+), changed (~) and removed (-)
+items of each file are listed.
+
+--profile prints where the run spent its time (load, resolve, emitting each
+output, cache, rustfmt, write) and the --profile-top items of each output
+that took longest to generate and are largest. --profile-json writes the same
+as JSON, per item, and --profile-dump writes cProfile stats of the run.
+
+No external Python dependencies required. Pure Python 3.6+ (plus rustfmt).
 """
 
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import cProfile
+import glob
+import hashlib
+import importlib.util
+import itertools
 import json
+import os
 import re
+import shutil
+import subprocess
 import sys
-import os
+import threading
+import time
+import traceback
 from pathlib import Path
 
+from spec_model import (
+    BASE_TYPE_MAP, field_rust_type, is_array, load_spec, memoised, method_fn_name,
+    method_params_struct, opt_wrap, raw_json, return_rust_type, safe_field_name,
+    snake_case, strip_array,
+)
+
 # Types that are hand-crafted in the library and must NOT be generated.
 # Keep this in sync with HAND_CRAFTED_TYPES in .github/scripts/validate_generated.py
 SKIP_TYPES = {
@@ -35,119 +119,760 @@ SKIP_TYPES = {
     "InputMedia",  # ergonomic wrapper enum in tgbotrs/src/lib.rs
 }
 
+# String fields whose description quotes several values but does not list the
+# full set the API may send; they stay plain `String` instead of becoming a
+# closed enum (see string_enums).
+STRING_ENUM_OPT_OUT = {
+    ("EncryptedPassportElement", "data"),         # lists the element types it applies to
+    ("InlineQueryResultVenue", "foursquare_type"),  # examples only
+    ("InputVenueMessageContent", "foursquare_type"),
+    ("Venue", "foursquare_type"),
+    ("ReactionTypeEmoji", "emoji"),               # emoji, not identifiers
+    ("RefundedPayment", "currency"),              # ISO 4217 code, "XTR" for now
+    ("VideoQuality", "codec"),                    # examples only
+}
+
+# Structs decoded by a generated Deserialize impl instead of the derived one
+# (see emit_fast_deserialize); override with --hot-types.
+HOT_TYPES = ('Message', 'Update')
+
+# Structs bigger than this many bytes get their largest optional by-value
+# fields boxed (see type_layouts), which keeps Update and RawUpdate small;
+# override with --size-budget.
+SIZE_BUDGET = 256
+
+# Output shards for --shard mode, grouped by API area. Each type and method
+# goes to the first shard whose pattern matches its (PascalCase) name;
+# anything unmatched lands in SHARD_DEFAULT. Shards glob-import each other, so
+# a misplaced item only affects which compile unit it lives in.
+SHARD_RULES = [
+    ('common',     r'Webhook|^(GetMe|LogOut|Close|GetUpdates|GetFile|File|ResponseParameters)$'),
+    ('games',      r'^(Game|CallbackGame|SendGame|SetGameScore|GetGameHighScores)'),
+    ('inline',     r'Inline(Query|Message)|^ChosenInlineResult$|MessageContent$|WebApp(Query|Message)|^SwitchInlineQuery'),
+    ('stickers',   r'Sticker|^MaskPosition$'),
+    ('payments',   r'Invoice|Shipping|PreCheckout|Payment|^LabeledPrice$|^OrderInfo$|Star(?!t)|Transaction|RevenueWithdrawal|^AffiliateInfo$|PaidMedia|PaidMessage|SuggestedPost|PremiumSubscription'),
+    ('chat_admin', r'ChatMember|ChatPermissions|Administrator|InviteLink|JoinRequest|^(Ban|Unban|Restrict|Promote)|SenderChat|^SetChat|^DeleteChat|^(Pin|Unpin)|^LeaveChat$|ForumTopic|Boost|BotCommand|MenuButton|MyCommands'),
+    ('business',   r'Business|Gift|Story|InputProfilePhoto|ProfilePhoto$|Verification|^Verify|EmojiStatus|^UserRating$'),
+    ('messages',   r'Message|^(Send|Edit|Forward|Copy|Delete|Stop)|Photo|Video|Audio|Document|Animation|Voice|Poll|Location|Venue|Contact|Dice|Entity|InputMedia|Reaction|TextQuote|ReplyParameters|LinkPreview|Keyboard|ForceReply|Checklist|Giveaway|Background|ExternalReplyInfo|ProximityAlert|WriteAccess|Shared|DirectMessage|LoginUrl|CopyTextButton'),
+]
+SHARD_DEFAULT = 'common'
+
 # ─────────────────────────────────────────────────
-# Load spec
+# Naming helpers
 # ─────────────────────────────────────────────────
 
-def load_spec(path):
-    with open(path) as f:
-        return json.load(f)
+def shard_of(name):
+    """Return the --shard output module a type or method belongs to."""
+    pascal = name[0].upper() + name[1:]
+    for shard, pattern in SHARD_RULES:
+        if re.search(pattern, pascal):
+            return shard
+    return SHARD_DEFAULT
+
+# Required method arguments of these types are taken as `impl Into<T>`.
+INTO_ARG_TYPES = ('String', 'ChatId', 'InputFileOrString', 'InputMedia')
 
 # ─────────────────────────────────────────────────
-# Naming helpers
+# Union discriminators
 # ─────────────────────────────────────────────────
 
-def snake_case(name):
-    """Convert camelCase or PascalCase to snake_case"""
-    s = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
-    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-    return s.lower()
+# Fields whose constant value identifies the variant of a union type,
+# in order of preference.
+DISCRIMINATOR_FIELDS = ('type', 'status', 'source')
+
+def field_discriminator(field):
+    """Constant value of a discriminator field, e.g. 'always "creator"' or 'must be chat'."""
+    if field['types'] != ['String']:
+        return None
+    desc = field.get('description', '')
+    m = re.search(r'always "([^"]+)"', desc) or re.search(r'must be ([a-z0-9_]+)$', desc)
+    return m.group(1) if m else None
+
+@memoised
+def union_discriminator(type_name, types_map):
+    """Find the tag field of a union type.
+
+    Returns (tag field, [(variant, tag value)], None) when every variant has a
+    distinct constant value in the same field, else (None, None, reason).
+    """
+    subtypes = types_map[type_name].get('subtypes', [])
+    reason = 'no discriminator field'
+    for tag in DISCRIMINATOR_FIELDS:
+        values = []
+        for variant in subtypes:
+            field = next((f for f in types_map.get(variant, {}).get('fields', []) if f['name'] == tag), None)
+            value = field_discriminator(field) if field else None
+            if value is None:
+                break
+            values.append((variant, value))
+        else:
+            if len({value for _, value in values}) == len(values):
+                return tag, values, None
+            reason = f"duplicate '{tag}' values"
+    return None, None, reason
 
-def safe_field_name(name):
-    """Return a Rust-safe field name"""
-    keywords = {'type', 'self', 'move', 'use', 'in', 'fn', 'let', 'mut', 'ref', 'where', 'loop', 'if', 'else', 'match', 'return'}
-    if name in keywords:
-        return 'r#' + name
-    return snake_case(name)
+def untagged_unions(spec):
+    """[(union name, reason)] for generated unions that fall back to #[serde(untagged)]."""
+    types_map = spec['types']
+    fallbacks = []
+    for type_name in sorted(types_map.keys()):
+        if type_name in SKIP_TYPES or not types_map[type_name].get('subtypes'):
+            continue
+        tag, _, reason = union_discriminator(type_name, types_map)
+        if tag is None:
+            fallbacks.append((type_name, reason))
+    return fallbacks
 
-def method_fn_name(name):
-    return snake_case(name)
+# ─────────────────────────────────────────────────
+# String enums
+# ─────────────────────────────────────────────────
 
-def method_params_struct(name):
-    return name[0].upper() + name[1:] + 'Params'
+def pascal_case(name):
+    """'bot_command' -> 'BotCommand', 'application/pdf' -> 'ApplicationPdf'."""
+    name = ''.join(part[:1].upper() + part[1:] for part in re.split(r'[^A-Za-z0-9]+', name) if part)
+    return name if name[:1].isalpha() else f'V{name}'
+
+def string_enum_values(type_name, field):
+    """Distinct quoted values a String field's description lists, e.g. '"regular" or "quiz"'."""
+    if field['types'] != ['String'] or (type_name, field['name']) in STRING_ENUM_OPT_OUT:
+        return None
+    values = list(dict.fromkeys(re.findall(r'"([^"]+)"', field.get('description', ''))))
+    variants = [pascal_case(v) for v in values]
+    if len(values) < 2 or len(set(variants)) != len(variants) or 'Other' in variants:
+        return None
+    return values
+
+@memoised
+def string_enums(types_map):
+    """Closed enums for String fields with a fixed set of values.
+
+    Returns ({(type, field): enum name}, {enum name: (values, [(type, field)])}).
+    Fields listing the same values share one enum, named after the first of
+    them in type order (Chat.type and ChatFullInfo.type both use ChatType).
+    """
+    fields = {}
+    enums = {}
+    by_values = {}
+    for type_name in sorted(types_map.keys()):
+        if type_name in SKIP_TYPES:
+            continue
+        for field in types_map[type_name].get('fields', []):
+            values = string_enum_values(type_name, field)
+            if values is None:
+                continue
+            key = tuple(sorted(values))
+            name = by_values.get(key)
+            if name is None:
+                name = type_name + pascal_case(field['name'])
+                if name in types_map or name in enums:
+                    name += 'Value'
+                by_values[key] = name
+                enums[name] = (values, [])
+            enums[name][1].append((type_name, field['name']))
+            fields[(type_name, field['name'])] = name
+    return fields, enums
 
 # ─────────────────────────────────────────────────
-# Type mapping
+# Short arrays and strings
 # ─────────────────────────────────────────────────
+#
+# Arrays that rarely hold more than a few items and strings of a few bytes
+# are typed ShortVec<T, N> and ShortString (tgbotrs/src/small.rs). Those are
+# Vec<T> and String by default; the `small` feature makes them a SmallVec
+# keeping N items inline and a CompactString keeping up to 24 bytes inline,
+# so a typical update allocates less. The serde derives stay the same.
+
+# Items kept inline in arrays of these types.
+SHORT_ARRAY_ITEMS = {
+    'PhotoSize': 4,       # one per available resolution
+    'MessageEntity': 2,
+    'ReactionType': 2,
+    'ReactionCount': 4,
+    'PollOption': 4,
+    'LabeledPrice': 4,
+}
 
-BASE_TYPE_MAP = {
-    'Integer': 'i64',
-    'Float': 'f64',
-    'Boolean': 'bool',
-    'String': 'String',
-    'InputFile': 'InputFile',
+# Inline items for single fields, overriding SHORT_ARRAY_ITEMS (0: plain Vec).
+SHORT_ARRAY_FIELDS = {
+    ("Message", "new_chat_members"): 1,  # one user joining, nearly always
+    ("UsersShared", "users"): 1,         # request_users defaults to one user
 }
 
-def is_array(t):
-    return t.startswith('Array of ')
+# String fields whose description says they hold a short code or identifier.
+SHORT_STRING_PATTERN = re.compile(
+    r'IETF language tag|ISO 4217|ISO 3166-1 alpha-2|[Cc]ustom emoji identifier|identifier of the custom emoji')
 
-def strip_array(t):
-    return t[len('Array of '):]
+# Other short string fields.
+SHORT_STRING_FIELDS = {
+    ("ReactionTypeEmoji", "emoji"),
+}
 
-def tg_to_rust(t, optional, types_map):
-    """Convert a single TG type string to Rust."""
-    if is_array(t):
-        inner = strip_array(t)
-        inner_rust = tg_to_rust(inner, False, types_map)
-        rust = f'Vec<{inner_rust}>'
-        return f'Option<{rust}>' if optional else rust
-
-    base = BASE_TYPE_MAP.get(t, t)
-
-    if optional:
-        # Check if this is a struct or enum that needs boxing to break potential cycles
-        tg = types_map.get(t)
-        if tg and t not in BASE_TYPE_MAP:
-            return f'Option<Box<{base}>>'
-        return f'Option<{base}>'
-    return base
-
-def field_rust_type(field, types_map):
-    """Determine the full Rust type for a field."""
-    types = field['types']
-    required = field['required']
-    name = field['name']
-
-    if len(types) == 0:
-        return 'serde_json::Value'
-
-    if len(types) == 1:
-        return tg_to_rust(types[0], not required, types_map)
-
-    # Multi-type field handling
-    sorted_types = sorted(types)
-    if sorted_types == ['Integer', 'String']:
-        return 'ChatId' if required else 'Option<ChatId>'
-
-    if 'InputFile' in types and 'String' in types and len(types) == 2:
-        return 'InputFileOrString' if required else 'Option<InputFileOrString>'
-
-    if name == 'reply_markup' and len(types) >= 2:
-        return 'ReplyMarkup' if required else 'Option<ReplyMarkup>'
-
-    # media field (InputMedia* types)
-    if name == 'media':
-        if any('InputMedia' in t for t in types) or any('InputPaidMedia' in t for t in types):
-            return 'InputMedia' if required else 'Option<InputMedia>'
-
-    # Default: use first type
-    return tg_to_rust(types[0], not required, types_map)
-
-def opt_wrap(rust_type, optional):
-    """Ensure a type is wrapped in Option if optional."""
-    if optional and not rust_type.startswith('Option<'):
-        return f'Option<{rust_type}>'
-    return rust_type
-
-def return_rust_type(returns, types_map):
-    """Get Rust return type from a list of TG return types."""
-    if not returns:
-        return 'bool'
-    if len(returns) == 1:
-        t = returns[0]
-        return tg_to_rust(t, False, types_map)
-    # Multiple returns: serde_json::Value
-    return 'serde_json::Value'
+def short_array_items(type_name, field):
+    """Items a field's ShortVec keeps inline, or 0 if it is a plain Vec."""
+    if len(field['types']) != 1 or not is_array(field['types'][0]) or is_array(strip_array(field['types'][0])):
+        return 0
+    default = SHORT_ARRAY_ITEMS.get(strip_array(field['types'][0]), 0)
+    return SHORT_ARRAY_FIELDS.get((type_name, field['name']), default)
+
+def is_short_string(type_name, field):
+    return field['types'] == ['String'] and (
+        (type_name, field['name']) in SHORT_STRING_FIELDS
+        or SHORT_STRING_PATTERN.search(field.get('description', '')) is not None)
+
+def short_field_type(type_name, field):
+    """ShortVec/ShortString Rust type of a struct field, or None if it keeps Vec/String."""
+    items = short_array_items(type_name, field)
+    if items:
+        item = strip_array(field['types'][0])
+        rust = f'ShortVec<{BASE_TYPE_MAP.get(item, item)}, {items}>'
+    elif is_short_string(type_name, field):
+        rust = 'ShortString'
+    else:
+        return None
+    return opt_wrap(rust, not field['required'])
+
+# ─────────────────────────────────────────────────
+# Recursive types
+# ─────────────────────────────────────────────────
+
+def type_edges(type_name, types_map):
+    """Yield (target, field name) for every inline reference from a type to another.
+
+    Array fields are left out (a Vec already allocates). The field name is
+    None where the reference cannot be boxed: union variants and the members
+    of hand-crafted enums such as ReplyMarkup.
+    """
+    tg_type = types_map[type_name]
+    for variant in tg_type.get('subtypes', []):
+        yield variant, None
+    for field in tg_type.get('fields', []):
+        types = [t for t in field['types'] if not is_array(t) and t in types_map]
+        if not types:
+            continue
+        rust = field_rust_type(field, types_map, boxed=False)
+        if rust in (types[0], f'Option<{types[0]}>'):
+            yield types[0], field['name']
+        else:
+            for t in types:
+                yield t, None
+
+def find_cycle(graph, order, cut):
+    """First cycle reached by a depth-first search over `order`, as [(owner, target, field)].
+
+    Edges whose (owner, field) is in `cut` are ignored.
+    """
+    done = set()
+    path = []
+    on_path = {}
+
+    def visit(node):
+        on_path[node] = len(path)
+        for target, field in graph.get(node, ()):
+            if (node, field) in cut:
+                continue
+            if target in on_path:
+                return path[on_path[target]:] + [(node, target, field)]
+            if target not in done:
+                path.append((node, target, field))
+                cycle = visit(target)
+                if cycle:
+                    return cycle
+                path.pop()
+        del on_path[node]
+        done.add(node)
+        return None
+
+    for root in order:
+        if root not in done:
+            cycle = visit(root)
+            if cycle:
+                return cycle
+    return None
+
+def strongly_connected(graph):
+    """{node: component index} for the strongly connected components of `graph` (Tarjan)."""
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    component = {}
+
+    def visit(node):
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        for target, _ in graph.get(node, ()):
+            if target not in graph:
+                continue
+            if target not in index:
+                visit(target)
+                low[node] = min(low[node], low[target])
+            elif target in on_stack:
+                low[node] = min(low[node], index[target])
+        if low[node] == index[node]:
+            n = len(set(component.values()))
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component[member] = n
+                if member == node:
+                    break
+
+    for node in sorted(graph):
+        if node not in index:
+            visit(node)
+    return component
+
+@memoised
+def recursive_holders(graph):
+    """{(type, field): reason} for the fields holding a recursive type from outside its cycle.
+
+    The recursive types are the large hubs (Message and the types around it),
+    so boxing a field that only points into a cycle is not needed to make the
+    types representable but keeps their holders small: Update holds several
+    of them, and inline they would make it too big for a thread's stack.
+    Fields inside a cycle are left to the cycle breaking in boxed_fields.
+    """
+    component = strongly_connected(graph)
+    sizes = {}
+    for n in component.values():
+        sizes[n] = sizes.get(n, 0) + 1
+    recursive = {name for name, n in component.items()
+                 if sizes[n] > 1 or any(t == name for t, _ in graph[name])}
+    holders = {}
+    for owner in sorted(graph):
+        for target, field in graph[owner]:
+            if (field is not None and target in recursive
+                    and component.get(owner) != component[target]):
+                holders[(owner, field)] = f'holds recursive {target}'
+    return holders
+
+def boxed_fields(types_map, budget=SIZE_BUDGET):
+    """{(type, field): reason} for the struct fields that must be boxed.
+
+    A struct can only hold another by value if the two are not mutually
+    recursive, so each cycle in the type graph is broken by boxing one field
+    on it: the one closing the cycle when it is a field, else the nearest
+    field before it. The search starts from the most referenced types, so
+    cycles are cut on the edges pointing back into them (Message.reply_to_message,
+    *.checklist_message, ...) and the result is stable across spec updates.
+
+    Fields holding a recursive type from outside its cycle are boxed too
+    (see recursive_holders), so every field typed as a recursive type is a
+    Box and the hubs are never copied inline into the structs around them.
+
+    With a size `budget` in bytes, cold fields of larger structs are boxed
+    as well (see type_layouts).
+    """
+    graph = {name: list(type_edges(name, types_map))
+             for name in types_map if name not in SKIP_TYPES}
+    in_degree = {name: 0 for name in graph}
+    for edges in graph.values():
+        for target, _ in edges:
+            if target in in_degree:
+                in_degree[target] += 1
+    order = sorted(graph, key=lambda name: (-in_degree[name], name))
+
+    boxed = {}
+    while True:
+        cycle = find_cycle(graph, order, boxed)
+        if cycle is None:
+            break
+        for owner, _, field in reversed(cycle):
+            if field is not None:
+                path = [owner for owner, _, _ in cycle] + [cycle[0][0]]
+                boxed[(owner, field)] = 'cycle ' + ' → '.join(path)
+                break
+        else:
+            names = ' → '.join(owner for owner, _, _ in cycle)
+            sys.exit(f'error: type cycle without a boxable field: {names}')
+
+    boxed.update(recursive_holders(graph))
+    if budget is not None:
+        boxed.update(type_layouts(types_map, boxed, budget)[1])
+    return boxed
+
+# ─────────────────────────────────────────────────
+# Struct layout
+# ─────────────────────────────────────────────────
+#
+# An estimate of std::mem::size_of for every generated type on a 64-bit
+# target, following rustc's layout rules: struct fields are reordered so only
+# the end is padded, and an enum (Option included) is its largest variant
+# with the tag stored in a niche of it (bool, String, Vec, Box, another tag)
+# when the other variants fit beside the niche, else with a tag in front.
+# Layouts are (size, align, free niche values) tuples.
+
+# Niche values of a String/Vec capacity (anything above isize::MAX).
+WIDE_NICHE = 2 ** 63
+
+SCALAR_LAYOUTS = {
+    'i64': (8, 8, 0),
+    'f64': (8, 8, 0),
+    'bool': (1, 1, 254),
+    'String': (24, 8, WIDE_NICHE),
+    'ShortString': (24, 8, WIDE_NICHE),
+    'Bytes': (32, 8, 1),
+    'serde_json::Value': (32, 8, 250),
+}
+
+# Variants of the hand-written enums, as the types each one holds.
+HAND_CRAFTED_VARIANTS = {
+    'ChatId': [['i64'], ['String']],
+    'InputFile': [['String'], ['String'], ['String', 'Bytes']],
+    'InputFileOrString': [['InputFile'], ['String']],
+    'ReplyMarkup': [['InlineKeyboardMarkup'], ['ReplyKeyboardMarkup'], ['ReplyKeyboardRemove'], ['ForceReply']],
+    'InputMedia': [['InputMediaPhoto'], ['InputMediaVideo'], ['InputMediaAudio'],
+                   ['InputMediaDocument'], ['InputMediaAnimation']],
+}
+
+def round_up(n, align):
+    return -(-n // align) * align
+
+def struct_layout(fields):
+    """Layout of a struct holding fields of the given layouts."""
+    align = max((a for _, a, _ in fields), default=1)
+    return round_up(sum(s for s, _, _ in fields), align), align, max((n for _, _, n in fields), default=0)
+
+def enum_layout(variants):
+    """Layout of an enum whose variants hold fields of the given layouts."""
+    payloads = [struct_layout(fields) for fields in variants]
+    align = max(a for _, a, _ in payloads)
+    largest = max(range(len(payloads)), key=lambda i: payloads[i][0])
+    size, _, niche = payloads[largest]
+    others = [s for i, (s, _, _) in enumerate(payloads) if i != largest]
+    # The niche is at most a word wide; the other variants go in the rest.
+    if niche >= len(others) and all(s <= size - 8 or s == 0 for s in others):
+        return size, align, niche - len(others)
+    return round_up(max(round_up(1, a) + s for s, a, _ in payloads), align), align, 256 - len(payloads)
+
+def rust_layout(rust, named):
+    """Layout of a Rust field type; `named` gives the layout of a type name."""
+    m = re.fullmatch(r'(Option|Box|Vec|ShortVec)<(.*)>', rust)
+    if m is None:
+        return named(rust)
+    kind, inner = m.groups()
+    if kind == 'Box':
+        return 8, 8, 1
+    if kind in ('Vec', 'ShortVec'):
+        return SCALAR_LAYOUTS['String']
+    return enum_layout([[], [rust_layout(inner, named)]])
+
+def type_layouts(types_map, boxed, budget=None):
+    """({name: layout} of every type fields use, {(type, field): reason} to box).
+
+    With a `budget` in bytes, a struct larger than it gets its biggest
+    optional by-value struct fields boxed, one at a time, until it fits; the
+    second result lists those cold fields.
+    """
+    enum_fields, enums = string_enums(types_map)
+    layouts = dict(SCALAR_LAYOUTS)
+    for name, (values, _) in enums.items():
+        layouts[name] = enum_layout([[] for _ in values] + [[SCALAR_LAYOUTS['String']]])
+    by_owner = {}
+    for (owner, field), name in enum_fields.items():
+        by_owner.setdefault(owner, {})[field] = name
+    boxed = set(boxed)
+    cold = {}
+
+    def named(name):
+        if name in layouts:
+            return layouts[name]
+        if name in HAND_CRAFTED_VARIANTS:
+            layout = enum_layout([[rust_layout(t, named) for t in ts] for ts in HAND_CRAFTED_VARIANTS[name]])
+        elif types_map[name].get('subtypes'):
+            layout = enum_layout([[named(v)] for v in types_map[name]['subtypes']])
+        else:
+            layout = struct_layout_of(name)
+        layouts[name] = layout
+        return layout
+
+    def struct_layout_of(name):
+        tg_type = types_map[name]
+        while True:
+            own = {field for owner, field in boxed if owner == name}
+            fields = [(field, rust_layout(ftype, named), ftype)
+                      for field, _, ftype in struct_fields(tg_type, types_map, own, by_owner.get(name))]
+            layout = struct_layout([l for _, l, _ in fields])
+            if budget is None or layout[0] <= budget:
+                return layout
+            candidates = [(l[0], f['name']) for f, l, ftype in fields
+                          if re.fullmatch(r'Option<(\w+)>', ftype)
+                          and ftype[7:-1] in types_map and l[0] > 8]
+            if not candidates:
+                return layout
+            size, field = max(candidates)
+            boxed.add((name, field))
+            cold[(name, field)] = f'cold, {size} bytes ({name} is {layout[0]}, budget {budget})'
+
+    for name in sorted(types_map):
+        if name not in SKIP_TYPES:
+            named(name)
+    for name in HAND_CRAFTED_VARIANTS:
+        named(name)
+    return layouts, cold
+
+@memoised
+def resolved_layouts(types_map, budget=SIZE_BUDGET):
+    """type_layouts of the types as boxed_fields(types_map, budget) boxes them."""
+    return type_layouts(types_map, boxed_fields(types_map, budget))
+
+def layout_report(types_map, layouts, boxed):
+    """Lines of a report listing every generated type by estimated size, largest first."""
+    enum_fields, _ = string_enums(types_map)
+    lines = [f"{'Type':<40} {'Size':>7} {'Align':>5}  Largest fields"]
+    named = layouts.__getitem__
+    for name in sorted(layouts, key=lambda n: (-layouts[n][0], n)):
+        if name not in types_map or name in SKIP_TYPES:
+            continue
+        size, align, _ = layouts[name]
+        tg_type = types_map[name]
+        if tg_type.get('subtypes'):
+            parts = [(layouts[v][0], v) for v in tg_type['subtypes']]
+        else:
+            own = {field for owner, field in boxed if owner == name}
+            enums = {field: e for (owner, field), e in enum_fields.items() if owner == name}
+            parts = [(rust_layout(ftype, named)[0], field['name'])
+                     for field, _, ftype in struct_fields(tg_type, types_map, own, enums)]
+        largest = ', '.join(f'{part} {n}' for n, part in sorted(parts, reverse=True)[:3])
+        lines.append(f'{name:<40} {size:>7} {align:>5}  {largest}')
+    return lines
+
+def emit_layout_tests(sizes):
+    """Yield a 64-bit-only test asserting the estimated size of each type in [(name, size)].
+
+    The estimates assume the default field types, so the test is left out
+    with the `small` feature.
+    """
+    yield '#[cfg(all(test, target_pointer_width = "64", not(feature = "small")))]'
+    yield 'mod layout_tests {'
+    yield '    use super::*;'
+    yield ''
+    yield '    macro_rules! assert_sizes {'
+    yield '        ($($t:ty => $size:expr,)*) => {'
+    yield '            $(assert_eq!(std::mem::size_of::<$t>(), $size, stringify!($t));)*'
+    yield '        };'
+    yield '    }'
+    yield ''
+    yield '    /// Sizes codegen.py estimated (see type_layouts); a failure means the model is off.'
+    yield '    #[test]'
+    yield '    fn sizes_match_codegen() {'
+    yield '        assert_sizes! {'
+    for name, size in sizes:
+        yield f'            {name} => {size},'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+
+# ─────────────────────────────────────────────────
+# Intermediate representation (--emit-ir)
+# ─────────────────────────────────────────────────
+#
+# Everything the type and method emitters resolve from the spec (Rust names
+# and types, boxing, serde renames, union discriminators, string enums, field
+# order, size estimates) as plain records in output order. type_items and
+# method_items render these records, and so does the Rust generator in
+# codegen/src/main.rs, from the file --emit-ir writes:
+#
+#     tgbotrs-ir/<IR_VERSION> sha256:<digest of the rest>\n<compact JSON>
+#
+# Bump IR_VERSION whenever a record changes shape or meaning. Hot struct records carry
+# the JSON samples of their Deserialize test and the Update record its update
+# kinds, so the records hold everything gen_types.rs and gen_methods.rs are
+# rendered from; .github/scripts/check_ir_parity.py checks that the Rust
+# generator's output, once formatted, is what codegen.py writes.
+
+IR_VERSION = 3
+
+IR_MAGIC = 'tgbotrs-ir'
+
+def ir_field(field, fname, ftype, boxed=None):
+    """IR record of a struct field or method parameter."""
+    record = {
+        'json': field['name'],
+        'rust': fname,
+        'type': ftype,
+        'doc': field['description'].replace('\n', ' '),
+        'rename': fname != field['name'],
+        'optional': ftype.startswith('Option<'),
+    }
+    if boxed:
+        record['boxed'] = boxed
+    return record
+
+def ir_enum(enum_name, values, users):
+    """IR record of a closed string enum (see string_enums)."""
+    return {
+        'name': enum_name,
+        'values': [[value, pascal_case(value)] for value in values],
+        'users': [[owner, field] for owner, field in users],
+    }
+
+def ir_type(type_name, tg_type, types_map, boxed=None, enum_fields=None, enums=(), hot=False, size=None):
+    """IR record of a generated type.
+
+    `boxed` maps the struct's boxed fields to the reason (see boxed_fields),
+    `enum_fields` its fields to their string enum, and `enums` lists the
+    (name, (values, users)) string enums emitted after it. A `hot` struct's
+    record also holds the module and JSON samples of its Deserialize test,
+    and the Update record the (field, variant, Rust field) of each update kind.
+    """
+    boxed = boxed or {}
+    record = {
+        'name': type_name,
+        'doc': tg_type.get('description', []),
+        'href': tg_type.get('href', ''),
+    }
+    subtypes = tg_type.get('subtypes', [])
+    if subtypes:
+        tag, tag_values, reason = union_discriminator(type_name, types_map)
+        record['kind'] = 'union'
+        record['derive'] = 'Debug, Clone, Serialize, PartialEq'
+        record['variants'] = subtypes
+        record['tag'] = tag
+        record['tag_values'] = [[variant, value] for variant, value in tag_values or ()]
+        if reason is not None:
+            record['untagged'] = reason
+    else:
+        fields = [ir_field(field, fname, ftype, boxed.get(field['name']))
+                  for field, fname, ftype in struct_fields(tg_type, types_map, boxed, enum_fields)]
+        record['kind'] = 'struct'
+        if not fields:
+            record['derive'] = 'Debug, Clone, Serialize, Deserialize, PartialEq, Default'
+        elif hot:
+            record['derive'] = 'Debug, Clone, Serialize, PartialEq'
+        else:
+            record['derive'] = 'Debug, Clone, Serialize, Deserialize, PartialEq'
+        record['fields'] = fields
+        record['hot'] = hot
+        if hot:
+            record['test_module'] = f'{snake_case(type_name)}_deserialize_tests'
+            record['samples'] = deserialize_samples(type_name, types_map, fields)
+        if type_name == UPDATE_TYPE:
+            record['update_kinds'] = [[name, variant, safe_field_name(name)]
+                                      for name, variant in update_kinds(tg_type)]
+    record['enums'] = [ir_enum(name, values, users) for name, (values, users) in enums]
+    record['size'] = size
+    return record
+
+def type_records(spec, shard=None, hot=HOT_TYPES, keep=None, budget=SIZE_BUDGET):
+    """Yield (spec entry, IR record) for every generated type, in output order.
+
+    `shard`, `hot`, `keep` and `budget` are as for type_items. The spec entry
+    is what the record depends on, for the item cache.
+    """
+    types_map = spec['types']
+    cycles = boxed_fields(types_map, budget)
+    layouts, _ = resolved_layouts(types_map, budget)
+    enum_fields, enums = string_enums(types_map)
+    for type_name in sorted(types_map.keys()):
+        if shard is not None and shard_of(type_name) != shard:
+            continue
+        # Skip types that are hand-crafted in the library (not auto-generated).
+        # Add new hand-crafted types to SKIP_TYPES above AND to HAND_CRAFTED_TYPES
+        # in .github/scripts/validate_generated.py.
+        if type_name in SKIP_TYPES or (keep is not None and type_name not in keep):
+            continue
+        tg_type = types_map[type_name]
+        boxed = {field: reason for (owner, field), reason in sorted(cycles.items()) if owner == type_name}
+        fields = {field: name for (owner, field), name in enum_fields.items() if owner == type_name}
+        # String enums are emitted after the first (generated) type that uses them.
+        owned = [(name, enums[name]) for name in sorted(enums)
+                 if next((owner for owner, _ in enums[name][1] if keep is None or owner in keep), None) == type_name]
+        # A union's output also depends on its variants' tag fields, and a
+        # struct's on which of its fields the cycle analysis boxed and which
+        # enums it uses or defines.
+        entry = [tg_type, sorted(boxed), fields, owned] + [types_map.get(v) for v in tg_type.get('subtypes', [])]
+        is_hot = type_name in hot and bool(tg_type.get('fields')) and not tg_type.get('subtypes')
+        if is_hot:
+            # The generated test samples every type the struct refers to.
+            entry += ['hot', digest(types_map)]
+        yield entry, ir_type(type_name, tg_type, types_map, boxed, fields, owned, is_hot, layouts[type_name][0])
+
+def ir_method(method_name, method, types_map):
+    """IR record of a method: its arguments, optional params and return type."""
+    args = []
+    options = []
+    for field in method.get('fields', []):
+        fname = safe_field_name(field['name'])
+        ftype = field_rust_type(field, types_map)
+        if field['required']:
+            record = ir_field(field, fname, ftype)
+            record['into'] = ftype in INTO_ARG_TYPES
+            args.append(record)
+        else:
+            # Ensure it's wrapped in Option
+            record = ir_field(field, fname, opt_wrap(ftype, True))
+            record['inner'] = record['type'][len('Option<'):-1]
+            options.append(record)
+    return {
+        'name': method_name,
+        'fn': method_fn_name(method_name),
+        'params': method_params_struct(method_name),
+        'doc': method.get('description', []),
+        'href': method.get('href', ''),
+        'returns': return_rust_type(method.get('returns', []), types_map),
+        'args': args,
+        'options': options,
+    }
+
+def resolve_spec(spec, budget=SIZE_BUDGET, borrowed=False):
+    """Run the spec-wide analyses that items share (all memoised) up front."""
+    types_map = spec['types']
+    boxed_fields(types_map, budget)
+    string_enums(types_map)
+    resolved_layouts(types_map, budget)
+    for type_name, tg_type in types_map.items():
+        if tg_type.get('subtypes'):
+            union_discriminator(type_name, types_map)
+    if borrowed:
+        borrowed_types(types_map)
+
+def method_records(spec, shard=None, keep=None):
+    """Yield (spec entry, IR record) for every method, in output order (see method_items)."""
+    types_map = spec['types']
+    methods_map = spec['methods']
+    for method_name in sorted(methods_map.keys()):
+        if shard is not None and shard_of(method_name) != shard:
+            continue
+        if keep is not None and method_name not in keep:
+            continue
+        method = methods_map[method_name]
+        yield method, ir_method(method_name, method, types_map)
+
+def build_ir(spec, hot=HOT_TYPES, lean=None, budget=SIZE_BUDGET):
+    """The IR of the unsharded gen_types.rs and gen_methods.rs (see output_plan for the arguments)."""
+    keep_types, keep_methods = lean or (None, None)
+    return {
+        'spec': {'version': spec['version'], 'release_date': spec.get('release_date', '')},
+        'types': [record for _, record in type_records(spec, hot=hot, keep=keep_types, budget=budget)],
+        'methods': [record for _, record in method_records(spec, keep=keep_methods)],
+    }
+
+def encode_ir(ir):
+    body = json.dumps(ir, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+    header = f'{IR_MAGIC}/{IR_VERSION} sha256:{hashlib.sha256(body).hexdigest()}\n'.encode()
+    return header + body
+
+def write_ir(ir, path):
+    data = encode_ir(ir)
+    Path(path).write_bytes(data)
+    return len(data)
+
+def read_ir(path):
+    """The IR in a file written by --emit-ir; exits if it is for another IR_VERSION or corrupt."""
+    data = Path(path).read_bytes()
+    header, _, body = data.partition(b'\n')
+    magic, _, rest = header.decode('ascii', 'replace').partition('/')
+    version, _, checksum = rest.partition(' sha256:')
+    if magic != IR_MAGIC:
+        sys.exit(f'error: {path} is not a tgbotrs IR file')
+    if version != str(IR_VERSION):
+        sys.exit(f'error: {path} is IR version {version}, this codegen.py reads version {IR_VERSION}')
+    if hashlib.sha256(body).hexdigest() != checksum:
+        sys.exit(f'error: {path} does not match its content hash')
+    return json.loads(body)
 
 # ─────────────────────────────────────────────────
 # Docs helpers
@@ -156,15 +881,253 @@ def return_rust_type(returns, types_map):
 def doc_comment(lines, indent=''):
     return '\n'.join(f'{indent}/// {line}' for line in lines)
 
+# ─────────────────────────────────────────────────
+# Layout
+# ─────────────────────────────────────────────────
+#
+# The emitters lay their code out the way rustfmt (default configuration)
+# does, so --no-fmt output is already `cargo fmt` clean and rustfmt leaves
+# every item as generated. These helpers cover the constructs whose layout
+# depends on the length of the names in them: fn signatures, arrays, match
+# arms, method chains and calls. The widths are rustfmt's defaults.
+
+MAX_WIDTH = 100        # max_width
+TAB_SPACES = 4         # tab_spaces
+CHAIN_WIDTH = 60       # chain_width
+FN_CALL_WIDTH = 60     # fn_call_width
+ARRAY_WIDTH = 60       # array_width
+ATTR_WIDTH = 70        # attr_fn_like_width
+STRUCT_LIT_WIDTH = 18  # struct_lit_width
+SHORT_ITEM_WIDTH = 10  # short_array_element_width_threshold
+
+CLOSURE_RE = re.compile(r'(\|\w*\| |\|\| )(.*)')
+
+def fits(indent, text):
+    return indent + len(text) <= MAX_WIDTH
+
+def fn_lines(indent, head, params, tail):
+    """`head(params)tail`, a fn signature; one param per line if it does not fit."""
+    pad = ' ' * indent
+    line = f'{pad}{head}({", ".join(params)}){tail}'
+    if len(line) <= MAX_WIDTH or not params:
+        return [line]
+    return [f'{pad}{head}('] + [f'{pad}    {param},' for param in params] + [f'{pad}){tail}']
+
+def array_lines(indent, head, items, tail):
+    """`head` + `items` + `tail`, an array literal: on one line, packed or one item per line."""
+    pad = ' ' * indent
+    joined = ', '.join(items)
+    if len(joined) <= ARRAY_WIDTH and fits(indent, f'{head}{joined}{tail}'):
+        return [f'{pad}{head}{joined}{tail}']
+    lines = [pad + head]
+    if all(len(item) <= SHORT_ITEM_WIDTH for item in items):
+        line = ''
+        for item in items:
+            if line and not fits(indent + 4, f'{line} {item},'):
+                lines.append(f'{pad}    {line}')
+                line = ''
+            line = f'{line} {item},' if line else f'{item},'
+        lines.append(f'{pad}    {line}')
+    else:
+        lines += [f'{pad}    {item},' for item in items]
+    return lines + [pad + tail]
+
+def attr_lines(indent, name, args):
+    """`#[name(args)]`, one arg per line if it does not fit."""
+    pad = ' ' * indent
+    joined = ', '.join(args)
+    if len(joined) <= ATTR_WIDTH and fits(indent, f'#[{name}({joined})]'):
+        return [f'{pad}#[{name}({joined})]']
+    return [f'{pad}#[{name}('] + [f'{pad}    {arg},' for arg in args[:-1]] + \
+        [f'{pad}    {args[-1]}', f'{pad})]']
+
+def let_lines(indent, head, value):
+    """`head = value;`, the value on the next line if it does not fit."""
+    pad = ' ' * indent
+    if fits(indent, f'{head} = {value};'):
+        return [f'{pad}{head} = {value};']
+    if fits(indent, f'{head} ='):
+        return [f'{pad}{head} =', f'{pad}    {value};']
+    # Not even the type fits: its generic argument goes on a line of its own.
+    outer, _, inner = head.partition('<')
+    return [f'{pad}{outer}<', f'{pad}    {inner[:-1]},', f'{pad}> = {value};']
+
+def arm_lines(indent, pattern, callee, arg):
+    """`pattern => callee(arg),`, a match arm; `callee` is a path or `receiver.method`."""
+    pad = ' ' * indent
+    body = f'{callee}({arg})'
+    if fits(indent, f'{pattern} => {body},'):
+        return [f'{pad}{pattern} => {body},']
+    if fits(indent + 4, body):
+        return [f'{pad}{pattern} => {{', f'{pad}    {body}', f'{pad}}}']
+    receiver, dot, method = callee.rpartition('.')
+    if dot and fits(indent + 4, f'.{method}({arg}),'):
+        return [f'{pad}{pattern} => {receiver}', f'{pad}    .{method}({arg}),']
+    broken = [f'{callee}(', f'    {arg},', ')']
+    if dot or fits(indent, f'{pattern} => {broken[0]}'):
+        return [f'{pad}{pattern} => {broken[0]}', pad + broken[1], f'{pad}{broken[2]},']
+    return [f'{pad}{pattern} => {{'] + [f'{pad}    {line}' for line in broken] + [f'{pad}}}']
+
+def split_top(text, sep):
+    """Indices of `sep` in `text` outside brackets."""
+    depth = 0
+    for i, c in enumerate(text):
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == sep and depth == 0:
+            yield i
+
+def split_args(args):
+    """Top-level comma-separated parts of an argument list."""
+    cuts = [-1] + list(split_top(args, ',')) + [len(args)]
+    return [args[a + 1:b].strip() for a, b in zip(cuts, cuts[1:])]
+
+def chain_parts(expr):
+    """`expr` split before each top-level `.`: ['self', '.x', '.map(...)']."""
+    cuts = [0] + list(split_top(expr, '.')) + [len(expr)]
+    return [expr[a:b] for a, b in zip(cuts, cuts[1:]) if b > a]
+
+def call_parts(text):
+    """(head, args, tail) of a call `head(args)tail`, `tail` only `?`s; None for anything else."""
+    start = text.find('(')
+    if start < 0 or '.' in text[1:start]:
+        return None
+    depth = 0
+    for end in range(start, len(text)):
+        depth += {'(': 1, '[': 1, '{': 1, ')': -1, ']': -1, '}': -1}.get(text[end], 0)
+        if depth == 0:
+            break
+    if text[end + 1:].strip('?'):
+        return None
+    return text[:start], text[start + 1:end], text[end + 1:]
+
+def call_spans(text):
+    """(open, close) positions of the parentheses of every call in `text`."""
+    stack = []
+    for i, c in enumerate(text):
+        if c == '(':
+            stack.append(i)
+        elif c == ')':
+            start = stack.pop()
+            if start and (text[start - 1].isalnum() or text[start - 1] in '_>'):
+                yield start, i
+
+def one_line(text, width):
+    """True if rustfmt keeps `text` on one line: it fits, and no call but one ending in a closure
+    has over FN_CALL_WIDTH of arguments."""
+    return len(text) <= width and all(close - start - 1 <= FN_CALL_WIDTH
+                                      or CLOSURE_RE.fullmatch(text[start + 1:close])
+                                      for start, close in call_spans(text))
+
+def expr_lines(text, indent, width, broken=False):
+    """Lines of a call expression whose first line has `width` columns, or None if it cannot fit.
+
+    Later lines are indented from `indent`. A last closure argument gets a
+    block body, a single call argument is overflowed onto the caller's line
+    and other arguments go on their own lines. With `broken`, a call that
+    would fit on one line is broken anyway.
+    """
+    if not broken and one_line(text, width):
+        return [text]
+    parts = call_parts(text)
+    if parts is None:
+        return None
+    head, args, tail = parts
+    args = split_args(args)
+    pad = ' ' * indent
+    first = f'{head}(' + ''.join(f'{arg}, ' for arg in args[:-1])
+    closure = CLOSURE_RE.fullmatch(args[-1])
+    # rustfmt keeps a few columns in reserve before it overflows a closure into a block.
+    reserve = 3 if len(args) == 1 else 0
+    if closure and len(first) + len(closure[1]) + 1 <= width - reserve - len(tail):
+        body = expr_lines(closure[2], indent + 4, MAX_WIDTH - indent - 4)
+        if body is not None:
+            return [f'{first}{closure[1]}{{', f'{pad}    {body[0]}'] + body[1:] + [f'{pad}}}){tail}']
+    if len(args) == 1 and call_parts(args[0]) is not None:
+        inner = expr_lines(args[0], indent, width - len(head) - 2 - len(tail), broken=True)
+        if inner is not None:
+            return [f'{head}({inner[0]}'] + inner[1:-1] + [f'{inner[-1]}){tail}']
+    if len(head) + 1 > width + len(tail):
+        return None
+    lines = [f'{head}(']
+    for arg in args:
+        arg_lines = closure_lines(arg, indent + 4, MAX_WIDTH - indent - 5)
+        if arg_lines is None:
+            return None
+        lines += [f'{pad}    {arg_lines[0]}'] + arg_lines[1:]
+        lines[-1] += ','
+    return lines + [f'{pad}){tail}']
+
+def closure_lines(arg, indent, width):
+    """Like expr_lines, for an argument that may be a closure."""
+    closure = CLOSURE_RE.fullmatch(arg)
+    if closure is None or one_line(arg, width):
+        return expr_lines(arg, indent, width)
+    pad = ' ' * indent
+    body = expr_lines(closure[2], indent + 4, MAX_WIDTH - indent - 4)
+    if body is None:
+        return None
+    return [f'{closure[1]}{{', f'{pad}    {body[0]}'] + body[1:] + [f'{pad}}}']
+
+def chain_lines(indent, prefix, expr, suffix):
+    """`prefix` + `expr` + `suffix` where `expr` is a method chain or a call."""
+    pad = ' ' * indent
+    width = MAX_WIDTH - indent - len(prefix) - len(suffix)
+    elements = chain_parts(expr)
+    if len(elements) == 1:
+        lines = expr_lines(expr, indent, width) or [expr]
+        lines[0] = pad + prefix + lines[0]
+        lines[-1] += suffix
+        return lines
+    *head, last = elements
+    head = ''.join(head)
+    tries = len(last) - len(last.rstrip('?'))
+    almost_total = len(head) + tries
+    budget = (width if len(elements) == 2 else min(width, CHAIN_WIDTH)) - almost_total
+    own_width = MAX_WIDTH - indent - 4 - len(suffix) - tries
+    if budget > 0:
+        overflowed = expr_lines(last, indent, width - tries - almost_total)
+        if overflowed:
+            own_line = expr_lines(last, indent + 4, own_width)
+            if len(overflowed[0]) <= budget and (len(overflowed) >= 5 or not own_line
+                                                 or len(own_line) >= len(overflowed)):
+                lines = [pad + prefix + head + overflowed[0]] + overflowed[1:]
+                lines[-1] += suffix
+                return lines
+    # Children go on their own lines, except those joined to a root no wider than a tab.
+    root, *rest = elements
+    while rest and len(root) <= TAB_SPACES - len(prefix):
+        root += rest.pop(0)
+    if not rest:
+        return chain_lines(indent, prefix, root, suffix)
+    lines = [pad + prefix + root] + [f'{pad}    {part}' for part in rest[:-1]]
+    last_lines = expr_lines(rest[-1], indent + 4, own_width) or [rest[-1]]
+    lines += [f'{pad}    {last_lines[0]}'] + last_lines[1:]
+    lines[-1] += suffix
+    return lines
+
+def field_lines(indent, name, expr):
+    """`name: expr,`, a struct literal field; the value on the next line if it does not fit after the name."""
+    lines = chain_lines(indent, f'{name}: ', expr, ',')
+    # A broken chain must leave room for the comma on its first line too.
+    if all(len(line) <= MAX_WIDTH for line in lines) and (len(lines) == 1 or len(lines[0]) < MAX_WIDTH):
+        return lines
+    return [f"{' ' * indent}{name}:"] + chain_lines(indent + 4, '', expr, ',')
+
+def return_lines(indent, expr):
+    """`return expr;`, which rustfmt gives one column less than other statements."""
+    lines = chain_lines(indent, 'return ', expr, ';;')
+    lines[-1] = lines[-1][:-1]
+    return lines
+
 # ─────────────────────────────────────────────────
 # Generate types
 # ─────────────────────────────────────────────────
 
-def generate_types(spec):
-    types_map = spec['types']
-    version = spec['version']
+def types_header(version, sharded=False):
     lines = []
-
     lines.append(f'// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.')
     lines.append(f'// Generated from Telegram Bot API {version}')
     lines.append(f'// Spec:    https://github.com/ankit-chaubey/api-spec')
@@ -175,73 +1138,635 @@ def generate_types(spec):
     lines.append(f'')
     lines.append(f'#![allow(clippy::all, dead_code, unused_imports)]')
     lines.append(f'')
+    if sharded:
+        lines.append(f'use super::*;')
     lines.append(f'use serde::{{Deserialize, Serialize}};')
+    lines.append(f'use serde_json::value::RawValue;')
+    lines.append(f'use std::borrow::Cow;')
     lines.append(f'#[rustfmt::skip]')
-    lines.append(f'use crate::{{ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia}};')
+    lines.append(f'use crate::{{ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia, ShortString, ShortVec}};')
     lines.append(f'')
+    lines += borrow_opt_str_lines()
+    return '\n'.join(lines)
 
-    for type_name in sorted(types_map.keys()):
-        # Skip types that are hand-crafted in the library (not auto-generated).
-        # Add new hand-crafted types to SKIP_TYPES above AND to HAND_CRAFTED_TYPES
-        # in .github/scripts/validate_generated.py.
-        if type_name in SKIP_TYPES:
+def borrow_opt_str_lines():
+    """The borrow_opt_str helper the union Tag structs read their tag with."""
+    lines = []
+    lines.append(f'/// `Option<Cow<str>>` that borrows from the input like a bare `#[serde(borrow)] Cow<str>` does.')
+    lines.append(f"fn borrow_opt_str<'de: 'a, 'a, D: serde::Deserializer<'de>>(")
+    lines.append(f'    deserializer: D,')
+    lines.append(f") -> Result<Option<Cow<'a, str>>, D::Error> {{")
+    lines.append(f'    #[derive(Deserialize)]')
+    lines.append(f"    struct Str<'a>(#[serde(borrow)] Cow<'a, str>);")
+    lines.append(f'    Ok(Option::<Str>::deserialize(deserializer)?.map(|s| s.0))')
+    lines.append(f'}}')
+    lines.append(f'')
+    return lines
+
+def emit_type(record):
+    """Yield the (unformatted) Rust source lines of a type's IR record (see ir_type).
+
+    A hot struct's Deserialize impl is not included (see emit_type_item).
+    """
+    yield doc_comment(record['doc'])
+    yield f"/// {record['href']}"
+    yield f"#[derive({record['derive']})]"
+    type_name = record['name']
+
+    if record['kind'] == 'union':
+        # Union / enum type. Variants carry their own tag field, so they
+        # serialise as themselves (untagged).
+        yield '#[serde(untagged)]'
+        yield f'pub enum {type_name} {{'
+        for variant in record['variants']:
+            yield f'    {variant}({variant}),'
+        yield '}'
+        yield ''
+        yield from emit_union_deserialize(type_name, record['tag'], record['tag_values'], record['variants'])
+    elif not record['fields']:
+        # Empty marker struct
+        yield f'pub struct {type_name} {{}}'
+        yield ''
+    else:
+        # Regular struct
+        yield f'pub struct {type_name} {{'
+        for field in record['fields']:
+            yield f"    /// {field['doc']}"
+            # serde rename if the field name differs or is a keyword
+            if field['rename']:
+                rename_attr = '#[serde(rename = "' + field['json'] + '")]'
+                yield f'    {rename_attr}'
+            if field['optional']:
+                yield f'    #[serde(skip_serializing_if = "Option::is_none")]'
+            yield f"    pub {field['rust']}: {field['type']},"
+        yield '}'
+        yield ''
+
+def struct_fields(tg_type, types_map, boxed=(), enum_fields=None):
+    """Yield (spec field, Rust name, Rust type) for every field of a struct."""
+    enum_fields = enum_fields or {}
+    for field in tg_type.get('fields', []):
+        if field['name'] in enum_fields:
+            ftype = opt_wrap(enum_fields[field['name']], not field['required'])
+        else:
+            ftype = (short_field_type(tg_type['name'], field)
+                     or field_rust_type(field, types_map, field['name'] in boxed))
+        yield field, safe_field_name(field['name']), ftype
+
+def emit_union_deserialize(type_name, tag, tag_values, variants):
+    """Yield a Deserialize impl for a union (see union_deserialize_lines)."""
+    yield f"impl<'de> Deserialize<'de> for {type_name} {{"
+    yield f"    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield f'        use serde::de::Error;'
+    yield f'        let raw = Box::<RawValue>::deserialize(deserializer)?;'
+    yield from union_deserialize_lines(type_name, tag, tag_values, variants)
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+
+def union_deserialize_lines(type_name, tag, tag_values, variants):
+    """Body of a union's Deserialize impl, decoding the object captured in `raw`.
+
+    The object is kept as raw JSON. When the spec gives every variant a
+    distinct constant tag, only the tag is read from it (borrowed) and the
+    matching variant decoded; otherwise each variant is tried in turn.
+    """
+    if tag is None:
+        for variant in variants:
+            yield f'        if let Ok(v) = serde_json::from_str(raw.get()) {{'
+            yield f'            return Ok(Self::{variant}(v));'
+            yield f'        }}'
+        message = f'data did not match any variant of untagged enum {type_name}'
+        yield from chain_lines(8, '', f'Err(D::Error::custom("{message}"))', '')
+        return
+    yield from array_lines(8, 'const TAGS: &[&str] = &[', [f'"{value}"' for _, value in tag_values], '];')
+    yield f'        #[derive(Deserialize)]'
+    yield f"        struct Tag<'a> {{"
+    yield from attr_lines(12, 'serde', [f'rename = "{tag}"', 'borrow', 'default',
+                                        'deserialize_with = "borrow_opt_str"'])
+    yield f"            tag: Option<Cow<'a, str>>,"
+    yield f'        }}'
+    yield f'        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;'
+    yield f'        match tag.tag.as_deref() {{'
+    for variant, value in tag_values:
+        yield from arm_lines(12, f'Some("{value}")', 'serde_json::from_str(raw.get()).map', f'Self::{variant}')
+    yield f'            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),'
+    yield f'            None => return Err(D::Error::missing_field("{tag}")),'
+    yield f'        }}'
+    yield f'        .map_err(D::Error::custom)'
+
+def emit_string_enum(record):
+    """Yield a closed string enum with an `Other` fallback for values added later (see ir_enum)."""
+    enum_name = record['name']
+    values = record['values']
+    fields = ', '.join(f'`{owner}.{field}`' for owner, field in record['users'])
+    yield f'/// Values of {fields}.'
+    yield '///'
+    yield '/// Values added by later Bot API versions deserialise to `Other`.'
+    yield '#[derive(Debug, Clone, PartialEq, Eq, Hash)]'
+    yield '#[non_exhaustive]'
+    yield f'pub enum {enum_name} {{'
+    for value, variant in values:
+        yield f'    /// `"{value}"`'
+        yield f'    {variant},'
+    yield '    /// A value not known to this version of the library.'
+    yield '    Other(String),'
+    yield '}'
+    yield ''
+    yield f'impl {enum_name} {{'
+    yield '    /// The value as sent by the Bot API.'
+    yield '    pub fn as_str(&self) -> &str {'
+    yield '        match self {'
+    for value, variant in values:
+        yield f'            Self::{variant} => "{value}",'
+    yield '            Self::Other(value) => value,'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f'impl From<&str> for {enum_name} {{'
+    yield '    fn from(value: &str) -> Self {'
+    yield '        match value {'
+    for value, variant in values:
+        yield f'            "{value}" => Self::{variant},'
+    yield '            _ => Self::Other(value.to_string()),'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f'impl std::fmt::Display for {enum_name} {{'
+    yield "    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+    yield '        f.write_str(self.as_str())'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f'impl PartialEq<str> for {enum_name} {{'
+    yield '    fn eq(&self, other: &str) -> bool {'
+    yield '        self.as_str() == other'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f'impl PartialEq<&str> for {enum_name} {{'
+    yield '    fn eq(&self, other: &&str) -> bool {'
+    yield '        self.as_str() == *other'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f'impl Serialize for {enum_name} {{'
+    yield '    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {'
+    yield '        serializer.serialize_str(self.as_str())'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield f"impl<'de> Deserialize<'de> for {enum_name} {{"
+    yield f"    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield '        struct Visitor;'
+    yield f"        impl<'de> serde::de::Visitor<'de> for Visitor {{"
+    yield f'            type Value = {enum_name};'
+    yield "            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+    yield '                f.write_str("a string")'
+    yield '            }'
+    yield from fn_lines(12, 'fn visit_str<E: serde::de::Error>', ['self', 'value: &str'],
+                        f' -> Result<{enum_name}, E> {{')
+    yield f'                Ok({enum_name}::from(value))'
+    yield '            }'
+    yield '        }'
+    yield '        deserializer.deserialize_str(Visitor)'
+    yield '    }'
+    yield '}'
+    yield ''
+
+# ─────────────────────────────────────────────────
+# Hot types
+# ─────────────────────────────────────────────────
+#
+# The derived Deserialize impl matches each key against every field name in
+# turn. For the largest inbound structs a hand-rolled impl switches on the
+# key's length and first byte instead, so a key is compared against at most a
+# few names. It otherwise behaves like the derived impl (same errors, unknown
+# fields skipped, sequence form accepted), which a generated test checks
+# against a derived copy of the struct.
+
+def field_buckets(names):
+    """{(length, first byte): [(index, name)]} for a struct's JSON field names."""
+    buckets = {}
+    for i, name in enumerate(names):
+        buckets.setdefault((len(name.encode()), name.encode()[0]), []).append((i, name))
+    return dict(sorted(buckets.items()))
+
+def emit_field_index(names):
+    """Yield a `Field(index)` identifier type that finds a key among `names` by (length, first byte).
+
+    Keys not in `names` map to IGNORE. Meant for the body of a `deserialize`
+    fn that has `FIELDS` and `IGNORE` constants and serde::de's Error and
+    Visitor in scope.
+    """
+    yield f'        fn field_index(name: &[u8]) -> usize {{'
+    yield f'            match (name.len(), name.first()) {{'
+    for (length, first), candidates in field_buckets(names).items():
+        yield f"                ({length}, Some(b'{chr(first)}')) => match name {{"
+        for i, name in candidates:
+            yield f'                    b"{name}" => {i},'
+        yield f'                    _ => IGNORE,'
+        yield f'                }},'
+    yield f'                _ => IGNORE,'
+    yield f'            }}'
+    yield f'        }}'
+    yield ''
+    yield f'        struct Field(usize);'
+    yield f"        impl<'de> Deserialize<'de> for Field {{"
+    yield f"            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield f'                struct FieldVisitor;'
+    yield f"                impl<'de> Visitor<'de> for FieldVisitor {{"
+    yield f'                    type Value = Field;'
+    yield f"                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {{"
+    yield f'                        f.write_str("field identifier")'
+    yield f'                    }}'
+    yield f'                    fn visit_u64<E: Error>(self, value: u64) -> Result<Field, E> {{'
+    yield f'                        Ok(Field(if value < FIELDS.len() as u64 {{'
+    yield f'                            value as usize'
+    yield f'                        }} else {{'
+    yield f'                            IGNORE'
+    yield f'                        }}))'
+    yield f'                    }}'
+    yield f'                    fn visit_str<E: Error>(self, value: &str) -> Result<Field, E> {{'
+    yield f'                        Ok(Field(field_index(value.as_bytes())))'
+    yield f'                    }}'
+    yield f'                    fn visit_bytes<E: Error>(self, value: &[u8]) -> Result<Field, E> {{'
+    yield f'                        Ok(Field(field_index(value)))'
+    yield f'                    }}'
+    yield f'                }}'
+    yield f'                deserializer.deserialize_identifier(FieldVisitor)'
+    yield f'            }}'
+    yield f'        }}'
+    yield ''
+
+
+def emit_fast_deserialize(record):
+    """Yield a Deserialize impl for a hot struct's IR record that dispatches keys on (length, first byte)."""
+    type_name = record['name']
+    fields = record['fields']
+    names = [field['json'] for field in fields]
+    expecting = f'struct {type_name} with {len(fields)} elements'
+    yield f"impl<'de> Deserialize<'de> for {type_name} {{"
+    yield f"    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield f'        use serde::de::{{Error, IgnoredAny, MapAccess, SeqAccess, Visitor}};'
+    yield f''
+    yield from array_lines(8, 'const FIELDS: &[&str] = &[', [f'"{name}"' for name in names], '];')
+    yield f'        const IGNORE: usize = usize::MAX;'
+    yield f''
+    yield from emit_field_index(names)
+    yield f'        struct StructVisitor;'
+    yield f"        impl<'de> Visitor<'de> for StructVisitor {{"
+    yield f'            type Value = {type_name};'
+    yield f"            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {{"
+    yield f'                f.write_str("struct {type_name}")'
+    yield f'            }}'
+    yield f''
+    yield from fn_lines(12, "fn visit_seq<A: SeqAccess<'de>>", ['self', 'mut seq: A'],
+                        f' -> Result<{type_name}, A::Error> {{')
+    yield f'                Ok({type_name} {{'
+    for i, field in enumerate(fields):
+        yield from field_lines(20, field['rust'],
+                               f'seq.next_element()?.ok_or_else(|| A::Error::invalid_length({i}, &"{expecting}"))?')
+    yield f'                }})'
+    yield f'            }}'
+    yield f''
+    yield from fn_lines(12, "fn visit_map<A: MapAccess<'de>>", ['self', 'mut map: A'],
+                        f' -> Result<{type_name}, A::Error> {{')
+    for field in fields:
+        yield from let_lines(16, f"let mut {field['rust']}: Option<{field['type']}>", 'None')
+    yield f'                while let Some(Field(index)) = map.next_key()? {{'
+    yield f'                    match index {{'
+    for i, field in enumerate(fields):
+        yield f'                        {i} => {{'
+        yield f"                            if {field['rust']}.is_some() {{"
+        yield from return_lines(32, f"Err(A::Error::duplicate_field(\"{field['json']}\"))")
+        yield f'                            }}'
+        yield f"                            {field['rust']} = Some(map.next_value()?);"
+        yield f'                        }}'
+    yield f'                        _ => {{'
+    yield f'                            map.next_value::<IgnoredAny>()?;'
+    yield f'                        }}'
+    yield f'                    }}'
+    yield f'                }}'
+    yield f'                Ok({type_name} {{'
+    for field in fields:
+        fname = field['rust']
+        if field['optional']:
+            yield from field_lines(20, fname, f'{fname}.unwrap_or(None)')
+        else:
+            yield from field_lines(20, fname, f"{fname}.ok_or_else(|| A::Error::missing_field(\"{field['json']}\"))?")
+    yield f'                }})'
+    yield f'            }}'
+    yield f'        }}'
+    yield f''
+    yield from chain_lines(8, '', f'deserializer.deserialize_struct("{type_name}", FIELDS, StructVisitor)', '')
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+    yield from emit_fast_deserialize_test(record)
+
+def sample_value(types, types_map, enums, depth=0):
+    """A small JSON value of a field's (first) TG type, with only the required fields of objects."""
+    t = types[0] if types else 'String'
+    if is_array(t):
+        return [sample_value([strip_array(t)], types_map, enums, depth)]
+    if t in ('Integer', 'Float', 'Boolean', 'String'):
+        return {'Integer': 1, 'Float': 1.5, 'Boolean': True, 'String': 'x'}[t]
+    tg_type = types_map[t]
+    if tg_type.get('subtypes'):
+        return sample_value(tg_type['subtypes'][:1], types_map, enums, depth)
+    return sample_object(t, types_map, enums, depth + 1)
+
+def sample_object(type_name, types_map, enums, depth=0, optional=False):
+    """A JSON object of a type with its required (and with `optional`, all) fields set.
+
+    `enums` is the result of string_enums; enum fields get their first value.
+    """
+    enum_fields, enum_values = enums
+    obj = {}
+    for field in types_map[type_name].get('fields', []):
+        if not field['required'] and not optional:
             continue
-        tg_type = types_map[type_name]
-        docs = tg_type.get('description', [])
-        href = tg_type.get('href', '')
-        subtypes = tg_type.get('subtypes', [])
-        fields = tg_type.get('fields', [])
-
-        lines.append(doc_comment(docs))
-        lines.append(f'/// {href}')
-
-        if subtypes:
-            # Union / enum type
-            lines.append('#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]')
-            lines.append('#[serde(untagged)]')
-            lines.append(f'pub enum {type_name} {{')
-            for variant in subtypes:
-                lines.append(f'    {variant}({variant}),')
-            lines.append('}')
-            lines.append('')
-        elif not fields:
-            # Empty marker struct
-            lines.append('#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Default)]')
-            lines.append(f'pub struct {type_name} {{}}')
-            lines.append('')
+        enum = enum_fields.get((type_name, field['name']))
+        if enum is not None:
+            obj[field['name']] = enum_values[enum][0][0]
+        elif field_discriminator(field) is not None:
+            obj[field['name']] = field_discriminator(field)
+        elif depth > 8:
+            obj[field['name']] = None
         else:
-            # Regular struct
-            lines.append('#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]')
-            lines.append(f'pub struct {type_name} {{')
-            for field in fields:
-                fname = safe_field_name(field['name'])
-                fdesc = field['description'].replace('\n', ' ')
-                ftype = field_rust_type(field, types_map)
-                lines.append(f'    /// {fdesc}')
-                # serde rename if the field name differs or is a keyword
-                if fname != field['name']:
-                    rename_attr = '#[serde(rename = "' + field['name'] + '")]'
-                    lines.append(f'    {rename_attr}')
-                if ftype.startswith('Option<'):
-                    lines.append(f'    #[serde(skip_serializing_if = "Option::is_none")]')
-                    lines.append(f'    pub {fname}: {ftype},')
-                else:
-                    lines.append(f'    pub {fname}: {ftype},')
-            lines.append('}')
-            lines.append('')
+            obj[field['name']] = sample_value(field['types'], types_map, enums, depth)
+    return obj
+
+def deserialize_samples(type_name, types_map, fields):
+    """JSON texts the hot struct's Deserialize test decodes with both impls.
+
+    `fields` are the struct's IR field records. The samples cover the
+    minimal and full objects, unknown and null fields, the sequence form,
+    each missing required field, a duplicated key and truncated input.
+    """
+    enums = string_enums(types_map)
+    minimal = sample_object(type_name, types_map, enums)
+    full = sample_object(type_name, types_map, enums, optional=True)
+    cases = [minimal, full, dict(full, unknown_field={'nested': [1, None]}),
+             dict(minimal, **{f['json']: None for f in fields if f['optional']}),
+             [], [full[f['json']] for f in fields]]
+    cases += [{k: v for k, v in minimal.items() if k != name} for name in minimal]
+    texts = [json.dumps(case, separators=(',', ':')) for case in cases]
+    # A duplicated key, and input that ends inside a value.
+    last = json.dumps(fields[-1]['json'])
+    pair = f"{last}:{json.dumps(full[fields[-1]['json']])}"
+    texts.append(texts[0][:-1] + f',{pair},{pair}}}')
+    texts.append('{' + last + ':')
+    return texts
+
+def emit_fast_deserialize_test(record):
+    """Yield a test comparing the hand-rolled Deserialize impl with a derived copy of the struct."""
+    type_name = record['name']
+    yield '#[cfg(test)]'
+    yield f"mod {record['test_module']} {{"
+    yield '    use super::*;'
+    yield ''
+    yield f'    /// {type_name} with the derived Deserialize impl (same name, so error messages match).'
+    yield '    #[derive(Serialize, Deserialize)]'
+    yield f'    struct {type_name} {{'
+    for field in record['fields']:
+        if field['rename']:
+            yield f"        #[serde(rename = \"{field['json']}\")]"
+        if field['optional']:
+            yield f'        #[serde(skip_serializing_if = "Option::is_none")]'
+        yield f"        {field['rust']}: {field['type']},"
+    yield '    }'
+    yield ''
+    yield '    #[test]'
+    yield '    fn matches_derived() {'
+    yield from array_lines(8, 'for json in [', [f'r##"{text}"##' for text in record['samples']], '] {')
+    yield f'            let fast = serde_json::from_str::<super::{type_name}>(json)'
+    yield '                .map(|v| serde_json::to_value(v).unwrap())'
+    yield '                .map_err(|e| e.to_string());'
+    yield f'            let derived = serde_json::from_str::<{type_name}>(json)'
+    yield '                .map(|v| serde_json::to_value(v).unwrap())'
+    yield '                .map_err(|e| e.to_string());'
+    yield '            assert_eq!(fast, derived, "{}", json);'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
 
-    return '\n'.join(lines)
+# ─────────────────────────────────────────────────
+# Update kinds
+# ─────────────────────────────────────────────────
+
+# The type whose optional fields are the update kinds (`allowed_updates` names).
+UPDATE_TYPE = 'Update'
+
+def update_kinds(tg_type):
+    """[(field name, variant)] for the payload fields of Update."""
+    return [(f['name'], pascal_case(f['name'])) for f in tg_type.get('fields', []) if not f['required']]
+
+def emit_update_kind(record):
+    """Yield UpdateKind, Update::kind() and the lazily decoded RawUpdate for the Update IR record.
+
+    RawUpdate reads only `update_id` and the payload key up front, so the
+    dispatchers can drop updates nobody handles without decoding them.
+    """
+    kinds = record['update_kinds']
+    yield '/// The payload kinds of an [`Update`], named as in `allowed_updates`.'
+    yield '#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]'
+    yield '#[non_exhaustive]'
+    yield 'pub enum UpdateKind {'
+    for name, variant, _ in kinds:
+        yield f'    /// `{name}`'
+        yield f'    {variant},'
+    yield '}'
+    yield ''
+    yield 'impl UpdateKind {'
+    yield '    /// Every kind, in spec order.'
+    all_kinds = [f'Self::{variant}' for _, variant, _ in kinds]
+    yield from array_lines(4, "pub const ALL: &'static [UpdateKind] = &[", all_kinds, '];')
+    yield ''
+    yield '    /// The field name, as used in `allowed_updates`.'
+    yield "    pub fn as_str(self) -> &'static str {"
+    yield '        match self {'
+    for name, variant, _ in kinds:
+        yield f'            Self::{variant} => "{name}",'
+    yield '        }'
+    yield '    }'
+    yield ''
+    yield '    /// The kind named `name`, or `None` if this version of the library does not know it.'
+    yield '    pub fn from_name(name: &str) -> Option<Self> {'
+    yield '        match name {'
+    for name, variant, _ in kinds:
+        yield f'            "{name}" => Some(Self::{variant}),'
+    yield '            _ => None,'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield 'impl std::fmt::Display for UpdateKind {'
+    yield "    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+    yield '        f.write_str(self.as_str())'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield 'impl Update {'
+    yield '    /// Which payload this update carries.'
+    yield '    pub fn kind(&self) -> Option<UpdateKind> {'
+    for _, variant, fname in kinds:
+        yield f'        if self.{fname}.is_some() {{'
+        yield f'            return Some(UpdateKind::{variant});'
+        yield '        }'
+    yield '        None'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield '/// An update whose payload is decoded on first access.'
+    yield '///'
+    yield '/// Deserialising one only reads `update_id` and the payload key; the JSON'
+    yield '/// is kept and decoded into an [`Update`] by [`RawUpdate::update`] or'
+    yield '/// [`RawUpdate::into_update`].'
+    yield '#[derive(Debug)]'
+    yield 'pub struct RawUpdate {'
+    yield '    /// The update\'s unique identifier.'
+    yield '    pub update_id: i64,'
+    yield '    /// The payload kind, `None` if this version of the library does not know it.'
+    yield '    pub kind: Option<UpdateKind>,'
+    yield '    json: Box<serde_json::value::RawValue>,'
+    yield '    update: std::sync::OnceLock<Update>,'
+    yield '}'
+    yield ''
+    yield 'impl RawUpdate {'
+    yield '    /// Read `update_id` and the payload kind of a JSON update.'
+    yield '    pub fn from_slice(json: &[u8]) -> serde_json::Result<Self> {'
+    yield '        serde_json::from_slice(json)'
+    yield '    }'
+    yield ''
+    yield '    /// The update as received.'
+    yield '    pub fn json(&self) -> &str {'
+    yield '        self.json.get()'
+    yield '    }'
+    yield ''
+    yield '    /// The decoded update; the JSON is decoded on the first call only.'
+    yield '    pub fn update(&self) -> serde_json::Result<&Update> {'
+    yield '        if let Some(update) = self.update.get() {'
+    yield '            return Ok(update);'
+    yield '        }'
+    yield '        let update = serde_json::from_str(self.json.get())?;'
+    yield '        Ok(self.update.get_or_init(|| update))'
+    yield '    }'
+    yield ''
+    yield '    /// Decode the update, reusing it if it was already decoded.'
+    yield '    pub fn into_update(self) -> serde_json::Result<Update> {'
+    yield '        match self.update.into_inner() {'
+    yield '            Some(update) => Ok(update),'
+    yield '            None => serde_json::from_str(self.json.get()),'
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+    yield "impl<'de> Deserialize<'de> for RawUpdate {"
+    yield "    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {"
+    yield '        use serde::de::{Error, IgnoredAny, MapAccess, Visitor};'
+    yield ''
+    yield '        enum Key {'
+    yield '            UpdateId,'
+    yield '            Kind(UpdateKind),'
+    yield '            Other,'
+    yield '        }'
+    yield "        impl<'de> Deserialize<'de> for Key {"
+    yield "            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {"
+    yield '                struct KeyVisitor;'
+    yield "                impl<'de> Visitor<'de> for KeyVisitor {"
+    yield '                    type Value = Key;'
+    yield "                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+    yield '                        f.write_str("a field name")'
+    yield '                    }'
+    yield '                    fn visit_str<E: Error>(self, name: &str) -> Result<Key, E> {'
+    yield '                        Ok(match name {'
+    yield '                            "update_id" => Key::UpdateId,'
+    yield '                            _ => UpdateKind::from_name(name).map_or(Key::Other, Key::Kind),'
+    yield '                        })'
+    yield '                    }'
+    yield '                }'
+    yield '                deserializer.deserialize_identifier(KeyVisitor)'
+    yield '            }'
+    yield '        }'
+    yield ''
+    yield '        struct HeadVisitor;'
+    yield "        impl<'de> Visitor<'de> for HeadVisitor {"
+    yield '            type Value = (i64, Option<UpdateKind>);'
+    yield "            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+    yield '                f.write_str("an Update object")'
+    yield '            }'
+    yield "            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {"
+    yield '                let mut update_id = None;'
+    yield '                let mut kind = None;'
+    yield '                while let Some(key) = map.next_key()? {'
+    yield '                    match key {'
+    yield '                        Key::UpdateId => update_id = Some(map.next_value()?),'
+    yield '                        Key::Kind(k) => {'
+    yield '                            kind = kind.or(Some(k));'
+    yield '                            map.next_value::<IgnoredAny>()?;'
+    yield '                        }'
+    yield '                        Key::Other => {'
+    yield '                            map.next_value::<IgnoredAny>()?;'
+    yield '                        }'
+    yield '                    }'
+    yield '                }'
+    yield '                let update_id = update_id.ok_or_else(|| A::Error::missing_field("update_id"))?;'
+    yield '                Ok((update_id, kind))'
+    yield '            }'
+    yield '        }'
+    yield ''
+    yield '        let json = Box::<serde_json::value::RawValue>::deserialize(deserializer)?;'
+    yield '        let mut peek = serde_json::Deserializer::from_str(json.get());'
+    yield '        let (update_id, kind) = serde::Deserializer::deserialize_map(&mut peek, HeadVisitor)'
+    yield '            .map_err(D::Error::custom)?;'
+    yield '        Ok(RawUpdate {'
+    yield '            update_id,'
+    yield '            kind,'
+    yield '            json,'
+    yield '            update: std::sync::OnceLock::new(),'
+    yield '        })'
+    yield '    }'
+    yield '}'
+    yield ''
+
+def emit_type_item(record):
+    """Yield the lines of a type's whole output item: the type, a hot struct's
+    Deserialize impl and test, its string enums and, for Update, UpdateKind."""
+    yield from emit_type(record)
+    if record.get('hot'):
+        yield from emit_fast_deserialize(record)
+    for enum in record['enums']:
+        yield from emit_string_enum(enum)
+    if 'update_kinds' in record:
+        yield from emit_update_kind(record)
+
+def type_items(spec, shard=None, hot=HOT_TYPES, keep=None, budget=SIZE_BUDGET):
+    """Yield (name, spec entry, source) for every generated type, in output order.
+
+    With `shard`, only the types belonging to that --shard module are yielded,
+    and with `keep` (see lean_subset) only the types it names.
+    Structs named in `hot` get a hand-rolled Deserialize impl, and structs
+    over the size `budget` have their cold fields boxed.
+    The last item is a test checking the estimated size of every type.
+    """
+    sizes = []
+    for entry, record in type_records(spec, shard, hot, keep, budget):
+        sizes.append((record['name'], record['size']))
+        yield record['name'], entry, '\n'.join(emit_type_item(record))
+    if sizes:
+        yield 'layout_tests', sizes, '\n'.join(emit_layout_tests(sizes))
 
 # ─────────────────────────────────────────────────
 # Generate methods
 # ─────────────────────────────────────────────────
 
-def generate_methods(spec):
-    types_map = spec['types']
-    methods_map = spec['methods']
-    version = spec['version']
+def methods_header(version):
     lines = []
-
     lines.append(f'// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.')
     lines.append(f'// Generated from Telegram Bot API {version}')
     lines.append(f'// Spec:    https://github.com/ankit-chaubey/api-spec')
@@ -252,111 +1777,803 @@ def generate_methods(spec):
     lines.append(f'')
     lines.append(f'#![allow(clippy::all, dead_code, unused_imports, unused_mut)]')
     lines.append(f'')
-    lines.append(f'use serde::{{Deserialize, Serialize}};')
     lines.append(f'use crate::types::*;')
+    lines.append(f'use serde::{{Deserialize, Serialize}};')
     lines.append(f'#[rustfmt::skip]')
     lines.append(f'use crate::{{Bot, BotError, ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia}};')
     lines.append(f'')
+    return '\n'.join(lines)
 
-    for method_name in sorted(methods_map.keys()):
-        method = methods_map[method_name]
-        fn_name = method_fn_name(method_name)
-        params_name = method_params_struct(method_name)
-        docs = method.get('description', [])
-        href = method.get('href', '')
-        all_fields = method.get('fields', [])
-        returns = method.get('returns', [])
-
-        required_fields = [f for f in all_fields if f['required']]
-        optional_fields = [f for f in all_fields if not f['required']]
-
-        # Params struct for optional fields
-        if optional_fields:
-            lines.append(f'/// Optional parameters for [`Bot::{fn_name}`]')
-            lines.append('#[derive(Debug, Clone, Serialize, Deserialize, Default)]')
-            lines.append(f'pub struct {params_name} {{')
-            for field in optional_fields:
-                fname = safe_field_name(field['name'])
-                fdesc = field['description'].replace('\n', ' ')
-                ftype = field_rust_type(field, types_map)
-                # Ensure it's wrapped in Option
-                ftype = opt_wrap(ftype, True)
-                lines.append(f'    /// {fdesc}')
-                if fname != field['name']:
-                    rename_attr2 = '#[serde(rename = "' + field['name'] + '")]'
-                    lines.append(f'    {rename_attr2}')
-                lines.append(f'    #[serde(skip_serializing_if = "Option::is_none")]')
-                lines.append(f'    pub {fname}: {ftype},')
-            lines.append('}')
-            lines.append('')
-
-            # Builder pattern for params
-            lines.append(f'impl {params_name} {{')
-            lines.append(f'    pub fn new() -> Self {{ Self::default() }}')
-            for field in optional_fields:
-                fname = safe_field_name(field['name'])
-                ftype = field_rust_type(field, types_map)
-                ftype = opt_wrap(ftype, True)
-                inner_type = ftype[len('Option<'):-1] if ftype.startswith('Option<') else ftype
-                lines.append(f'    pub fn {fname}(mut self, v: impl Into<{inner_type}>) -> Self {{ self.{fname} = Some(v.into()); self }}')
-            lines.append('}')
-            lines.append('')
-
-        # Return type
-        ret = return_rust_type(returns, types_map)
-
-        # Signature args
-        sig_parts = []
+def call_api_lines(indent, name, inits):
+    """`self.call_api("name", &Request { inits }).await`, laid out as rustfmt lays it out."""
+    pad = ' ' * indent
+    fields = ', '.join(inits)
+    body = f'Request {{ {fields} }}' if inits else 'Request {}'
+    call = f'self.call_api("{name}", &{body})'
+    short_body = len(fields) <= STRUCT_LIT_WIDTH
+    if len(call + '.await') <= CHAIN_WIDTH and fits(indent, call + '.await') and short_body:
+        return [pad + call + '.await']
+    if len(f'"{name}", &{body}') <= FN_CALL_WIDTH and short_body and fits(indent, call):
+        return [pad + call, pad + '    .await']
+    lines = [pad + 'self.call_api(', f'{pad}    "{name}",']
+    if short_body and fits(indent + 4, f'&{body},'):
+        lines.append(f'{pad}    &{body},')
+    else:
+        lines.append(f'{pad}    &Request {{')
+        lines += [f'{pad}        {init},' for init in inits]
+        lines.append(f'{pad}    }},')
+    return lines + [pad + ')', pad + '.await']
+
+def emit_method(record):
+    """Yield the (unformatted) Rust source lines of a method's IR record (see ir_method)."""
+    fn_name = record['fn']
+    params_name = record['params']
+    required_fields = record['args']
+    optional_fields = record['options']
+
+    # Params struct for optional fields
+    if optional_fields:
+        yield f'/// Optional parameters for [`Bot::{fn_name}`]'
+        yield '#[derive(Debug, Clone, Serialize, Deserialize, Default)]'
+        yield f'pub struct {params_name} {{'
+        for field in optional_fields:
+            yield f"    /// {field['doc']}"
+            if field['rename']:
+                rename_attr2 = '#[serde(rename = "' + field['json'] + '")]'
+                yield f'    {rename_attr2}'
+            yield f'    #[serde(skip_serializing_if = "Option::is_none")]'
+            yield f"    pub {field['rust']}: {field['type']},"
+        yield '}'
+        yield ''
+
+        # Builder pattern for params
+        yield f'impl {params_name} {{'
+        yield f'    pub fn new() -> Self {{'
+        yield f'        Self::default()'
+        yield f'    }}'
+        for field in optional_fields:
+            fname = field['rust']
+            yield from fn_lines(4, f'pub fn {fname}', ['mut self', f"v: impl Into<{field['inner']}>"],
+                                ' -> Self {')
+            yield f'        self.{fname} = Some(v.into());'
+            yield f'        self'
+            yield f'    }}'
+        yield '}'
+        yield ''
+
+    # Signature args
+    sig_parts = []
+    for field in required_fields:
+        # Flexible Into<> for common types
+        if field['into']:
+            sig_parts.append(f"{field['rust']}: impl Into<{field['type']}>")
+        else:
+            sig_parts.append(f"{field['rust']}: {field['type']}")
+
+    has_opts = bool(optional_fields)
+    if has_opts:
+        sig_parts.append(f'params: Option<{params_name}>')
+
+    yield f'impl Bot {{'
+    yield doc_comment(record['doc'], '    ')
+    yield f"    /// See: {record['href']}"
+    yield from fn_lines(4, f'pub async fn {fn_name}', ['&self'] + sig_parts,
+                        f" -> Result<{record['returns']}, BotError> {{")
+
+    # Request body: a borrowed struct serialised straight into the HTTP body,
+    # with the optional params flattened into it.
+    yield f'        #[derive(Serialize)]'
+    if required_fields or optional_fields:
+        yield f"        struct Request<'a> {{"
         for field in required_fields:
-            fname = safe_field_name(field['name'])
-            ftype = field_rust_type(field, types_map)
-            # Flexible Into<> for common types
-            if ftype == 'String':
-                sig_parts.append(f'{fname}: impl Into<String>')
-            elif ftype == 'ChatId':
-                sig_parts.append(f'{fname}: impl Into<ChatId>')
-            elif ftype == 'InputFileOrString':
-                sig_parts.append(f'{fname}: impl Into<InputFileOrString>')
-            elif ftype == 'InputMedia':
-                sig_parts.append(f'{fname}: impl Into<InputMedia>')
+            if field['rename']:
+                yield f'            #[serde(rename = "{field["json"]}")]'
+            yield f"            {field['rust']}: &'a {field['type']},"
+        if has_opts:
+            yield f'            #[serde(flatten)]'
+            yield f"            params: Option<&'a {params_name}>,"
+        yield f'        }}'
+    else:
+        yield f'        struct Request {{}}'
+
+    inits = []
+    for field in required_fields:
+        fname = field['rust']
+        if field['into']:
+            yield f"        let {fname}: {field['type']} = {fname}.into();"
+        inits.append(f'{fname}: &{fname}')
+    if has_opts:
+        inits.append('params: params.as_ref()')
+    yield from call_api_lines(8, record['name'], inits)
+    yield f'    }}'
+    yield f'}}'
+    yield f''
+
+def method_items(spec, shard=None, keep=None):
+    """Yield (name, spec entry, source) for every method, in output order.
+
+    With `shard`, only the methods belonging to that --shard module are yielded,
+    and with `keep` (see lean_subset) only the methods it names.
+    """
+    for method, record in method_records(spec, shard, keep):
+        yield record['name'], method, '\n'.join(emit_method(record))
+
+# ─────────────────────────────────────────────────
+# Borrowed inbound types (--borrowed)
+# ─────────────────────────────────────────────────
+#
+# gen_borrowed.rs mirrors every type an Update can contain with a lifetime,
+# so a handler can read strings straight out of the request body instead of
+# copying them into owned `String`s. Only types that (transitively) hold a
+# string get a mirror; the rest, and closed string enums, are reused from
+# crate::types as they are.
+
+# Type whose contents are mirrored.
+BORROWED_ROOT = 'Update'
+
+def base_type(t):
+    while is_array(t):
+        t = strip_array(t)
+    return t
+
+@memoised
+def inbound_types(types_map):
+    """Names of the generated types reachable from BORROWED_ROOT."""
+    seen = set()
+    stack = [BORROWED_ROOT]
+    while stack:
+        name = stack.pop()
+        if name in seen or name in SKIP_TYPES or name not in types_map:
+            continue
+        seen.add(name)
+        tg_type = types_map[name]
+        stack.extend(tg_type.get('subtypes', []))
+        for field in tg_type.get('fields', []):
+            stack.extend(base_type(t) for t in field['types'])
+    return seen
+
+def is_borrowable(field, enum_fields):
+    """Whether a field is a single (possibly array) reference that can hold borrowed data."""
+    return len(field['types']) == 1 and field['name'] not in enum_fields
+
+@memoised
+def borrowed_types(types_map):
+    """Inbound types that get a `<'a>` mirror: those holding a string somewhere below them."""
+    enum_fields, _ = string_enums(types_map)
+    inbound = inbound_types(types_map)
+    borrowed = set()
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(inbound - borrowed):
+            tg_type = types_map[name]
+            refs = list(tg_type.get('subtypes', []))
+            for field in tg_type.get('fields', []):
+                if not is_borrowable(field, {f for (o, f) in enum_fields if o == name}):
+                    continue
+                if field['types'] == ['String']:
+                    refs.append('String')
+                elif not is_array(field['types'][0]):
+                    refs.append(field['types'][0])
+                elif base_type(field['types'][0]) in types_map:
+                    refs.append(base_type(field['types'][0]))
+            if any(ref == 'String' or ref in borrowed for ref in refs):
+                borrowed.add(name)
+                changed = True
+    return borrowed
+
+def borrowed_rust_type(t, borrowed):
+    """Rust type of a single (non-optional, unboxed) TG type inside gen_borrowed.rs."""
+    if is_array(t):
+        return f'Vec<{borrowed_rust_type(strip_array(t), borrowed)}>'
+    if t in borrowed:
+        return f"{t}<'a>"
+    if t == 'String':
+        return 'String'
+    if t in BASE_TYPE_MAP:
+        return BASE_TYPE_MAP[t]
+    return f'owned::{t}'
+
+def owned_conversion(t, expr, borrowed):
+    """Rust expression turning `expr` of borrowed TG type `t` into its owned form."""
+    if is_array(t):
+        inner = owned_conversion(strip_array(t), 'v', borrowed)
+        return expr if inner == 'v' else f'{expr}.into_iter().map(|v| {inner}).collect()'
+    if t in borrowed:
+        return f'{expr}.into_owned()'
+    return expr
+
+def borrowed_header(version):
+    lines = types_header(version).split('\n')
+    lines = lines[:lines.index('use serde::{Deserialize, Serialize};')]
+    lines.append(f'use crate::types as owned;')
+    lines.append(f'use serde::{{Deserialize, Serialize}};')
+    lines.append(f'use serde_json::value::RawValue;')
+    lines.append(f'use std::borrow::Cow;')
+    lines.append(f'#[rustfmt::skip]')
+    lines.append(f'use crate::{{ChatId, InputFileOrString, ReplyMarkup, ShortString, ShortVec}};')
+    lines.append(f'')
+    lines += borrow_opt_str_lines()
+    return '\n'.join(lines)
+
+def emit_borrowed_type(type_name, tg_type, types_map, borrowed, boxed=(), enum_fields=None):
+    """Yield the (unformatted) Rust source lines of a type's borrowed mirror and its into_owned()."""
+    enum_fields = enum_fields or {}
+    subtypes = tg_type.get('subtypes', [])
+    fields = tg_type.get('fields', [])
+
+    yield f'/// Borrowed [`owned::{type_name}`].'
+    if subtypes:
+        yield '#[derive(Debug, Clone, Serialize, PartialEq)]'
+        yield '#[serde(untagged)]'
+        yield f"pub enum {type_name}<'a> {{"
+        for variant in subtypes:
+            yield f'    {variant}({borrowed_rust_type(variant, borrowed)}),'
+        yield '}'
+        yield ''
+        yield from emit_borrowed_union_deserialize(type_name, types_map)
+        yield f"impl<'a> {type_name}<'a> {{"
+        yield f'    /// Copy every borrowed string into an owned [`owned::{type_name}`].'
+        yield f'    pub fn into_owned(self) -> owned::{type_name} {{'
+        yield '        match self {'
+        for variant in subtypes:
+            value = owned_conversion(variant, 'v', borrowed)
+            yield from arm_lines(12, f'Self::{variant}(v)', f'owned::{type_name}::{variant}', value)
+        yield '        }'
+        yield '    }'
+        yield '}'
+        yield ''
+        return
+
+    yield '#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]'
+    yield f"pub struct {type_name}<'a> {{"
+    conversions = []
+    for field in fields:
+        fname = safe_field_name(field['name'])
+        optional = not field['required']
+        if field['name'] in enum_fields:
+            ftype = opt_wrap(f"owned::{enum_fields[field['name']]}", optional)
+            value = f'self.{fname}'
+            borrow = None
+        elif not is_borrowable(field, enum_fields):
+            # ChatId, InputFileOrString, ReplyMarkup, ... are used as-is.
+            ftype = field_rust_type(field, types_map, field['name'] in boxed)
+            value = f'self.{fname}'
+            borrow = None
+        elif field['types'] == ['String']:
+            ftype = opt_wrap("Cow<'a, str>", optional)
+            # A ShortString converts from the Cow itself.
+            to_owned = 'into' if is_short_string(type_name, field) else 'into_owned'
+            value = f'self.{fname}.map(|v| v.{to_owned}())' if optional else f'self.{fname}.{to_owned}()'
+            borrow = '#[serde(borrow, default, deserialize_with = "borrow_opt_str")]' if optional else '#[serde(borrow)]'
+        else:
+            t = field['types'][0]
+            ftype = borrowed_rust_type(t, borrowed)
+            items = short_array_items(type_name, field)
+            if items:
+                ftype = f'ShortVec<{borrowed_rust_type(strip_array(t), borrowed)}, {items}>'
+            target = 'v' if optional else f'self.{fname}'
+            if field['name'] in boxed:
+                ftype = f'Box<{ftype}>'
+                converted = owned_conversion(t, f'(*{target})', borrowed)
+                converted = target if converted == f'(*{target})' else f'Box::new({converted})'
+            else:
+                converted = owned_conversion(t, target, borrowed)
+            if converted == target:
+                value = f'self.{fname}'
+            elif optional:
+                value = f'self.{fname}.map(|v| {converted})'
             else:
-                sig_parts.append(f'{fname}: {ftype}')
+                value = converted
+            ftype = opt_wrap(ftype, optional)
+            borrow = '#[serde(borrow)]' if "<'a>" in ftype else None
+        if fname != field['name']:
+            yield f'    #[serde(rename = "{field["name"]}")]'
+        if borrow:
+            yield f'    {borrow}'
+        if ftype.startswith('Option<'):
+            yield f'    #[serde(skip_serializing_if = "Option::is_none")]'
+        yield f'    pub {fname}: {ftype},'
+        conversions += field_lines(12, fname, value)
+    yield '}'
+    yield ''
+    yield f"impl<'a> {type_name}<'a> {{"
+    yield f'    /// Copy every borrowed string into an owned [`owned::{type_name}`].'
+    yield f'    pub fn into_owned(self) -> owned::{type_name} {{'
+    yield f'        owned::{type_name} {{'
+    yield from conversions
+    yield '        }'
+    yield '    }'
+    yield '}'
+    yield ''
+
+def emit_borrowed_union_deserialize(type_name, types_map):
+    """Yield a borrowing Deserialize impl for a union (see union_deserialize_lines)."""
+    tag, tag_values, _ = union_discriminator(type_name, types_map)
+    yield f"impl<'de: 'a, 'a> Deserialize<'de> for {type_name}<'a> {{"
+    yield f"    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield f'        use serde::de::Error;'
+    yield f"        let raw = <&'a RawValue>::deserialize(deserializer)?;"
+    yield from union_deserialize_lines(type_name, tag, tag_values, types_map[type_name]['subtypes'])
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+
+def borrowed_items(spec, budget=SIZE_BUDGET):
+    """Yield (name, spec entry, source) for every borrowed mirror, in output order."""
+    types_map = spec['types']
+    borrowed = borrowed_types(types_map)
+    cycles = boxed_fields(types_map, budget)
+    enum_fields, _ = string_enums(types_map)
+    for type_name in sorted(borrowed):
+        tg_type = types_map[type_name]
+        boxed = sorted(field for owner, field in cycles if owner == type_name)
+        fields = {field: name for (owner, field), name in enum_fields.items() if owner == type_name}
+        # Which referenced types are mirrored decides between `X<'a>` and `owned::X`.
+        refs = sorted({base_type(t) for f in tg_type.get('fields', []) for t in f['types']}
+                      | set(tg_type.get('subtypes', [])))
+        entry = ['borrowed', tg_type, boxed, fields, [ref in borrowed for ref in refs]] + \
+            [types_map.get(v) for v in tg_type.get('subtypes', [])]
+        lines = emit_borrowed_type(type_name, tg_type, types_map, borrowed, boxed, fields)
+        yield type_name, entry, '\n'.join(lines)
 
-        has_opts = bool(optional_fields)
-        if has_opts:
-            sig_parts.append(f'params: Option<{params_name}>')
+# ─────────────────────────────────────────────────
+# Traffic-profile compact types (--traffic-profile)
+# ─────────────────────────────────────────────────
+#
+# A traffic profile (written by traffic_profile.py) counts how often each
+# field of each inbound type was present in a corpus of real updates.
+# The compact module mirrors the structs an Update reaches through plain struct
+# fields, leaving out the optional fields rarer than the profile's threshold:
+# those stay encoded, together, in one `extra: Option<Box<RawValue>>` JSON
+# object that `extra()` and `into_full()` decode on demand. Unions are not
+# mirrored: dispatching one buffers the value, and RawValue cannot be read
+# back out of a buffer.
+#
+# The module is generated into the bot's crate (--compact-out), declared with
+# `mod compact;` there, and refers to the library as `tgbotrs::`.
+
+# Share of a type's instances below which an optional field is rare.
+DEFAULT_RARE_THRESHOLD = 0.01
+
+# Name of the field holding the rare fields' JSON.
+EXTRA_FIELD = 'extra'
+
+def load_profile(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
 
-        sig = ', '.join(sig_parts)
+def rare_fields(types_map, profile):
+    """{struct: [optional fields present in fewer than `threshold` of its instances]}.
 
-        lines.append(f'impl Bot {{')
-        lines.append(doc_comment(docs, '    '))
-        lines.append(f'    /// See: {href}')
-        args = f'&self, {sig}' if sig else '&self'
-        lines.append(f'    pub async fn {fn_name}({args}) -> Result<{ret}, BotError> {{')
+    A struct the corpus never contained has every optional field rare.
+    """
+    threshold = profile.get('threshold', DEFAULT_RARE_THRESHOLD)
+    rare = {}
+    for type_name in sorted(inbound_types(types_map)):
+        tg_type = types_map[type_name]
+        stats = profile['types'].get(type_name, {})
+        seen = stats.get('seen', 0)
+        counts = stats.get('fields', {})
+        names = [field['name'] for field in tg_type.get('fields', [])
+                 if not field['required'] and (seen == 0 or counts.get(field['name'], 0) / seen < threshold)]
+        if names and not tg_type.get('subtypes'):
+            rare[type_name] = names
+    return rare
+
+def compact_types(types_map, rare):
+    """Structs that get a compact mirror: those with rare fields or a kept field holding a mirror.
+
+    Only structs reachable from UPDATE_TYPE through kept, single-typed fields
+    are candidates.
+    """
+    def refs(name):
+        skip = set(rare.get(name, ()))
+        for field in types_map[name].get('fields', []):
+            t = base_type(field['types'][0]) if len(field['types']) == 1 else None
+            if field['name'] not in skip and t in types_map and not types_map[t].get('subtypes'):
+                yield t
+
+    reachable = set()
+    stack = [UPDATE_TYPE]
+    while stack:
+        name = stack.pop()
+        if name not in reachable and name not in SKIP_TYPES:
+            reachable.add(name)
+            stack.extend(refs(name))
+    compact = {name for name in reachable if name in rare}
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(reachable - compact):
+            if any(ref in compact for ref in refs(name)):
+                compact.add(name)
+                changed = True
+    return compact
+
+def compact_qualify(rust_type, compact, owned_names):
+    """Refer to owned types as `owned::X` in a Rust type; mirrored ones stay bare."""
+    return re.sub(r'\b[A-Z]\w*\b',
+                  lambda m: m[0] if m[0] in compact or m[0] not in owned_names else f'owned::{m[0]}',
+                  rust_type)
+
+def full_conversion(t, expr, compact):
+    """`serde_json::Result` expression turning `expr` of compact TG type `t` into its full form.
+
+    None if `t` holds no compact mirror and needs no conversion.
+    """
+    if is_array(t):
+        item = strip_array(t)
+        inner = full_conversion(item, 'v', compact)
+        if inner is None:
+            return None
+        convert = f'{item}::into_full' if inner == 'v.into_full()' else f'|v| {inner}'
+        return f'full_items({expr}, {convert})'
+    if t in compact:
+        return f'{expr}.into_full()'
+    return None
+
+def compact_header(version, profile):
+    lines = types_header(version).split('\n')
+    lines = lines[:lines.index('use serde::{Deserialize, Serialize};')]
+    threshold = profile.get('threshold', DEFAULT_RARE_THRESHOLD)
+    lines.append(f'use serde::{{Deserialize, Serialize}};')
+    lines.append(f'use serde_json::value::RawValue;')
+    lines.append(f'use tgbotrs::types as owned;')
+    lines.append(f'#[rustfmt::skip]')
+    lines.append(f'use tgbotrs::{{ChatId, InputFileOrString, ReplyMarkup, ShortString, ShortVec}};')
+    lines.append(f'')
+    lines.append(f"// Traffic profile: {profile['updates']} updates; fields present in under "
+                 f'{threshold:.2%} of a type\'s instances are kept in `extra`.')
+    lines.append(f'')
+    lines.append(f'/// Convert every item of a compact array with `into_full`.')
+    lines.append(f'fn full_items<T, U, C: FromIterator<U>>(')
+    lines.append(f'    items: impl IntoIterator<Item = T>,')
+    lines.append(f'    into_full: impl FnMut(T) -> serde_json::Result<U>,')
+    lines.append(f') -> serde_json::Result<C> {{')
+    lines.append(f'    items.into_iter().map(into_full).collect()')
+    lines.append(f'}}')
+    lines.append(f'')
+    return '\n'.join(lines)
 
-        # Build body
-        lines.append(f'        let mut req = serde_json::Map::new();')
-        for field in required_fields:
-            fname = safe_field_name(field['name'])
-            ftype = field_rust_type(field, types_map)
-            expr = f'{fname}.into()' if ftype in ('String', 'ChatId', 'InputFileOrString', 'InputMedia') else fname
-            lines.append(f'        req.insert("{field["name"]}".into(), serde_json::to_value({expr}).unwrap_or_default());')
+def emit_compact_type(type_name, tg_type, types_map, compact, rare, boxed=(), enum_fields=None):
+    """Yield the (unformatted) Rust source lines of a struct's compact mirror."""
+    owned_names = (set(types_map) - SKIP_TYPES) | set(string_enums(types_map)[1])
+    fields = list(struct_fields(tg_type, types_map, boxed, enum_fields))
+    # Rare fields decode straight into the owned types.
+    kept = [(field, fname, compact_qualify(ftype, compact, owned_names))
+            for field, fname, ftype in fields if field['name'] not in rare]
+    extra = [(field, fname, compact_qualify(ftype, (), owned_names))
+             for field, fname, ftype in fields if field['name'] in rare]
+    extra_name = f'{type_name}Extra'
+
+    if extra:
+        yield f'/// [`owned::{type_name}`] without its {len(extra)} rare fields, which stay'
+        yield f'/// undecoded in `extra` (see [`{extra_name}`]).'
+    else:
+        yield f'/// [`owned::{type_name}`] holding compact mirrors.'
+    yield '#[derive(Debug, Clone)]'
+    yield f'pub struct {type_name} {{'
+    for field, fname, ftype in kept:
+        yield f'    pub {fname}: {ftype},'
+    if extra:
+        yield f'    /// The rare fields that were present, as a JSON object.'
+        yield f'    pub {EXTRA_FIELD}: Option<Box<RawValue>>,'
+    yield '}'
+    yield ''
+
+    if extra:
+        yield f'/// The rare fields of [`{type_name}`], decoded from its `extra`.'
+        yield '#[derive(Debug, Clone, Default, Deserialize)]'
+        yield f'pub struct {extra_name} {{'
+        for field, fname, ftype in extra:
+            if fname != field['name']:
+                yield f'    #[serde(rename = "{field["name"]}")]'
+            yield f'    pub {fname}: {ftype},'
+        yield '}'
+        yield ''
+
+    yield f'impl {type_name} {{'
+    if extra:
+        yield f'    /// Decode the rare fields held in `extra`.'
+        yield from fn_lines(4, f'pub fn {EXTRA_FIELD}', ['&self'], f' -> serde_json::Result<{extra_name}> {{')
+        yield f'        match &self.{EXTRA_FIELD} {{'
+        yield f'            Some(raw) => serde_json::from_str(raw.get()),'
+        yield f'            None => Ok({extra_name}::default()),'
+        yield f'        }}'
+        yield f'    }}'
+        yield ''
+    yield f'    /// The full [`owned::{type_name}`], decoding every rare field.'
+    yield from fn_lines(4, 'pub fn into_full', ['self'], f' -> serde_json::Result<owned::{type_name}> {{')
+    if extra:
+        yield f'        let extra = self.{EXTRA_FIELD}()?;'
+    yield f'        Ok(owned::{type_name} {{'
+    for field, fname, _ in kept:
+        t = field['types'][0] if len(field['types']) == 1 else None
+        target = f'self.{fname}' if field['required'] else 'v'
+        boxed_field = field['name'] in boxed
+        converted = t and full_conversion(t, f'(*{target})' if boxed_field else target, compact)
+        if converted is None:
+            value = f'self.{fname}'
+        elif field['required']:
+            value = f'Box::new({converted}?)' if boxed_field else f'{converted}?'
+        elif converted == 'v.into_full()':
+            value = f'self.{fname}.map({t}::into_full).transpose()?'
+        else:
+            converted = f'{converted}.map(Box::new)' if boxed_field else converted
+            value = f'self.{fname}.map(|v| {converted}).transpose()?'
+        yield from field_lines(12, fname, value)
+    for field, fname, _ in extra:
+        yield from field_lines(12, fname, f'extra.{fname}')
+    yield f'        }})'
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+    yield from emit_compact_serialize(type_name, kept, bool(extra))
+    yield from emit_compact_deserialize(type_name, kept, extra)
+
+def emit_compact_serialize(type_name, kept, has_extra):
+    """Yield a Serialize impl writing the kept fields and then the ones in `extra`."""
+    yield f'impl Serialize for {type_name} {{'
+    yield f'    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {{'
+    yield f'        use serde::ser::SerializeMap;'
+    yield f'        let mut map = serializer.serialize_map(None)?;'
+    for field, fname, ftype in kept:
+        if ftype.startswith('Option<'):
+            yield f'        if let Some(v) = &self.{fname} {{'
+            yield from chain_lines(12, '', f'map.serialize_entry("{field["name"]}", v)?', ';')
+            yield f'        }}'
+        else:
+            yield from chain_lines(8, '', f'map.serialize_entry("{field["name"]}", &self.{fname})?', ';')
+    if has_extra:
+        yield f'        if let Some(raw) = &self.{EXTRA_FIELD} {{'
+        yield f'            let fields: std::collections::BTreeMap<&str, &RawValue> ='
+        yield f'                serde_json::from_str(raw.get()).map_err(serde::ser::Error::custom)?;'
+        yield f'            for (name, value) in fields {{'
+        yield f'                map.serialize_entry(name, value)?;'
+        yield f'            }}'
+        yield f'        }}'
+    yield f'        map.end()'
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+
+def emit_compact_deserialize(type_name, kept, extra):
+    """Yield a Deserialize impl decoding the kept fields and copying rare ones into `extra`.
+
+    Needs a serde_json deserializer (RawValue), like every type that holds one.
+    """
+    names = [field['name'] for field, _, _ in kept + extra]
+    yield f"impl<'de> Deserialize<'de> for {type_name} {{"
+    yield f"    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {{"
+    yield f'        use serde::de::{{Error, IgnoredAny, MapAccess, Visitor}};'
+    yield ''
+    yield from array_lines(8, 'const FIELDS: &[&str] = &[', [f'"{name}"' for name in names], '];')
+    yield f'        const IGNORE: usize = usize::MAX;'
+    yield ''
+    yield from emit_field_index(names)
+    yield f'        struct StructVisitor;'
+    yield f"        impl<'de> Visitor<'de> for StructVisitor {{"
+    yield f'            type Value = {type_name};'
+    yield f"            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {{"
+    yield f'                f.write_str("struct {type_name}")'
+    yield f'            }}'
+    yield ''
+    yield from fn_lines(12, "fn visit_map<A: MapAccess<'de>>", ['self', 'mut map: A'],
+                        f' -> Result<{type_name}, A::Error> {{')
+    for _, fname, ftype in kept:
+        yield from let_lines(16, f'let mut {fname}: Option<{ftype}>', 'None')
+    if extra:
+        yield f'                let mut extra = String::new();'
+    yield f'                while let Some(Field(index)) = map.next_key()? {{'
+    yield f'                    match index {{'
+    for i, (field, fname, _) in enumerate(kept):
+        yield f'                        {i} => {{'
+        yield f'                            if {fname}.is_some() {{'
+        yield from return_lines(32, f'Err(A::Error::duplicate_field("{field["name"]}"))')
+        yield f'                            }}'
+        yield f'                            {fname} = Some(map.next_value()?);'
+        yield f'                        }}'
+    if extra:
+        yield f'                        {len(kept)}..={len(names) - 1} => {{'
+        yield f"                            extra.push(if extra.is_empty() {{ '{{' }} else {{ ',' }});"
+        yield f"                            extra.push('\"');"
+        yield f'                            extra.push_str(FIELDS[index]);'
+        yield f'                            extra.push_str("\\":");'
+        yield f'                            extra.push_str(map.next_value::<Box<RawValue>>()?.get());'
+        yield f'                        }}'
+    yield f'                        _ => {{'
+    yield f'                            map.next_value::<IgnoredAny>()?;'
+    yield f'                        }}'
+    yield f'                    }}'
+    yield f'                }}'
+    yield f'                Ok({type_name} {{'
+    for field, fname, ftype in kept:
+        if ftype.startswith('Option<'):
+            yield from field_lines(20, fname, f'{fname}.unwrap_or(None)')
+        else:
+            yield from field_lines(20, fname, f'{fname}.ok_or_else(|| A::Error::missing_field("{field["name"]}"))?')
+    if extra:
+        yield f'                    {EXTRA_FIELD}: if extra.is_empty() {{'
+        yield f'                        None'
+        yield f'                    }} else {{'
+        yield f"                        extra.push('}}');"
+        yield f'                        Some(RawValue::from_string(extra).map_err(A::Error::custom)?)'
+        yield f'                    }},'
+    yield f'                }})'
+    yield f'            }}'
+    yield f'        }}'
+    yield ''
+    yield from chain_lines(8, '', f'deserializer.deserialize_struct("{type_name}", FIELDS, StructVisitor)', '')
+    yield f'    }}'
+    yield f'}}'
+    yield ''
+
+def compact_items(spec, profile, budget=SIZE_BUDGET):
+    """Yield (name, spec entry, source) for every compact mirror, in output order.
+
+    Exits with an error if a mirrored struct has a field named like the
+    `extra` field or a rare-fields struct would shadow a type.
+    """
+    types_map = spec['types']
+    rare = rare_fields(types_map, profile)
+    compact = compact_types(types_map, rare)
+    cycles = boxed_fields(types_map, budget)
+    enum_fields, _ = string_enums(types_map)
+    for type_name in sorted(compact):
+        tg_type = types_map[type_name]
+        names = rare.get(type_name, [])
+        if names and (f'{type_name}Extra' in types_map
+                      or any(f['name'] == EXTRA_FIELD for f in tg_type['fields'])):
+            sys.exit(f'error: cannot generate compact {type_name}: `{EXTRA_FIELD}` is taken')
+        boxed = sorted(field for owner, field in cycles if owner == type_name)
+        fields = {field: name for (owner, field), name in enum_fields.items() if owner == type_name}
+        refs = sorted({base_type(t) for f in tg_type['fields'] for t in f['types']})
+        entry = ['compact', tg_type, boxed, fields, names, [ref in compact for ref in refs]]
+        lines = emit_compact_type(type_name, tg_type, types_map, compact, set(names), boxed, fields)
+        yield type_name, entry, '\n'.join(lines)
 
-        if has_opts:
-            lines.append(f'        if let Some(p) = params {{')
-            lines.append(f'            let extra = serde_json::to_value(&p).unwrap_or_default();')
-            lines.append(f'            if let serde_json::Value::Object(m) = extra {{')
-            lines.append(f'                for (k, v) in m {{ if !v.is_null() {{ req.insert(k, v); }} }}')
-            lines.append(f'            }}')
-            lines.append(f'        }}')
-
-        lines.append(f'        self.call_api("{method_name}", &serde_json::Value::Object(req)).await')
-        lines.append(f'    }}')
-        lines.append(f'}}')
-        lines.append(f'')
+# ─────────────────────────────────────────────────
+# Lean builds (--methods / --manifest)
+# ─────────────────────────────────────────────────
+#
+# A lean build generates only the methods a bot calls and the types reachable
+# from them: their parameters and return types, then every field type and
+# union variant of those in turn. Update is always kept, so every payload
+# type a handler can receive is there too.
+
+# Methods and types the hand-written library code uses (Poller, WebhookServer,
+# Bot::new, ReplyMarkup, InputMedia); a lean build always keeps them.
+LIBRARY_METHODS = ('getUpdates', 'setWebhook')
+LIBRARY_TYPES = (
+    'Update', 'User',
+    'ForceReply', 'InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove',
+    'InputMediaAnimation', 'InputMediaAudio', 'InputMediaDocument', 'InputMediaPhoto', 'InputMediaVideo',
+)
+
+def read_manifest(path):
+    """Method names listed in a manifest file: whitespace or comma separated, `#` comments."""
+    with open(path) as f:
+        text = re.sub(r'#.*', '', f.read())
+    return [name for name in re.split(r'[\s,]+', text) if name]
 
+def lean_subset(spec, methods):
+    """(types, methods) to generate for a bot that calls `methods`.
+
+    Exits with an error if a method is not in the spec.
+    """
+    types_map = spec['types']
+    methods_map = spec['methods']
+    unknown = sorted(set(methods) - set(methods_map))
+    if unknown:
+        sys.exit(f"error: unknown method(s) in manifest: {', '.join(unknown)}")
+    keep_methods = set(methods) | set(LIBRARY_METHODS)
+    stack = list(LIBRARY_TYPES)
+    for name in keep_methods:
+        method = methods_map[name]
+        stack.extend(base_type(t) for t in method.get('returns', []))
+        for field in method.get('fields', []):
+            stack.extend(base_type(t) for t in field['types'])
+    keep_types = set()
+    while stack:
+        name = stack.pop()
+        if name in keep_types or name not in types_map:
+            continue
+        keep_types.add(name)
+        tg_type = types_map[name]
+        stack.extend(tg_type.get('subtypes', []))
+        for field in tg_type.get('fields', []):
+            stack.extend(base_type(t) for t in field['types'])
+    return keep_types, keep_methods
+
+# ─────────────────────────────────────────────────
+# Sharded output (--shard)
+# ─────────────────────────────────────────────────
+
+def shard_mod(version, shards):
+    """mod.rs for a sharded output directory: declares and re-exports every shard."""
+    lines = []
+    lines.append(f'// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.')
+    lines.append(f'// Generated from Telegram Bot API {version}')
+    lines.append(f'// See:     https://core.telegram.org/bots/api')
+    lines.append(f'')
+    for shard in shards:
+        lines.append(f'mod {shard};')
+    lines.append(f'')
+    for shard in shards:
+        lines.append(f'pub use {shard}::*;')
+    lines.append(f'')
     return '\n'.join(lines)
 
+def used_shards(names):
+    return sorted({shard_of(name) for name in names})
+
+def output_plan(spec, sharded, borrowed=False, hot=HOT_TYPES, lean=None, profile=None, budget=SIZE_BUDGET,
+                compact_out='compact.rs'):
+    """Return [(path relative to the output directory, header, items)] for every file to generate.
+
+    `lean` is a (types, methods) pair from lean_subset restricting the output,
+    `profile` a traffic profile to generate the compact module (written to
+    `compact_out`, which may be absolute) from and `budget` the struct size
+    above which cold fields are boxed.
+    """
+    version = spec['version']
+    keep_types, keep_methods = lean or (None, None)
+    extra = [('gen_borrowed.rs', borrowed_header(version), borrowed_items(spec, budget))] if borrowed else []
+    if profile is not None:
+        extra.append((compact_out, compact_header(version, profile), compact_items(spec, profile, budget)))
+    if not sharded:
+        return [
+            ('gen_types.rs', types_header(version), type_items(spec, hot=hot, keep=keep_types, budget=budget)),
+            ('gen_methods.rs', methods_header(version), method_items(spec, keep=keep_methods)),
+        ] + extra
+    type_shards = used_shards(n for n in keep_types or spec['types'] if n not in SKIP_TYPES)
+    method_shards = used_shards(keep_methods or spec['methods'])
+    plan = [('gen_types/mod.rs', shard_mod(version, type_shards), [])]
+    plan += [(f'gen_types/{shard}.rs', types_header(version, sharded=True),
+              type_items(spec, shard, hot, keep_types, budget))
+             for shard in type_shards]
+    plan.append(('gen_methods/mod.rs', shard_mod(version, method_shards), []))
+    plan += [(f'gen_methods/{shard}.rs', methods_header(version), method_items(spec, shard, keep_methods))
+             for shard in method_shards]
+    return plan + extra
+
+def is_generated(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.readline().startswith('// THIS FILE IS AUTO-GENERATED')
+    except OSError:
+        return False
+
+def stale_outputs(out_dir, plan):
+    """Generated files in out_dir that the current plan no longer produces.
+
+    Switching between monolithic and --shard output must remove the other
+    form, otherwise rustc finds both `gen_types.rs` and `gen_types/mod.rs`.
+    """
+    planned = {os.path.normpath(os.path.join(out_dir, rel)) for rel, _, _ in plan}
+    candidates = [os.path.join(out_dir, f'{name}.rs') for name in ('gen_types', 'gen_methods')]
+    for name in ('gen_types', 'gen_methods'):
+        candidates += sorted(glob.glob(os.path.join(out_dir, name, '*.rs')))
+    return [path for path in candidates
+            if os.path.normpath(path) not in planned and is_generated(path)]
+
+def remove_stale(out_dir, plan, check=False):
+    """Delete the stale_outputs of `plan` (with `check`, only report them); returns their paths."""
+    stale = stale_outputs(out_dir, plan)
+    for path in stale:
+        if check:
+            print(f'Would remove: {path}')
+        else:
+            os.unlink(path)
+            print(f'Removed: {path}')
+    if not check:
+        for name in ('gen_types', 'gen_methods'):
+            shard_dir = Path(out_dir) / name
+            if shard_dir.is_dir() and not any(shard_dir.iterdir()):
+                shard_dir.rmdir()
+    return stale
+
 # ─────────────────────────────────────────────────
 # Generate constants (string literals from spec)
 # ─────────────────────────────────────────────────
@@ -389,38 +2606,721 @@ def generate_consts(spec):
     lines.append('')
     return '\n'.join(lines)
 
+# ─────────────────────────────────────────────────
+# Incremental cache
+# ─────────────────────────────────────────────────
+#
+# Every type and method is emitted as an independent item. The formatted Rust
+# for each item is cached on disk, keyed by a digest of its spec entry, the
+# generator version and whatever global spec state the item's output depends
+# on. On the next run only new or changed items go through rustfmt, and output
+# files whose content is unchanged are not rewritten (their mtime is kept, so
+# cargo does not recompile the crate).
+#
+# Fragments are stored one file per item so that a run only ever holds the
+# items it is currently emitting in memory. Builds with different options
+# (--shard, --methods, --hot-types, ...) share the cache, so a fragment is
+# only deleted once no run has used it for CACHE_MAX_AGE.
+
+# Bump when emitted output changes in a way the source digest below can't see.
+GENERATOR_VERSION = '1'
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+ITEM_MARKER = '// @@tgbotrs-item '
+
+# Number of uncached items sent to rustfmt in one call.
+FORMAT_BATCH = 64
+
+# Seconds after which a fragment no run has used is deleted.
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+def generator_fingerprint():
+    """Digest of the generator version and its source (this script and spec_model.py)."""
+    h = hashlib.sha256(GENERATOR_VERSION.encode())
+    here = Path(__file__).resolve().parent
+    for source in ('codegen.py', 'spec_model.py'):
+        h.update((here / source).read_bytes())
+    return h.hexdigest()
+
+def digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=raw_json).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+def spec_context(spec):
+    """Global spec state that individual items depend on.
+
+    Field types are resolved against the set of known type names (an optional
+    params field that references a struct is boxed), so adding or removing a
+    type invalidates every item.
+    """
+    return digest(sorted(spec['types'].keys()))
+
+def open_cache(cache_dir, fingerprint, readonly=False):
+    """Return the fragment directory for this generator, dropping stale generations.
+
+    With `readonly` (--check), nothing is created or dropped: the directory is
+    returned if it exists, else None.
+    """
+    root = Path(cache_dir)
+    current = root / fingerprint[:16]
+    if readonly:
+        return current if current.is_dir() else None
+    if root.is_dir():
+        for entry in root.iterdir():
+            if entry.is_dir() and entry != current:
+                shutil.rmtree(entry, ignore_errors=True)
+    current.mkdir(parents=True, exist_ok=True)
+    return current
+
+def prune_cache(cache, used, now=None):
+    """Mark the fragments this run used and delete those unused for CACHE_MAX_AGE.
+
+    A fragment's mtime is the last time a run used it. One this run did not
+    use may belong to a build with other options, so it is kept until it ages out.
+    """
+    now = time.time() if now is None else now
+    for entry in cache.iterdir():
+        if entry.suffix != '.rs':
+            continue
+        if entry.stem in used:
+            os.utime(entry, (now, now))
+        elif now - entry.stat().st_mtime > CACHE_MAX_AGE:
+            entry.unlink(missing_ok=True)
+
+def cache_get(cache, d):
+    if cache is None:
+        return None
+    try:
+        return (cache / f'{d}.rs').read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+def cache_put(cache, d, code):
+    if cache is None:
+        return
+    # Shards share a header, so two formatting threads may store the same digest.
+    tmp = cache / f'{d}.{threading.get_ident()}.tmp'
+    tmp.write_text(code, encoding='utf-8')
+    os.replace(tmp, cache / f'{d}.rs')
+
+def rustfmt_fragments(fragments):
+    """Format a list of independent Rust fragments with a single rustfmt call."""
+    if not fragments:
+        return []
+    marked = ''.join(f'{ITEM_MARKER}{i}\n{code}\n' for i, code in enumerate(fragments))
+    result = subprocess.run(
+        ['rustfmt', '--edition', '2021', '--emit', 'stdout'],
+        input=marked, capture_output=True, text=True, check=True,
+    )
+    parts = re.split(r'^' + re.escape(ITEM_MARKER) + r'\d+\n', result.stdout, flags=re.M)
+    formatted = [part.rstrip() + '\n' for part in parts[1:]]
+    if len(formatted) != len(fragments):
+        raise RuntimeError(f'rustfmt returned {len(formatted)} fragments, expected {len(fragments)}')
+    return formatted
+
+# ─────────────────────────────────────────────────
+# Output sinks
+# ─────────────────────────────────────────────────
+#
+# Formatted fragments are streamed into a sink as soon as they are ready:
+#   FileSink   — buffered write to a temp file, replaces the target only if
+#                the content changed
+#   HashSink   — only hashes the output, for "would this change?" checks
+
+def file_digest(path):
+    """sha256 of a file's contents, or None if it does not exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+class HashSink:
+    """Hashes everything written; `changed` compares against an existing file."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.hash = hashlib.sha256()
+        self.changed = None
+
+    def write(self, text):
+        self.hash.update(text.encode('utf-8'))
+
+    def close(self):
+        self.changed = self.path is None or file_digest(self.path) != self.hash.hexdigest()
+        return self.changed
+
+class FileSink(HashSink):
+    """Streams into a temp file next to `path` and swaps it in only if the content changed."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.tmp_path = f'{path}.tmp'
+        self.file = open(self.tmp_path, 'w', encoding='utf-8', buffering=1 << 16)
+
+    def write(self, text):
+        super().write(text)
+        self.file.write(text)
+
+    def close(self):
+        self.file.close()
+        if super().close():
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.unlink(self.tmp_path)
+        return self.changed
+
+def emit_file(header, items, context, cache, sink, used=None, formatter=None, fmt=True, profiler=None,
+              store=True):
+    """Stream a formatted output file from (key, spec entry, source) items into `sink`.
+
+    Cached items are written straight through; uncached ones are held back (in
+    output order) until FORMAT_BATCH of them are waiting for rustfmt. With a
+    `formatter` executor (--jobs), batches are formatted concurrently and
+    written in order as they complete. Without `fmt` (--no-fmt), uncached
+    items are written as generated, already in rustfmt's layout, and not
+    cached; without `store` (--check) they are formatted but not cached
+    either. Digests of all emitted items are added to `used`. A `profiler`
+    (--profile) is charged for the cache, rustfmt and write time. Returns
+    (items, items not found in the cache).
+    """
+    pending = []  # [digest, code, is_formatted]
+    batches = collections.deque()  # futures of formatted pending lists, in output order
+    total = reformatted = 0
+
+    def format_batch(entries):
+        stale = [entry for entry in entries if not entry[2]]
+        if fmt and stale:
+            with profiled(profiler, 'rustfmt'):
+                formatted = rustfmt_fragments([entry[1] for entry in stale])
+            with profiled(profiler, 'cache'):
+                for entry, code in zip(stale, formatted):
+                    entry[1] = code
+                    if store:
+                        cache_put(cache, entry[0], code)
+        return entries
+
+    def write(entries):
+        nonlocal total
+        with profiled(profiler, 'write'):
+            for _, code, _ in entries:
+                if total:
+                    sink.write('\n')
+                sink.write(code)
+                total += 1
+
+    def flush():
+        entries = pending[:]
+        pending.clear()
+        if formatter is None:
+            write(format_batch(entries))
+            return
+        batches.append(formatter.submit(format_batch, entries))
+        while batches and batches[0].done():
+            write(batches.popleft().result())
+
+    waiting = 0
+    for key, entry, code in itertools.chain([('__header__', header, header)], items):
+        with profiled(profiler, 'cache'):
+            d = digest(key, context, entry)
+            cached = cache_get(cache, d)
+        if used is not None:
+            used.add(d)
+        if cached is None:
+            pending.append([d, code, False])
+            reformatted += 1
+            waiting += 1
+        elif pending or batches:
+            pending.append([d, cached, True])
+        else:
+            write([(d, cached, True)])
+        if waiting >= FORMAT_BATCH:
+            flush()
+            waiting = 0
+    flush()
+    while batches:
+        write(batches.popleft().result())
+    with profiled(profiler, 'write'):
+        sink.close()
+    return total, reformatted
+
+# ─────────────────────────────────────────────────
+# Profiling (--profile)
+# ─────────────────────────────────────────────────
+#
+# A Profiler charges wall time to the phases of a run and records how long
+# each item took to generate and how big its source is. Phases run by
+# several --jobs threads at once are summed, so they can add up to more than
+# the wall time.
+
+PROFILE_PHASES = ('load', 'resolve', 'emit types', 'emit methods', 'emit borrowed', 'emit compact',
+                  'cache', 'rustfmt', 'write')
+
+def output_kind(fname):
+    """'types', 'methods', 'borrowed' or 'compact' for a planned output file."""
+    if not Path(fname).parts[0].startswith('gen_'):
+        return 'compact'
+    return Path(fname).parts[0][len('gen_'):].split('.')[0]
+
+def profiled(profiler, name):
+    """Context charging its duration to phase `name` of `profiler`, if there is one."""
+    return profiler.phase(name) if profiler else contextlib.nullcontext()
+
+class Profiler:
+    """Seconds per phase and (kind, file, name, seconds, bytes) per generated item."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = collections.Counter()
+        self.items = []
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        with self.lock:
+            self.phases[name] += seconds
+
+    def timed_items(self, fname, items):
+        """Pass `items` through, timing how long each one takes to generate."""
+        kind = output_kind(fname)
+        items = iter(items)
+        while True:
+            start = time.perf_counter()
+            item = next(items, None)
+            elapsed = time.perf_counter() - start
+            self.add(f'emit {kind}', elapsed)
+            if item is None:
+                return
+            with self.lock:
+                self.items.append((kind, fname, item[0], elapsed, len(item[2].encode())))
+            yield item
+
+    def report(self, top):
+        """Lines of the phase breakdown and the `top` costliest items of each kind."""
+        wall = time.perf_counter() - self.start
+        lines = [f'Profile: {wall:.3f}s wall']
+        for name in sorted(self.phases, key=PROFILE_PHASES.index):
+            seconds = self.phases[name]
+            lines.append(f'  {name:<14} {seconds:>8.3f}s {seconds / wall:>6.1%}')
+        for kind in ('types', 'methods', 'borrowed', 'compact'):
+            items = [item for item in self.items if item[0] == kind]
+            if not items:
+                continue
+            for label, column in (('slowest to generate', 3), ('largest', 4)):
+                lines.append(f'Top {min(top, len(items))} {kind}, {label}:')
+                for _, _, name, seconds, size in sorted(items, key=lambda item: -item[column])[:top]:
+                    lines.append(f'  {name:<40} {seconds * 1000:>8.2f} ms {size:>9,} B')
+        return lines
+
+    def trace(self, **info):
+        """The profile as JSON-serialisable data, with `info` about the run."""
+        return dict(info, wall=time.perf_counter() - self.start,
+                    phases={name: self.phases[name] for name in sorted(self.phases, key=PROFILE_PHASES.index)},
+                    items=[{'kind': kind, 'file': fname, 'name': name, 'seconds': seconds, 'bytes': size}
+                           for kind, fname, name, seconds, size in self.items])
+
+# ─────────────────────────────────────────────────
+# Watch mode (--watch)
+# ─────────────────────────────────────────────────
+#
+# --watch keeps the parsed spec and the source and formatted code of every
+# item in memory, and polls the spec, the generator (its rules live in this
+# file and spec_model.py) and the manifest and traffic profile for changes.
+# Generating the source of every item takes a fraction of a second, so each
+# change re-runs the whole plan; only items whose source differs from the
+# last run (and is not in the cache) go through rustfmt, and only files whose
+# content changed are rewritten. Edits to the generator are picked up by
+# loading a fresh copy of it; a failing run is reported and the last good
+# state kept until the next change.
+
+# Seconds between two polls of the watched files.
+WATCH_INTERVAL = 0.25
+
+def watched_files(args):
+    here = Path(__file__).resolve().parent
+    paths = [args.spec, here / 'codegen.py', here / 'spec_model.py', args.manifest, args.traffic_profile]
+    return [str(path) for path in paths if path]
+
+def file_stamps(paths):
+    """(mtime, size) of every path, None for missing ones."""
+    stamps = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+def load_generator(reload_model):
+    """A fresh copy of this module, with the rules as they are on disk now.
+
+    With `reload_model`, spec_model.py is imported afresh too (and the spec
+    parsed again by it).
+    """
+    if reload_model:
+        sys.modules.pop('spec_model', None)
+    module_spec = importlib.util.spec_from_file_location('codegen_watch', Path(__file__).resolve())
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+def item_changes(old, new):
+    """Lines naming the items added (+), changed (~) and removed (-) between two runs of a file."""
+    lines = []
+    for key, (_, code) in new.items():
+        if key not in old:
+            lines.append(f'  + {key}')
+        elif old[key][1] != code:
+            lines.append(f'  ~ {key}')
+    lines += [f'  - {key}' for key in old if key not in new]
+    return lines
+
+class Watcher:
+    """The in-memory state of --watch: {path: {item key: (source, formatted code)}}."""
+
+    def __init__(self, args):
+        self.args = args
+        self.gen = sys.modules[__name__]
+        self.items = {}
+        self.cache = None
+        self.fingerprint = None
+
+    def run(self, changed=()):
+        """Regenerate after `changed` files changed; returns False if the run failed."""
+        start = time.perf_counter()
+        try:
+            written = self.regenerate(changed)
+        except Exception:
+            traceback.print_exc()
+            print('❌ Regeneration failed; keeping the previous output')
+            return False
+        names = ', '.join(os.path.basename(path) for path in changed) or 'initial run'
+        summary = f'{written} file(s) written' if written else 'no output changed'
+        print(f'Regenerated in {time.perf_counter() - start:.2f}s ({names}): {summary}')
+        return True
+
+    def regenerate(self, changed):
+        args = self.args
+        here = Path(__file__).resolve().parent
+        model_changed = str(here / 'spec_model.py') in changed
+        rules_changed = model_changed or str(here / 'codegen.py') in changed
+        if rules_changed:
+            self.gen = load_generator(model_changed)
+        gen = self.gen
+        spec = gen.load_spec(args.spec)
+        if rules_changed:
+            # Analyses memoised on the spec were computed under the old rules.
+            spec.types.memo.clear()
+        new_cache = False
+        if not args.no_cache:
+            fingerprint = gen.generator_fingerprint()
+            if fingerprint != self.fingerprint:
+                self.cache = gen.open_cache(args.cache_dir, fingerprint)
+                self.fingerprint = fingerprint
+                new_cache = True
+        context = gen.spec_context(spec)
+        lean, _, outputs = gen.plan_outputs(spec, args)
+
+        # [key, digest, source, formatted] per item, by output file.
+        files = []
+        used = set()
+        for fname, header, items in outputs:
+            path = os.path.join(args.out_dir, fname)
+            old = self.items.get(path, {})
+            entries = []
+            for key, entry, code in itertools.chain([('__header__', header, header)], items):
+                d = gen.digest(key, context, entry)
+                used.add(d)
+                prev = old.get(key)
+                if prev and prev[0] == code:
+                    formatted = prev[1]
+                    if new_cache and not args.no_fmt:
+                        # Keep the new cache generation complete for the next cold run.
+                        gen.cache_put(self.cache, d, formatted)
+                else:
+                    formatted = gen.cache_get(self.cache, d)
+                entries.append([key, d, code, formatted])
+            files.append((path, entries))
+
+        # Batches never span files: a header's inner attributes must come first.
+        batches = []
+        for _, entries in files:
+            stale = [entry for entry in entries if entry[3] is None]
+            batches += [stale[i:i + gen.FORMAT_BATCH] for i in range(0, len(stale), gen.FORMAT_BATCH)]
+        if args.no_fmt:
+            for entry in itertools.chain.from_iterable(batches):
+                entry[3] = entry[2]
+        else:
+            sources = [[entry[2] for entry in batch] for batch in batches]
+            if args.jobs > 1 and len(batches) > 1:
+                with concurrent.futures.ThreadPoolExecutor(args.jobs) as pool:
+                    results = list(pool.map(gen.rustfmt_fragments, sources))
+            else:
+                results = [gen.rustfmt_fragments(batch) for batch in sources]
+            for batch, formatted in zip(batches, results):
+                for entry, code in zip(batch, formatted):
+                    entry[3] = code
+                    gen.cache_put(self.cache, entry[1], code)
+
+        written = 0
+        first = not self.items
+        for path, entries in files:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            sink = gen.FileSink(path)
+            sink.write('\n'.join(entry[3] for entry in entries))
+            new = {entry[0]: (entry[2], entry[3]) for entry in entries}
+            changes = item_changes(self.items.get(path, {}), new)
+            self.items[path] = new
+            if sink.close():
+                written += 1
+            if first:
+                state = 'Written' if sink.changed else 'Unchanged'
+                print(f'{state}: {path} ({len(entries)} items)')
+            elif changes:
+                print(f"{'Written' if sink.changed else 'Unchanged'}: {path}")
+                print('\n'.join(changes))
+        for path in gen.remove_stale(args.out_dir, outputs):
+            self.items.pop(path, None)
+        if self.cache is not None:
+            gen.prune_cache(self.cache, used)
+        gen.write_reports(spec, args, lean)
+        return written
+
+def watch(args):
+    """Regenerate into args.out_dir every time a watched file changes, until interrupted."""
+    paths = watched_files(args)
+    stamps = file_stamps(paths)
+    watcher = Watcher(args)
+    watcher.run()
+    print(f"Watching {', '.join(paths)} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = file_stamps(paths)
+            if current == stamps:
+                continue
+            # Wait for the editor to finish writing before reading anything.
+            settled = None
+            while settled != current:
+                time.sleep(WATCH_INTERVAL)
+                settled, current = current, file_stamps(paths)
+            changed = [path for path in paths if current[path] != stamps[path]]
+            stamps = current
+            watcher.run(changed)
+    except KeyboardInterrupt:
+        print('\nStopped watching')
+
 # ─────────────────────────────────────────────────
 # Main
 # ─────────────────────────────────────────────────
 
+def plan_outputs(spec, args):
+    """(lean subset, traffic profile, output_plan) for the command line `args`."""
+    methods = read_manifest(args.manifest) if args.manifest else args.methods
+    lean = None if methods is None else lean_subset(spec, methods)
+    profile = load_profile(args.traffic_profile) if args.traffic_profile else None
+    outputs = output_plan(spec, args.shard, args.borrowed, args.hot_types, lean, profile, args.size_budget,
+                          os.path.abspath(args.compact_out) if args.compact_out else None)
+    return lean, profile, outputs
+
+def write_reports(spec, args, lean):
+    """Write the --layout-report and --emit-ir files, if requested."""
+    if args.layout_report:
+        cycles = boxed_fields(spec['types'], args.size_budget)
+        layouts, _ = type_layouts(spec['types'], cycles)
+        with open(args.layout_report, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(layout_report(spec['types'], layouts, cycles)) + '\n')
+        print(f'Layout report: {args.layout_report}')
+    if args.emit_ir:
+        size = write_ir(build_ir(spec, args.hot_types, lean, args.size_budget), args.emit_ir)
+        print(f'IR: {args.emit_ir} ({size} bytes, version {IR_VERSION})')
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Generate tgbotrs Rust sources from api.json')
+    parser.add_argument('spec', nargs='?', default='api.json', help='path to api.json')
+    parser.add_argument('out_dir', nargs='?', default='../tgbotrs/src', help='output directory')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help='directory for the incremental item cache (default: codegen/.cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore and do not update the incremental cache')
+    parser.add_argument('--check', action='store_true',
+                        help='do not write anything (outputs, cache, --layout-report, --emit-ir); '
+                             'exit 1 if any output file would change')
+    parser.add_argument('--shard', action='store_true',
+                        help='split output into gen_types/ and gen_methods/ modules per API area')
+    parser.add_argument('--hot-types', type=lambda v: tuple(filter(None, v.split(','))), default=HOT_TYPES,
+                        help='comma-separated structs that get a hand-rolled Deserialize impl '
+                             f"(default: {','.join(HOT_TYPES)}; '' for none)")
+    lean = parser.add_mutually_exclusive_group()
+    lean.add_argument('--methods', type=lambda v: [name for name in v.split(',') if name],
+                      help='lean build: comma-separated methods to generate, plus the types they reach')
+    lean.add_argument('--manifest', help='lean build: file listing the methods to generate')
+    parser.add_argument('--borrowed', action='store_true',
+                        help="also generate gen_borrowed.rs, zero-copy Update<'a> mirrors (`borrowed` feature)")
+    parser.add_argument('--size-budget', type=int, default=SIZE_BUDGET, metavar='BYTES',
+                        help='box the largest optional by-value fields of structs bigger than this '
+                             f'(default: {SIZE_BUDGET}; 0 for none)')
+    parser.add_argument('--layout-report', metavar='FILE',
+                        help='write the estimated size of every type, largest first, to FILE')
+    parser.add_argument('--traffic-profile', metavar='FILE',
+                        help='also generate compact Update mirrors from a traffic_profile.py profile')
+    parser.add_argument('--compact-out', metavar='FILE',
+                        help="where --traffic-profile writes the compact module, e.g. your bot's src/compact.rs")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='generate the output files concurrently and run up to N rustfmt batches at once '
+                             '(0: one per CPU; output is identical to --jobs 1)')
+    parser.add_argument('--no-fmt', action='store_true',
+                        help='do not run rustfmt: write items missing from the cache as generated '
+                             '(the generated layout is already rustfmt\'s)')
+    parser.add_argument('--emit-ir', metavar='FILE',
+                        help='write the resolved types and methods to FILE for codegen/src/main.rs')
+    parser.add_argument('--profile', action='store_true',
+                        help='print the time spent per phase and the costliest items to generate')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help='items of each kind listed by --profile (default: 10)')
+    parser.add_argument('--profile-json', metavar='FILE',
+                        help='write the phase and per-item timings to FILE as JSON')
+    parser.add_argument('--profile-dump', metavar='FILE',
+                        help='write cProfile stats of the run to FILE (main thread only; see `python3 -m pstats`)')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and regenerate whenever the spec, the generator, '
+                             'the manifest or the traffic profile changes')
+    args = parser.parse_args(argv)
+    args.size_budget = args.size_budget or None
+    if args.watch and args.check:
+        parser.error('--watch cannot be combined with --check')
+    if bool(args.traffic_profile) != bool(args.compact_out):
+        parser.error('--traffic-profile and --compact-out go together')
+    return args
+
 def main():
-    spec_path = sys.argv[1] if len(sys.argv) > 1 else 'api.json'
-    out_dir = sys.argv[2] if len(sys.argv) > 2 else '../tgbotrs/src'
+    args = parse_args(sys.argv[1:])
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if args.watch:
+        watch(args)
+        return
+    spec_path = args.spec
+    out_dir = args.out_dir
+    profiler = Profiler() if args.profile or args.profile_json or args.profile_dump else None
+    cprofile = None
+    if args.profile_dump:
+        cprofile = cProfile.Profile()
+        cprofile.enable()
 
     print(f'Reading spec: {spec_path}')
-    spec = load_spec(spec_path)
+    with profiled(profiler, 'load'):
+        spec = load_spec(spec_path)
     print(f"Telegram Bot API {spec['version']} ({spec['release_date']})")
     print(f"Types: {len(spec['types'])}, Methods: {len(spec['methods'])}")
 
-    Path(out_dir).mkdir(parents=True, exist_ok=True)
-
-    # gen_types.rs
-    types_code = generate_types(spec)
-    with open(f'{out_dir}/gen_types.rs', 'w') as f:
-        f.write(types_code)
-    print(f'Written: {out_dir}/gen_types.rs')
-
-    # gen_methods.rs
-    methods_code = generate_methods(spec)
-    with open(f'{out_dir}/gen_methods.rs', 'w') as f:
-        f.write(methods_code)
-    print(f'Written: {out_dir}/gen_methods.rs')
-
-    # Format generated files so output is always consistent with cargo fmt.
+    cache = None if args.no_cache else open_cache(args.cache_dir, generator_fingerprint(), args.check)
+    with profiled(profiler, 'resolve'):
+        context = spec_context(spec)
+        lean, profile, outputs = plan_outputs(spec, args)
+        resolve_spec(spec, args.size_budget, args.borrowed)
+    if lean is not None:
+        # Counted as validate_generated.py counts them: the hand-crafted types
+        # are always in the crate, whether the kept methods reach them or not.
+        keep_methods = lean[1]
+        keep_types = lean[0] | SKIP_TYPES
+        hand_crafted = SKIP_TYPES
+        print(f"Lean build: {len(keep_types)}/{len(spec['types'])} types "
+              f'({len(keep_types) - len(hand_crafted)} generated + {len(hand_crafted)} hand-crafted), '
+              f"{len(keep_methods)}/{len(spec['methods'])} methods "
+              f"({len(spec['types']) - len(keep_types)} types and "
+              f"{len(spec['methods']) - len(keep_methods)} methods pruned)")
+    if profile is not None:
+        rare = rare_fields(spec['types'], profile)
+        compact = compact_types(spec['types'], rare)
+        print(f"Traffic profile: {profile['updates']} updates, {len(compact)} compact types, "
+              f'{sum(len(rare[name]) for name in compact if name in rare)} rare fields')
+
+    # Output is formatted item by item so it is always consistent with cargo fmt.
     # This ensures the validate-generated-code CI check never diffs on formatting.
-    import subprocess
-    for fname in ['gen_types.rs', 'gen_methods.rs']:
-        subprocess.run(['rustfmt', '--edition', '2021', f'{out_dir}/{fname}'], check=True)
+    used = set()
+    changed = []
+
+    def emit_output(fname, header, items):
+        path = os.path.join(out_dir, fname)
+        if not args.check:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        sink = HashSink(path) if args.check else FileSink(path)
+        if profiler:
+            items = profiler.timed_items(fname, items)
+        total, reformatted = emit_file(header, items, context, cache, sink, used, formatter, not args.no_fmt,
+                                       profiler, store=not args.check)
+        return path, sink.changed, total, reformatted
+
+    # With --jobs, every file is generated on its own thread and the rustfmt
+    # batches of all of them run concurrently; files are reported in plan order.
+    formatter = None
+    if args.jobs > 1:
+        formatter = concurrent.futures.ThreadPoolExecutor(args.jobs)
+        with concurrent.futures.ThreadPoolExecutor(len(outputs)) as files:
+            results = [f.result() for f in [files.submit(emit_output, *output) for output in outputs]]
+        formatter.shutdown()
+    else:
+        results = [emit_output(*output) for output in outputs]
+    for path, was_changed, total, reformatted in results:
+        if was_changed:
+            changed.append(path)
+        if args.check:
+            state = 'Would change' if was_changed else 'Up to date'
+        else:
+            state = 'Written' if was_changed else 'Unchanged'
+        formatted = 'unformatted' if args.no_fmt else 'formatted'
+        print(f'{state}: {path} ({reformatted}/{total} items {formatted})')
+
+    changed += remove_stale(out_dir, outputs, args.check)
+
+    if cache is not None and not args.check:
+        prune_cache(cache, used)
+
+    if not args.check:
+        write_reports(spec, args, lean)
+    cycles = boxed_fields(spec['types'], args.size_budget)
+    print(f'Boxed fields ({len(cycles)}):')
+    for (owner, field), reason in sorted(cycles.items()):
+        print(f'  {owner}.{field}: {reason}')
+
+    fallbacks = untagged_unions(spec)
+    if fallbacks:
+        print(f'Untagged unions ({len(fallbacks)}, no usable discriminator):')
+        for name, reason in fallbacks:
+            print(f'  {name}: {reason}')
+
+    if cprofile is not None:
+        cprofile.disable()
+        cprofile.dump_stats(args.profile_dump)
+        print(f'cProfile stats: {args.profile_dump}')
+    if args.profile:
+        print('\n'.join(profiler.report(args.profile_top)))
+    if args.profile_json:
+        trace = profiler.trace(spec=spec['version'], jobs=args.jobs, cached=cache is not None)
+        with open(args.profile_json, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=2)
+            f.write('\n')
+        print(f'Profile trace: {args.profile_json}')
+
+    if args.check and changed:
+        print(f'❌ {len(changed)} file(s) out of date')
+        sys.exit(1)
 
     print('Done ✅')
 
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+tgbotrs — Spec Model
+====================
+The Telegram Bot API spec (api.json) as a typed model shared by codegen.py,
+traffic_profile.py and the scripts in .github/scripts/.
+
+Usage:
+    python3 spec_model.py <api.json> [KEY...] [--shell]
+    python3 spec_model.py <api.json> --describe NAME
+
+Keys: version, release_date, types, methods, unions, fields (default: all).
+Each value is printed on its own line, or with --shell as KEY='value' lines
+to `eval` in a workflow step. --describe prints the fields of a type or
+method with their Rust names and types (before codegen.py's string enums,
+boxing and short types).
+
+Library use:
+    from spec_model import load_spec
+    spec = load_spec('api.json')
+    spec.types['Message'].fields[0].rust_name
+
+A spec is parsed once per process. The model classes keep dict-style access
+to the JSON (`spec['types']`, `field['name']`), so code written against
+api.json works unchanged. Each field resolves its Rust name and its Rust type
+(per boxing) once, and `memoised` caches whole-spec analyses, such as
+codegen.py's boxed_fields, on the spec's type table.
+
+No external Python dependencies required.
+"""
+
+import argparse
+import functools
+import json
+import os
+import re
+import shlex
+import sys
+
+# ─────────────────────────────────────────────────
+# Model
+# ─────────────────────────────────────────────────
+
+class Entry:
+    """Dict-style access to the JSON object behind a model object.
+
+    Keys listed in MODELLED return the modelled attribute instead of the raw
+    value (a type's `fields` are Field objects).
+    """
+    __slots__ = ('raw',)
+    MODELLED = ()
+
+    def __getitem__(self, key):
+        return getattr(self, key) if key in self.MODELLED else self.raw[key]
+
+    def get(self, key, default=None):
+        if key not in self.raw:
+            return default
+        return self[key]
+
+    def __contains__(self, key):
+        return key in self.raw
+
+
+class Field(Entry):
+    """A field of a type, or a parameter of a method."""
+    __slots__ = ('owner', 'name', 'types', 'required', '_rust_name', 'rust_types')
+
+    def __init__(self, owner, raw):
+        self.raw = raw
+        self.owner = owner
+        self.name = raw['name']
+        self.types = raw['types']
+        self.required = raw['required']
+        self._rust_name = None
+        # field_rust_type results by boxing, filled on first use.
+        self.rust_types = {}
+
+    @property
+    def rust_name(self):
+        if self._rust_name is None:
+            self._rust_name = safe_field_name(self.name)
+        return self._rust_name
+
+    def rust_type(self, types_map, boxed=None):
+        return field_rust_type(self, types_map, boxed)
+
+
+class TypeDef(Entry):
+    __slots__ = ('name', 'fields', 'subtypes')
+    MODELLED = ('fields',)
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.name = raw['name']
+        self.fields = [Field(self.name, f) for f in raw.get('fields', [])]
+        self.subtypes = raw.get('subtypes', [])
+
+
+class MethodDef(Entry):
+    __slots__ = ('name', 'fields', 'returns')
+    MODELLED = ('fields',)
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.name = raw['name']
+        self.fields = [Field(self.name, f) for f in raw.get('fields', [])]
+        self.returns = raw.get('returns', [])
+
+
+class TypeTable(dict):
+    """Types by name, plus the results of `memoised` analyses of them."""
+    __slots__ = ('memo',)
+
+    def __init__(self, types):
+        super().__init__(types)
+        self.memo = {}
+
+
+class Spec(Entry):
+    __slots__ = ('types', 'methods')
+    MODELLED = ('types', 'methods')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.types = TypeTable((name, TypeDef(t)) for name, t in raw.get('types', {}).items())
+        self.methods = {name: MethodDef(m) for name, m in raw.get('methods', {}).items()}
+
+    @property
+    def version(self):
+        return self.raw.get('version', 'unknown')
+
+    @property
+    def release_date(self):
+        return self.raw.get('release_date', '')
+
+
+_loaded = {}  # realpath -> ((mtime, size), Spec)
+
+def load_spec(path):
+    """The Spec in an api.json file, parsed once per process (until the file changes)."""
+    st = os.stat(path)
+    real = os.path.realpath(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    loaded = _loaded.get(real)
+    if loaded is None or loaded[0] != stamp:
+        with open(path, encoding='utf-8') as f:
+            loaded = _loaded[real] = (stamp, Spec(json.load(f)))
+    return loaded[1]
+
+def raw_json(entry):
+    """`default` for json.dumps: model objects serialise as their JSON."""
+    if isinstance(entry, Entry):
+        return entry.raw
+    raise TypeError(f'{type(entry).__name__} is not JSON serializable')
+
+def memoised(fn):
+    """Cache `fn` on the TypeTable among its arguments.
+
+    Calls without a TypeTable (a plain dict of types) or with unhashable
+    arguments are not cached. Callers must not mutate the result.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        table = next((a for a in args if isinstance(a, TypeTable)), None)
+        if table is None:
+            return fn(*args, **kwargs)
+        key = (fn.__name__,) + tuple(None if a is table else a for a in args) + tuple(sorted(kwargs.items()))
+        try:
+            return table.memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return fn(*args, **kwargs)
+        result = table.memo[key] = fn(*args, **kwargs)
+        return result
+    return wrapper
+
+# ─────────────────────────────────────────────────
+# Naming helpers
+# ─────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=None)
+def snake_case(name):
+    """Convert camelCase or PascalCase to snake_case"""
+    s = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
+    return s.lower()
+
+def safe_field_name(name):
+    """Return a Rust-safe field name"""
+    keywords = {'type', 'self', 'move', 'use', 'in', 'fn', 'let', 'mut', 'ref', 'where', 'loop', 'if', 'else', 'match', 'return'}
+    if name in keywords:
+        return 'r#' + name
+    return snake_case(name)
+
+def method_fn_name(name):
+    return snake_case(name)
+
+def method_params_struct(name):
+    return name[0].upper() + name[1:] + 'Params'
+
+# ─────────────────────────────────────────────────
+# Type mapping
+# ─────────────────────────────────────────────────
+
+BASE_TYPE_MAP = {
+    'Integer': 'i64',
+    'Float': 'f64',
+    'Boolean': 'bool',
+    'String': 'String',
+    'InputFile': 'InputFile',
+}
+
+def is_array(t):
+    return t.startswith('Array of ')
+
+def strip_array(t):
+    return t[len('Array of '):]
+
+def tg_to_rust(t, optional, types_map, boxed=None):
+    """Convert a single TG type string to Rust.
+
+    `boxed` says whether a reference to a generated struct or enum is boxed.
+    None keeps the method-params rule of boxing every optional one.
+    """
+    if is_array(t):
+        inner = strip_array(t)
+        inner_rust = tg_to_rust(inner, False, types_map)
+        rust = f'Vec<{inner_rust}>'
+        return f'Option<{rust}>' if optional else rust
+
+    base = BASE_TYPE_MAP.get(t, t)
+
+    if boxed is None:
+        boxed = optional and t in types_map and t not in BASE_TYPE_MAP
+    if boxed:
+        base = f'Box<{base}>'
+    return f'Option<{base}>' if optional else base
+
+def field_rust_type(field, types_map, boxed=None):
+    """Determine the full Rust type for a field (see tg_to_rust for `boxed`).
+
+    A model Field keeps the result, so it is resolved against its own spec.
+    """
+    cache = getattr(field, 'rust_types', None)
+    if cache is not None and boxed in cache:
+        return cache[boxed]
+    rust = resolve_field_type(field, types_map, boxed)
+    if cache is not None:
+        cache[boxed] = rust
+    return rust
+
+def resolve_field_type(field, types_map, boxed):
+    types = field['types']
+    required = field['required']
+    name = field['name']
+
+    if len(types) == 0:
+        return 'serde_json::Value'
+
+    if len(types) == 1:
+        return tg_to_rust(types[0], not required, types_map, boxed)
+
+    # Multi-type field handling
+    sorted_types = sorted(types)
+    if sorted_types == ['Integer', 'String']:
+        return 'ChatId' if required else 'Option<ChatId>'
+
+    if 'InputFile' in types and 'String' in types and len(types) == 2:
+        return 'InputFileOrString' if required else 'Option<InputFileOrString>'
+
+    if name == 'reply_markup' and len(types) >= 2:
+        return 'ReplyMarkup' if required else 'Option<ReplyMarkup>'
+
+    # media field (InputMedia* types)
+    if name == 'media':
+        if any('InputMedia' in t for t in types) or any('InputPaidMedia' in t for t in types):
+            return 'InputMedia' if required else 'Option<InputMedia>'
+
+    # Default: use first type
+    return tg_to_rust(types[0], not required, types_map, boxed)
+
+def opt_wrap(rust_type, optional):
+    """Ensure a type is wrapped in Option if optional."""
+    if optional and not rust_type.startswith('Option<'):
+        return f'Option<{rust_type}>'
+    return rust_type
+
+def return_rust_type(returns, types_map):
+    """Get Rust return type from a list of TG return types."""
+    if not returns:
+        return 'bool'
+    if len(returns) == 1:
+        t = returns[0]
+        return tg_to_rust(t, False, types_map)
+    # Multiple returns: serde_json::Value
+    return 'serde_json::Value'
+
+# ─────────────────────────────────────────────────
+# Main
+# ─────────────────────────────────────────────────
+
+QUERIES = {
+    'version': lambda spec: spec.version,
+    'release_date': lambda spec: spec.release_date,
+    'types': lambda spec: len(spec.types),
+    'methods': lambda spec: len(spec.methods),
+    'unions': lambda spec: sum(1 for t in spec.types.values() if t.subtypes),
+    'fields': lambda spec: sum(len(t.fields) for t in spec.types.values()),
+}
+
+def describe(spec, name):
+    """Lines listing a type's or method's fields with their Rust names and types."""
+    entry = spec.types.get(name) or spec.methods.get(name)
+    if entry is None:
+        sys.exit(f'error: no type or method named {name}')
+    lines = [f"{name}: {entry.get('href', '')}"]
+    if isinstance(entry, TypeDef) and entry.subtypes:
+        lines.append(f"  one of: {', '.join(entry.subtypes)}")
+    if isinstance(entry, MethodDef):
+        lines.append(f'  returns: {return_rust_type(entry.returns, spec.types)}')
+    # Method params box optional structs; type fields are boxed only where
+    # codegen.py's cycle analysis says so.
+    boxed = None if isinstance(entry, MethodDef) else False
+    for field in entry.fields:
+        lines.append(f'  {field.rust_name}: {field.rust_type(spec.types, boxed)}')
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description='Query Telegram Bot API spec metadata.')
+    parser.add_argument('spec', help='path to api.json')
+    parser.add_argument('keys', nargs='*', metavar='KEY',
+                        help=f"metadata to print: {', '.join(QUERIES)} (default: all)")
+    parser.add_argument('--shell', action='store_true', help="print KEY='value' lines for eval")
+    parser.add_argument('--describe', metavar='NAME', help='print the fields of a type or method')
+    args = parser.parse_args()
+    unknown = [key for key in args.keys if key not in QUERIES]
+    if unknown:
+        parser.error(f"unknown KEY {', '.join(unknown)} (choose from {', '.join(QUERIES)})")
+
+    spec = load_spec(args.spec)
+    if args.describe:
+        print('\n'.join(describe(spec, args.describe)))
+        return
+    for key in args.keys or QUERIES:
+        value = QUERIES[key](spec)
+        print(f'{key.upper()}={shlex.quote(str(value))}' if args.shell else value)
+
+if __name__ == '__main__':
+    main()
@@ -1,435 +1,990 @@
-use heck::{ToPascalCase, ToSnakeCase};
+//! Renders gen_types.rs and gen_methods.rs from the IR written by
+//! `codegen.py --emit-ir`, where every name, type, boxing decision, serde
+//! rename and union discriminator is already resolved.
+//!
+//! The output is unformatted (run rustfmt on it); once formatted it is what
+//! codegen.py writes, which `.github/scripts/check_ir_parity.py` checks byte
+//! for byte.
+
 use serde::Deserialize;
-use std::collections::HashMap;
-use std::fmt::Write;
+use sha2::{Digest, Sha256};
+
+/// IR format this generator reads; keep in sync with IR_VERSION in codegen.py.
+const IR_VERSION: &str = "3";
+const IR_MAGIC: &str = "tgbotrs-ir";
 
 // ─────────────────────────────────────────────────
-// API Spec structures
+// IR records (see "Intermediate representation" in codegen.py)
 // ─────────────────────────────────────────────────
 
-#[derive(Debug, Clone, Deserialize)]
-struct ApiSpec {
+#[derive(Debug, Deserialize)]
+struct Ir {
+    spec: SpecInfo,
+    types: Vec<TypeRecord>,
+    methods: Vec<MethodRecord>,
+}
+
+#[derive(Debug, Deserialize)]
+struct SpecInfo {
     version: String,
     release_date: String,
-    methods: HashMap<String, Method>,
-    types: HashMap<String, TgType>,
 }
 
-#[derive(Debug, Clone, Deserialize)]
-#[allow(dead_code)]
-struct TgType {
+#[derive(Debug, Deserialize)]
+struct TypeRecord {
     name: String,
-    description: Vec<String>,
+    kind: Kind,
+    doc: Vec<String>,
     href: String,
+    derive: String,
+    #[serde(default)]
+    fields: Vec<FieldRecord>,
+    #[serde(default)]
+    variants: Vec<String>,
+    #[serde(default)]
+    tag: Option<String>,
+    /// (variant, tag value) pairs of a tagged union.
+    #[serde(default)]
+    tag_values: Vec<(String, String)>,
+    enums: Vec<EnumRecord>,
+    size: u64,
+    /// Hot structs get a hand-rolled Deserialize impl.
     #[serde(default)]
-    fields: Vec<Field>,
-    /// If non-empty, this is a union/interface type; the list is its variants.
+    hot: bool,
+    /// Hot structs: the module of their Deserialize test and the JSON
+    /// texts it decodes.
     #[serde(default)]
-    subtypes: Vec<String>,
-    /// Which union types this type belongs to
+    test_module: String,
     #[serde(default)]
-    subtype_of: Vec<String>,
+    samples: Vec<String>,
+    /// Update: (field, variant, Rust field) of each update kind.
+    #[serde(default)]
+    update_kinds: Vec<(String, String, String)>,
 }
 
-#[derive(Debug, Clone, Deserialize)]
-struct Method {
-    name: String,
-    description: Vec<String>,
-    href: String,
+#[derive(Debug, Deserialize, PartialEq)]
+#[serde(rename_all = "lowercase")]
+enum Kind {
+    Struct,
+    Union,
+}
+
+#[derive(Debug, Deserialize)]
+struct FieldRecord {
+    json: String,
+    rust: String,
+    #[serde(rename = "type")]
+    rust_type: String,
+    doc: String,
+    rename: bool,
+    optional: bool,
+    /// Method arguments: taken as `impl Into<T>`.
+    #[serde(default)]
+    into: bool,
+    /// Optional method params: the type inside the `Option`.
     #[serde(default)]
-    fields: Vec<Field>,
-    returns: Vec<String>,
+    inner: String,
+}
+
+#[derive(Debug, Deserialize)]
+struct EnumRecord {
+    name: String,
+    /// (value, variant) pairs.
+    values: Vec<(String, String)>,
+    /// (type, field) pairs using the enum.
+    users: Vec<(String, String)>,
 }
 
-#[derive(Debug, Clone, Deserialize)]
-struct Field {
+#[derive(Debug, Deserialize)]
+struct MethodRecord {
     name: String,
-    /// Multiple means the field can be one of several types (union field).
-    types: Vec<String>,
-    required: bool,
-    description: String,
+    #[serde(rename = "fn")]
+    fn_name: String,
+    params: String,
+    doc: Vec<String>,
+    href: String,
+    returns: String,
+    args: Vec<FieldRecord>,
+    options: Vec<FieldRecord>,
+}
+
+/// Parse an IR file, checking its version and content hash.
+fn read_ir(data: &[u8]) -> Result<Ir, String> {
+    let newline = data
+        .iter()
+        .position(|&b| b == b'\n')
+        .ok_or("not a tgbotrs IR file")?;
+    let (header, body) = (&data[..newline], &data[newline + 1..]);
+    let header = std::str::from_utf8(header).map_err(|_| "not a tgbotrs IR file")?;
+    let (magic, rest) = header.split_once('/').ok_or("not a tgbotrs IR file")?;
+    let (version, checksum) = rest.split_once(" sha256:").ok_or("not a tgbotrs IR file")?;
+    if magic != IR_MAGIC {
+        return Err("not a tgbotrs IR file".to_string());
+    }
+    if version != IR_VERSION {
+        return Err(format!(
+            "IR version {version}, this generator reads version {IR_VERSION}"
+        ));
+    }
+    if format!("{:x}", Sha256::digest(body)) != checksum {
+        return Err("does not match its content hash".to_string());
+    }
+    serde_json::from_slice(body).map_err(|e| format!("invalid IR: {e}"))
 }
 
 // ─────────────────────────────────────────────────
-// Type mapping helpers
+// Headers
 // ─────────────────────────────────────────────────
 
-fn is_tg_array(s: &str) -> bool {
-    s.starts_with("Array of ")
+const BANNER: &[&str] = &[
+    "// Spec:    https://github.com/ankit-chaubey/api-spec",
+    "// Project: https://github.com/ankit-chaubey/tgbotrs",
+    "// Author:  Ankit Chaubey <ankitchaubey.dev@gmail.com>",
+    "// License: MIT",
+    "// See:     https://core.telegram.org/bots/api",
+    "",
+];
+
+fn types_header(version: &str) -> String {
+    let mut lines = vec![
+        "// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.".to_string(),
+        format!("// Generated from Telegram Bot API {version}"),
+    ];
+    lines.extend(BANNER.iter().map(|s| s.to_string()));
+    lines.extend(
+        [
+            "#![allow(clippy::all, dead_code, unused_imports)]",
+            "",
+            "use serde::{Deserialize, Serialize};",
+            "use serde_json::value::RawValue;",
+            "use std::borrow::Cow;",
+            "#[rustfmt::skip]",
+            "use crate::{ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia, ShortString, ShortVec};",
+            "",
+            "/// `Option<Cow<str>>` that borrows from the input like a bare `#[serde(borrow)] Cow<str>` does.",
+            "fn borrow_opt_str<'de: 'a, 'a, D: serde::Deserializer<'de>>(",
+            "    deserializer: D,",
+            ") -> Result<Option<Cow<'a, str>>, D::Error> {",
+            "    #[derive(Deserialize)]",
+            "    struct Str<'a>(#[serde(borrow)] Cow<'a, str>);",
+            "    Ok(Option::<Str>::deserialize(deserializer)?.map(|s| s.0))",
+            "}",
+            "",
+        ]
+        .map(String::from),
+    );
+    lines.join("\n")
 }
 
-fn strip_array(s: &str) -> &str {
-    s.trim_start_matches("Array of ")
+fn methods_header(version: &str) -> String {
+    let mut lines = vec![
+        "// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.".to_string(),
+        format!("// Generated from Telegram Bot API {version}"),
+    ];
+    lines.extend(BANNER.iter().map(|s| s.to_string()));
+    lines.extend(
+        [
+            "#![allow(clippy::all, dead_code, unused_imports, unused_mut)]",
+            "",
+            "use serde::{Deserialize, Serialize};",
+            "use crate::types::*;",
+            "#[rustfmt::skip]",
+            "use crate::{Bot, BotError, ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia};",
+            "",
+        ]
+        .map(String::from),
+    );
+    lines.join("\n")
 }
 
-/// Convert a Telegram API type name to a Rust type string.
-/// `optional` wraps struct types in `Option<Box<...>>`.
-fn tg_to_rust(s: &str, optional: bool, types_map: &HashMap<String, TgType>) -> String {
-    if is_tg_array(s) {
-        let inner = strip_array(s);
-        let inner_rust = tg_to_rust(inner, false, types_map);
-        if optional {
-            return format!("Option<Vec<{}>>", inner_rust);
-        }
-        return format!("Vec<{}>", inner_rust);
-    }
-    let base = match s {
-        "Integer" => "i64".to_string(),
-        "Float" => "f64".to_string(),
-        "Boolean" => "bool".to_string(),
-        "String" => "String".to_string(),
-        "InputFile" => "InputFile".to_string(),
-        _ => s.to_string(),
-    };
-    // If it's a complex TG type (struct) and optional, box it
-    if optional {
-        let is_tg_struct = types_map
-            .get(s)
-            .map(|t| t.subtypes.is_empty() && !t.fields.is_empty())
-            .unwrap_or(false);
-        let is_tg_union = types_map
-            .get(s)
-            .map(|t| !t.subtypes.is_empty())
-            .unwrap_or(false);
-        if is_tg_struct || is_tg_union {
-            return format!("Option<Box<{}>>", base);
-        }
-        if matches!(s, "Integer" | "Float" | "Boolean" | "String") {
-            return format!("Option<{}>", base);
+fn doc_comment(lines: &[String], indent: &str) -> String {
+    lines
+        .iter()
+        .map(|line| format!("{indent}/// {line}"))
+        .collect::<Vec<_>>()
+        .join("\n")
+}
+
+// ─────────────────────────────────────────────────
+// Types
+// ─────────────────────────────────────────────────
+
+fn emit_type(out: &mut Vec<String>, record: &TypeRecord) {
+    let name = &record.name;
+    out.push(doc_comment(&record.doc, ""));
+    out.push(format!("/// {}", record.href));
+    out.push(format!("#[derive({})]", record.derive));
+
+    if record.kind == Kind::Union {
+        out.push("#[serde(untagged)]".to_string());
+        out.push(format!("pub enum {name} {{"));
+        for variant in &record.variants {
+            out.push(format!("    {variant}({variant}),"));
         }
-        format!("Option<{}>", base)
+        out.push("}".to_string());
+        out.push(String::new());
+        emit_union_deserialize(out, record);
+    } else if record.fields.is_empty() {
+        out.push(format!("pub struct {name} {{}}"));
+        out.push(String::new());
     } else {
-        base
+        out.push(format!("pub struct {name} {{"));
+        for field in &record.fields {
+            out.push(format!("    /// {}", field.doc));
+            if field.rename {
+                out.push(format!("    #[serde(rename = \"{}\")]", field.json));
+            }
+            if field.optional {
+                out.push("    #[serde(skip_serializing_if = \"Option::is_none\")]".to_string());
+            }
+            out.push(format!("    pub {}: {},", field.rust, field.rust_type));
+        }
+        out.push("}".to_string());
+        out.push(String::new());
     }
 }
 
-/// Determine the Rust type for a field (handling union fields, optional, etc.)
-fn field_rust_type(field: &Field, types_map: &HashMap<String, TgType>) -> String {
-    match field.types.len() {
-        0 => "serde_json::Value".to_string(),
-        1 => tg_to_rust(&field.types[0], !field.required, types_map),
-        _ => {
-            // Multi-type field
-            let types = &field.types;
-            // chat_id: Integer | String => ChatId enum
-            if types == &["Integer", "String"] || types == &["String", "Integer"] {
-                if field.required {
-                    return "ChatId".to_string();
-                } else {
-                    return "Option<ChatId>".to_string();
-                }
+/// A union's Deserialize impl: the object is kept as raw JSON, then only its
+/// tag is read and the matching variant decoded, or with no tag each variant
+/// is tried in turn.
+fn emit_union_deserialize(out: &mut Vec<String>, record: &TypeRecord) {
+    let name = &record.name;
+    out.push(format!("impl<'de> Deserialize<'de> for {name} {{"));
+    out.push("    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {".to_string());
+    out.push("        use serde::de::Error;".to_string());
+    out.push("        let raw = Box::<RawValue>::deserialize(deserializer)?;".to_string());
+    match &record.tag {
+        None => {
+            for variant in &record.variants {
+                out.push("        if let Ok(v) = serde_json::from_str(raw.get()) {".to_string());
+                out.push(format!("            return Ok(Self::{variant}(v));"));
+                out.push("        }".to_string());
             }
-            // InputFile | String => InputFileOrString
-            if (types.contains(&"InputFile".to_string()) && types.contains(&"String".to_string()))
-                && types.len() == 2
-            {
-                if field.required {
-                    return "InputFileOrString".to_string();
-                } else {
-                    return "Option<InputFileOrString>".to_string();
-                }
-            }
-            // reply_markup: InlineKeyboardMarkup | ReplyKeyboardMarkup | ReplyKeyboardRemove | ForceReply
-            if field.name == "reply_markup" {
-                if field.required {
-                    return "ReplyMarkup".to_string();
-                } else {
-                    return "Option<ReplyMarkup>".to_string();
-                }
+            out.push(format!(
+                "        Err(D::Error::custom(\"data did not match any variant of untagged enum {name}\"))"
+            ));
+        }
+        Some(tag) => {
+            let tags = record
+                .tag_values
+                .iter()
+                .map(|(_, value)| format!("\"{value}\""))
+                .collect::<Vec<_>>()
+                .join(", ");
+            out.push(format!("        const TAGS: &[&str] = &[{tags}];"));
+            out.push("        #[derive(Deserialize)]".to_string());
+            out.push("        struct Tag<'a> {".to_string());
+            out.push(format!(
+                "            #[serde(rename = \"{tag}\", borrow, default, deserialize_with = \"borrow_opt_str\")]"
+            ));
+            out.push("            tag: Option<Cow<'a, str>>,".to_string());
+            out.push("        }".to_string());
+            out.push(
+                "        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;"
+                    .to_string(),
+            );
+            out.push("        match tag.tag.as_deref() {".to_string());
+            for (variant, value) in &record.tag_values {
+                out.push(format!(
+                    "            Some(\"{value}\") => serde_json::from_str(raw.get()).map(Self::{variant}),"
+                ));
             }
-            // Default: use first type
-            tg_to_rust(&types[0], !field.required, types_map)
+            out.push(
+                "            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),"
+                    .to_string(),
+            );
+            out.push(format!(
+                "            None => return Err(D::Error::missing_field(\"{tag}\")),"
+            ));
+            out.push("        }".to_string());
+            out.push("        .map_err(D::Error::custom)".to_string());
         }
     }
+    out.push("    }".to_string());
+    out.push("}".to_string());
+    out.push(String::new());
 }
 
-fn rust_field_name(name: &str) -> String {
-    // Some names conflict with Rust keywords
-    match name {
-        "type" => "r#type".to_string(),
-        "self" => "r#self".to_string(),
-        "move" => "r#move".to_string(),
-        _ => name.to_snake_case(),
+fn emit_string_enum(out: &mut Vec<String>, record: &EnumRecord) {
+    let name = &record.name;
+    let fields = record
+        .users
+        .iter()
+        .map(|(owner, field)| format!("`{owner}.{field}`"))
+        .collect::<Vec<_>>()
+        .join(", ");
+    let mut push = |line: &str| out.push(line.to_string());
+    push(&format!("/// Values of {fields}."));
+    push("///");
+    push("/// Values added by later Bot API versions deserialise to `Other`.");
+    push("#[derive(Debug, Clone, PartialEq, Eq, Hash)]");
+    push("#[non_exhaustive]");
+    push(&format!("pub enum {name} {{"));
+    for (value, variant) in &record.values {
+        push(&format!("    /// `\"{value}\"`"));
+        push(&format!("    {variant},"));
+    }
+    push("    /// A value not known to this version of the library.");
+    push("    Other(String),");
+    push("}");
+    push("");
+    push(&format!("impl {name} {{"));
+    push("    /// The value as sent by the Bot API.");
+    push("    pub fn as_str(&self) -> &str {");
+    push("        match self {");
+    for (value, variant) in &record.values {
+        push(&format!("            Self::{variant} => \"{value}\","));
+    }
+    push("            Self::Other(value) => value,");
+    push("        }");
+    push("    }");
+    push("}");
+    push("");
+    push(&format!("impl From<&str> for {name} {{"));
+    push("    fn from(value: &str) -> Self {");
+    push("        match value {");
+    for (value, variant) in &record.values {
+        push(&format!("            \"{value}\" => Self::{variant},"));
     }
+    push("            _ => Self::Other(value.to_string()),");
+    push("        }");
+    push("    }");
+    push("}");
+    push("");
+    push(&format!("impl std::fmt::Display for {name} {{"));
+    push("    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {");
+    push("        f.write_str(self.as_str())");
+    push("    }");
+    push("}");
+    push("");
+    push(&format!("impl PartialEq<str> for {name} {{"));
+    push("    fn eq(&self, other: &str) -> bool { self.as_str() == other }");
+    push("}");
+    push("");
+    push(&format!("impl PartialEq<&str> for {name} {{"));
+    push("    fn eq(&self, other: &&str) -> bool { self.as_str() == *other }");
+    push("}");
+    push("");
+    push(&format!("impl Serialize for {name} {{"));
+    push(
+        "    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {",
+    );
+    push("        serializer.serialize_str(self.as_str())");
+    push("    }");
+    push("}");
+    push("");
+    push(&format!("impl<'de> Deserialize<'de> for {name} {{"));
+    push("    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {");
+    push("        struct Visitor;");
+    push("        impl<'de> serde::de::Visitor<'de> for Visitor {");
+    push(&format!("            type Value = {name};"));
+    push("            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {");
+    push("                f.write_str(\"a string\")");
+    push("            }");
+    push(&format!(
+        "            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<{name}, E> {{"
+    ));
+    push(&format!("                Ok({name}::from(value))"));
+    push("            }");
+    push("        }");
+    push("        deserializer.deserialize_str(Visitor)");
+    push("    }");
+    push("}");
+    push("");
 }
 
-fn method_fn_name(name: &str) -> String {
-    name.to_snake_case()
+// ─────────────────────────────────────────────────
+// Hot types (see "Hot types" in codegen.py)
+// ─────────────────────────────────────────────────
+
+/// {(length, first byte): [(index, name)]} for a struct's JSON field names.
+type Buckets<'a> = std::collections::BTreeMap<(usize, u8), Vec<(usize, &'a str)>>;
+
+fn field_buckets<'a>(names: &[&'a str]) -> Buckets<'a> {
+    let mut buckets = Buckets::new();
+    for (i, name) in names.iter().enumerate() {
+        buckets
+            .entry((name.len(), name.as_bytes()[0]))
+            .or_default()
+            .push((i, name));
+    }
+    buckets
 }
 
-fn method_params_name(name: &str) -> String {
-    format!("{}Params", name.to_pascal_case())
+fn emit_field_index(out: &mut Vec<String>, names: &[&str]) {
+    out.push("        fn field_index(name: &[u8]) -> usize {".to_string());
+    out.push("            match (name.len(), name.first()) {".to_string());
+    for ((length, first), candidates) in field_buckets(names) {
+        let arms = candidates
+            .iter()
+            .map(|(i, name)| format!("b\"{name}\" => {i},"))
+            .collect::<Vec<_>>()
+            .join(" ");
+        out.push(format!(
+            "                ({length}, Some(b'{}')) => match name {{ {arms} _ => IGNORE }},",
+            first as char
+        ));
+    }
+    for line in [
+        "                _ => IGNORE,",
+        "            }",
+        "        }",
+        "",
+        "        struct Field(usize);",
+        "        impl<'de> Deserialize<'de> for Field {",
+        "            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {",
+        "                struct FieldVisitor;",
+        "                impl<'de> Visitor<'de> for FieldVisitor {",
+        "                    type Value = Field;",
+        "                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {",
+        "                        f.write_str(\"field identifier\")",
+        "                    }",
+        "                    fn visit_u64<E: Error>(self, value: u64) -> Result<Field, E> {",
+        "                        Ok(Field(if value < FIELDS.len() as u64 { value as usize } else { IGNORE }))",
+        "                    }",
+        "                    fn visit_str<E: Error>(self, value: &str) -> Result<Field, E> {",
+        "                        Ok(Field(field_index(value.as_bytes())))",
+        "                    }",
+        "                    fn visit_bytes<E: Error>(self, value: &[u8]) -> Result<Field, E> {",
+        "                        Ok(Field(field_index(value)))",
+        "                    }",
+        "                }",
+        "                deserializer.deserialize_identifier(FieldVisitor)",
+        "            }",
+        "        }",
+        "",
+    ] {
+        out.push(line.to_string());
+    }
 }
 
-// Types implemented manually in the library — skip generating them to avoid duplicates.
-// Keep in sync with SKIP_TYPES in codegen/codegen.py and HAND_CRAFTED_TYPES in
-// .github/scripts/validate_generated.py
-const SKIP_TYPES: &[&str] = &["InputFile", "InputMedia"];
+fn emit_fast_deserialize(out: &mut Vec<String>, record: &TypeRecord) {
+    let name = &record.name;
+    let fields = &record.fields;
+    let names: Vec<&str> = fields.iter().map(|field| field.json.as_str()).collect();
+    let expecting = format!("struct {name} with {} elements", fields.len());
+    let quoted = names
+        .iter()
+        .map(|name| format!("\"{name}\""))
+        .collect::<Vec<_>>()
+        .join(", ");
+    out.push(format!("impl<'de> Deserialize<'de> for {name} {{"));
+    out.push("    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {".to_string());
+    out.push(
+        "        use serde::de::{Error, IgnoredAny, MapAccess, SeqAccess, Visitor};".to_string(),
+    );
+    out.push(String::new());
+    out.push(format!("        const FIELDS: &[&str] = &[{quoted}];"));
+    out.push("        const IGNORE: usize = usize::MAX;".to_string());
+    out.push(String::new());
+    emit_field_index(out, &names);
+    out.push("        struct StructVisitor;".to_string());
+    out.push("        impl<'de> Visitor<'de> for StructVisitor {".to_string());
+    out.push(format!("            type Value = {name};"));
+    out.push(
+        "            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {"
+            .to_string(),
+    );
+    out.push(format!("                f.write_str(\"struct {name}\")"));
+    out.push("            }".to_string());
+    out.push(String::new());
+    out.push(format!(
+        "            fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<{name}, A::Error> {{"
+    ));
+    out.push(format!("                Ok({name} {{"));
+    for (i, field) in fields.iter().enumerate() {
+        out.push(format!(
+            "                    {}: seq.next_element()?.ok_or_else(|| A::Error::invalid_length({i}, &\"{expecting}\"))?,",
+            field.rust
+        ));
+    }
+    out.push("                })".to_string());
+    out.push("            }".to_string());
+    out.push(String::new());
+    out.push(format!(
+        "            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<{name}, A::Error> {{"
+    ));
+    for field in fields {
+        out.push(format!(
+            "                let mut {}: Option<{}> = None;",
+            field.rust, field.rust_type
+        ));
+    }
+    out.push("                while let Some(Field(index)) = map.next_key()? {".to_string());
+    out.push("                    match index {".to_string());
+    for (i, field) in fields.iter().enumerate() {
+        out.push(format!("                        {i} => {{"));
+        out.push(format!(
+            "                            if {}.is_some() {{",
+            field.rust
+        ));
+        out.push(format!(
+            "                                return Err(A::Error::duplicate_field(\"{}\"));",
+            field.json
+        ));
+        out.push("                            }".to_string());
+        out.push(format!(
+            "                            {} = Some(map.next_value()?);",
+            field.rust
+        ));
+        out.push("                        }".to_string());
+    }
+    for line in [
+        "                        _ => {",
+        "                            map.next_value::<IgnoredAny>()?;",
+        "                        }",
+        "                    }",
+        "                }",
+    ] {
+        out.push(line.to_string());
+    }
+    out.push(format!("                Ok({name} {{"));
+    for field in fields {
+        let fname = &field.rust;
+        if field.optional {
+            out.push(format!(
+                "                    {fname}: {fname}.unwrap_or(None),"
+            ));
+        } else {
+            out.push(format!(
+                "                    {fname}: {fname}.ok_or_else(|| A::Error::missing_field(\"{}\"))?,",
+                field.json
+            ));
+        }
+    }
+    out.push("                })".to_string());
+    out.push("            }".to_string());
+    out.push("        }".to_string());
+    out.push(String::new());
+    out.push(format!(
+        "        deserializer.deserialize_struct(\"{name}\", FIELDS, StructVisitor)"
+    ));
+    out.push("    }".to_string());
+    out.push("}".to_string());
+    out.push(String::new());
+    emit_fast_deserialize_test(out, record);
+}
 
-fn sorted_keys<V>(map: &HashMap<String, V>) -> Vec<String> {
-    let mut keys: Vec<_> = map.keys().cloned().collect();
-    keys.sort();
-    keys
+fn emit_fast_deserialize_test(out: &mut Vec<String>, record: &TypeRecord) {
+    let name = &record.name;
+    out.push("#[cfg(test)]".to_string());
+    out.push(format!("mod {} {{", record.test_module));
+    out.push("    use super::*;".to_string());
+    out.push(String::new());
+    out.push(format!(
+        "    /// {name} with the derived Deserialize impl (same name, so error messages match)."
+    ));
+    out.push("    #[derive(Serialize, Deserialize)]".to_string());
+    out.push(format!("    struct {name} {{"));
+    for field in &record.fields {
+        if field.rename {
+            out.push(format!("        #[serde(rename = \"{}\")]", field.json));
+        }
+        if field.optional {
+            out.push("        #[serde(skip_serializing_if = \"Option::is_none\")]".to_string());
+        }
+        out.push(format!("        {}: {},", field.rust, field.rust_type));
+    }
+    for line in [
+        "    }",
+        "",
+        "    #[test]",
+        "    fn matches_derived() {",
+        "        for json in [",
+    ] {
+        out.push(line.to_string());
+    }
+    for text in &record.samples {
+        out.push(format!("            r##\"{text}\"##,"));
+    }
+    out.push("        ] {".to_string());
+    out.push(format!(
+        "            let fast = serde_json::from_str::<super::{name}>(json)"
+    ));
+    out.push("                .map(|v| serde_json::to_value(v).unwrap())".to_string());
+    out.push("                .map_err(|e| e.to_string());".to_string());
+    out.push(format!(
+        "            let derived = serde_json::from_str::<{name}>(json)"
+    ));
+    for line in [
+        "                .map(|v| serde_json::to_value(v).unwrap())",
+        "                .map_err(|e| e.to_string());",
+        "            assert_eq!(fast, derived, \"{}\", json);",
+        "        }",
+        "    }",
+        "}",
+        "",
+    ] {
+        out.push(line.to_string());
+    }
 }
 
 // ─────────────────────────────────────────────────
-// Code generators
+// Update kinds
 // ─────────────────────────────────────────────────
 
-fn generate_types(spec: &ApiSpec) -> String {
-    let mut out = String::new();
-    writeln!(out, "// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.").unwrap();
-    writeln!(out, "// Generated from Telegram Bot API {}", spec.version).unwrap();
-    writeln!(out, "// https://core.telegram.org/bots/api").unwrap();
-    writeln!(out).unwrap();
-    writeln!(out, "use serde::{{Deserialize, Serialize}};").unwrap();
-    writeln!(
-        out,
-        "use crate::{{ChatId, InputFile, InputFileOrString, ReplyMarkup}};"
-    )
-    .unwrap();
-    writeln!(out).unwrap();
-
-    let types_map = &spec.types;
-
-    for type_name_str in sorted_keys(types_map) {
-        if SKIP_TYPES.contains(&type_name_str.as_str()) {
-            continue;
-        }
-        let tg_type = &types_map[&type_name_str];
-        let docs = tg_type.description.join("\n/// ");
-
-        if !tg_type.subtypes.is_empty() {
-            // Union type → Rust enum
-            writeln!(out, "/// {}", docs).unwrap();
-            writeln!(out, "/// See: {}", tg_type.href).unwrap();
-            writeln!(
-                out,
-                "#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]"
-            )
-            .unwrap();
-            writeln!(out, "#[serde(untagged)]").unwrap();
-            writeln!(out, "pub enum {} {{", type_name_str).unwrap();
-            for variant in &tg_type.subtypes {
-                writeln!(out, "    {}({}),", variant, variant).unwrap();
-            }
-            writeln!(out, "}}").unwrap();
-            writeln!(out).unwrap();
-        } else if tg_type.fields.is_empty() {
-            // Empty struct (marker type)
-            writeln!(out, "/// {}", docs).unwrap();
-            writeln!(out, "/// See: {}", tg_type.href).unwrap();
-            writeln!(
-                out,
-                "#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Default)]"
-            )
-            .unwrap();
-            writeln!(out, "pub struct {} {{}}", type_name_str).unwrap();
-            writeln!(out).unwrap();
-        } else {
-            // Regular struct
-            writeln!(out, "/// {}", docs).unwrap();
-            writeln!(out, "/// See: {}", tg_type.href).unwrap();
-            writeln!(
-                out,
-                "#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]"
-            )
-            .unwrap();
-            writeln!(out, "pub struct {} {{", type_name_str).unwrap();
-
-            for field in &tg_type.fields {
-                let rust_type = field_rust_type(field, types_map);
-                let fname = rust_field_name(&field.name);
-                let desc = field.description.replace('\n', " ");
-                writeln!(out, "    /// {}", desc).unwrap();
-                // serde rename if needed (snake_case is already the default for serde)
-                if fname.starts_with("r#") || fname != field.name {
-                    writeln!(out, "    #[serde(rename = \"{}\")]", field.name).unwrap();
-                }
-                // skip_serializing_if for optional fields
-                if rust_type.starts_with("Option<") {
-                    writeln!(
-                        out,
-                        "    #[serde(skip_serializing_if = \"Option::is_none\")]"
-                    )
-                    .unwrap();
-                }
-                writeln!(out, "    pub {}: {},", fname, rust_type).unwrap();
-            }
+fn emit_update_kind(out: &mut Vec<String>, record: &TypeRecord) {
+    let kinds = &record.update_kinds;
+    let mut push = |line: &str| out.push(line.to_string());
+    push("/// The payload kinds of an [`Update`], named as in `allowed_updates`.");
+    push("#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]");
+    push("#[non_exhaustive]");
+    push("pub enum UpdateKind {");
+    for (name, variant, _) in kinds {
+        push(&format!("    /// `{name}`"));
+        push(&format!("    {variant},"));
+    }
+    push("}");
+    push("");
+    push("impl UpdateKind {");
+    push("    /// Every kind, in spec order.");
+    let all_kinds = kinds
+        .iter()
+        .map(|(_, variant, _)| format!("Self::{variant}"))
+        .collect::<Vec<_>>()
+        .join(", ");
+    push(&format!(
+        "    pub const ALL: &'static [UpdateKind] = &[{all_kinds}];"
+    ));
+    push("");
+    push("    /// The field name, as used in `allowed_updates`.");
+    push("    pub fn as_str(self) -> &'static str {");
+    push("        match self {");
+    for (name, variant, _) in kinds {
+        push(&format!("            Self::{variant} => \"{name}\","));
+    }
+    push("        }");
+    push("    }");
+    push("");
+    push(
+        "    /// The kind named `name`, or `None` if this version of the library does not know it.",
+    );
+    push("    pub fn from_name(name: &str) -> Option<Self> {");
+    push("        match name {");
+    for (name, variant, _) in kinds {
+        push(&format!("            \"{name}\" => Some(Self::{variant}),"));
+    }
+    push("            _ => None,");
+    push("        }");
+    push("    }");
+    push("}");
+    push("");
+    push("impl std::fmt::Display for UpdateKind {");
+    push("    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {");
+    push("        f.write_str(self.as_str())");
+    push("    }");
+    push("}");
+    push("");
+    push("impl Update {");
+    push("    /// Which payload this update carries.");
+    push("    pub fn kind(&self) -> Option<UpdateKind> {");
+    for (_, variant, fname) in kinds {
+        push(&format!("        if self.{fname}.is_some() {{"));
+        push(&format!("            return Some(UpdateKind::{variant});"));
+        push("        }");
+    }
+    push("        None");
+    push("    }");
+    push("}");
+    push("");
+    for line in RAW_UPDATE {
+        push(line);
+    }
+}
 
-            writeln!(out, "}}").unwrap();
-            writeln!(out).unwrap();
-        }
+/// RawUpdate and its Deserialize impl, which only depend on UpdateKind.
+const RAW_UPDATE: &[&str] = &[
+    "/// An update whose payload is decoded on first access.",
+    "///",
+    "/// Deserialising one only reads `update_id` and the payload key; the JSON",
+    "/// is kept and decoded into an [`Update`] by [`RawUpdate::update`] or",
+    "/// [`RawUpdate::into_update`].",
+    "#[derive(Debug)]",
+    "pub struct RawUpdate {",
+    "    /// The update's unique identifier.",
+    "    pub update_id: i64,",
+    "    /// The payload kind, `None` if this version of the library does not know it.",
+    "    pub kind: Option<UpdateKind>,",
+    "    json: Box<serde_json::value::RawValue>,",
+    "    update: std::sync::OnceLock<Update>,",
+    "}",
+    "",
+    "impl RawUpdate {",
+    "    /// Read `update_id` and the payload kind of a JSON update.",
+    "    pub fn from_slice(json: &[u8]) -> serde_json::Result<Self> {",
+    "        serde_json::from_slice(json)",
+    "    }",
+    "",
+    "    /// The update as received.",
+    "    pub fn json(&self) -> &str {",
+    "        self.json.get()",
+    "    }",
+    "",
+    "    /// The decoded update; the JSON is decoded on the first call only.",
+    "    pub fn update(&self) -> serde_json::Result<&Update> {",
+    "        if let Some(update) = self.update.get() {",
+    "            return Ok(update);",
+    "        }",
+    "        let update = serde_json::from_str(self.json.get())?;",
+    "        Ok(self.update.get_or_init(|| update))",
+    "    }",
+    "",
+    "    /// Decode the update, reusing it if it was already decoded.",
+    "    pub fn into_update(self) -> serde_json::Result<Update> {",
+    "        match self.update.into_inner() {",
+    "            Some(update) => Ok(update),",
+    "            None => serde_json::from_str(self.json.get()),",
+    "        }",
+    "    }",
+    "}",
+    "",
+    "impl<'de> Deserialize<'de> for RawUpdate {",
+    "    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {",
+    "        use serde::de::{Error, IgnoredAny, MapAccess, Visitor};",
+    "",
+    "        enum Key {",
+    "            UpdateId,",
+    "            Kind(UpdateKind),",
+    "            Other,",
+    "        }",
+    "        impl<'de> Deserialize<'de> for Key {",
+    "            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {",
+    "                struct KeyVisitor;",
+    "                impl<'de> Visitor<'de> for KeyVisitor {",
+    "                    type Value = Key;",
+    "                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {",
+    "                        f.write_str(\"a field name\")",
+    "                    }",
+    "                    fn visit_str<E: Error>(self, name: &str) -> Result<Key, E> {",
+    "                        Ok(match name {",
+    "                            \"update_id\" => Key::UpdateId,",
+    "                            _ => UpdateKind::from_name(name).map_or(Key::Other, Key::Kind),",
+    "                        })",
+    "                    }",
+    "                }",
+    "                deserializer.deserialize_identifier(KeyVisitor)",
+    "            }",
+    "        }",
+    "",
+    "        struct HeadVisitor;",
+    "        impl<'de> Visitor<'de> for HeadVisitor {",
+    "            type Value = (i64, Option<UpdateKind>);",
+    "            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {",
+    "                f.write_str(\"an Update object\")",
+    "            }",
+    "            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {",
+    "                let mut update_id = None;",
+    "                let mut kind = None;",
+    "                while let Some(key) = map.next_key()? {",
+    "                    match key {",
+    "                        Key::UpdateId => update_id = Some(map.next_value()?),",
+    "                        Key::Kind(k) => {",
+    "                            kind = kind.or(Some(k));",
+    "                            map.next_value::<IgnoredAny>()?;",
+    "                        }",
+    "                        Key::Other => {",
+    "                            map.next_value::<IgnoredAny>()?;",
+    "                        }",
+    "                    }",
+    "                }",
+    "                let update_id = update_id.ok_or_else(|| A::Error::missing_field(\"update_id\"))?;",
+    "                Ok((update_id, kind))",
+    "            }",
+    "        }",
+    "",
+    "        let json = Box::<serde_json::value::RawValue>::deserialize(deserializer)?;",
+    "        let mut peek = serde_json::Deserializer::from_str(json.get());",
+    "        let (update_id, kind) = serde::Deserializer::deserialize_map(&mut peek, HeadVisitor)",
+    "            .map_err(D::Error::custom)?;",
+    "        Ok(RawUpdate { update_id, kind, json, update: std::sync::OnceLock::new() })",
+    "    }",
+    "}",
+    "",
+];
+
+fn emit_layout_tests(out: &mut Vec<String>, types: &[TypeRecord]) {
+    for line in [
+        "#[cfg(all(test, target_pointer_width = \"64\", not(feature = \"small\")))]",
+        "mod layout_tests {",
+        "    use super::*;",
+        "",
+        "    macro_rules! assert_sizes {",
+        "        ($($t:ty => $size:expr,)*) => {",
+        "            $(assert_eq!(std::mem::size_of::<$t>(), $size, stringify!($t));)*",
+        "        };",
+        "    }",
+        "",
+        "    /// Sizes codegen.py estimated (see type_layouts); a failure means the model is off.",
+        "    #[test]",
+        "    fn sizes_match_codegen() {",
+        "        assert_sizes! {",
+    ] {
+        out.push(line.to_string());
+    }
+    for record in types {
+        out.push(format!("            {} => {},", record.name, record.size));
+    }
+    for line in ["        }", "    }", "}", ""] {
+        out.push(line.to_string());
     }
+}
 
+fn generate_types(ir: &Ir) -> String {
+    let mut out = types_header(&ir.spec.version);
+    for record in &ir.types {
+        let mut lines = Vec::new();
+        emit_type(&mut lines, record);
+        if record.hot {
+            emit_fast_deserialize(&mut lines, record);
+        }
+        for enum_record in &record.enums {
+            emit_string_enum(&mut lines, enum_record);
+        }
+        if !record.update_kinds.is_empty() {
+            emit_update_kind(&mut lines, record);
+        }
+        out.push('\n');
+        out.push_str(&lines.join("\n"));
+    }
+    if !ir.types.is_empty() {
+        let mut lines = Vec::new();
+        emit_layout_tests(&mut lines, &ir.types);
+        out.push('\n');
+        out.push_str(&lines.join("\n"));
+    }
     out
 }
 
-fn generate_methods(spec: &ApiSpec) -> String {
-    let mut out = String::new();
-    writeln!(out, "// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.").unwrap();
-    writeln!(out, "// Generated from Telegram Bot API {}", spec.version).unwrap();
-    writeln!(out).unwrap();
-    writeln!(out, "use serde::{{Deserialize, Serialize}};").unwrap();
-    writeln!(
-        out,
-        "use crate::{{Bot, BotError, ChatId, InputFile, InputFileOrString, ReplyMarkup}};"
-    )
-    .unwrap();
-    writeln!(out, "use crate::types::*;").unwrap();
-    writeln!(out).unwrap();
-
-    let types_map = &spec.types;
-
-    for method_name_str in sorted_keys(&spec.methods) {
-        let method = &spec.methods[&method_name_str];
-        let fn_name = method_fn_name(&method.name);
-        let params_name = method_params_name(&method.name);
-        let docs = method.description.join("\n    /// ");
-
-        let required_fields: Vec<&Field> = method.fields.iter().filter(|f| f.required).collect();
-        let optional_fields: Vec<&Field> = method.fields.iter().filter(|f| !f.required).collect();
-
-        // Generate the params struct (optional fields)
-        if !optional_fields.is_empty() {
-            writeln!(out, "/// Optional parameters for [`Bot::{}`]", fn_name).unwrap();
-            writeln!(
-                out,
-                "#[derive(Debug, Clone, Serialize, Deserialize, Default)]"
-            )
-            .unwrap();
-            writeln!(out, "pub struct {} {{", params_name).unwrap();
-            for field in &optional_fields {
-                let rust_type = field_rust_type(field, types_map);
-                let fname = rust_field_name(&field.name);
-                let desc = field.description.replace('\n', " ");
-                writeln!(out, "    /// {}", desc).unwrap();
-                if fname.starts_with("r#") || fname != field.name {
-                    writeln!(out, "    #[serde(rename = \"{}\")]", field.name).unwrap();
-                }
-                writeln!(
-                    out,
-                    "    #[serde(skip_serializing_if = \"Option::is_none\")]"
-                )
-                .unwrap();
-                // Optional fields in params struct are always Option
-                let opt_type = if rust_type.starts_with("Option<") {
-                    rust_type.clone()
-                } else {
-                    format!("Option<{}>", rust_type)
-                };
-                writeln!(out, "    pub {}: {},", fname, opt_type).unwrap();
-            }
-            writeln!(out, "}}").unwrap();
-            writeln!(out).unwrap();
-        }
+// ─────────────────────────────────────────────────
+// Methods
+// ─────────────────────────────────────────────────
 
-        // Return type
-        let ret_type = build_return_type(&method.returns, types_map);
+fn emit_method(out: &mut Vec<String>, record: &MethodRecord) {
+    let fn_name = &record.fn_name;
+    let params_name = &record.params;
+    let has_opts = !record.options.is_empty();
 
-        // Function signature
-        let req_args: Vec<String> = required_fields
-            .iter()
-            .map(|f| {
-                let rust_type = field_rust_type(f, types_map);
-                let fname = rust_field_name(&f.name);
-                // Use into() for flexible types
-                let param_type = if rust_type == "String" {
-                    "impl Into<String>".to_string()
-                } else if rust_type == "ChatId" {
-                    "impl Into<ChatId>".to_string()
-                } else if rust_type == "InputFileOrString" {
-                    "impl Into<InputFileOrString>".to_string()
-                } else {
-                    rust_type
-                };
-                format!("{}: {}", fname, param_type)
-            })
-            .collect();
-
-        let has_opts = !optional_fields.is_empty();
-
-        writeln!(out, "impl Bot {{").unwrap();
-        writeln!(out, "    /// {}", docs).unwrap();
-        writeln!(out, "    /// See: {}", method.href).unwrap();
-
-        let mut sig_args = req_args.join(", ");
-        if has_opts {
-            if !sig_args.is_empty() {
-                sig_args.push_str(", ");
+    // Params struct for optional fields
+    if has_opts {
+        out.push(format!("/// Optional parameters for [`Bot::{fn_name}`]"));
+        out.push("#[derive(Debug, Clone, Serialize, Deserialize, Default)]".to_string());
+        out.push(format!("pub struct {params_name} {{"));
+        for field in &record.options {
+            out.push(format!("    /// {}", field.doc));
+            if field.rename {
+                out.push(format!("    #[serde(rename = \"{}\")]", field.json));
             }
-            sig_args.push_str(&format!("params: Option<&{}>", params_name));
+            out.push("    #[serde(skip_serializing_if = \"Option::is_none\")]".to_string());
+            out.push(format!("    pub {}: {},", field.rust, field.rust_type));
         }
+        out.push("}".to_string());
+        out.push(String::new());
 
-        writeln!(
-            out,
-            "    pub async fn {}(&self, {}) -> Result<{}, BotError> {{",
-            fn_name, sig_args, ret_type
-        )
-        .unwrap();
-
-        // Build request body
-        writeln!(out, "        let mut form = serde_json::json!({{}});").unwrap();
-
-        // Add required fields
-        for field in &required_fields {
-            let fname = rust_field_name(&field.name);
-            let rust_type = field_rust_type(field, types_map);
-            // .into() for flexible types
-            let expr = if rust_type == "String"
-                || rust_type == "ChatId"
-                || rust_type == "InputFileOrString"
-            {
-                format!("{}.into()", fname)
-            } else {
-                fname.to_string()
-            };
-            writeln!(
-                out,
-                "        form[\"{}\"] = serde_json::to_value({}).unwrap_or_default();",
-                field.name, expr
-            )
-            .unwrap();
+        // Builder pattern for params
+        out.push(format!("impl {params_name} {{"));
+        out.push("    pub fn new() -> Self { Self::default() }".to_string());
+        for field in &record.options {
+            let fname = &field.rust;
+            out.push(format!(
+                "    pub fn {fname}(mut self, v: impl Into<{}>) -> Self {{ self.{fname} = Some(v.into()); self }}",
+                field.inner
+            ));
         }
+        out.push("}".to_string());
+        out.push(String::new());
+    }
 
-        // Add optional fields from params
-        if has_opts {
-            writeln!(out, "        if let Some(p) = params {{").unwrap();
-            for field in &optional_fields {
-                let fname = rust_field_name(&field.name);
-                writeln!(
-                    out,
-                    "            if let Some(ref v) = p.{} {{ form[\"{}\"] = serde_json::to_value(v).unwrap_or_default(); }}",
-                    fname, field.name
-                )
-                .unwrap();
+    // Signature args
+    let mut sig_parts: Vec<String> = record
+        .args
+        .iter()
+        .map(|field| {
+            if field.into {
+                format!("{}: impl Into<{}>", field.rust, field.rust_type)
+            } else {
+                format!("{}: {}", field.rust, field.rust_type)
             }
-            writeln!(out, "        }}").unwrap();
-        }
+        })
+        .collect();
+    if has_opts {
+        sig_parts.push(format!("params: Option<{params_name}>"));
+    }
+    let sig = sig_parts.join(", ");
+
+    out.push("impl Bot {".to_string());
+    out.push(doc_comment(&record.doc, "    "));
+    out.push(format!("    /// See: {}", record.href));
+    let args = if sig.is_empty() {
+        "&self".to_string()
+    } else {
+        format!("&self, {sig}")
+    };
+    out.push(format!(
+        "    pub async fn {fn_name}({args}) -> Result<{}, BotError> {{",
+        record.returns
+    ));
 
-        writeln!(
-            out,
-            "        self.call_api(\"{}\", &form).await",
-            method.name
-        )
-        .unwrap();
-        writeln!(out, "    }}").unwrap();
-        writeln!(out, "}}").unwrap();
-        writeln!(out).unwrap();
+    // Request body: a borrowed struct serialised straight into the HTTP body,
+    // with the optional params flattened into it.
+    let lifetime = if record.args.is_empty() && !has_opts {
+        ""
+    } else {
+        "<'a>"
+    };
+    out.push("        #[derive(Serialize)]".to_string());
+    out.push(format!("        struct Request{lifetime} {{"));
+    for field in &record.args {
+        if field.rename {
+            out.push(format!("            #[serde(rename = \"{}\")]", field.json));
+        }
+        out.push(format!(
+            "            {}: &'a {},",
+            field.rust, field.rust_type
+        ));
     }
+    if has_opts {
+        out.push("            #[serde(flatten)]".to_string());
+        out.push(format!("            params: Option<&'a {params_name}>,"));
+    }
+    out.push("        }".to_string());
 
-    out
+    let mut inits = Vec::new();
+    for field in &record.args {
+        let fname = &field.rust;
+        if field.into {
+            out.push(format!(
+                "        let {fname}: {} = {fname}.into();",
+                field.rust_type
+            ));
+        }
+        inits.push(format!("{fname}: &{fname}"));
+    }
+    if has_opts {
+        inits.push("params: params.as_ref()".to_string());
+    }
+    let body = if inits.is_empty() {
+        "Request {}".to_string()
+    } else {
+        format!("Request {{ {} }}", inits.join(", "))
+    };
+    out.push(format!(
+        "        self.call_api(\"{}\", &{body}).await",
+        record.name
+    ));
+    out.push("    }".to_string());
+    out.push("}".to_string());
+    out.push(String::new());
 }
 
-fn build_return_type(returns: &[String], types_map: &HashMap<String, TgType>) -> String {
-    if returns.is_empty() {
-        return "serde_json::Value".to_string();
+fn generate_methods(ir: &Ir) -> String {
+    let mut out = methods_header(&ir.spec.version);
+    for record in &ir.methods {
+        let mut lines = Vec::new();
+        emit_method(&mut lines, record);
+        out.push('\n');
+        out.push_str(&lines.join("\n"));
     }
-    if returns.len() == 1 {
-        return tg_to_rust(&returns[0], false, types_map);
-    }
-    // Multiple: use serde_json::Value as fallback
-    "serde_json::Value".to_string()
+    out
 }
 
 // ─────────────────────────────────────────────────
@@ -438,31 +993,35 @@ fn build_return_type(returns: &[String], types_map: &HashMap<String, TgType>) ->
 
 fn main() {
     let args: Vec<String> = std::env::args().collect();
+    let (Some(ir_path), Some(out_dir)) = (args.get(1), args.get(2)) else {
+        eprintln!("Usage: codegen <api.ir> <out_dir>   (write api.ir with codegen.py --emit-ir)");
+        std::process::exit(2);
+    };
 
-    let spec_path = args.get(1).map(|s| s.as_str()).unwrap_or("api.json");
-    let out_dir = args.get(2).map(|s| s.as_str()).unwrap_or("../tgbotrs/src");
-
-    println!("Reading spec from: {}", spec_path);
-    let json = std::fs::read_to_string(spec_path).expect("Could not read api.json");
-    let spec: ApiSpec = serde_json::from_str(&json).expect("Could not parse api.json");
+    println!("Reading IR from: {ir_path}");
+    let data = std::fs::read(ir_path).expect("Could not read the IR file");
+    let ir = read_ir(&data).unwrap_or_else(|e| {
+        eprintln!("error: {ir_path}: {e}");
+        std::process::exit(1);
+    });
 
-    println!("Telegram Bot API {} ({})", spec.version, spec.release_date);
+    println!(
+        "Telegram Bot API {} ({})",
+        ir.spec.version, ir.spec.release_date
+    );
     println!(
         "Found {} types and {} methods",
-        spec.types.len(),
-        spec.methods.len()
+        ir.types.len(),
+        ir.methods.len()
     );
 
-    let types_code = generate_types(&spec);
-    let methods_code = generate_methods(&spec);
-
-    let types_out = format!("{}/gen_types.rs", out_dir);
-    let methods_out = format!("{}/gen_methods.rs", out_dir);
+    let types_out = format!("{out_dir}/gen_types.rs");
+    let methods_out = format!("{out_dir}/gen_methods.rs");
 
-    std::fs::write(&types_out, &types_code).expect("Failed to write gen_types.rs");
-    std::fs::write(&methods_out, &methods_code).expect("Failed to write gen_methods.rs");
+    std::fs::write(&types_out, generate_types(&ir)).expect("Failed to write gen_types.rs");
+    std::fs::write(&methods_out, generate_methods(&ir)).expect("Failed to write gen_methods.rs");
 
-    println!("Generated: {}", types_out);
-    println!("Generated: {}", methods_out);
+    println!("Generated: {types_out}");
+    println!("Generated: {methods_out}");
     println!("Done! ✅");
 }
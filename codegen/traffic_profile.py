@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+tgbotrs — Traffic Profiler
+==========================
+Counts how often each field of each inbound type is present in a corpus of
+captured updates, for `codegen.py --traffic-profile`.
+
+Usage:
+    python3 traffic_profile.py <api.json> <corpus.jsonl>... [-o profile.json] [--threshold 0.01]
+
+Each corpus line is one Update as Telegram sends it, or a whole getUpdates
+response ({"ok": true, "result": [...]}). Objects are matched against the
+spec starting at Update; union values are attributed to the variant their tag
+names, or to the first variant whose required fields are all present.
+
+The report lists, per type, how many instances were seen and which optional
+fields are rare (present in fewer than --threshold of them), and estimates the
+memory a compact model saves per update: the bytes of the rare fields' slots
+minus the `extra` slot that replaces them, weighted by how often the type
+occurs. Sizes are codegen.py's 64-bit layout estimates (see type_layouts).
+
+No external Python dependencies required.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+
+from codegen import (
+    DEFAULT_RARE_THRESHOLD, UPDATE_TYPE, boxed_fields, compact_types, rare_fields, rust_layout,
+    string_enums, struct_fields, type_layouts, union_discriminator,
+)
+from spec_model import is_array, load_spec, strip_array
+
+# ─────────────────────────────────────────────────
+# Counting
+# ─────────────────────────────────────────────────
+
+def read_corpus(paths, bad):
+    """Yield every update in the corpus files, counting lines that are not JSON in `bad`."""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    bad[path] += 1
+                    continue
+                if isinstance(value, dict) and isinstance(value.get('result'), list):
+                    yield from value['result']
+                else:
+                    yield value
+
+def union_variant(type_name, value, types_map):
+    """The variant of union `type_name` a JSON object decodes as, or None."""
+    tag, tag_values, _ = union_discriminator(type_name, types_map)
+    if tag is not None:
+        return next((variant for variant, v in tag_values if v == value.get(tag)), None)
+    for variant in types_map[type_name]['subtypes']:
+        fields = types_map.get(variant, {}).get('fields', [])
+        if all(field['name'] in value for field in fields if field['required']):
+            return variant
+    return None
+
+def count(value, t, types_map, stats):
+    """Add the objects in `value`, of TG type `t`, to `stats`."""
+    if is_array(t):
+        for item in value if isinstance(value, list) else ():
+            count(item, strip_array(t), types_map, stats)
+        return
+    tg_type = types_map.get(t)
+    if tg_type is None or not isinstance(value, dict):
+        return
+    if tg_type.get('subtypes'):
+        variant = union_variant(t, value, types_map)
+        if variant is not None:
+            count(value, variant, types_map, stats)
+        return
+    entry = stats.setdefault(t, {'seen': 0, 'fields': Counter(), 'unknown': Counter()})
+    entry['seen'] += 1
+    fields = {field['name']: field for field in tg_type.get('fields', [])}
+    for key, item in value.items():
+        field = fields.get(key)
+        if field is None:
+            entry['unknown'][key] += 1
+            continue
+        entry['fields'][key] += 1
+        if field['types']:
+            count(item, field['types'][0], types_map, stats)
+
+def build_profile(spec, updates, threshold):
+    types_map = spec['types']
+    stats = {}
+    total = 0
+    for update in updates:
+        total += 1
+        count(update, UPDATE_TYPE, types_map, stats)
+    return {
+        'spec_version': spec['version'],
+        'updates': total,
+        'threshold': threshold,
+        'types': {
+            name: {
+                'seen': entry['seen'],
+                'fields': dict(sorted(entry['fields'].items())),
+                **({'unknown': dict(sorted(entry['unknown'].items()))} if entry['unknown'] else {}),
+            }
+            for name, entry in sorted(stats.items())
+        },
+    }
+
+# ─────────────────────────────────────────────────
+# Size estimate
+# ─────────────────────────────────────────────────
+
+def savings(spec, profile):
+    """[(type, instances per update, rare fields, bytes saved per instance)] for every compact type."""
+    types_map = spec['types']
+    cycles = boxed_fields(types_map)
+    layouts, _ = type_layouts(types_map, cycles)
+    enum_fields, _ = string_enums(types_map)
+    rare = rare_fields(types_map, profile)
+    rows = []
+    for type_name in sorted(compact_types(types_map, rare)):
+        names = set(rare.get(type_name, ()))
+        boxed = {field for owner, field in cycles if owner == type_name}
+        enums = {field: name for (owner, field), name in enum_fields.items() if owner == type_name}
+        saved = sum(rust_layout(ftype, layouts.__getitem__)[0]
+                    for field, _, ftype in struct_fields(types_map[type_name], types_map, boxed, enums)
+                    if field['name'] in names)
+        if names:
+            saved -= 16  # Option<Box<RawValue>>
+        seen = profile['types'].get(type_name, {}).get('seen', 0)
+        rows.append((type_name, seen / max(profile['updates'], 1), len(names), saved))
+    return rows
+
+# ─────────────────────────────────────────────────
+# Main
+# ─────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile field presence in captured updates.')
+    parser.add_argument('spec', help='path to api.json')
+    parser.add_argument('corpus', nargs='+', help='JSONL files of captured updates')
+    parser.add_argument('-o', '--output', help='write the profile here (for codegen.py --traffic-profile)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_RARE_THRESHOLD,
+                        help=f'presence ratio below which an optional field is rare (default: {DEFAULT_RARE_THRESHOLD})')
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    bad = Counter()
+    profile = build_profile(spec, read_corpus(args.corpus, bad), args.threshold)
+    if not profile['updates']:
+        sys.exit('error: the corpus holds no updates')
+    skipped = f' ({sum(bad.values())} malformed lines skipped)' if bad else ''
+    print(f"Read {profile['updates']} updates{skipped}")
+
+    types_map = spec['types']
+    rare = rare_fields(types_map, profile)
+    print(f"\n{'Type':<34} {'Seen':>8} {'Fields':>7} {'Rare':>5}")
+    for name, entry in profile['types'].items():
+        fields = len(types_map[name].get('fields', []))
+        print(f"{name:<34} {entry['seen']:>8} {fields:>7} {len(rare.get(name, ())):>5}")
+        for key, n in entry.get('unknown', {}).items():
+            print(f'  not in spec: {key} ({n}x)')
+
+    rows = savings(spec, profile)
+    print(f"\n{'Compact type':<34} {'Per update':>10} {'Rare':>5} {'Saved':>8}")
+    total = 0.0
+    for name, per_update, n_rare, saved in sorted(rows, key=lambda r: -r[1] * r[3]):
+        total += per_update * saved
+        print(f'{name:<34} {per_update:>10.3f} {n_rare:>5} {saved:>6} B')
+    print(f'\nEstimated saving: ~{total:.0f} bytes per update '
+          f'({len(rows)} compact types, threshold {args.threshold:.2%})')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=2)
+            f.write('\n')
+        print(f'Profile written: {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -25,7 +25,7 @@ fn ibtn(text: &str, data: &str, style: Option<&str>) -> InlineKeyboardButton {
     InlineKeyboardButton {
         text: text.to_string(),
         callback_data: Some(data.to_string()),
-        style: style.map(|s| s.to_string()),
+        style: style.map(Into::into),
         icon_custom_emoji_id: None,
         url: None,
         web_app: None,
@@ -42,7 +42,7 @@ fn ibtn(text: &str, data: &str, style: Option<&str>) -> InlineKeyboardButton {
 fn rbtn(text: &str, style: Option<&str>) -> KeyboardButton {
     KeyboardButton {
         text: text.to_string(),
-        style: style.map(|s| s.to_string()),
+        style: style.map(Into::into),
         icon_custom_emoji_id: None,
         request_users: None,
         request_chat: None,
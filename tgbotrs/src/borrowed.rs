@@ -0,0 +1,21 @@
+//! Zero-copy mirrors of the inbound types (`borrowed` feature).
+//!
+//! [`Update<'a>`](Update) and every type it can contain are generated with a
+//! lifetime: strings are `Cow<'a, str>` borrowed from the JSON body when they
+//! contain no escapes, so a handler can read them without copying. Types that
+//! hold no strings, and closed string enums, are the owned [`crate::types`]
+//! ones.
+//!
+//! Deserialise with `serde_json::from_slice` or `serde_json::from_str` (not
+//! `from_reader` or `from_value`, which cannot lend out of the input) and call
+//! `into_owned()` when an owned value is needed:
+//!
+//! ```rust,ignore
+//! let update: tgbotrs::borrowed::Update = serde_json::from_slice(&body)?;
+//! if let Some(text) = update.message.as_ref().and_then(|m| m.text.as_deref()) {
+//!     println!("{text}");
+//! }
+//! let owned: tgbotrs::Update = update.into_owned();
+//! ```
+
+pub use crate::gen_borrowed::*;
@@ -1,6 +1,6 @@
 use crate::{types::User, BotError};
 use reqwest::Client;
-use serde::Deserialize;
+use serde::{Deserialize, Serialize};
 
 const DEFAULT_API_URL: &str = "https://api.telegram.org";
 
@@ -128,9 +128,14 @@ impl Bot {
     }
 
     /// Make a raw API call with a JSON body.
-    pub async fn call_api<T>(&self, method: &str, body: &serde_json::Value) -> Result<T, BotError>
+    ///
+    /// `body` is serialised straight into the request, so it can be a
+    /// `serde_json::Value` or any `Serialize` type (generated methods pass a
+    /// borrowed request struct).
+    pub async fn call_api<T, B>(&self, method: &str, body: &B) -> Result<T, BotError>
     where
         T: for<'de> Deserialize<'de>,
+        B: Serialize + ?Sized,
     {
         let url = self.endpoint(method);
 
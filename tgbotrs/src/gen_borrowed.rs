@@ -0,0 +1,4424 @@
+// THIS FILE IS AUTO-GENERATED. DO NOT EDIT.
+// Generated from Telegram Bot API Bot API 9.4
+// Spec:    https://github.com/ankit-chaubey/api-spec
+// Project: https://github.com/ankit-chaubey/tgbotrs
+// Author:  Ankit Chaubey <ankitchaubey.dev@gmail.com>
+// License: MIT
+// See:     https://core.telegram.org/bots/api
+
+#![allow(clippy::all, dead_code, unused_imports)]
+
+use crate::types as owned;
+use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
+use std::borrow::Cow;
+#[rustfmt::skip]
+use crate::{ChatId, InputFileOrString, ReplyMarkup, ShortString, ShortVec};
+
+/// `Option<Cow<str>>` that borrows from the input like a bare `#[serde(borrow)] Cow<str>` does.
+fn borrow_opt_str<'de: 'a, 'a, D: serde::Deserializer<'de>>(
+    deserializer: D,
+) -> Result<Option<Cow<'a, str>>, D::Error> {
+    #[derive(Deserialize)]
+    struct Str<'a>(#[serde(borrow)] Cow<'a, str>);
+    Ok(Option::<Str>::deserialize(deserializer)?.map(|s| s.0))
+}
+
+/// Borrowed [`owned::Animation`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Animation<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub width: i64,
+    pub height: i64,
+    pub duration: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<PhotoSize<'a>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> Animation<'a> {
+    /// Copy every borrowed string into an owned [`owned::Animation`].
+    pub fn into_owned(self) -> owned::Animation {
+        owned::Animation {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            width: self.width,
+            height: self.height,
+            duration: self.duration,
+            thumbnail: self.thumbnail.map(|v| v.into_owned()),
+            file_name: self.file_name.map(|v| v.into_owned()),
+            mime_type: self.mime_type.map(|v| v.into_owned()),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::Audio`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Audio<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub duration: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub performer: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<PhotoSize<'a>>,
+}
+
+impl<'a> Audio<'a> {
+    /// Copy every borrowed string into an owned [`owned::Audio`].
+    pub fn into_owned(self) -> owned::Audio {
+        owned::Audio {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            duration: self.duration,
+            performer: self.performer.map(|v| v.into_owned()),
+            title: self.title.map(|v| v.into_owned()),
+            file_name: self.file_name.map(|v| v.into_owned()),
+            mime_type: self.mime_type.map(|v| v.into_owned()),
+            file_size: self.file_size,
+            thumbnail: self.thumbnail.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundFill`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum BackgroundFill<'a> {
+    BackgroundFillSolid(BackgroundFillSolid<'a>),
+    BackgroundFillGradient(BackgroundFillGradient<'a>),
+    BackgroundFillFreeformGradient(BackgroundFillFreeformGradient<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for BackgroundFill<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["solid", "gradient", "freeform_gradient"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("solid") => serde_json::from_str(raw.get()).map(Self::BackgroundFillSolid),
+            Some("gradient") => serde_json::from_str(raw.get()).map(Self::BackgroundFillGradient),
+            Some("freeform_gradient") => {
+                serde_json::from_str(raw.get()).map(Self::BackgroundFillFreeformGradient)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> BackgroundFill<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundFill`].
+    pub fn into_owned(self) -> owned::BackgroundFill {
+        match self {
+            Self::BackgroundFillSolid(v) => {
+                owned::BackgroundFill::BackgroundFillSolid(v.into_owned())
+            }
+            Self::BackgroundFillGradient(v) => {
+                owned::BackgroundFill::BackgroundFillGradient(v.into_owned())
+            }
+            Self::BackgroundFillFreeformGradient(v) => {
+                owned::BackgroundFill::BackgroundFillFreeformGradient(v.into_owned())
+            }
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundFillFreeformGradient`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundFillFreeformGradient<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub colors: Vec<i64>,
+}
+
+impl<'a> BackgroundFillFreeformGradient<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundFillFreeformGradient`].
+    pub fn into_owned(self) -> owned::BackgroundFillFreeformGradient {
+        owned::BackgroundFillFreeformGradient {
+            r#type: self.r#type.into_owned(),
+            colors: self.colors,
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundFillGradient`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundFillGradient<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub top_color: i64,
+    pub bottom_color: i64,
+    pub rotation_angle: i64,
+}
+
+impl<'a> BackgroundFillGradient<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundFillGradient`].
+    pub fn into_owned(self) -> owned::BackgroundFillGradient {
+        owned::BackgroundFillGradient {
+            r#type: self.r#type.into_owned(),
+            top_color: self.top_color,
+            bottom_color: self.bottom_color,
+            rotation_angle: self.rotation_angle,
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundFillSolid`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundFillSolid<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub color: i64,
+}
+
+impl<'a> BackgroundFillSolid<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundFillSolid`].
+    pub fn into_owned(self) -> owned::BackgroundFillSolid {
+        owned::BackgroundFillSolid {
+            r#type: self.r#type.into_owned(),
+            color: self.color,
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundType`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum BackgroundType<'a> {
+    BackgroundTypeFill(BackgroundTypeFill<'a>),
+    BackgroundTypeWallpaper(BackgroundTypeWallpaper<'a>),
+    BackgroundTypePattern(BackgroundTypePattern<'a>),
+    BackgroundTypeChatTheme(BackgroundTypeChatTheme<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for BackgroundType<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["fill", "wallpaper", "pattern", "chat_theme"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("fill") => serde_json::from_str(raw.get()).map(Self::BackgroundTypeFill),
+            Some("wallpaper") => serde_json::from_str(raw.get()).map(Self::BackgroundTypeWallpaper),
+            Some("pattern") => serde_json::from_str(raw.get()).map(Self::BackgroundTypePattern),
+            Some("chat_theme") => {
+                serde_json::from_str(raw.get()).map(Self::BackgroundTypeChatTheme)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> BackgroundType<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundType`].
+    pub fn into_owned(self) -> owned::BackgroundType {
+        match self {
+            Self::BackgroundTypeFill(v) => {
+                owned::BackgroundType::BackgroundTypeFill(v.into_owned())
+            }
+            Self::BackgroundTypeWallpaper(v) => {
+                owned::BackgroundType::BackgroundTypeWallpaper(v.into_owned())
+            }
+            Self::BackgroundTypePattern(v) => {
+                owned::BackgroundType::BackgroundTypePattern(v.into_owned())
+            }
+            Self::BackgroundTypeChatTheme(v) => {
+                owned::BackgroundType::BackgroundTypeChatTheme(v.into_owned())
+            }
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundTypeChatTheme`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundTypeChatTheme<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub theme_name: Cow<'a, str>,
+}
+
+impl<'a> BackgroundTypeChatTheme<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundTypeChatTheme`].
+    pub fn into_owned(self) -> owned::BackgroundTypeChatTheme {
+        owned::BackgroundTypeChatTheme {
+            r#type: self.r#type.into_owned(),
+            theme_name: self.theme_name.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundTypeFill`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundTypeFill<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub fill: BackgroundFill<'a>,
+    pub dark_theme_dimming: i64,
+}
+
+impl<'a> BackgroundTypeFill<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundTypeFill`].
+    pub fn into_owned(self) -> owned::BackgroundTypeFill {
+        owned::BackgroundTypeFill {
+            r#type: self.r#type.into_owned(),
+            fill: self.fill.into_owned(),
+            dark_theme_dimming: self.dark_theme_dimming,
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundTypePattern`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundTypePattern<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub document: Document<'a>,
+    #[serde(borrow)]
+    pub fill: BackgroundFill<'a>,
+    pub intensity: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_inverted: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_moving: Option<bool>,
+}
+
+impl<'a> BackgroundTypePattern<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundTypePattern`].
+    pub fn into_owned(self) -> owned::BackgroundTypePattern {
+        owned::BackgroundTypePattern {
+            r#type: self.r#type.into_owned(),
+            document: self.document.into_owned(),
+            fill: self.fill.into_owned(),
+            intensity: self.intensity,
+            is_inverted: self.is_inverted,
+            is_moving: self.is_moving,
+        }
+    }
+}
+
+/// Borrowed [`owned::BackgroundTypeWallpaper`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BackgroundTypeWallpaper<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub document: Document<'a>,
+    pub dark_theme_dimming: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_blurred: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_moving: Option<bool>,
+}
+
+impl<'a> BackgroundTypeWallpaper<'a> {
+    /// Copy every borrowed string into an owned [`owned::BackgroundTypeWallpaper`].
+    pub fn into_owned(self) -> owned::BackgroundTypeWallpaper {
+        owned::BackgroundTypeWallpaper {
+            r#type: self.r#type.into_owned(),
+            document: self.document.into_owned(),
+            dark_theme_dimming: self.dark_theme_dimming,
+            is_blurred: self.is_blurred,
+            is_moving: self.is_moving,
+        }
+    }
+}
+
+/// Borrowed [`owned::BusinessConnection`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BusinessConnection<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    pub user_chat_id: i64,
+    pub date: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub rights: Option<owned::BusinessBotRights>,
+    pub is_enabled: bool,
+}
+
+impl<'a> BusinessConnection<'a> {
+    /// Copy every borrowed string into an owned [`owned::BusinessConnection`].
+    pub fn into_owned(self) -> owned::BusinessConnection {
+        owned::BusinessConnection {
+            id: self.id.into_owned(),
+            user: self.user.into_owned(),
+            user_chat_id: self.user_chat_id,
+            date: self.date,
+            rights: self.rights,
+            is_enabled: self.is_enabled,
+        }
+    }
+}
+
+/// Borrowed [`owned::BusinessMessagesDeleted`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct BusinessMessagesDeleted<'a> {
+    #[serde(borrow)]
+    pub business_connection_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub message_ids: Vec<i64>,
+}
+
+impl<'a> BusinessMessagesDeleted<'a> {
+    /// Copy every borrowed string into an owned [`owned::BusinessMessagesDeleted`].
+    pub fn into_owned(self) -> owned::BusinessMessagesDeleted {
+        owned::BusinessMessagesDeleted {
+            business_connection_id: self.business_connection_id.into_owned(),
+            chat: self.chat.into_owned(),
+            message_ids: self.message_ids,
+        }
+    }
+}
+
+/// Borrowed [`owned::CallbackQuery`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct CallbackQuery<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message: Option<Box<MaybeInaccessibleMessage<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub inline_message_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub chat_instance: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub data: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub game_short_name: Option<Cow<'a, str>>,
+}
+
+impl<'a> CallbackQuery<'a> {
+    /// Copy every borrowed string into an owned [`owned::CallbackQuery`].
+    pub fn into_owned(self) -> owned::CallbackQuery {
+        owned::CallbackQuery {
+            id: self.id.into_owned(),
+            from: self.from.into_owned(),
+            message: self.message.map(|v| Box::new((*v).into_owned())),
+            inline_message_id: self.inline_message_id.map(|v| v.into_owned()),
+            chat_instance: self.chat_instance.into_owned(),
+            data: self.data.map(|v| v.into_owned()),
+            game_short_name: self.game_short_name.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::Chat`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Chat<'a> {
+    pub id: i64,
+    #[serde(rename = "type")]
+    pub r#type: owned::ChatType,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub username: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub first_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_name: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_forum: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_direct_messages: Option<bool>,
+}
+
+impl<'a> Chat<'a> {
+    /// Copy every borrowed string into an owned [`owned::Chat`].
+    pub fn into_owned(self) -> owned::Chat {
+        owned::Chat {
+            id: self.id,
+            r#type: self.r#type,
+            title: self.title.map(|v| v.into_owned()),
+            username: self.username.map(|v| v.into_owned()),
+            first_name: self.first_name.map(|v| v.into_owned()),
+            last_name: self.last_name.map(|v| v.into_owned()),
+            is_forum: self.is_forum,
+            is_direct_messages: self.is_direct_messages,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBackground`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBackground<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: BackgroundType<'a>,
+}
+
+impl<'a> ChatBackground<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBackground`].
+    pub fn into_owned(self) -> owned::ChatBackground {
+        owned::ChatBackground {
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoost`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoost<'a> {
+    #[serde(borrow)]
+    pub boost_id: Cow<'a, str>,
+    pub add_date: i64,
+    pub expiration_date: i64,
+    #[serde(borrow)]
+    pub source: ChatBoostSource<'a>,
+}
+
+impl<'a> ChatBoost<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoost`].
+    pub fn into_owned(self) -> owned::ChatBoost {
+        owned::ChatBoost {
+            boost_id: self.boost_id.into_owned(),
+            add_date: self.add_date,
+            expiration_date: self.expiration_date,
+            source: self.source.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostRemoved`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoostRemoved<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    #[serde(borrow)]
+    pub boost_id: Cow<'a, str>,
+    pub remove_date: i64,
+    #[serde(borrow)]
+    pub source: ChatBoostSource<'a>,
+}
+
+impl<'a> ChatBoostRemoved<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostRemoved`].
+    pub fn into_owned(self) -> owned::ChatBoostRemoved {
+        owned::ChatBoostRemoved {
+            chat: self.chat.into_owned(),
+            boost_id: self.boost_id.into_owned(),
+            remove_date: self.remove_date,
+            source: self.source.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostSource`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum ChatBoostSource<'a> {
+    ChatBoostSourcePremium(ChatBoostSourcePremium<'a>),
+    ChatBoostSourceGiftCode(ChatBoostSourceGiftCode<'a>),
+    ChatBoostSourceGiveaway(ChatBoostSourceGiveaway<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for ChatBoostSource<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["premium", "gift_code", "giveaway"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(
+                rename = "source",
+                borrow,
+                default,
+                deserialize_with = "borrow_opt_str"
+            )]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("premium") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourcePremium),
+            Some("gift_code") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourceGiftCode),
+            Some("giveaway") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourceGiveaway),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("source")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> ChatBoostSource<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostSource`].
+    pub fn into_owned(self) -> owned::ChatBoostSource {
+        match self {
+            Self::ChatBoostSourcePremium(v) => {
+                owned::ChatBoostSource::ChatBoostSourcePremium(v.into_owned())
+            }
+            Self::ChatBoostSourceGiftCode(v) => {
+                owned::ChatBoostSource::ChatBoostSourceGiftCode(v.into_owned())
+            }
+            Self::ChatBoostSourceGiveaway(v) => {
+                owned::ChatBoostSource::ChatBoostSourceGiveaway(v.into_owned())
+            }
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostSourceGiftCode`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoostSourceGiftCode<'a> {
+    #[serde(borrow)]
+    pub source: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+}
+
+impl<'a> ChatBoostSourceGiftCode<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostSourceGiftCode`].
+    pub fn into_owned(self) -> owned::ChatBoostSourceGiftCode {
+        owned::ChatBoostSourceGiftCode {
+            source: self.source.into_owned(),
+            user: self.user.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostSourceGiveaway`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoostSourceGiveaway<'a> {
+    #[serde(borrow)]
+    pub source: Cow<'a, str>,
+    pub giveaway_message_id: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user: Option<User<'a>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prize_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_unclaimed: Option<bool>,
+}
+
+impl<'a> ChatBoostSourceGiveaway<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostSourceGiveaway`].
+    pub fn into_owned(self) -> owned::ChatBoostSourceGiveaway {
+        owned::ChatBoostSourceGiveaway {
+            source: self.source.into_owned(),
+            giveaway_message_id: self.giveaway_message_id,
+            user: self.user.map(|v| v.into_owned()),
+            prize_star_count: self.prize_star_count,
+            is_unclaimed: self.is_unclaimed,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostSourcePremium`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoostSourcePremium<'a> {
+    #[serde(borrow)]
+    pub source: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+}
+
+impl<'a> ChatBoostSourcePremium<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostSourcePremium`].
+    pub fn into_owned(self) -> owned::ChatBoostSourcePremium {
+        owned::ChatBoostSourcePremium {
+            source: self.source.into_owned(),
+            user: self.user.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatBoostUpdated`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatBoostUpdated<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    #[serde(borrow)]
+    pub boost: ChatBoost<'a>,
+}
+
+impl<'a> ChatBoostUpdated<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatBoostUpdated`].
+    pub fn into_owned(self) -> owned::ChatBoostUpdated {
+        owned::ChatBoostUpdated {
+            chat: self.chat.into_owned(),
+            boost: self.boost.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatInviteLink`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatInviteLink<'a> {
+    #[serde(borrow)]
+    pub invite_link: Cow<'a, str>,
+    #[serde(borrow)]
+    pub creator: User<'a>,
+    pub creates_join_request: bool,
+    pub is_primary: bool,
+    pub is_revoked: bool,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub name: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub expire_date: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub member_limit: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub pending_join_request_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub subscription_period: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub subscription_price: Option<i64>,
+}
+
+impl<'a> ChatInviteLink<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatInviteLink`].
+    pub fn into_owned(self) -> owned::ChatInviteLink {
+        owned::ChatInviteLink {
+            invite_link: self.invite_link.into_owned(),
+            creator: self.creator.into_owned(),
+            creates_join_request: self.creates_join_request,
+            is_primary: self.is_primary,
+            is_revoked: self.is_revoked,
+            name: self.name.map(|v| v.into_owned()),
+            expire_date: self.expire_date,
+            member_limit: self.member_limit,
+            pending_join_request_count: self.pending_join_request_count,
+            subscription_period: self.subscription_period,
+            subscription_price: self.subscription_price,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatJoinRequest`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatJoinRequest<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    pub user_chat_id: i64,
+    pub date: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub bio: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub invite_link: Option<Box<ChatInviteLink<'a>>>,
+}
+
+impl<'a> ChatJoinRequest<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatJoinRequest`].
+    pub fn into_owned(self) -> owned::ChatJoinRequest {
+        owned::ChatJoinRequest {
+            chat: self.chat.into_owned(),
+            from: self.from.into_owned(),
+            user_chat_id: self.user_chat_id,
+            date: self.date,
+            bio: self.bio.map(|v| v.into_owned()),
+            invite_link: self.invite_link.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMember`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum ChatMember<'a> {
+    ChatMemberOwner(ChatMemberOwner<'a>),
+    ChatMemberAdministrator(ChatMemberAdministrator<'a>),
+    ChatMemberMember(ChatMemberMember<'a>),
+    ChatMemberRestricted(ChatMemberRestricted<'a>),
+    ChatMemberLeft(ChatMemberLeft<'a>),
+    ChatMemberBanned(ChatMemberBanned<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for ChatMember<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "creator",
+            "administrator",
+            "member",
+            "restricted",
+            "left",
+            "kicked",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(
+                rename = "status",
+                borrow,
+                default,
+                deserialize_with = "borrow_opt_str"
+            )]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("creator") => serde_json::from_str(raw.get()).map(Self::ChatMemberOwner),
+            Some("administrator") => {
+                serde_json::from_str(raw.get()).map(Self::ChatMemberAdministrator)
+            }
+            Some("member") => serde_json::from_str(raw.get()).map(Self::ChatMemberMember),
+            Some("restricted") => serde_json::from_str(raw.get()).map(Self::ChatMemberRestricted),
+            Some("left") => serde_json::from_str(raw.get()).map(Self::ChatMemberLeft),
+            Some("kicked") => serde_json::from_str(raw.get()).map(Self::ChatMemberBanned),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("status")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> ChatMember<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMember`].
+    pub fn into_owned(self) -> owned::ChatMember {
+        match self {
+            Self::ChatMemberOwner(v) => owned::ChatMember::ChatMemberOwner(v.into_owned()),
+            Self::ChatMemberAdministrator(v) => {
+                owned::ChatMember::ChatMemberAdministrator(v.into_owned())
+            }
+            Self::ChatMemberMember(v) => owned::ChatMember::ChatMemberMember(v.into_owned()),
+            Self::ChatMemberRestricted(v) => {
+                owned::ChatMember::ChatMemberRestricted(v.into_owned())
+            }
+            Self::ChatMemberLeft(v) => owned::ChatMember::ChatMemberLeft(v.into_owned()),
+            Self::ChatMemberBanned(v) => owned::ChatMember::ChatMemberBanned(v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberAdministrator`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberAdministrator<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    pub can_be_edited: bool,
+    pub is_anonymous: bool,
+    pub can_manage_chat: bool,
+    pub can_delete_messages: bool,
+    pub can_manage_video_chats: bool,
+    pub can_restrict_members: bool,
+    pub can_promote_members: bool,
+    pub can_change_info: bool,
+    pub can_invite_users: bool,
+    pub can_post_stories: bool,
+    pub can_edit_stories: bool,
+    pub can_delete_stories: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_post_messages: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_edit_messages: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_pin_messages: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_manage_topics: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_manage_direct_messages: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub custom_title: Option<Cow<'a, str>>,
+}
+
+impl<'a> ChatMemberAdministrator<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberAdministrator`].
+    pub fn into_owned(self) -> owned::ChatMemberAdministrator {
+        owned::ChatMemberAdministrator {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+            can_be_edited: self.can_be_edited,
+            is_anonymous: self.is_anonymous,
+            can_manage_chat: self.can_manage_chat,
+            can_delete_messages: self.can_delete_messages,
+            can_manage_video_chats: self.can_manage_video_chats,
+            can_restrict_members: self.can_restrict_members,
+            can_promote_members: self.can_promote_members,
+            can_change_info: self.can_change_info,
+            can_invite_users: self.can_invite_users,
+            can_post_stories: self.can_post_stories,
+            can_edit_stories: self.can_edit_stories,
+            can_delete_stories: self.can_delete_stories,
+            can_post_messages: self.can_post_messages,
+            can_edit_messages: self.can_edit_messages,
+            can_pin_messages: self.can_pin_messages,
+            can_manage_topics: self.can_manage_topics,
+            can_manage_direct_messages: self.can_manage_direct_messages,
+            custom_title: self.custom_title.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberBanned`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberBanned<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    pub until_date: i64,
+}
+
+impl<'a> ChatMemberBanned<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberBanned`].
+    pub fn into_owned(self) -> owned::ChatMemberBanned {
+        owned::ChatMemberBanned {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+            until_date: self.until_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberLeft`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberLeft<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+}
+
+impl<'a> ChatMemberLeft<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberLeft`].
+    pub fn into_owned(self) -> owned::ChatMemberLeft {
+        owned::ChatMemberLeft {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberMember`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberMember<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub until_date: Option<i64>,
+}
+
+impl<'a> ChatMemberMember<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberMember`].
+    pub fn into_owned(self) -> owned::ChatMemberMember {
+        owned::ChatMemberMember {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+            until_date: self.until_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberOwner`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberOwner<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    pub is_anonymous: bool,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub custom_title: Option<Cow<'a, str>>,
+}
+
+impl<'a> ChatMemberOwner<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberOwner`].
+    pub fn into_owned(self) -> owned::ChatMemberOwner {
+        owned::ChatMemberOwner {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+            is_anonymous: self.is_anonymous,
+            custom_title: self.custom_title.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberRestricted`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberRestricted<'a> {
+    #[serde(borrow)]
+    pub status: Cow<'a, str>,
+    #[serde(borrow)]
+    pub user: User<'a>,
+    pub is_member: bool,
+    pub can_send_messages: bool,
+    pub can_send_audios: bool,
+    pub can_send_documents: bool,
+    pub can_send_photos: bool,
+    pub can_send_videos: bool,
+    pub can_send_video_notes: bool,
+    pub can_send_voice_notes: bool,
+    pub can_send_polls: bool,
+    pub can_send_other_messages: bool,
+    pub can_add_web_page_previews: bool,
+    pub can_change_info: bool,
+    pub can_invite_users: bool,
+    pub can_pin_messages: bool,
+    pub can_manage_topics: bool,
+    pub until_date: i64,
+}
+
+impl<'a> ChatMemberRestricted<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberRestricted`].
+    pub fn into_owned(self) -> owned::ChatMemberRestricted {
+        owned::ChatMemberRestricted {
+            status: self.status.into_owned(),
+            user: self.user.into_owned(),
+            is_member: self.is_member,
+            can_send_messages: self.can_send_messages,
+            can_send_audios: self.can_send_audios,
+            can_send_documents: self.can_send_documents,
+            can_send_photos: self.can_send_photos,
+            can_send_videos: self.can_send_videos,
+            can_send_video_notes: self.can_send_video_notes,
+            can_send_voice_notes: self.can_send_voice_notes,
+            can_send_polls: self.can_send_polls,
+            can_send_other_messages: self.can_send_other_messages,
+            can_add_web_page_previews: self.can_add_web_page_previews,
+            can_change_info: self.can_change_info,
+            can_invite_users: self.can_invite_users,
+            can_pin_messages: self.can_pin_messages,
+            can_manage_topics: self.can_manage_topics,
+            until_date: self.until_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatMemberUpdated`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatMemberUpdated<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub old_chat_member: ChatMember<'a>,
+    #[serde(borrow)]
+    pub new_chat_member: ChatMember<'a>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub invite_link: Option<Box<ChatInviteLink<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub via_join_request: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub via_chat_folder_invite_link: Option<bool>,
+}
+
+impl<'a> ChatMemberUpdated<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatMemberUpdated`].
+    pub fn into_owned(self) -> owned::ChatMemberUpdated {
+        owned::ChatMemberUpdated {
+            chat: self.chat.into_owned(),
+            from: self.from.into_owned(),
+            date: self.date,
+            old_chat_member: self.old_chat_member.into_owned(),
+            new_chat_member: self.new_chat_member.into_owned(),
+            invite_link: self.invite_link.map(|v| Box::new((*v).into_owned())),
+            via_join_request: self.via_join_request,
+            via_chat_folder_invite_link: self.via_chat_folder_invite_link,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatOwnerChanged`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatOwnerChanged<'a> {
+    #[serde(borrow)]
+    pub new_owner: User<'a>,
+}
+
+impl<'a> ChatOwnerChanged<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatOwnerChanged`].
+    pub fn into_owned(self) -> owned::ChatOwnerChanged {
+        owned::ChatOwnerChanged {
+            new_owner: self.new_owner.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatOwnerLeft`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatOwnerLeft<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub new_owner: Option<User<'a>>,
+}
+
+impl<'a> ChatOwnerLeft<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatOwnerLeft`].
+    pub fn into_owned(self) -> owned::ChatOwnerLeft {
+        owned::ChatOwnerLeft {
+            new_owner: self.new_owner.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChatShared`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChatShared<'a> {
+    pub request_id: i64,
+    pub chat_id: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub username: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub photo: Option<ShortVec<PhotoSize<'a>, 4>>,
+}
+
+impl<'a> ChatShared<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChatShared`].
+    pub fn into_owned(self) -> owned::ChatShared {
+        owned::ChatShared {
+            request_id: self.request_id,
+            chat_id: self.chat_id,
+            title: self.title.map(|v| v.into_owned()),
+            username: self.username.map(|v| v.into_owned()),
+            photo: self
+                .photo
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+        }
+    }
+}
+
+/// Borrowed [`owned::Checklist`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Checklist<'a> {
+    #[serde(borrow)]
+    pub title: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub title_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(borrow)]
+    pub tasks: Vec<ChecklistTask<'a>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub others_can_add_tasks: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub others_can_mark_tasks_as_done: Option<bool>,
+}
+
+impl<'a> Checklist<'a> {
+    /// Copy every borrowed string into an owned [`owned::Checklist`].
+    pub fn into_owned(self) -> owned::Checklist {
+        owned::Checklist {
+            title: self.title.into_owned(),
+            title_entities: self
+                .title_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            tasks: self.tasks.into_iter().map(|v| v.into_owned()).collect(),
+            others_can_add_tasks: self.others_can_add_tasks,
+            others_can_mark_tasks_as_done: self.others_can_mark_tasks_as_done,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChecklistTask`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChecklistTask<'a> {
+    pub id: i64,
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub completed_by_user: Option<User<'a>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub completed_by_chat: Option<Box<Chat<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub completion_date: Option<i64>,
+}
+
+impl<'a> ChecklistTask<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChecklistTask`].
+    pub fn into_owned(self) -> owned::ChecklistTask {
+        owned::ChecklistTask {
+            id: self.id,
+            text: self.text.into_owned(),
+            text_entities: self
+                .text_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            completed_by_user: self.completed_by_user.map(|v| v.into_owned()),
+            completed_by_chat: self.completed_by_chat.map(|v| Box::new((*v).into_owned())),
+            completion_date: self.completion_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChecklistTasksAdded`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChecklistTasksAdded<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist_message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    pub tasks: Vec<ChecklistTask<'a>>,
+}
+
+impl<'a> ChecklistTasksAdded<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChecklistTasksAdded`].
+    pub fn into_owned(self) -> owned::ChecklistTasksAdded {
+        owned::ChecklistTasksAdded {
+            checklist_message: self.checklist_message.map(|v| Box::new((*v).into_owned())),
+            tasks: self.tasks.into_iter().map(|v| v.into_owned()).collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ChecklistTasksDone`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChecklistTasksDone<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist_message: Option<Box<Message<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub marked_as_done_task_ids: Option<Vec<i64>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub marked_as_not_done_task_ids: Option<Vec<i64>>,
+}
+
+impl<'a> ChecklistTasksDone<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChecklistTasksDone`].
+    pub fn into_owned(self) -> owned::ChecklistTasksDone {
+        owned::ChecklistTasksDone {
+            checklist_message: self.checklist_message.map(|v| Box::new((*v).into_owned())),
+            marked_as_done_task_ids: self.marked_as_done_task_ids,
+            marked_as_not_done_task_ids: self.marked_as_not_done_task_ids,
+        }
+    }
+}
+
+/// Borrowed [`owned::ChosenInlineResult`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ChosenInlineResult<'a> {
+    #[serde(borrow)]
+    pub result_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub location: Option<Box<owned::Location>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub inline_message_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub query: Cow<'a, str>,
+}
+
+impl<'a> ChosenInlineResult<'a> {
+    /// Copy every borrowed string into an owned [`owned::ChosenInlineResult`].
+    pub fn into_owned(self) -> owned::ChosenInlineResult {
+        owned::ChosenInlineResult {
+            result_id: self.result_id.into_owned(),
+            from: self.from.into_owned(),
+            location: self.location,
+            inline_message_id: self.inline_message_id.map(|v| v.into_owned()),
+            query: self.query.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::Contact`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Contact<'a> {
+    #[serde(borrow)]
+    pub phone_number: Cow<'a, str>,
+    #[serde(borrow)]
+    pub first_name: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_name: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user_id: Option<i64>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub vcard: Option<Cow<'a, str>>,
+}
+
+impl<'a> Contact<'a> {
+    /// Copy every borrowed string into an owned [`owned::Contact`].
+    pub fn into_owned(self) -> owned::Contact {
+        owned::Contact {
+            phone_number: self.phone_number.into_owned(),
+            first_name: self.first_name.into_owned(),
+            last_name: self.last_name.map(|v| v.into_owned()),
+            user_id: self.user_id,
+            vcard: self.vcard.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::CopyTextButton`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct CopyTextButton<'a> {
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+}
+
+impl<'a> CopyTextButton<'a> {
+    /// Copy every borrowed string into an owned [`owned::CopyTextButton`].
+    pub fn into_owned(self) -> owned::CopyTextButton {
+        owned::CopyTextButton {
+            text: self.text.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::Dice`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Dice<'a> {
+    #[serde(borrow)]
+    pub emoji: Cow<'a, str>,
+    pub value: i64,
+}
+
+impl<'a> Dice<'a> {
+    /// Copy every borrowed string into an owned [`owned::Dice`].
+    pub fn into_owned(self) -> owned::Dice {
+        owned::Dice {
+            emoji: self.emoji.into_owned(),
+            value: self.value,
+        }
+    }
+}
+
+/// Borrowed [`owned::DirectMessagesTopic`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct DirectMessagesTopic<'a> {
+    pub topic_id: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user: Option<User<'a>>,
+}
+
+impl<'a> DirectMessagesTopic<'a> {
+    /// Copy every borrowed string into an owned [`owned::DirectMessagesTopic`].
+    pub fn into_owned(self) -> owned::DirectMessagesTopic {
+        owned::DirectMessagesTopic {
+            topic_id: self.topic_id,
+            user: self.user.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::Document`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Document<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<PhotoSize<'a>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> Document<'a> {
+    /// Copy every borrowed string into an owned [`owned::Document`].
+    pub fn into_owned(self) -> owned::Document {
+        owned::Document {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            thumbnail: self.thumbnail.map(|v| v.into_owned()),
+            file_name: self.file_name.map(|v| v.into_owned()),
+            mime_type: self.mime_type.map(|v| v.into_owned()),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::EncryptedCredentials`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct EncryptedCredentials<'a> {
+    #[serde(borrow)]
+    pub data: Cow<'a, str>,
+    #[serde(borrow)]
+    pub hash: Cow<'a, str>,
+    #[serde(borrow)]
+    pub secret: Cow<'a, str>,
+}
+
+impl<'a> EncryptedCredentials<'a> {
+    /// Copy every borrowed string into an owned [`owned::EncryptedCredentials`].
+    pub fn into_owned(self) -> owned::EncryptedCredentials {
+        owned::EncryptedCredentials {
+            data: self.data.into_owned(),
+            hash: self.hash.into_owned(),
+            secret: self.secret.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::EncryptedPassportElement`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct EncryptedPassportElement<'a> {
+    #[serde(rename = "type")]
+    pub r#type: owned::EncryptedPassportElementType,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub data: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub phone_number: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub email: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub files: Option<Vec<PassportFile<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub front_side: Option<PassportFile<'a>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reverse_side: Option<Box<PassportFile<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub selfie: Option<Box<PassportFile<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub translation: Option<Vec<PassportFile<'a>>>,
+    #[serde(borrow)]
+    pub hash: Cow<'a, str>,
+}
+
+impl<'a> EncryptedPassportElement<'a> {
+    /// Copy every borrowed string into an owned [`owned::EncryptedPassportElement`].
+    pub fn into_owned(self) -> owned::EncryptedPassportElement {
+        owned::EncryptedPassportElement {
+            r#type: self.r#type,
+            data: self.data.map(|v| v.into_owned()),
+            phone_number: self.phone_number.map(|v| v.into_owned()),
+            email: self.email.map(|v| v.into_owned()),
+            files: self
+                .files
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            front_side: self.front_side.map(|v| v.into_owned()),
+            reverse_side: self.reverse_side.map(|v| Box::new((*v).into_owned())),
+            selfie: self.selfie.map(|v| Box::new((*v).into_owned())),
+            translation: self
+                .translation
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            hash: self.hash.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ExternalReplyInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ExternalReplyInfo<'a> {
+    #[serde(borrow)]
+    pub origin: MessageOrigin<'a>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat: Option<Box<Chat<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message_id: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub link_preview_options: Option<Box<LinkPreviewOptions<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub animation: Option<Box<Animation<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub audio: Option<Box<Audio<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub document: Option<Box<Document<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub paid_media: Option<Box<PaidMediaInfo<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub photo: Option<ShortVec<PhotoSize<'a>, 4>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sticker: Option<Box<Sticker<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub story: Option<Box<Story<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video: Option<Box<Video<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_note: Option<Box<VideoNote<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub voice: Option<Box<Voice<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_media_spoiler: Option<bool>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist: Option<Box<Checklist<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub contact: Option<Box<Contact<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub dice: Option<Box<Dice<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub game: Option<Box<Game<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway: Option<Box<Giveaway<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway_winners: Option<Box<GiveawayWinners<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub invoice: Option<Box<Invoice<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub location: Option<Box<owned::Location>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub poll: Option<Box<Poll<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub venue: Option<Box<Venue<'a>>>,
+}
+
+impl<'a> ExternalReplyInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::ExternalReplyInfo`].
+    pub fn into_owned(self) -> owned::ExternalReplyInfo {
+        owned::ExternalReplyInfo {
+            origin: self.origin.into_owned(),
+            chat: self.chat.map(|v| Box::new((*v).into_owned())),
+            message_id: self.message_id,
+            link_preview_options: self
+                .link_preview_options
+                .map(|v| Box::new((*v).into_owned())),
+            animation: self.animation.map(|v| Box::new((*v).into_owned())),
+            audio: self.audio.map(|v| Box::new((*v).into_owned())),
+            document: self.document.map(|v| Box::new((*v).into_owned())),
+            paid_media: self.paid_media.map(|v| Box::new((*v).into_owned())),
+            photo: self
+                .photo
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            sticker: self.sticker.map(|v| Box::new((*v).into_owned())),
+            story: self.story.map(|v| Box::new((*v).into_owned())),
+            video: self.video.map(|v| Box::new((*v).into_owned())),
+            video_note: self.video_note.map(|v| Box::new((*v).into_owned())),
+            voice: self.voice.map(|v| Box::new((*v).into_owned())),
+            has_media_spoiler: self.has_media_spoiler,
+            checklist: self.checklist.map(|v| Box::new((*v).into_owned())),
+            contact: self.contact.map(|v| Box::new((*v).into_owned())),
+            dice: self.dice.map(|v| Box::new((*v).into_owned())),
+            game: self.game.map(|v| Box::new((*v).into_owned())),
+            giveaway: self.giveaway.map(|v| Box::new((*v).into_owned())),
+            giveaway_winners: self.giveaway_winners.map(|v| Box::new((*v).into_owned())),
+            invoice: self.invoice.map(|v| Box::new((*v).into_owned())),
+            location: self.location,
+            poll: self.poll.map(|v| Box::new((*v).into_owned())),
+            venue: self.venue.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::File`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct File<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_path: Option<Cow<'a, str>>,
+}
+
+impl<'a> File<'a> {
+    /// Copy every borrowed string into an owned [`owned::File`].
+    pub fn into_owned(self) -> owned::File {
+        owned::File {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            file_size: self.file_size,
+            file_path: self.file_path.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ForumTopicCreated`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ForumTopicCreated<'a> {
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    pub icon_color: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub icon_custom_emoji_id: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_name_implicit: Option<bool>,
+}
+
+impl<'a> ForumTopicCreated<'a> {
+    /// Copy every borrowed string into an owned [`owned::ForumTopicCreated`].
+    pub fn into_owned(self) -> owned::ForumTopicCreated {
+        owned::ForumTopicCreated {
+            name: self.name.into_owned(),
+            icon_color: self.icon_color,
+            icon_custom_emoji_id: self.icon_custom_emoji_id.map(|v| v.into()),
+            is_name_implicit: self.is_name_implicit,
+        }
+    }
+}
+
+/// Borrowed [`owned::ForumTopicEdited`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ForumTopicEdited<'a> {
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub icon_custom_emoji_id: Option<Cow<'a, str>>,
+}
+
+impl<'a> ForumTopicEdited<'a> {
+    /// Copy every borrowed string into an owned [`owned::ForumTopicEdited`].
+    pub fn into_owned(self) -> owned::ForumTopicEdited {
+        owned::ForumTopicEdited {
+            name: self.name.map(|v| v.into_owned()),
+            icon_custom_emoji_id: self.icon_custom_emoji_id.map(|v| v.into()),
+        }
+    }
+}
+
+/// Borrowed [`owned::Game`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Game<'a> {
+    #[serde(borrow)]
+    pub title: Cow<'a, str>,
+    #[serde(borrow)]
+    pub description: Cow<'a, str>,
+    #[serde(borrow)]
+    pub photo: ShortVec<PhotoSize<'a>, 4>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub animation: Option<Box<Animation<'a>>>,
+}
+
+impl<'a> Game<'a> {
+    /// Copy every borrowed string into an owned [`owned::Game`].
+    pub fn into_owned(self) -> owned::Game {
+        owned::Game {
+            title: self.title.into_owned(),
+            description: self.description.into_owned(),
+            photo: self.photo.into_iter().map(|v| v.into_owned()).collect(),
+            text: self.text.map(|v| v.into_owned()),
+            text_entities: self
+                .text_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            animation: self.animation.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::Gift`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Gift<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub sticker: Sticker<'a>,
+    pub star_count: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub upgrade_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_premium: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_colors: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub total_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub remaining_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub personal_total_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub personal_remaining_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub background: Option<Box<owned::GiftBackground>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub unique_gift_variant_count: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub publisher_chat: Option<Box<Chat<'a>>>,
+}
+
+impl<'a> Gift<'a> {
+    /// Copy every borrowed string into an owned [`owned::Gift`].
+    pub fn into_owned(self) -> owned::Gift {
+        owned::Gift {
+            id: self.id.into_owned(),
+            sticker: self.sticker.into_owned(),
+            star_count: self.star_count,
+            upgrade_star_count: self.upgrade_star_count,
+            is_premium: self.is_premium,
+            has_colors: self.has_colors,
+            total_count: self.total_count,
+            remaining_count: self.remaining_count,
+            personal_total_count: self.personal_total_count,
+            personal_remaining_count: self.personal_remaining_count,
+            background: self.background,
+            unique_gift_variant_count: self.unique_gift_variant_count,
+            publisher_chat: self.publisher_chat.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::GiftInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct GiftInfo<'a> {
+    #[serde(borrow)]
+    pub gift: Gift<'a>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub owned_gift_id: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub convert_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prepaid_upgrade_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_upgrade_separate: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_be_upgraded: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_private: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub unique_gift_number: Option<i64>,
+}
+
+impl<'a> GiftInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::GiftInfo`].
+    pub fn into_owned(self) -> owned::GiftInfo {
+        owned::GiftInfo {
+            gift: self.gift.into_owned(),
+            owned_gift_id: self.owned_gift_id.map(|v| v.into_owned()),
+            convert_star_count: self.convert_star_count,
+            prepaid_upgrade_star_count: self.prepaid_upgrade_star_count,
+            is_upgrade_separate: self.is_upgrade_separate,
+            can_be_upgraded: self.can_be_upgraded,
+            text: self.text.map(|v| v.into_owned()),
+            entities: self
+                .entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            is_private: self.is_private,
+            unique_gift_number: self.unique_gift_number,
+        }
+    }
+}
+
+/// Borrowed [`owned::Giveaway`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Giveaway<'a> {
+    #[serde(borrow)]
+    pub chats: Vec<Chat<'a>>,
+    pub winners_selection_date: i64,
+    pub winner_count: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub only_new_members: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_public_winners: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prize_description: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub country_codes: Option<Vec<String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prize_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub premium_subscription_month_count: Option<i64>,
+}
+
+impl<'a> Giveaway<'a> {
+    /// Copy every borrowed string into an owned [`owned::Giveaway`].
+    pub fn into_owned(self) -> owned::Giveaway {
+        owned::Giveaway {
+            chats: self.chats.into_iter().map(|v| v.into_owned()).collect(),
+            winners_selection_date: self.winners_selection_date,
+            winner_count: self.winner_count,
+            only_new_members: self.only_new_members,
+            has_public_winners: self.has_public_winners,
+            prize_description: self.prize_description.map(|v| v.into_owned()),
+            country_codes: self.country_codes,
+            prize_star_count: self.prize_star_count,
+            premium_subscription_month_count: self.premium_subscription_month_count,
+        }
+    }
+}
+
+/// Borrowed [`owned::GiveawayCompleted`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct GiveawayCompleted<'a> {
+    pub winner_count: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub unclaimed_prize_count: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway_message: Option<Box<Message<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_star_giveaway: Option<bool>,
+}
+
+impl<'a> GiveawayCompleted<'a> {
+    /// Copy every borrowed string into an owned [`owned::GiveawayCompleted`].
+    pub fn into_owned(self) -> owned::GiveawayCompleted {
+        owned::GiveawayCompleted {
+            winner_count: self.winner_count,
+            unclaimed_prize_count: self.unclaimed_prize_count,
+            giveaway_message: self.giveaway_message.map(|v| Box::new((*v).into_owned())),
+            is_star_giveaway: self.is_star_giveaway,
+        }
+    }
+}
+
+/// Borrowed [`owned::GiveawayWinners`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct GiveawayWinners<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub giveaway_message_id: i64,
+    pub winners_selection_date: i64,
+    pub winner_count: i64,
+    #[serde(borrow)]
+    pub winners: Vec<User<'a>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub additional_chat_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prize_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub premium_subscription_month_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub unclaimed_prize_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub only_new_members: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub was_refunded: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prize_description: Option<Cow<'a, str>>,
+}
+
+impl<'a> GiveawayWinners<'a> {
+    /// Copy every borrowed string into an owned [`owned::GiveawayWinners`].
+    pub fn into_owned(self) -> owned::GiveawayWinners {
+        owned::GiveawayWinners {
+            chat: self.chat.into_owned(),
+            giveaway_message_id: self.giveaway_message_id,
+            winners_selection_date: self.winners_selection_date,
+            winner_count: self.winner_count,
+            winners: self.winners.into_iter().map(|v| v.into_owned()).collect(),
+            additional_chat_count: self.additional_chat_count,
+            prize_star_count: self.prize_star_count,
+            premium_subscription_month_count: self.premium_subscription_month_count,
+            unclaimed_prize_count: self.unclaimed_prize_count,
+            only_new_members: self.only_new_members,
+            was_refunded: self.was_refunded,
+            prize_description: self.prize_description.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::InaccessibleMessage`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct InaccessibleMessage<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub message_id: i64,
+    pub date: i64,
+}
+
+impl<'a> InaccessibleMessage<'a> {
+    /// Copy every borrowed string into an owned [`owned::InaccessibleMessage`].
+    pub fn into_owned(self) -> owned::InaccessibleMessage {
+        owned::InaccessibleMessage {
+            chat: self.chat.into_owned(),
+            message_id: self.message_id,
+            date: self.date,
+        }
+    }
+}
+
+/// Borrowed [`owned::InlineKeyboardButton`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct InlineKeyboardButton<'a> {
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub icon_custom_emoji_id: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub style: Option<owned::InlineKeyboardButtonStyle>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub url: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub callback_data: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub web_app: Option<WebAppInfo<'a>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub login_url: Option<Box<LoginUrl<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub switch_inline_query: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub switch_inline_query_current_chat: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub switch_inline_query_chosen_chat: Option<Box<SwitchInlineQueryChosenChat<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub copy_text: Option<CopyTextButton<'a>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub callback_game: Option<owned::CallbackGame>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub pay: Option<bool>,
+}
+
+impl<'a> InlineKeyboardButton<'a> {
+    /// Copy every borrowed string into an owned [`owned::InlineKeyboardButton`].
+    pub fn into_owned(self) -> owned::InlineKeyboardButton {
+        owned::InlineKeyboardButton {
+            text: self.text.into_owned(),
+            icon_custom_emoji_id: self.icon_custom_emoji_id.map(|v| v.into()),
+            style: self.style,
+            url: self.url.map(|v| v.into_owned()),
+            callback_data: self.callback_data.map(|v| v.into_owned()),
+            web_app: self.web_app.map(|v| v.into_owned()),
+            login_url: self.login_url.map(|v| Box::new((*v).into_owned())),
+            switch_inline_query: self.switch_inline_query.map(|v| v.into_owned()),
+            switch_inline_query_current_chat: self
+                .switch_inline_query_current_chat
+                .map(|v| v.into_owned()),
+            switch_inline_query_chosen_chat: self
+                .switch_inline_query_chosen_chat
+                .map(|v| Box::new((*v).into_owned())),
+            copy_text: self.copy_text.map(|v| v.into_owned()),
+            callback_game: self.callback_game,
+            pay: self.pay,
+        }
+    }
+}
+
+/// Borrowed [`owned::InlineKeyboardMarkup`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct InlineKeyboardMarkup<'a> {
+    #[serde(borrow)]
+    pub inline_keyboard: Vec<Vec<InlineKeyboardButton<'a>>>,
+}
+
+impl<'a> InlineKeyboardMarkup<'a> {
+    /// Copy every borrowed string into an owned [`owned::InlineKeyboardMarkup`].
+    pub fn into_owned(self) -> owned::InlineKeyboardMarkup {
+        owned::InlineKeyboardMarkup {
+            inline_keyboard: self
+                .inline_keyboard
+                .into_iter()
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect())
+                .collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::InlineQuery`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct InlineQuery<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(borrow)]
+    pub query: Cow<'a, str>,
+    #[serde(borrow)]
+    pub offset: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_type: Option<owned::InlineQueryChatType>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub location: Option<Box<owned::Location>>,
+}
+
+impl<'a> InlineQuery<'a> {
+    /// Copy every borrowed string into an owned [`owned::InlineQuery`].
+    pub fn into_owned(self) -> owned::InlineQuery {
+        owned::InlineQuery {
+            id: self.id.into_owned(),
+            from: self.from.into_owned(),
+            query: self.query.into_owned(),
+            offset: self.offset.into_owned(),
+            chat_type: self.chat_type,
+            location: self.location,
+        }
+    }
+}
+
+/// Borrowed [`owned::Invoice`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Invoice<'a> {
+    #[serde(borrow)]
+    pub title: Cow<'a, str>,
+    #[serde(borrow)]
+    pub description: Cow<'a, str>,
+    #[serde(borrow)]
+    pub start_parameter: Cow<'a, str>,
+    #[serde(borrow)]
+    pub currency: Cow<'a, str>,
+    pub total_amount: i64,
+}
+
+impl<'a> Invoice<'a> {
+    /// Copy every borrowed string into an owned [`owned::Invoice`].
+    pub fn into_owned(self) -> owned::Invoice {
+        owned::Invoice {
+            title: self.title.into_owned(),
+            description: self.description.into_owned(),
+            start_parameter: self.start_parameter.into_owned(),
+            currency: self.currency.into(),
+            total_amount: self.total_amount,
+        }
+    }
+}
+
+/// Borrowed [`owned::LinkPreviewOptions`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct LinkPreviewOptions<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_disabled: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub url: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prefer_small_media: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub prefer_large_media: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub show_above_text: Option<bool>,
+}
+
+impl<'a> LinkPreviewOptions<'a> {
+    /// Copy every borrowed string into an owned [`owned::LinkPreviewOptions`].
+    pub fn into_owned(self) -> owned::LinkPreviewOptions {
+        owned::LinkPreviewOptions {
+            is_disabled: self.is_disabled,
+            url: self.url.map(|v| v.into_owned()),
+            prefer_small_media: self.prefer_small_media,
+            prefer_large_media: self.prefer_large_media,
+            show_above_text: self.show_above_text,
+        }
+    }
+}
+
+/// Borrowed [`owned::LoginUrl`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct LoginUrl<'a> {
+    #[serde(borrow)]
+    pub url: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forward_text: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub bot_username: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub request_write_access: Option<bool>,
+}
+
+impl<'a> LoginUrl<'a> {
+    /// Copy every borrowed string into an owned [`owned::LoginUrl`].
+    pub fn into_owned(self) -> owned::LoginUrl {
+        owned::LoginUrl {
+            url: self.url.into_owned(),
+            forward_text: self.forward_text.map(|v| v.into_owned()),
+            bot_username: self.bot_username.map(|v| v.into_owned()),
+            request_write_access: self.request_write_access,
+        }
+    }
+}
+
+/// Borrowed [`owned::MaybeInaccessibleMessage`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum MaybeInaccessibleMessage<'a> {
+    Message(Message<'a>),
+    InaccessibleMessage(InaccessibleMessage<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for MaybeInaccessibleMessage<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::Message(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InaccessibleMessage(v));
+        }
+        Err(D::Error::custom(
+            "data did not match any variant of untagged enum MaybeInaccessibleMessage",
+        ))
+    }
+}
+
+impl<'a> MaybeInaccessibleMessage<'a> {
+    /// Copy every borrowed string into an owned [`owned::MaybeInaccessibleMessage`].
+    pub fn into_owned(self) -> owned::MaybeInaccessibleMessage {
+        match self {
+            Self::Message(v) => owned::MaybeInaccessibleMessage::Message(v.into_owned()),
+            Self::InaccessibleMessage(v) => {
+                owned::MaybeInaccessibleMessage::InaccessibleMessage(v.into_owned())
+            }
+        }
+    }
+}
+
+/// Borrowed [`owned::Message`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Message<'a> {
+    pub message_id: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message_thread_id: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub direct_messages_topic: Option<Box<DirectMessagesTopic<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub from: Option<Box<User<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sender_chat: Option<Box<Chat<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sender_boost_count: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sender_business_bot: Option<Box<User<'a>>>,
+    pub date: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub business_connection_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forward_origin: Option<Box<MessageOrigin<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_topic_message: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_automatic_forward: Option<bool>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reply_to_message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub external_reply: Option<Box<ExternalReplyInfo<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub quote: Option<Box<TextQuote<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reply_to_story: Option<Box<Story<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reply_to_checklist_task_id: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub via_bot: Option<Box<User<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub edit_date: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_protected_content: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_from_offline: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_paid_post: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub media_group_id: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub author_signature: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub paid_star_count: Option<i64>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub link_preview_options: Option<Box<LinkPreviewOptions<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_info: Option<Box<owned::SuggestedPostInfo>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub effect_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub animation: Option<Box<Animation<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub audio: Option<Box<Audio<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub document: Option<Box<Document<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub paid_media: Option<Box<PaidMediaInfo<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub photo: Option<ShortVec<PhotoSize<'a>, 4>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sticker: Option<Box<Sticker<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub story: Option<Box<Story<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video: Option<Box<Video<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_note: Option<Box<VideoNote<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub voice: Option<Box<Voice<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub caption: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub caption_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub show_caption_above_media: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_media_spoiler: Option<bool>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist: Option<Box<Checklist<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub contact: Option<Box<Contact<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub dice: Option<Box<Dice<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub game: Option<Box<Game<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub poll: Option<Box<Poll<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub venue: Option<Box<Venue<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub location: Option<Box<owned::Location>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub new_chat_members: Option<ShortVec<User<'a>, 1>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub left_chat_member: Option<Box<User<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_owner_left: Option<Box<ChatOwnerLeft<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_owner_changed: Option<Box<ChatOwnerChanged<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub new_chat_title: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub new_chat_photo: Option<ShortVec<PhotoSize<'a>, 4>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub delete_chat_photo: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub group_chat_created: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub supergroup_chat_created: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub channel_chat_created: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message_auto_delete_timer_changed: Option<Box<owned::MessageAutoDeleteTimerChanged>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub migrate_to_chat_id: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub migrate_from_chat_id: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub pinned_message: Option<Box<MaybeInaccessibleMessage<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub invoice: Option<Box<Invoice<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub successful_payment: Option<Box<SuccessfulPayment<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub refunded_payment: Option<Box<RefundedPayment<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub users_shared: Option<Box<UsersShared<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_shared: Option<Box<ChatShared<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub gift: Option<Box<GiftInfo<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub unique_gift: Option<Box<UniqueGiftInfo<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub gift_upgrade_sent: Option<Box<GiftInfo<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub connected_website: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub write_access_allowed: Option<Box<WriteAccessAllowed<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub passport_data: Option<Box<PassportData<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub proximity_alert_triggered: Option<Box<ProximityAlertTriggered<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub boost_added: Option<Box<owned::ChatBoostAdded>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_background_set: Option<Box<ChatBackground<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist_tasks_done: Option<Box<ChecklistTasksDone<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub checklist_tasks_added: Option<Box<ChecklistTasksAdded<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub direct_message_price_changed: Option<Box<owned::DirectMessagePriceChanged>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forum_topic_created: Option<Box<ForumTopicCreated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forum_topic_edited: Option<Box<ForumTopicEdited<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forum_topic_closed: Option<owned::ForumTopicClosed>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub forum_topic_reopened: Option<owned::ForumTopicReopened>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub general_forum_topic_hidden: Option<owned::GeneralForumTopicHidden>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub general_forum_topic_unhidden: Option<owned::GeneralForumTopicUnhidden>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway_created: Option<Box<owned::GiveawayCreated>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway: Option<Box<Giveaway<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway_winners: Option<Box<GiveawayWinners<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub giveaway_completed: Option<Box<GiveawayCompleted<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub paid_message_price_changed: Option<Box<owned::PaidMessagePriceChanged>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_approved: Option<Box<SuggestedPostApproved<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_approval_failed: Option<Box<SuggestedPostApprovalFailed<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_declined: Option<Box<SuggestedPostDeclined<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_paid: Option<Box<SuggestedPostPaid<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_refunded: Option<Box<SuggestedPostRefunded<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_chat_scheduled: Option<Box<owned::VideoChatScheduled>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_chat_started: Option<owned::VideoChatStarted>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_chat_ended: Option<Box<owned::VideoChatEnded>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub video_chat_participants_invited: Option<Box<VideoChatParticipantsInvited<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub web_app_data: Option<Box<WebAppData<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reply_markup: Option<Box<InlineKeyboardMarkup<'a>>>,
+}
+
+impl<'a> Message<'a> {
+    /// Copy every borrowed string into an owned [`owned::Message`].
+    pub fn into_owned(self) -> owned::Message {
+        owned::Message {
+            message_id: self.message_id,
+            message_thread_id: self.message_thread_id,
+            direct_messages_topic: self
+                .direct_messages_topic
+                .map(|v| Box::new((*v).into_owned())),
+            from: self.from.map(|v| Box::new((*v).into_owned())),
+            sender_chat: self.sender_chat.map(|v| Box::new((*v).into_owned())),
+            sender_boost_count: self.sender_boost_count,
+            sender_business_bot: self
+                .sender_business_bot
+                .map(|v| Box::new((*v).into_owned())),
+            date: self.date,
+            business_connection_id: self.business_connection_id.map(|v| v.into_owned()),
+            chat: self.chat.into_owned(),
+            forward_origin: self.forward_origin.map(|v| Box::new((*v).into_owned())),
+            is_topic_message: self.is_topic_message,
+            is_automatic_forward: self.is_automatic_forward,
+            reply_to_message: self.reply_to_message.map(|v| Box::new((*v).into_owned())),
+            external_reply: self.external_reply.map(|v| Box::new((*v).into_owned())),
+            quote: self.quote.map(|v| Box::new((*v).into_owned())),
+            reply_to_story: self.reply_to_story.map(|v| Box::new((*v).into_owned())),
+            reply_to_checklist_task_id: self.reply_to_checklist_task_id,
+            via_bot: self.via_bot.map(|v| Box::new((*v).into_owned())),
+            edit_date: self.edit_date,
+            has_protected_content: self.has_protected_content,
+            is_from_offline: self.is_from_offline,
+            is_paid_post: self.is_paid_post,
+            media_group_id: self.media_group_id.map(|v| v.into_owned()),
+            author_signature: self.author_signature.map(|v| v.into_owned()),
+            paid_star_count: self.paid_star_count,
+            text: self.text.map(|v| v.into_owned()),
+            entities: self
+                .entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            link_preview_options: self
+                .link_preview_options
+                .map(|v| Box::new((*v).into_owned())),
+            suggested_post_info: self.suggested_post_info,
+            effect_id: self.effect_id.map(|v| v.into_owned()),
+            animation: self.animation.map(|v| Box::new((*v).into_owned())),
+            audio: self.audio.map(|v| Box::new((*v).into_owned())),
+            document: self.document.map(|v| Box::new((*v).into_owned())),
+            paid_media: self.paid_media.map(|v| Box::new((*v).into_owned())),
+            photo: self
+                .photo
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            sticker: self.sticker.map(|v| Box::new((*v).into_owned())),
+            story: self.story.map(|v| Box::new((*v).into_owned())),
+            video: self.video.map(|v| Box::new((*v).into_owned())),
+            video_note: self.video_note.map(|v| Box::new((*v).into_owned())),
+            voice: self.voice.map(|v| Box::new((*v).into_owned())),
+            caption: self.caption.map(|v| v.into_owned()),
+            caption_entities: self
+                .caption_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            show_caption_above_media: self.show_caption_above_media,
+            has_media_spoiler: self.has_media_spoiler,
+            checklist: self.checklist.map(|v| Box::new((*v).into_owned())),
+            contact: self.contact.map(|v| Box::new((*v).into_owned())),
+            dice: self.dice.map(|v| Box::new((*v).into_owned())),
+            game: self.game.map(|v| Box::new((*v).into_owned())),
+            poll: self.poll.map(|v| Box::new((*v).into_owned())),
+            venue: self.venue.map(|v| Box::new((*v).into_owned())),
+            location: self.location,
+            new_chat_members: self
+                .new_chat_members
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            left_chat_member: self.left_chat_member.map(|v| Box::new((*v).into_owned())),
+            chat_owner_left: self.chat_owner_left.map(|v| Box::new((*v).into_owned())),
+            chat_owner_changed: self.chat_owner_changed.map(|v| Box::new((*v).into_owned())),
+            new_chat_title: self.new_chat_title.map(|v| v.into_owned()),
+            new_chat_photo: self
+                .new_chat_photo
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            delete_chat_photo: self.delete_chat_photo,
+            group_chat_created: self.group_chat_created,
+            supergroup_chat_created: self.supergroup_chat_created,
+            channel_chat_created: self.channel_chat_created,
+            message_auto_delete_timer_changed: self.message_auto_delete_timer_changed,
+            migrate_to_chat_id: self.migrate_to_chat_id,
+            migrate_from_chat_id: self.migrate_from_chat_id,
+            pinned_message: self.pinned_message.map(|v| Box::new((*v).into_owned())),
+            invoice: self.invoice.map(|v| Box::new((*v).into_owned())),
+            successful_payment: self.successful_payment.map(|v| Box::new((*v).into_owned())),
+            refunded_payment: self.refunded_payment.map(|v| Box::new((*v).into_owned())),
+            users_shared: self.users_shared.map(|v| Box::new((*v).into_owned())),
+            chat_shared: self.chat_shared.map(|v| Box::new((*v).into_owned())),
+            gift: self.gift.map(|v| Box::new((*v).into_owned())),
+            unique_gift: self.unique_gift.map(|v| Box::new((*v).into_owned())),
+            gift_upgrade_sent: self.gift_upgrade_sent.map(|v| Box::new((*v).into_owned())),
+            connected_website: self.connected_website.map(|v| v.into_owned()),
+            write_access_allowed: self
+                .write_access_allowed
+                .map(|v| Box::new((*v).into_owned())),
+            passport_data: self.passport_data.map(|v| Box::new((*v).into_owned())),
+            proximity_alert_triggered: self
+                .proximity_alert_triggered
+                .map(|v| Box::new((*v).into_owned())),
+            boost_added: self.boost_added,
+            chat_background_set: self
+                .chat_background_set
+                .map(|v| Box::new((*v).into_owned())),
+            checklist_tasks_done: self
+                .checklist_tasks_done
+                .map(|v| Box::new((*v).into_owned())),
+            checklist_tasks_added: self
+                .checklist_tasks_added
+                .map(|v| Box::new((*v).into_owned())),
+            direct_message_price_changed: self.direct_message_price_changed,
+            forum_topic_created: self
+                .forum_topic_created
+                .map(|v| Box::new((*v).into_owned())),
+            forum_topic_edited: self.forum_topic_edited.map(|v| Box::new((*v).into_owned())),
+            forum_topic_closed: self.forum_topic_closed,
+            forum_topic_reopened: self.forum_topic_reopened,
+            general_forum_topic_hidden: self.general_forum_topic_hidden,
+            general_forum_topic_unhidden: self.general_forum_topic_unhidden,
+            giveaway_created: self.giveaway_created,
+            giveaway: self.giveaway.map(|v| Box::new((*v).into_owned())),
+            giveaway_winners: self.giveaway_winners.map(|v| Box::new((*v).into_owned())),
+            giveaway_completed: self.giveaway_completed.map(|v| Box::new((*v).into_owned())),
+            paid_message_price_changed: self.paid_message_price_changed,
+            suggested_post_approved: self
+                .suggested_post_approved
+                .map(|v| Box::new((*v).into_owned())),
+            suggested_post_approval_failed: self
+                .suggested_post_approval_failed
+                .map(|v| Box::new((*v).into_owned())),
+            suggested_post_declined: self
+                .suggested_post_declined
+                .map(|v| Box::new((*v).into_owned())),
+            suggested_post_paid: self
+                .suggested_post_paid
+                .map(|v| Box::new((*v).into_owned())),
+            suggested_post_refunded: self
+                .suggested_post_refunded
+                .map(|v| Box::new((*v).into_owned())),
+            video_chat_scheduled: self.video_chat_scheduled,
+            video_chat_started: self.video_chat_started,
+            video_chat_ended: self.video_chat_ended,
+            video_chat_participants_invited: self
+                .video_chat_participants_invited
+                .map(|v| Box::new((*v).into_owned())),
+            web_app_data: self.web_app_data.map(|v| Box::new((*v).into_owned())),
+            reply_markup: self.reply_markup.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageEntity`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageEntity<'a> {
+    #[serde(rename = "type")]
+    pub r#type: owned::MessageEntityType,
+    pub offset: i64,
+    pub length: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub url: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user: Option<User<'a>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub language: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub custom_emoji_id: Option<Cow<'a, str>>,
+}
+
+impl<'a> MessageEntity<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageEntity`].
+    pub fn into_owned(self) -> owned::MessageEntity {
+        owned::MessageEntity {
+            r#type: self.r#type,
+            offset: self.offset,
+            length: self.length,
+            url: self.url.map(|v| v.into_owned()),
+            user: self.user.map(|v| v.into_owned()),
+            language: self.language.map(|v| v.into_owned()),
+            custom_emoji_id: self.custom_emoji_id.map(|v| v.into()),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageOrigin`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum MessageOrigin<'a> {
+    MessageOriginUser(MessageOriginUser<'a>),
+    MessageOriginHiddenUser(MessageOriginHiddenUser<'a>),
+    MessageOriginChat(MessageOriginChat<'a>),
+    MessageOriginChannel(MessageOriginChannel<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for MessageOrigin<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["user", "hidden_user", "chat", "channel"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("user") => serde_json::from_str(raw.get()).map(Self::MessageOriginUser),
+            Some("hidden_user") => {
+                serde_json::from_str(raw.get()).map(Self::MessageOriginHiddenUser)
+            }
+            Some("chat") => serde_json::from_str(raw.get()).map(Self::MessageOriginChat),
+            Some("channel") => serde_json::from_str(raw.get()).map(Self::MessageOriginChannel),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> MessageOrigin<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageOrigin`].
+    pub fn into_owned(self) -> owned::MessageOrigin {
+        match self {
+            Self::MessageOriginUser(v) => owned::MessageOrigin::MessageOriginUser(v.into_owned()),
+            Self::MessageOriginHiddenUser(v) => {
+                owned::MessageOrigin::MessageOriginHiddenUser(v.into_owned())
+            }
+            Self::MessageOriginChat(v) => owned::MessageOrigin::MessageOriginChat(v.into_owned()),
+            Self::MessageOriginChannel(v) => {
+                owned::MessageOrigin::MessageOriginChannel(v.into_owned())
+            }
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageOriginChannel`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageOriginChannel<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub message_id: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub author_signature: Option<Cow<'a, str>>,
+}
+
+impl<'a> MessageOriginChannel<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageOriginChannel`].
+    pub fn into_owned(self) -> owned::MessageOriginChannel {
+        owned::MessageOriginChannel {
+            r#type: self.r#type.into_owned(),
+            date: self.date,
+            chat: self.chat.into_owned(),
+            message_id: self.message_id,
+            author_signature: self.author_signature.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageOriginChat`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageOriginChat<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub sender_chat: Chat<'a>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub author_signature: Option<Cow<'a, str>>,
+}
+
+impl<'a> MessageOriginChat<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageOriginChat`].
+    pub fn into_owned(self) -> owned::MessageOriginChat {
+        owned::MessageOriginChat {
+            r#type: self.r#type.into_owned(),
+            date: self.date,
+            sender_chat: self.sender_chat.into_owned(),
+            author_signature: self.author_signature.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageOriginHiddenUser`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageOriginHiddenUser<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub sender_user_name: Cow<'a, str>,
+}
+
+impl<'a> MessageOriginHiddenUser<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageOriginHiddenUser`].
+    pub fn into_owned(self) -> owned::MessageOriginHiddenUser {
+        owned::MessageOriginHiddenUser {
+            r#type: self.r#type.into_owned(),
+            date: self.date,
+            sender_user_name: self.sender_user_name.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageOriginUser`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageOriginUser<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub sender_user: User<'a>,
+}
+
+impl<'a> MessageOriginUser<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageOriginUser`].
+    pub fn into_owned(self) -> owned::MessageOriginUser {
+        owned::MessageOriginUser {
+            r#type: self.r#type.into_owned(),
+            date: self.date,
+            sender_user: self.sender_user.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageReactionCountUpdated`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageReactionCountUpdated<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub message_id: i64,
+    pub date: i64,
+    #[serde(borrow)]
+    pub reactions: ShortVec<ReactionCount<'a>, 4>,
+}
+
+impl<'a> MessageReactionCountUpdated<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageReactionCountUpdated`].
+    pub fn into_owned(self) -> owned::MessageReactionCountUpdated {
+        owned::MessageReactionCountUpdated {
+            chat: self.chat.into_owned(),
+            message_id: self.message_id,
+            date: self.date,
+            reactions: self.reactions.into_iter().map(|v| v.into_owned()).collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::MessageReactionUpdated`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct MessageReactionUpdated<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub message_id: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user: Option<Box<User<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub actor_chat: Option<Box<Chat<'a>>>,
+    pub date: i64,
+    #[serde(borrow)]
+    pub old_reaction: ShortVec<ReactionType<'a>, 2>,
+    #[serde(borrow)]
+    pub new_reaction: ShortVec<ReactionType<'a>, 2>,
+}
+
+impl<'a> MessageReactionUpdated<'a> {
+    /// Copy every borrowed string into an owned [`owned::MessageReactionUpdated`].
+    pub fn into_owned(self) -> owned::MessageReactionUpdated {
+        owned::MessageReactionUpdated {
+            chat: self.chat.into_owned(),
+            message_id: self.message_id,
+            user: self.user.map(|v| Box::new((*v).into_owned())),
+            actor_chat: self.actor_chat.map(|v| Box::new((*v).into_owned())),
+            date: self.date,
+            old_reaction: self
+                .old_reaction
+                .into_iter()
+                .map(|v| v.into_owned())
+                .collect(),
+            new_reaction: self
+                .new_reaction
+                .into_iter()
+                .map(|v| v.into_owned())
+                .collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::OrderInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct OrderInfo<'a> {
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub phone_number: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub email: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub shipping_address: Option<ShippingAddress<'a>>,
+}
+
+impl<'a> OrderInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::OrderInfo`].
+    pub fn into_owned(self) -> owned::OrderInfo {
+        owned::OrderInfo {
+            name: self.name.map(|v| v.into_owned()),
+            phone_number: self.phone_number.map(|v| v.into_owned()),
+            email: self.email.map(|v| v.into_owned()),
+            shipping_address: self.shipping_address.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMedia`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum PaidMedia<'a> {
+    PaidMediaPreview(PaidMediaPreview<'a>),
+    PaidMediaPhoto(PaidMediaPhoto<'a>),
+    PaidMediaVideo(PaidMediaVideo<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for PaidMedia<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["preview", "photo", "video"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("preview") => serde_json::from_str(raw.get()).map(Self::PaidMediaPreview),
+            Some("photo") => serde_json::from_str(raw.get()).map(Self::PaidMediaPhoto),
+            Some("video") => serde_json::from_str(raw.get()).map(Self::PaidMediaVideo),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> PaidMedia<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMedia`].
+    pub fn into_owned(self) -> owned::PaidMedia {
+        match self {
+            Self::PaidMediaPreview(v) => owned::PaidMedia::PaidMediaPreview(v.into_owned()),
+            Self::PaidMediaPhoto(v) => owned::PaidMedia::PaidMediaPhoto(v.into_owned()),
+            Self::PaidMediaVideo(v) => owned::PaidMedia::PaidMediaVideo(v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMediaInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PaidMediaInfo<'a> {
+    pub star_count: i64,
+    #[serde(borrow)]
+    pub paid_media: Vec<PaidMedia<'a>>,
+}
+
+impl<'a> PaidMediaInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMediaInfo`].
+    pub fn into_owned(self) -> owned::PaidMediaInfo {
+        owned::PaidMediaInfo {
+            star_count: self.star_count,
+            paid_media: self
+                .paid_media
+                .into_iter()
+                .map(|v| v.into_owned())
+                .collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMediaPhoto`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PaidMediaPhoto<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub photo: ShortVec<PhotoSize<'a>, 4>,
+}
+
+impl<'a> PaidMediaPhoto<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMediaPhoto`].
+    pub fn into_owned(self) -> owned::PaidMediaPhoto {
+        owned::PaidMediaPhoto {
+            r#type: self.r#type.into_owned(),
+            photo: self.photo.into_iter().map(|v| v.into_owned()).collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMediaPreview`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PaidMediaPreview<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub width: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub height: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub duration: Option<i64>,
+}
+
+impl<'a> PaidMediaPreview<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMediaPreview`].
+    pub fn into_owned(self) -> owned::PaidMediaPreview {
+        owned::PaidMediaPreview {
+            r#type: self.r#type.into_owned(),
+            width: self.width,
+            height: self.height,
+            duration: self.duration,
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMediaPurchased`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PaidMediaPurchased<'a> {
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(borrow)]
+    pub paid_media_payload: Cow<'a, str>,
+}
+
+impl<'a> PaidMediaPurchased<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMediaPurchased`].
+    pub fn into_owned(self) -> owned::PaidMediaPurchased {
+        owned::PaidMediaPurchased {
+            from: self.from.into_owned(),
+            paid_media_payload: self.paid_media_payload.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::PaidMediaVideo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PaidMediaVideo<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub video: Video<'a>,
+}
+
+impl<'a> PaidMediaVideo<'a> {
+    /// Copy every borrowed string into an owned [`owned::PaidMediaVideo`].
+    pub fn into_owned(self) -> owned::PaidMediaVideo {
+        owned::PaidMediaVideo {
+            r#type: self.r#type.into_owned(),
+            video: self.video.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::PassportData`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PassportData<'a> {
+    #[serde(borrow)]
+    pub data: Vec<EncryptedPassportElement<'a>>,
+    #[serde(borrow)]
+    pub credentials: EncryptedCredentials<'a>,
+}
+
+impl<'a> PassportData<'a> {
+    /// Copy every borrowed string into an owned [`owned::PassportData`].
+    pub fn into_owned(self) -> owned::PassportData {
+        owned::PassportData {
+            data: self.data.into_iter().map(|v| v.into_owned()).collect(),
+            credentials: self.credentials.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::PassportFile`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PassportFile<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub file_size: i64,
+    pub file_date: i64,
+}
+
+impl<'a> PassportFile<'a> {
+    /// Copy every borrowed string into an owned [`owned::PassportFile`].
+    pub fn into_owned(self) -> owned::PassportFile {
+        owned::PassportFile {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            file_size: self.file_size,
+            file_date: self.file_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::PhotoSize`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PhotoSize<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub width: i64,
+    pub height: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> PhotoSize<'a> {
+    /// Copy every borrowed string into an owned [`owned::PhotoSize`].
+    pub fn into_owned(self) -> owned::PhotoSize {
+        owned::PhotoSize {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            width: self.width,
+            height: self.height,
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::Poll`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Poll<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub question: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub question_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(borrow)]
+    pub options: ShortVec<PollOption<'a>, 4>,
+    pub total_voter_count: i64,
+    pub is_closed: bool,
+    pub is_anonymous: bool,
+    #[serde(rename = "type")]
+    pub r#type: owned::PollType,
+    pub allows_multiple_answers: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub correct_option_id: Option<i64>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub explanation: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub explanation_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub open_period: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub close_date: Option<i64>,
+}
+
+impl<'a> Poll<'a> {
+    /// Copy every borrowed string into an owned [`owned::Poll`].
+    pub fn into_owned(self) -> owned::Poll {
+        owned::Poll {
+            id: self.id.into_owned(),
+            question: self.question.into_owned(),
+            question_entities: self
+                .question_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            options: self.options.into_iter().map(|v| v.into_owned()).collect(),
+            total_voter_count: self.total_voter_count,
+            is_closed: self.is_closed,
+            is_anonymous: self.is_anonymous,
+            r#type: self.r#type,
+            allows_multiple_answers: self.allows_multiple_answers,
+            correct_option_id: self.correct_option_id,
+            explanation: self.explanation.map(|v| v.into_owned()),
+            explanation_entities: self
+                .explanation_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            open_period: self.open_period,
+            close_date: self.close_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::PollAnswer`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PollAnswer<'a> {
+    #[serde(borrow)]
+    pub poll_id: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub voter_chat: Option<Box<Chat<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub user: Option<User<'a>>,
+    pub option_ids: Vec<i64>,
+}
+
+impl<'a> PollAnswer<'a> {
+    /// Copy every borrowed string into an owned [`owned::PollAnswer`].
+    pub fn into_owned(self) -> owned::PollAnswer {
+        owned::PollAnswer {
+            poll_id: self.poll_id.into_owned(),
+            voter_chat: self.voter_chat.map(|v| Box::new((*v).into_owned())),
+            user: self.user.map(|v| v.into_owned()),
+            option_ids: self.option_ids,
+        }
+    }
+}
+
+/// Borrowed [`owned::PollOption`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PollOption<'a> {
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub text_entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    pub voter_count: i64,
+}
+
+impl<'a> PollOption<'a> {
+    /// Copy every borrowed string into an owned [`owned::PollOption`].
+    pub fn into_owned(self) -> owned::PollOption {
+        owned::PollOption {
+            text: self.text.into_owned(),
+            text_entities: self
+                .text_entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            voter_count: self.voter_count,
+        }
+    }
+}
+
+/// Borrowed [`owned::PreCheckoutQuery`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct PreCheckoutQuery<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(borrow)]
+    pub currency: Cow<'a, str>,
+    pub total_amount: i64,
+    #[serde(borrow)]
+    pub invoice_payload: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub shipping_option_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub order_info: Option<Box<OrderInfo<'a>>>,
+}
+
+impl<'a> PreCheckoutQuery<'a> {
+    /// Copy every borrowed string into an owned [`owned::PreCheckoutQuery`].
+    pub fn into_owned(self) -> owned::PreCheckoutQuery {
+        owned::PreCheckoutQuery {
+            id: self.id.into_owned(),
+            from: self.from.into_owned(),
+            currency: self.currency.into(),
+            total_amount: self.total_amount,
+            invoice_payload: self.invoice_payload.into_owned(),
+            shipping_option_id: self.shipping_option_id.map(|v| v.into_owned()),
+            order_info: self.order_info.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::ProximityAlertTriggered`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ProximityAlertTriggered<'a> {
+    #[serde(borrow)]
+    pub traveler: User<'a>,
+    #[serde(borrow)]
+    pub watcher: User<'a>,
+    pub distance: i64,
+}
+
+impl<'a> ProximityAlertTriggered<'a> {
+    /// Copy every borrowed string into an owned [`owned::ProximityAlertTriggered`].
+    pub fn into_owned(self) -> owned::ProximityAlertTriggered {
+        owned::ProximityAlertTriggered {
+            traveler: self.traveler.into_owned(),
+            watcher: self.watcher.into_owned(),
+            distance: self.distance,
+        }
+    }
+}
+
+/// Borrowed [`owned::ReactionCount`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ReactionCount<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: ReactionType<'a>,
+    pub total_count: i64,
+}
+
+impl<'a> ReactionCount<'a> {
+    /// Copy every borrowed string into an owned [`owned::ReactionCount`].
+    pub fn into_owned(self) -> owned::ReactionCount {
+        owned::ReactionCount {
+            r#type: self.r#type.into_owned(),
+            total_count: self.total_count,
+        }
+    }
+}
+
+/// Borrowed [`owned::ReactionType`].
+#[derive(Debug, Clone, Serialize, PartialEq)]
+#[serde(untagged)]
+pub enum ReactionType<'a> {
+    ReactionTypeEmoji(ReactionTypeEmoji<'a>),
+    ReactionTypeCustomEmoji(ReactionTypeCustomEmoji<'a>),
+    ReactionTypePaid(ReactionTypePaid<'a>),
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for ReactionType<'a> {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = <&'a RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["emoji", "custom_emoji", "paid"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("emoji") => serde_json::from_str(raw.get()).map(Self::ReactionTypeEmoji),
+            Some("custom_emoji") => {
+                serde_json::from_str(raw.get()).map(Self::ReactionTypeCustomEmoji)
+            }
+            Some("paid") => serde_json::from_str(raw.get()).map(Self::ReactionTypePaid),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
+impl<'a> ReactionType<'a> {
+    /// Copy every borrowed string into an owned [`owned::ReactionType`].
+    pub fn into_owned(self) -> owned::ReactionType {
+        match self {
+            Self::ReactionTypeEmoji(v) => owned::ReactionType::ReactionTypeEmoji(v.into_owned()),
+            Self::ReactionTypeCustomEmoji(v) => {
+                owned::ReactionType::ReactionTypeCustomEmoji(v.into_owned())
+            }
+            Self::ReactionTypePaid(v) => owned::ReactionType::ReactionTypePaid(v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ReactionTypeCustomEmoji`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ReactionTypeCustomEmoji<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub custom_emoji_id: Cow<'a, str>,
+}
+
+impl<'a> ReactionTypeCustomEmoji<'a> {
+    /// Copy every borrowed string into an owned [`owned::ReactionTypeCustomEmoji`].
+    pub fn into_owned(self) -> owned::ReactionTypeCustomEmoji {
+        owned::ReactionTypeCustomEmoji {
+            r#type: self.r#type.into_owned(),
+            custom_emoji_id: self.custom_emoji_id.into(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ReactionTypeEmoji`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ReactionTypeEmoji<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub emoji: Cow<'a, str>,
+}
+
+impl<'a> ReactionTypeEmoji<'a> {
+    /// Copy every borrowed string into an owned [`owned::ReactionTypeEmoji`].
+    pub fn into_owned(self) -> owned::ReactionTypeEmoji {
+        owned::ReactionTypeEmoji {
+            r#type: self.r#type.into_owned(),
+            emoji: self.emoji.into(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ReactionTypePaid`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ReactionTypePaid<'a> {
+    #[serde(rename = "type")]
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl<'a> ReactionTypePaid<'a> {
+    /// Copy every borrowed string into an owned [`owned::ReactionTypePaid`].
+    pub fn into_owned(self) -> owned::ReactionTypePaid {
+        owned::ReactionTypePaid {
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::RefundedPayment`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct RefundedPayment<'a> {
+    #[serde(borrow)]
+    pub currency: Cow<'a, str>,
+    pub total_amount: i64,
+    #[serde(borrow)]
+    pub invoice_payload: Cow<'a, str>,
+    #[serde(borrow)]
+    pub telegram_payment_charge_id: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub provider_payment_charge_id: Option<Cow<'a, str>>,
+}
+
+impl<'a> RefundedPayment<'a> {
+    /// Copy every borrowed string into an owned [`owned::RefundedPayment`].
+    pub fn into_owned(self) -> owned::RefundedPayment {
+        owned::RefundedPayment {
+            currency: self.currency.into(),
+            total_amount: self.total_amount,
+            invoice_payload: self.invoice_payload.into_owned(),
+            telegram_payment_charge_id: self.telegram_payment_charge_id.into_owned(),
+            provider_payment_charge_id: self.provider_payment_charge_id.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::SharedUser`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SharedUser<'a> {
+    pub user_id: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub first_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub username: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub photo: Option<ShortVec<PhotoSize<'a>, 4>>,
+}
+
+impl<'a> SharedUser<'a> {
+    /// Copy every borrowed string into an owned [`owned::SharedUser`].
+    pub fn into_owned(self) -> owned::SharedUser {
+        owned::SharedUser {
+            user_id: self.user_id,
+            first_name: self.first_name.map(|v| v.into_owned()),
+            last_name: self.last_name.map(|v| v.into_owned()),
+            username: self.username.map(|v| v.into_owned()),
+            photo: self
+                .photo
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+        }
+    }
+}
+
+/// Borrowed [`owned::ShippingAddress`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ShippingAddress<'a> {
+    #[serde(borrow)]
+    pub country_code: Cow<'a, str>,
+    #[serde(borrow)]
+    pub state: Cow<'a, str>,
+    #[serde(borrow)]
+    pub city: Cow<'a, str>,
+    #[serde(borrow)]
+    pub street_line1: Cow<'a, str>,
+    #[serde(borrow)]
+    pub street_line2: Cow<'a, str>,
+    #[serde(borrow)]
+    pub post_code: Cow<'a, str>,
+}
+
+impl<'a> ShippingAddress<'a> {
+    /// Copy every borrowed string into an owned [`owned::ShippingAddress`].
+    pub fn into_owned(self) -> owned::ShippingAddress {
+        owned::ShippingAddress {
+            country_code: self.country_code.into(),
+            state: self.state.into_owned(),
+            city: self.city.into_owned(),
+            street_line1: self.street_line1.into_owned(),
+            street_line2: self.street_line2.into_owned(),
+            post_code: self.post_code.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::ShippingQuery`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct ShippingQuery<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub from: User<'a>,
+    #[serde(borrow)]
+    pub invoice_payload: Cow<'a, str>,
+    #[serde(borrow)]
+    pub shipping_address: ShippingAddress<'a>,
+}
+
+impl<'a> ShippingQuery<'a> {
+    /// Copy every borrowed string into an owned [`owned::ShippingQuery`].
+    pub fn into_owned(self) -> owned::ShippingQuery {
+        owned::ShippingQuery {
+            id: self.id.into_owned(),
+            from: self.from.into_owned(),
+            invoice_payload: self.invoice_payload.into_owned(),
+            shipping_address: self.shipping_address.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::Sticker`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Sticker<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    #[serde(rename = "type")]
+    pub r#type: owned::StickerType,
+    pub width: i64,
+    pub height: i64,
+    pub is_animated: bool,
+    pub is_video: bool,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<Box<PhotoSize<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub emoji: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub set_name: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub premium_animation: Option<Box<File<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mask_position: Option<owned::MaskPosition>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub custom_emoji_id: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub needs_repainting: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> Sticker<'a> {
+    /// Copy every borrowed string into an owned [`owned::Sticker`].
+    pub fn into_owned(self) -> owned::Sticker {
+        owned::Sticker {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            r#type: self.r#type,
+            width: self.width,
+            height: self.height,
+            is_animated: self.is_animated,
+            is_video: self.is_video,
+            thumbnail: self.thumbnail.map(|v| Box::new((*v).into_owned())),
+            emoji: self.emoji.map(|v| v.into_owned()),
+            set_name: self.set_name.map(|v| v.into_owned()),
+            premium_animation: self.premium_animation.map(|v| Box::new((*v).into_owned())),
+            mask_position: self.mask_position,
+            custom_emoji_id: self.custom_emoji_id.map(|v| v.into()),
+            needs_repainting: self.needs_repainting,
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::Story`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Story<'a> {
+    #[serde(borrow)]
+    pub chat: Chat<'a>,
+    pub id: i64,
+}
+
+impl<'a> Story<'a> {
+    /// Copy every borrowed string into an owned [`owned::Story`].
+    pub fn into_owned(self) -> owned::Story {
+        owned::Story {
+            chat: self.chat.into_owned(),
+            id: self.id,
+        }
+    }
+}
+
+/// Borrowed [`owned::SuccessfulPayment`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuccessfulPayment<'a> {
+    #[serde(borrow)]
+    pub currency: Cow<'a, str>,
+    pub total_amount: i64,
+    #[serde(borrow)]
+    pub invoice_payload: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub subscription_expiration_date: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_recurring: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_first_recurring: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub shipping_option_id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub order_info: Option<Box<OrderInfo<'a>>>,
+    #[serde(borrow)]
+    pub telegram_payment_charge_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub provider_payment_charge_id: Cow<'a, str>,
+}
+
+impl<'a> SuccessfulPayment<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuccessfulPayment`].
+    pub fn into_owned(self) -> owned::SuccessfulPayment {
+        owned::SuccessfulPayment {
+            currency: self.currency.into(),
+            total_amount: self.total_amount,
+            invoice_payload: self.invoice_payload.into_owned(),
+            subscription_expiration_date: self.subscription_expiration_date,
+            is_recurring: self.is_recurring,
+            is_first_recurring: self.is_first_recurring,
+            shipping_option_id: self.shipping_option_id.map(|v| v.into_owned()),
+            order_info: self.order_info.map(|v| Box::new((*v).into_owned())),
+            telegram_payment_charge_id: self.telegram_payment_charge_id.into_owned(),
+            provider_payment_charge_id: self.provider_payment_charge_id.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::SuggestedPostApprovalFailed`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuggestedPostApprovalFailed<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_message: Option<Box<Message<'a>>>,
+    pub price: owned::SuggestedPostPrice,
+}
+
+impl<'a> SuggestedPostApprovalFailed<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuggestedPostApprovalFailed`].
+    pub fn into_owned(self) -> owned::SuggestedPostApprovalFailed {
+        owned::SuggestedPostApprovalFailed {
+            suggested_post_message: self
+                .suggested_post_message
+                .map(|v| Box::new((*v).into_owned())),
+            price: self.price,
+        }
+    }
+}
+
+/// Borrowed [`owned::SuggestedPostApproved`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuggestedPostApproved<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_message: Option<Box<Message<'a>>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub price: Option<owned::SuggestedPostPrice>,
+    pub send_date: i64,
+}
+
+impl<'a> SuggestedPostApproved<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuggestedPostApproved`].
+    pub fn into_owned(self) -> owned::SuggestedPostApproved {
+        owned::SuggestedPostApproved {
+            suggested_post_message: self
+                .suggested_post_message
+                .map(|v| Box::new((*v).into_owned())),
+            price: self.price,
+            send_date: self.send_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::SuggestedPostDeclined`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuggestedPostDeclined<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_message: Option<Box<Message<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub comment: Option<Cow<'a, str>>,
+}
+
+impl<'a> SuggestedPostDeclined<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuggestedPostDeclined`].
+    pub fn into_owned(self) -> owned::SuggestedPostDeclined {
+        owned::SuggestedPostDeclined {
+            suggested_post_message: self
+                .suggested_post_message
+                .map(|v| Box::new((*v).into_owned())),
+            comment: self.comment.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::SuggestedPostPaid`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuggestedPostPaid<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_message: Option<Box<Message<'a>>>,
+    pub currency: owned::SuggestedPostPaidCurrency,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub amount: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub star_amount: Option<owned::StarAmount>,
+}
+
+impl<'a> SuggestedPostPaid<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuggestedPostPaid`].
+    pub fn into_owned(self) -> owned::SuggestedPostPaid {
+        owned::SuggestedPostPaid {
+            suggested_post_message: self
+                .suggested_post_message
+                .map(|v| Box::new((*v).into_owned())),
+            currency: self.currency,
+            amount: self.amount,
+            star_amount: self.star_amount,
+        }
+    }
+}
+
+/// Borrowed [`owned::SuggestedPostRefunded`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SuggestedPostRefunded<'a> {
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub suggested_post_message: Option<Box<Message<'a>>>,
+    pub reason: owned::SuggestedPostRefundedReason,
+}
+
+impl<'a> SuggestedPostRefunded<'a> {
+    /// Copy every borrowed string into an owned [`owned::SuggestedPostRefunded`].
+    pub fn into_owned(self) -> owned::SuggestedPostRefunded {
+        owned::SuggestedPostRefunded {
+            suggested_post_message: self
+                .suggested_post_message
+                .map(|v| Box::new((*v).into_owned())),
+            reason: self.reason,
+        }
+    }
+}
+
+/// Borrowed [`owned::SwitchInlineQueryChosenChat`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct SwitchInlineQueryChosenChat<'a> {
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub query: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub allow_user_chats: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub allow_bot_chats: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub allow_group_chats: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub allow_channel_chats: Option<bool>,
+}
+
+impl<'a> SwitchInlineQueryChosenChat<'a> {
+    /// Copy every borrowed string into an owned [`owned::SwitchInlineQueryChosenChat`].
+    pub fn into_owned(self) -> owned::SwitchInlineQueryChosenChat {
+        owned::SwitchInlineQueryChosenChat {
+            query: self.query.map(|v| v.into_owned()),
+            allow_user_chats: self.allow_user_chats,
+            allow_bot_chats: self.allow_bot_chats,
+            allow_group_chats: self.allow_group_chats,
+            allow_channel_chats: self.allow_channel_chats,
+        }
+    }
+}
+
+/// Borrowed [`owned::TextQuote`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct TextQuote<'a> {
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub entities: Option<ShortVec<MessageEntity<'a>, 2>>,
+    pub position: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_manual: Option<bool>,
+}
+
+impl<'a> TextQuote<'a> {
+    /// Copy every borrowed string into an owned [`owned::TextQuote`].
+    pub fn into_owned(self) -> owned::TextQuote {
+        owned::TextQuote {
+            text: self.text.into_owned(),
+            entities: self
+                .entities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            position: self.position,
+            is_manual: self.is_manual,
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGift`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGift<'a> {
+    #[serde(borrow)]
+    pub gift_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub base_name: Cow<'a, str>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    pub number: i64,
+    #[serde(borrow)]
+    pub model: UniqueGiftModel<'a>,
+    #[serde(borrow)]
+    pub symbol: UniqueGiftSymbol<'a>,
+    #[serde(borrow)]
+    pub backdrop: UniqueGiftBackdrop<'a>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_premium: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_burned: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_from_blockchain: Option<bool>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub colors: Option<Box<UniqueGiftColors<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub publisher_chat: Option<Box<Chat<'a>>>,
+}
+
+impl<'a> UniqueGift<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGift`].
+    pub fn into_owned(self) -> owned::UniqueGift {
+        owned::UniqueGift {
+            gift_id: self.gift_id.into_owned(),
+            base_name: self.base_name.into_owned(),
+            name: self.name.into_owned(),
+            number: self.number,
+            model: self.model.into_owned(),
+            symbol: self.symbol.into_owned(),
+            backdrop: self.backdrop.into_owned(),
+            is_premium: self.is_premium,
+            is_burned: self.is_burned,
+            is_from_blockchain: self.is_from_blockchain,
+            colors: self.colors.map(|v| Box::new((*v).into_owned())),
+            publisher_chat: self.publisher_chat.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGiftBackdrop`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGiftBackdrop<'a> {
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    pub colors: owned::UniqueGiftBackdropColors,
+    pub rarity_per_mille: i64,
+}
+
+impl<'a> UniqueGiftBackdrop<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGiftBackdrop`].
+    pub fn into_owned(self) -> owned::UniqueGiftBackdrop {
+        owned::UniqueGiftBackdrop {
+            name: self.name.into_owned(),
+            colors: self.colors,
+            rarity_per_mille: self.rarity_per_mille,
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGiftColors`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGiftColors<'a> {
+    #[serde(borrow)]
+    pub model_custom_emoji_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub symbol_custom_emoji_id: Cow<'a, str>,
+    pub light_theme_main_color: i64,
+    pub light_theme_other_colors: Vec<i64>,
+    pub dark_theme_main_color: i64,
+    pub dark_theme_other_colors: Vec<i64>,
+}
+
+impl<'a> UniqueGiftColors<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGiftColors`].
+    pub fn into_owned(self) -> owned::UniqueGiftColors {
+        owned::UniqueGiftColors {
+            model_custom_emoji_id: self.model_custom_emoji_id.into(),
+            symbol_custom_emoji_id: self.symbol_custom_emoji_id.into(),
+            light_theme_main_color: self.light_theme_main_color,
+            light_theme_other_colors: self.light_theme_other_colors,
+            dark_theme_main_color: self.dark_theme_main_color,
+            dark_theme_other_colors: self.dark_theme_other_colors,
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGiftInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGiftInfo<'a> {
+    #[serde(borrow)]
+    pub gift: UniqueGift<'a>,
+    pub origin: owned::UniqueGiftInfoOrigin,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_resale_currency: Option<owned::SuggestedPostPaidCurrency>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_resale_amount: Option<i64>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub owned_gift_id: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub transfer_star_count: Option<i64>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub next_transfer_date: Option<i64>,
+}
+
+impl<'a> UniqueGiftInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGiftInfo`].
+    pub fn into_owned(self) -> owned::UniqueGiftInfo {
+        owned::UniqueGiftInfo {
+            gift: self.gift.into_owned(),
+            origin: self.origin,
+            last_resale_currency: self.last_resale_currency,
+            last_resale_amount: self.last_resale_amount,
+            owned_gift_id: self.owned_gift_id.map(|v| v.into_owned()),
+            transfer_star_count: self.transfer_star_count,
+            next_transfer_date: self.next_transfer_date,
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGiftModel`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGiftModel<'a> {
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(borrow)]
+    pub sticker: Sticker<'a>,
+    pub rarity_per_mille: i64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub rarity: Option<owned::UniqueGiftModelRarity>,
+}
+
+impl<'a> UniqueGiftModel<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGiftModel`].
+    pub fn into_owned(self) -> owned::UniqueGiftModel {
+        owned::UniqueGiftModel {
+            name: self.name.into_owned(),
+            sticker: self.sticker.into_owned(),
+            rarity_per_mille: self.rarity_per_mille,
+            rarity: self.rarity,
+        }
+    }
+}
+
+/// Borrowed [`owned::UniqueGiftSymbol`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UniqueGiftSymbol<'a> {
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(borrow)]
+    pub sticker: Sticker<'a>,
+    pub rarity_per_mille: i64,
+}
+
+impl<'a> UniqueGiftSymbol<'a> {
+    /// Copy every borrowed string into an owned [`owned::UniqueGiftSymbol`].
+    pub fn into_owned(self) -> owned::UniqueGiftSymbol {
+        owned::UniqueGiftSymbol {
+            name: self.name.into_owned(),
+            sticker: self.sticker.into_owned(),
+            rarity_per_mille: self.rarity_per_mille,
+        }
+    }
+}
+
+/// Borrowed [`owned::Update`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Update<'a> {
+    pub update_id: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub edited_message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub channel_post: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub edited_channel_post: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub business_connection: Option<Box<BusinessConnection<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub business_message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub edited_business_message: Option<Box<Message<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub deleted_business_messages: Option<Box<BusinessMessagesDeleted<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message_reaction: Option<Box<MessageReactionUpdated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub message_reaction_count: Option<Box<MessageReactionCountUpdated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub inline_query: Option<Box<InlineQuery<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chosen_inline_result: Option<Box<ChosenInlineResult<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub callback_query: Option<Box<CallbackQuery<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub shipping_query: Option<Box<ShippingQuery<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub pre_checkout_query: Option<Box<PreCheckoutQuery<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub purchased_paid_media: Option<Box<PaidMediaPurchased<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub poll: Option<Box<Poll<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub poll_answer: Option<Box<PollAnswer<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub my_chat_member: Option<Box<ChatMemberUpdated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_member: Option<Box<ChatMemberUpdated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_join_request: Option<Box<ChatJoinRequest<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub chat_boost: Option<Box<ChatBoostUpdated<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub removed_chat_boost: Option<Box<ChatBoostRemoved<'a>>>,
+}
+
+impl<'a> Update<'a> {
+    /// Copy every borrowed string into an owned [`owned::Update`].
+    pub fn into_owned(self) -> owned::Update {
+        owned::Update {
+            update_id: self.update_id,
+            message: self.message.map(|v| Box::new((*v).into_owned())),
+            edited_message: self.edited_message.map(|v| Box::new((*v).into_owned())),
+            channel_post: self.channel_post.map(|v| Box::new((*v).into_owned())),
+            edited_channel_post: self
+                .edited_channel_post
+                .map(|v| Box::new((*v).into_owned())),
+            business_connection: self
+                .business_connection
+                .map(|v| Box::new((*v).into_owned())),
+            business_message: self.business_message.map(|v| Box::new((*v).into_owned())),
+            edited_business_message: self
+                .edited_business_message
+                .map(|v| Box::new((*v).into_owned())),
+            deleted_business_messages: self
+                .deleted_business_messages
+                .map(|v| Box::new((*v).into_owned())),
+            message_reaction: self.message_reaction.map(|v| Box::new((*v).into_owned())),
+            message_reaction_count: self
+                .message_reaction_count
+                .map(|v| Box::new((*v).into_owned())),
+            inline_query: self.inline_query.map(|v| Box::new((*v).into_owned())),
+            chosen_inline_result: self
+                .chosen_inline_result
+                .map(|v| Box::new((*v).into_owned())),
+            callback_query: self.callback_query.map(|v| Box::new((*v).into_owned())),
+            shipping_query: self.shipping_query.map(|v| Box::new((*v).into_owned())),
+            pre_checkout_query: self.pre_checkout_query.map(|v| Box::new((*v).into_owned())),
+            purchased_paid_media: self
+                .purchased_paid_media
+                .map(|v| Box::new((*v).into_owned())),
+            poll: self.poll.map(|v| Box::new((*v).into_owned())),
+            poll_answer: self.poll_answer.map(|v| Box::new((*v).into_owned())),
+            my_chat_member: self.my_chat_member.map(|v| Box::new((*v).into_owned())),
+            chat_member: self.chat_member.map(|v| Box::new((*v).into_owned())),
+            chat_join_request: self.chat_join_request.map(|v| Box::new((*v).into_owned())),
+            chat_boost: self.chat_boost.map(|v| Box::new((*v).into_owned())),
+            removed_chat_boost: self.removed_chat_boost.map(|v| Box::new((*v).into_owned())),
+        }
+    }
+}
+
+/// Borrowed [`owned::User`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct User<'a> {
+    pub id: i64,
+    pub is_bot: bool,
+    #[serde(borrow)]
+    pub first_name: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub last_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub username: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub language_code: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub is_premium: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub added_to_attachment_menu: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_join_groups: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_read_all_group_messages: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub supports_inline_queries: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub can_connect_to_business: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_main_web_app: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub has_topics_enabled: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub allows_users_to_create_topics: Option<bool>,
+}
+
+impl<'a> User<'a> {
+    /// Copy every borrowed string into an owned [`owned::User`].
+    pub fn into_owned(self) -> owned::User {
+        owned::User {
+            id: self.id,
+            is_bot: self.is_bot,
+            first_name: self.first_name.into_owned(),
+            last_name: self.last_name.map(|v| v.into_owned()),
+            username: self.username.map(|v| v.into_owned()),
+            language_code: self.language_code.map(|v| v.into()),
+            is_premium: self.is_premium,
+            added_to_attachment_menu: self.added_to_attachment_menu,
+            can_join_groups: self.can_join_groups,
+            can_read_all_group_messages: self.can_read_all_group_messages,
+            supports_inline_queries: self.supports_inline_queries,
+            can_connect_to_business: self.can_connect_to_business,
+            has_main_web_app: self.has_main_web_app,
+            has_topics_enabled: self.has_topics_enabled,
+            allows_users_to_create_topics: self.allows_users_to_create_topics,
+        }
+    }
+}
+
+/// Borrowed [`owned::UsersShared`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct UsersShared<'a> {
+    pub request_id: i64,
+    #[serde(borrow)]
+    pub users: ShortVec<SharedUser<'a>, 1>,
+}
+
+impl<'a> UsersShared<'a> {
+    /// Copy every borrowed string into an owned [`owned::UsersShared`].
+    pub fn into_owned(self) -> owned::UsersShared {
+        owned::UsersShared {
+            request_id: self.request_id,
+            users: self.users.into_iter().map(|v| v.into_owned()).collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::Venue`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Venue<'a> {
+    pub location: owned::Location,
+    #[serde(borrow)]
+    pub title: Cow<'a, str>,
+    #[serde(borrow)]
+    pub address: Cow<'a, str>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub foursquare_id: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub foursquare_type: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub google_place_id: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub google_place_type: Option<Cow<'a, str>>,
+}
+
+impl<'a> Venue<'a> {
+    /// Copy every borrowed string into an owned [`owned::Venue`].
+    pub fn into_owned(self) -> owned::Venue {
+        owned::Venue {
+            location: self.location,
+            title: self.title.into_owned(),
+            address: self.address.into_owned(),
+            foursquare_id: self.foursquare_id.map(|v| v.into_owned()),
+            foursquare_type: self.foursquare_type.map(|v| v.into_owned()),
+            google_place_id: self.google_place_id.map(|v| v.into_owned()),
+            google_place_type: self.google_place_type.map(|v| v.into_owned()),
+        }
+    }
+}
+
+/// Borrowed [`owned::Video`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Video<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub width: i64,
+    pub height: i64,
+    pub duration: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<Box<PhotoSize<'a>>>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub cover: Option<ShortVec<PhotoSize<'a>, 4>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub start_timestamp: Option<i64>,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub qualities: Option<Vec<VideoQuality<'a>>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_name: Option<Cow<'a, str>>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> Video<'a> {
+    /// Copy every borrowed string into an owned [`owned::Video`].
+    pub fn into_owned(self) -> owned::Video {
+        owned::Video {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            width: self.width,
+            height: self.height,
+            duration: self.duration,
+            thumbnail: self.thumbnail.map(|v| Box::new((*v).into_owned())),
+            cover: self
+                .cover
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            start_timestamp: self.start_timestamp,
+            qualities: self
+                .qualities
+                .map(|v| v.into_iter().map(|v| v.into_owned()).collect()),
+            file_name: self.file_name.map(|v| v.into_owned()),
+            mime_type: self.mime_type.map(|v| v.into_owned()),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::VideoChatParticipantsInvited`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct VideoChatParticipantsInvited<'a> {
+    #[serde(borrow)]
+    pub users: Vec<User<'a>>,
+}
+
+impl<'a> VideoChatParticipantsInvited<'a> {
+    /// Copy every borrowed string into an owned [`owned::VideoChatParticipantsInvited`].
+    pub fn into_owned(self) -> owned::VideoChatParticipantsInvited {
+        owned::VideoChatParticipantsInvited {
+            users: self.users.into_iter().map(|v| v.into_owned()).collect(),
+        }
+    }
+}
+
+/// Borrowed [`owned::VideoNote`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct VideoNote<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub length: i64,
+    pub duration: i64,
+    #[serde(borrow)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub thumbnail: Option<PhotoSize<'a>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> VideoNote<'a> {
+    /// Copy every borrowed string into an owned [`owned::VideoNote`].
+    pub fn into_owned(self) -> owned::VideoNote {
+        owned::VideoNote {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            length: self.length,
+            duration: self.duration,
+            thumbnail: self.thumbnail.map(|v| v.into_owned()),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::VideoQuality`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct VideoQuality<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub width: i64,
+    pub height: i64,
+    #[serde(borrow)]
+    pub codec: Cow<'a, str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> VideoQuality<'a> {
+    /// Copy every borrowed string into an owned [`owned::VideoQuality`].
+    pub fn into_owned(self) -> owned::VideoQuality {
+        owned::VideoQuality {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            width: self.width,
+            height: self.height,
+            codec: self.codec.into_owned(),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::Voice`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct Voice<'a> {
+    #[serde(borrow)]
+    pub file_id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub file_unique_id: Cow<'a, str>,
+    pub duration: i64,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_size: Option<i64>,
+}
+
+impl<'a> Voice<'a> {
+    /// Copy every borrowed string into an owned [`owned::Voice`].
+    pub fn into_owned(self) -> owned::Voice {
+        owned::Voice {
+            file_id: self.file_id.into_owned(),
+            file_unique_id: self.file_unique_id.into_owned(),
+            duration: self.duration,
+            mime_type: self.mime_type.map(|v| v.into_owned()),
+            file_size: self.file_size,
+        }
+    }
+}
+
+/// Borrowed [`owned::WebAppData`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct WebAppData<'a> {
+    #[serde(borrow)]
+    pub data: Cow<'a, str>,
+    #[serde(borrow)]
+    pub button_text: Cow<'a, str>,
+}
+
+impl<'a> WebAppData<'a> {
+    /// Copy every borrowed string into an owned [`owned::WebAppData`].
+    pub fn into_owned(self) -> owned::WebAppData {
+        owned::WebAppData {
+            data: self.data.into_owned(),
+            button_text: self.button_text.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::WebAppInfo`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct WebAppInfo<'a> {
+    #[serde(borrow)]
+    pub url: Cow<'a, str>,
+}
+
+impl<'a> WebAppInfo<'a> {
+    /// Copy every borrowed string into an owned [`owned::WebAppInfo`].
+    pub fn into_owned(self) -> owned::WebAppInfo {
+        owned::WebAppInfo {
+            url: self.url.into_owned(),
+        }
+    }
+}
+
+/// Borrowed [`owned::WriteAccessAllowed`].
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct WriteAccessAllowed<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub from_request: Option<bool>,
+    #[serde(borrow, default, deserialize_with = "borrow_opt_str")]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub web_app_name: Option<Cow<'a, str>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub from_attachment_menu: Option<bool>,
+}
+
+impl<'a> WriteAccessAllowed<'a> {
+    /// Copy every borrowed string into an owned [`owned::WriteAccessAllowed`].
+    pub fn into_owned(self) -> owned::WriteAccessAllowed {
+        owned::WriteAccessAllowed {
+            from_request: self.from_request,
+            web_app_name: self.web_app_name.map(|v| v.into_owned()),
+            from_attachment_menu: self.from_attachment_menu,
+        }
+    }
+}
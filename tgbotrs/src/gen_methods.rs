@@ -22,21 +22,22 @@ impl Bot {
         name: impl Into<String>,
         sticker: InputSticker,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker).unwrap_or_default(),
-        );
-        self.call_api("addStickerToSet", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            name: &'a String,
+            sticker: &'a InputSticker,
+        }
+        let name: String = name.into();
+        self.call_api(
+            "addStickerToSet",
+            &Request {
+                user_id: &user_id,
+                name: &name,
+                sticker: &sticker,
+            },
+        )
+        .await
     }
 }
 
@@ -87,23 +88,21 @@ impl Bot {
         callback_query_id: impl Into<String>,
         params: Option<AnswerCallbackQueryParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "callback_query_id".into(),
-            serde_json::to_value(callback_query_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("answerCallbackQuery", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            callback_query_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a AnswerCallbackQueryParams>,
+        }
+        let callback_query_id: String = callback_query_id.into();
+        self.call_api(
+            "answerCallbackQuery",
+            &Request {
+                callback_query_id: &callback_query_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -156,27 +155,23 @@ impl Bot {
         results: Vec<InlineQueryResult>,
         params: Option<AnswerInlineQueryParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "inline_query_id".into(),
-            serde_json::to_value(inline_query_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "results".into(),
-            serde_json::to_value(results).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("answerInlineQuery", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            inline_query_id: &'a String,
+            results: &'a Vec<InlineQueryResult>,
+            #[serde(flatten)]
+            params: Option<&'a AnswerInlineQueryParams>,
+        }
+        let inline_query_id: String = inline_query_id.into();
+        self.call_api(
+            "answerInlineQuery",
+            &Request {
+                inline_query_id: &inline_query_id,
+                results: &results,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -207,24 +202,23 @@ impl Bot {
         ok: bool,
         params: Option<AnswerPreCheckoutQueryParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "pre_checkout_query_id".into(),
-            serde_json::to_value(pre_checkout_query_id.into()).unwrap_or_default(),
-        );
-        req.insert("ok".into(), serde_json::to_value(ok).unwrap_or_default());
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("answerPreCheckoutQuery", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            pre_checkout_query_id: &'a String,
+            ok: &'a bool,
+            #[serde(flatten)]
+            params: Option<&'a AnswerPreCheckoutQueryParams>,
+        }
+        let pre_checkout_query_id: String = pre_checkout_query_id.into();
+        self.call_api(
+            "answerPreCheckoutQuery",
+            &Request {
+                pre_checkout_query_id: &pre_checkout_query_id,
+                ok: &ok,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -262,24 +256,23 @@ impl Bot {
         ok: bool,
         params: Option<AnswerShippingQueryParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "shipping_query_id".into(),
-            serde_json::to_value(shipping_query_id.into()).unwrap_or_default(),
-        );
-        req.insert("ok".into(), serde_json::to_value(ok).unwrap_or_default());
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("answerShippingQuery", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            shipping_query_id: &'a String,
+            ok: &'a bool,
+            #[serde(flatten)]
+            params: Option<&'a AnswerShippingQueryParams>,
+        }
+        let shipping_query_id: String = shipping_query_id.into();
+        self.call_api(
+            "answerShippingQuery",
+            &Request {
+                shipping_query_id: &shipping_query_id,
+                ok: &ok,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -291,17 +284,20 @@ impl Bot {
         web_app_query_id: impl Into<String>,
         result: InlineQueryResult,
     ) -> Result<SentWebAppMessage, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "web_app_query_id".into(),
-            serde_json::to_value(web_app_query_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "result".into(),
-            serde_json::to_value(result).unwrap_or_default(),
-        );
-        self.call_api("answerWebAppQuery", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            web_app_query_id: &'a String,
+            result: &'a InlineQueryResult,
+        }
+        let web_app_query_id: String = web_app_query_id.into();
+        self.call_api(
+            "answerWebAppQuery",
+            &Request {
+                web_app_query_id: &web_app_query_id,
+                result: &result,
+            },
+        )
+        .await
     }
 }
 
@@ -313,17 +309,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         user_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        self.call_api("approveChatJoinRequest", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "approveChatJoinRequest",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+            },
+        )
+        .await
     }
 }
 
@@ -354,27 +353,22 @@ impl Bot {
         message_id: i64,
         params: Option<ApproveSuggestedPostParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("approveSuggestedPost", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a i64,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a ApproveSuggestedPostParams>,
+        }
+        self.call_api(
+            "approveSuggestedPost",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -412,27 +406,23 @@ impl Bot {
         user_id: i64,
         params: Option<BanChatMemberParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("banChatMember", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a BanChatMemberParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "banChatMember",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -444,17 +434,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         sender_chat_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sender_chat_id".into(),
-            serde_json::to_value(sender_chat_id).unwrap_or_default(),
-        );
-        self.call_api("banChatSenderChat", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            sender_chat_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "banChatSenderChat",
+            &Request {
+                chat_id: &chat_id,
+                sender_chat_id: &sender_chat_id,
+            },
+        )
+        .await
     }
 }
 
@@ -462,9 +455,9 @@ impl Bot {
     /// Use this method to close the bot instance before moving it from one local server to another. You need to delete the webhook before calling this method to ensure that the bot isn't launched again after server restart. The method will return error 429 in the first 10 minutes after the bot is launched. Returns True on success. Requires no parameters.
     /// See: https://core.telegram.org/bots/api#close
     pub async fn close(&self) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("close", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("close", &Request {}).await
     }
 }
 
@@ -476,17 +469,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_thread_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_thread_id".into(),
-            serde_json::to_value(message_thread_id).unwrap_or_default(),
-        );
-        self.call_api("closeForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_thread_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "closeForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                message_thread_id: &message_thread_id,
+            },
+        )
+        .await
     }
 }
 
@@ -497,12 +493,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("closeGeneralForumTopic", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("closeGeneralForumTopic", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -515,17 +511,21 @@ impl Bot {
         business_connection_id: impl Into<String>,
         owned_gift_id: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "owned_gift_id".into(),
-            serde_json::to_value(owned_gift_id.into()).unwrap_or_default(),
-        );
-        self.call_api("convertGiftToStars", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            owned_gift_id: &'a String,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        let owned_gift_id: String = owned_gift_id.into();
+        self.call_api(
+            "convertGiftToStars",
+            &Request {
+                business_connection_id: &business_connection_id,
+                owned_gift_id: &owned_gift_id,
+            },
+        )
+        .await
     }
 }
 
@@ -648,31 +648,26 @@ impl Bot {
         message_id: i64,
         params: Option<CopyMessageParams>,
     ) -> Result<MessageId, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "from_chat_id".into(),
-            serde_json::to_value(from_chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("copyMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            from_chat_id: &'a ChatId,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a CopyMessageParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let from_chat_id: ChatId = from_chat_id.into();
+        self.call_api(
+            "copyMessage",
+            &Request {
+                chat_id: &chat_id,
+                from_chat_id: &from_chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -732,31 +727,26 @@ impl Bot {
         message_ids: Vec<i64>,
         params: Option<CopyMessagesParams>,
     ) -> Result<Vec<MessageId>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "from_chat_id".into(),
-            serde_json::to_value(from_chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_ids".into(),
-            serde_json::to_value(message_ids).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("copyMessages", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            from_chat_id: &'a ChatId,
+            message_ids: &'a Vec<i64>,
+            #[serde(flatten)]
+            params: Option<&'a CopyMessagesParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let from_chat_id: ChatId = from_chat_id.into();
+        self.call_api(
+            "copyMessages",
+            &Request {
+                chat_id: &chat_id,
+                from_chat_id: &from_chat_id,
+                message_ids: &message_ids,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -807,23 +797,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<CreateChatInviteLinkParams>,
     ) -> Result<ChatInviteLink, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("createChatInviteLink", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a CreateChatInviteLinkParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "createChatInviteLink",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -855,32 +843,23 @@ impl Bot {
         subscription_price: i64,
         params: Option<CreateChatSubscriptionInviteLinkParams>,
     ) -> Result<ChatInviteLink, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "subscription_period".into(),
-            serde_json::to_value(subscription_period).unwrap_or_default(),
-        );
-        req.insert(
-            "subscription_price".into(),
-            serde_json::to_value(subscription_price).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            subscription_period: &'a i64,
+            subscription_price: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a CreateChatSubscriptionInviteLinkParams>,
         }
+        let chat_id: ChatId = chat_id.into();
         self.call_api(
             "createChatSubscriptionInviteLink",
-            &serde_json::Value::Object(req),
+            &Request {
+                chat_id: &chat_id,
+                subscription_period: &subscription_period,
+                subscription_price: &subscription_price,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -920,27 +899,24 @@ impl Bot {
         name: impl Into<String>,
         params: Option<CreateForumTopicParams>,
     ) -> Result<ForumTopic, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("createForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            name: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a CreateForumTopicParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let name: String = name.into();
+        self.call_api(
+            "createForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                name: &name,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1086,39 +1062,32 @@ impl Bot {
         prices: Vec<LabeledPrice>,
         params: Option<CreateInvoiceLinkParams>,
     ) -> Result<String, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "description".into(),
-            serde_json::to_value(description.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "payload".into(),
-            serde_json::to_value(payload.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "currency".into(),
-            serde_json::to_value(currency.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "prices".into(),
-            serde_json::to_value(prices).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("createInvoiceLink", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            title: &'a String,
+            description: &'a String,
+            payload: &'a String,
+            currency: &'a String,
+            prices: &'a Vec<LabeledPrice>,
+            #[serde(flatten)]
+            params: Option<&'a CreateInvoiceLinkParams>,
+        }
+        let title: String = title.into();
+        let description: String = description.into();
+        let payload: String = payload.into();
+        let currency: String = currency.into();
+        self.call_api(
+            "createInvoiceLink",
+            &Request {
+                title: &title,
+                description: &description,
+                payload: &payload,
+                currency: &currency,
+                prices: &prices,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1158,35 +1127,28 @@ impl Bot {
         stickers: Vec<InputSticker>,
         params: Option<CreateNewStickerSetParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "stickers".into(),
-            serde_json::to_value(stickers).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("createNewStickerSet", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            name: &'a String,
+            title: &'a String,
+            stickers: &'a Vec<InputSticker>,
+            #[serde(flatten)]
+            params: Option<&'a CreateNewStickerSetParams>,
+        }
+        let name: String = name.into();
+        let title: String = title.into();
+        self.call_api(
+            "createNewStickerSet",
+            &Request {
+                user_id: &user_id,
+                name: &name,
+                title: &title,
+                stickers: &stickers,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1198,17 +1160,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         user_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        self.call_api("declineChatJoinRequest", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "declineChatJoinRequest",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+            },
+        )
+        .await
     }
 }
 
@@ -1239,27 +1204,22 @@ impl Bot {
         message_id: i64,
         params: Option<DeclineSuggestedPostParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("declineSuggestedPost", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a i64,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a DeclineSuggestedPostParams>,
+        }
+        self.call_api(
+            "declineSuggestedPost",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1271,17 +1231,20 @@ impl Bot {
         business_connection_id: impl Into<String>,
         message_ids: Vec<i64>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_ids".into(),
-            serde_json::to_value(message_ids).unwrap_or_default(),
-        );
-        self.call_api("deleteBusinessMessages", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            message_ids: &'a Vec<i64>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "deleteBusinessMessages",
+            &Request {
+                business_connection_id: &business_connection_id,
+                message_ids: &message_ids,
+            },
+        )
+        .await
     }
 }
 
@@ -1289,12 +1252,12 @@ impl Bot {
     /// Use this method to delete a chat photo. Photos can't be changed for private chats. The bot must be an administrator in the chat for this to work and must have the appropriate administrator rights. Returns True on success.
     /// See: https://core.telegram.org/bots/api#deletechatphoto
     pub async fn delete_chat_photo(&self, chat_id: impl Into<ChatId>) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("deleteChatPhoto", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("deleteChatPhoto", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -1306,12 +1269,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("deleteChatStickerSet", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("deleteChatStickerSet", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -1324,17 +1287,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_thread_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_thread_id".into(),
-            serde_json::to_value(message_thread_id).unwrap_or_default(),
-        );
-        self.call_api("deleteForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_thread_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "deleteForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                message_thread_id: &message_thread_id,
+            },
+        )
+        .await
     }
 }
 
@@ -1356,17 +1322,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        self.call_api("deleteMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "deleteMessage",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+            },
+        )
+        .await
     }
 }
 
@@ -1378,17 +1347,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_ids: Vec<i64>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_ids".into(),
-            serde_json::to_value(message_ids).unwrap_or_default(),
-        );
-        self.call_api("deleteMessages", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_ids: &'a Vec<i64>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "deleteMessages",
+            &Request {
+                chat_id: &chat_id,
+                message_ids: &message_ids,
+            },
+        )
+        .await
     }
 }
 
@@ -1424,19 +1396,18 @@ impl Bot {
         &self,
         params: Option<DeleteMyCommandsParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("deleteMyCommands", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a DeleteMyCommandsParams>,
+        }
+        self.call_api(
+            "deleteMyCommands",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1447,12 +1418,12 @@ impl Bot {
         &self,
         sticker: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        self.call_api("deleteStickerFromSet", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            sticker: &'a String,
+        }
+        let sticker: String = sticker.into();
+        self.call_api("deleteStickerFromSet", &Request { sticker: &sticker })
             .await
     }
 }
@@ -1461,12 +1432,12 @@ impl Bot {
     /// Use this method to delete a sticker set that was created by the bot. Returns True on success.
     /// See: https://core.telegram.org/bots/api#deletestickerset
     pub async fn delete_sticker_set(&self, name: impl Into<String>) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        self.call_api("deleteStickerSet", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            name: &'a String,
+        }
+        let name: String = name.into();
+        self.call_api("deleteStickerSet", &Request { name: &name })
             .await
     }
 }
@@ -1479,17 +1450,20 @@ impl Bot {
         business_connection_id: impl Into<String>,
         story_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "story_id".into(),
-            serde_json::to_value(story_id).unwrap_or_default(),
-        );
-        self.call_api("deleteStory", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            story_id: &'a i64,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "deleteStory",
+            &Request {
+                business_connection_id: &business_connection_id,
+                story_id: &story_id,
+            },
+        )
+        .await
     }
 }
 
@@ -1518,19 +1492,18 @@ impl Bot {
         &self,
         params: Option<DeleteWebhookParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("deleteWebhook", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a DeleteWebhookParams>,
+        }
+        self.call_api(
+            "deleteWebhook",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1582,27 +1555,24 @@ impl Bot {
         invite_link: impl Into<String>,
         params: Option<EditChatInviteLinkParams>,
     ) -> Result<ChatInviteLink, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "invite_link".into(),
-            serde_json::to_value(invite_link.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editChatInviteLink", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            invite_link: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a EditChatInviteLinkParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let invite_link: String = invite_link.into();
+        self.call_api(
+            "editChatInviteLink",
+            &Request {
+                chat_id: &chat_id,
+                invite_link: &invite_link,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1633,28 +1603,22 @@ impl Bot {
         invite_link: impl Into<String>,
         params: Option<EditChatSubscriptionInviteLinkParams>,
     ) -> Result<ChatInviteLink, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "invite_link".into(),
-            serde_json::to_value(invite_link.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            invite_link: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a EditChatSubscriptionInviteLinkParams>,
         }
+        let chat_id: ChatId = chat_id.into();
+        let invite_link: String = invite_link.into();
         self.call_api(
             "editChatSubscriptionInviteLink",
-            &serde_json::Value::Object(req),
+            &Request {
+                chat_id: &chat_id,
+                invite_link: &invite_link,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -1694,27 +1658,23 @@ impl Bot {
         message_thread_id: i64,
         params: Option<EditForumTopicParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_thread_id".into(),
-            serde_json::to_value(message_thread_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_thread_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a EditForumTopicParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "editForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                message_thread_id: &message_thread_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1726,17 +1686,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         name: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        self.call_api("editGeneralForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            name: &'a String,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let name: String = name.into();
+        self.call_api(
+            "editGeneralForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                name: &name,
+            },
+        )
+        .await
     }
 }
 
@@ -1821,19 +1785,18 @@ impl Bot {
         &self,
         params: Option<EditMessageCaptionParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageCaption", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a EditMessageCaptionParams>,
+        }
+        self.call_api(
+            "editMessageCaption",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1866,35 +1829,27 @@ impl Bot {
         checklist: InputChecklist,
         params: Option<EditMessageChecklistParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        req.insert(
-            "checklist".into(),
-            serde_json::to_value(checklist).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageChecklist", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            chat_id: &'a i64,
+            message_id: &'a i64,
+            checklist: &'a InputChecklist,
+            #[serde(flatten)]
+            params: Option<&'a EditMessageChecklistParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "editMessageChecklist",
+            &Request {
+                business_connection_id: &business_connection_id,
+                chat_id: &chat_id,
+                message_id: &message_id,
+                checklist: &checklist,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -1981,27 +1936,22 @@ impl Bot {
         longitude: f64,
         params: Option<EditMessageLiveLocationParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "latitude".into(),
-            serde_json::to_value(latitude).unwrap_or_default(),
-        );
-        req.insert(
-            "longitude".into(),
-            serde_json::to_value(longitude).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageLiveLocation", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            latitude: &'a f64,
+            longitude: &'a f64,
+            #[serde(flatten)]
+            params: Option<&'a EditMessageLiveLocationParams>,
+        }
+        self.call_api(
+            "editMessageLiveLocation",
+            &Request {
+                latitude: &latitude,
+                longitude: &longitude,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2059,23 +2009,21 @@ impl Bot {
         media: impl Into<InputMedia>,
         params: Option<EditMessageMediaParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "media".into(),
-            serde_json::to_value(media.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageMedia", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            media: &'a InputMedia,
+            #[serde(flatten)]
+            params: Option<&'a EditMessageMediaParams>,
+        }
+        let media: InputMedia = media.into();
+        self.call_api(
+            "editMessageMedia",
+            &Request {
+                media: &media,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2132,19 +2080,18 @@ impl Bot {
         &self,
         params: Option<EditMessageReplyMarkupParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageReplyMarkup", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a EditMessageReplyMarkupParams>,
+        }
+        self.call_api(
+            "editMessageReplyMarkup",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2223,23 +2170,21 @@ impl Bot {
         text: impl Into<String>,
         params: Option<EditMessageTextParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "text".into(),
-            serde_json::to_value(text.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editMessageText", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            text: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a EditMessageTextParams>,
+        }
+        let text: String = text.into();
+        self.call_api(
+            "editMessageText",
+            &Request {
+                text: &text,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2292,31 +2237,25 @@ impl Bot {
         content: InputStoryContent,
         params: Option<EditStoryParams>,
     ) -> Result<Story, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "story_id".into(),
-            serde_json::to_value(story_id).unwrap_or_default(),
-        );
-        req.insert(
-            "content".into(),
-            serde_json::to_value(content).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("editStory", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            story_id: &'a i64,
+            content: &'a InputStoryContent,
+            #[serde(flatten)]
+            params: Option<&'a EditStoryParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "editStory",
+            &Request {
+                business_connection_id: &business_connection_id,
+                story_id: &story_id,
+                content: &content,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2329,21 +2268,22 @@ impl Bot {
         telegram_payment_charge_id: impl Into<String>,
         is_canceled: bool,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "telegram_payment_charge_id".into(),
-            serde_json::to_value(telegram_payment_charge_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "is_canceled".into(),
-            serde_json::to_value(is_canceled).unwrap_or_default(),
-        );
-        self.call_api("editUserStarSubscription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            telegram_payment_charge_id: &'a String,
+            is_canceled: &'a bool,
+        }
+        let telegram_payment_charge_id: String = telegram_payment_charge_id.into();
+        self.call_api(
+            "editUserStarSubscription",
+            &Request {
+                user_id: &user_id,
+                telegram_payment_charge_id: &telegram_payment_charge_id,
+                is_canceled: &is_canceled,
+            },
+        )
+        .await
     }
 }
 
@@ -2354,12 +2294,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<String, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("exportChatInviteLink", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("exportChatInviteLink", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -2434,31 +2374,26 @@ impl Bot {
         message_id: i64,
         params: Option<ForwardMessageParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "from_chat_id".into(),
-            serde_json::to_value(from_chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("forwardMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            from_chat_id: &'a ChatId,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a ForwardMessageParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let from_chat_id: ChatId = from_chat_id.into();
+        self.call_api(
+            "forwardMessage",
+            &Request {
+                chat_id: &chat_id,
+                from_chat_id: &from_chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2511,31 +2446,26 @@ impl Bot {
         message_ids: Vec<i64>,
         params: Option<ForwardMessagesParams>,
     ) -> Result<Vec<MessageId>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "from_chat_id".into(),
-            serde_json::to_value(from_chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_ids".into(),
-            serde_json::to_value(message_ids).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("forwardMessages", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            from_chat_id: &'a ChatId,
+            message_ids: &'a Vec<i64>,
+            #[serde(flatten)]
+            params: Option<&'a ForwardMessagesParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let from_chat_id: ChatId = from_chat_id.into();
+        self.call_api(
+            "forwardMessages",
+            &Request {
+                chat_id: &chat_id,
+                from_chat_id: &from_chat_id,
+                message_ids: &message_ids,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2543,9 +2473,9 @@ impl Bot {
     /// Returns the list of gifts that can be sent by the bot to users and channel chats. Requires no parameters. Returns a Gifts object.
     /// See: https://core.telegram.org/bots/api#getavailablegifts
     pub async fn get_available_gifts(&self) -> Result<Gifts, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("getAvailableGifts", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("getAvailableGifts", &Request {}).await
     }
 }
 
@@ -2638,23 +2568,21 @@ impl Bot {
         business_connection_id: impl Into<String>,
         params: Option<GetBusinessAccountGiftsParams>,
     ) -> Result<OwnedGifts, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getBusinessAccountGifts", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a GetBusinessAccountGiftsParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "getBusinessAccountGifts",
+            &Request {
+                business_connection_id: &business_connection_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2665,14 +2593,16 @@ impl Bot {
         &self,
         business_connection_id: impl Into<String>,
     ) -> Result<StarAmount, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+        }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "getBusinessAccountStarBalance",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+            },
         )
         .await
     }
@@ -2685,13 +2615,18 @@ impl Bot {
         &self,
         business_connection_id: impl Into<String>,
     ) -> Result<BusinessConnection, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        self.call_api("getBusinessConnection", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "getBusinessConnection",
+            &Request {
+                business_connection_id: &business_connection_id,
+            },
+        )
+        .await
     }
 }
 
@@ -2699,12 +2634,12 @@ impl Bot {
     /// Use this method to get up-to-date information about the chat. Returns a ChatFullInfo object on success.
     /// See: https://core.telegram.org/bots/api#getchat
     pub async fn get_chat(&self, chat_id: impl Into<ChatId>) -> Result<ChatFullInfo, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("getChat", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("getChat", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -2716,12 +2651,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<Vec<ChatMember>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("getChatAdministrators", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("getChatAdministrators", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -2815,23 +2750,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<GetChatGiftsParams>,
     ) -> Result<OwnedGifts, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getChatGifts", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a GetChatGiftsParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "getChatGifts",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2843,17 +2776,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         user_id: i64,
     ) -> Result<ChatMember, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        self.call_api("getChatMember", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "getChatMember",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+            },
+        )
+        .await
     }
 }
 
@@ -2861,12 +2797,12 @@ impl Bot {
     /// Use this method to get the number of members in a chat. Returns Int on success.
     /// See: https://core.telegram.org/bots/api#getchatmembercount
     pub async fn get_chat_member_count(&self, chat_id: impl Into<ChatId>) -> Result<i64, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("getChatMemberCount", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("getChatMemberCount", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -2896,19 +2832,18 @@ impl Bot {
         &self,
         params: Option<GetChatMenuButtonParams>,
     ) -> Result<MenuButton, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getChatMenuButton", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetChatMenuButtonParams>,
+        }
+        self.call_api(
+            "getChatMenuButton",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -2919,13 +2854,17 @@ impl Bot {
         &self,
         custom_emoji_ids: Vec<String>,
     ) -> Result<Vec<Sticker>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "custom_emoji_ids".into(),
-            serde_json::to_value(custom_emoji_ids).unwrap_or_default(),
-        );
-        self.call_api("getCustomEmojiStickers", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            custom_emoji_ids: &'a Vec<String>,
+        }
+        self.call_api(
+            "getCustomEmojiStickers",
+            &Request {
+                custom_emoji_ids: &custom_emoji_ids,
+            },
+        )
+        .await
     }
 }
 
@@ -2934,12 +2873,12 @@ impl Bot {
     /// Note: This function may not preserve the original file name and MIME type. You should save the file's MIME type and name (if available) when the File object is received.
     /// See: https://core.telegram.org/bots/api#getfile
     pub async fn get_file(&self, file_id: impl Into<String>) -> Result<File, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "file_id".into(),
-            serde_json::to_value(file_id.into()).unwrap_or_default(),
-        );
-        self.call_api("getFile", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            file_id: &'a String,
+        }
+        let file_id: String = file_id.into();
+        self.call_api("getFile", &Request { file_id: &file_id })
             .await
     }
 }
@@ -2948,8 +2887,9 @@ impl Bot {
     /// Use this method to get custom emoji stickers, which can be used as a forum topic icon by any user. Requires no parameters. Returns an Array of Sticker objects.
     /// See: https://core.telegram.org/bots/api#getforumtopiciconstickers
     pub async fn get_forum_topic_icon_stickers(&self) -> Result<Vec<Sticker>, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("getForumTopicIconStickers", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("getForumTopicIconStickers", &Request {})
             .await
     }
 }
@@ -2994,23 +2934,20 @@ impl Bot {
         user_id: i64,
         params: Option<GetGameHighScoresParams>,
     ) -> Result<Vec<GameHighScore>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getGameHighScores", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a GetGameHighScoresParams>,
+        }
+        self.call_api(
+            "getGameHighScores",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3018,9 +2955,9 @@ impl Bot {
     /// A simple method for testing your bot's authentication token. Requires no parameters. Returns basic information about the bot in form of a User object.
     /// See: https://core.telegram.org/bots/api#getme
     pub async fn get_me(&self) -> Result<User, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("getMe", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("getMe", &Request {}).await
     }
 }
 
@@ -3056,19 +2993,18 @@ impl Bot {
         &self,
         params: Option<GetMyCommandsParams>,
     ) -> Result<Vec<BotCommand>, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getMyCommands", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetMyCommandsParams>,
+        }
+        self.call_api(
+            "getMyCommands",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3097,20 +3033,16 @@ impl Bot {
         &self,
         params: Option<GetMyDefaultAdministratorRightsParams>,
     ) -> Result<ChatAdministratorRights, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetMyDefaultAdministratorRightsParams>,
         }
         self.call_api(
             "getMyDefaultAdministratorRights",
-            &serde_json::Value::Object(req),
+            &Request {
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -3141,19 +3073,18 @@ impl Bot {
         &self,
         params: Option<GetMyDescriptionParams>,
     ) -> Result<BotDescription, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getMyDescription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetMyDescriptionParams>,
+        }
+        self.call_api(
+            "getMyDescription",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3179,19 +3110,18 @@ impl Bot {
     /// Use this method to get the current bot name for the given user language. Returns BotName on success.
     /// See: https://core.telegram.org/bots/api#getmyname
     pub async fn get_my_name(&self, params: Option<GetMyNameParams>) -> Result<BotName, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getMyName", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetMyNameParams>,
+        }
+        self.call_api(
+            "getMyName",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3220,19 +3150,18 @@ impl Bot {
         &self,
         params: Option<GetMyShortDescriptionParams>,
     ) -> Result<BotShortDescription, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getMyShortDescription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetMyShortDescriptionParams>,
+        }
+        self.call_api(
+            "getMyShortDescription",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3240,9 +3169,9 @@ impl Bot {
     /// A method to get the current Telegram Stars balance of the bot. Requires no parameters. On success, returns a StarAmount object.
     /// See: https://core.telegram.org/bots/api#getmystarbalance
     pub async fn get_my_star_balance(&self) -> Result<StarAmount, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("getMyStarBalance", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("getMyStarBalance", &Request {}).await
     }
 }
 
@@ -3278,19 +3207,18 @@ impl Bot {
         &self,
         params: Option<GetStarTransactionsParams>,
     ) -> Result<StarTransactions, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getStarTransactions", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetStarTransactionsParams>,
+        }
+        self.call_api(
+            "getStarTransactions",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3298,12 +3226,12 @@ impl Bot {
     /// Use this method to get a sticker set. On success, a StickerSet object is returned.
     /// See: https://core.telegram.org/bots/api#getstickerset
     pub async fn get_sticker_set(&self, name: impl Into<String>) -> Result<StickerSet, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        self.call_api("getStickerSet", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            name: &'a String,
+        }
+        let name: String = name.into();
+        self.call_api("getStickerSet", &Request { name: &name })
             .await
     }
 }
@@ -3354,19 +3282,18 @@ impl Bot {
         &self,
         params: Option<GetUpdatesParams>,
     ) -> Result<Vec<Update>, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getUpdates", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a GetUpdatesParams>,
+        }
+        self.call_api(
+            "getUpdates",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3378,17 +3305,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         user_id: i64,
     ) -> Result<UserChatBoosts, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        self.call_api("getUserChatBoosts", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "getUserChatBoosts",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+            },
+        )
+        .await
     }
 }
 
@@ -3467,23 +3397,20 @@ impl Bot {
         user_id: i64,
         params: Option<GetUserGiftsParams>,
     ) -> Result<OwnedGifts, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getUserGifts", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a GetUserGiftsParams>,
+        }
+        self.call_api(
+            "getUserGifts",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3520,23 +3447,20 @@ impl Bot {
         user_id: i64,
         params: Option<GetUserProfileAudiosParams>,
     ) -> Result<UserProfileAudios, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getUserProfileAudios", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a GetUserProfileAudiosParams>,
+        }
+        self.call_api(
+            "getUserProfileAudios",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3573,23 +3497,20 @@ impl Bot {
         user_id: i64,
         params: Option<GetUserProfilePhotosParams>,
     ) -> Result<UserProfilePhotos, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("getUserProfilePhotos", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a GetUserProfilePhotosParams>,
+        }
+        self.call_api(
+            "getUserProfilePhotos",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3597,9 +3518,9 @@ impl Bot {
     /// Use this method to get current webhook status. Requires no parameters. On success, returns a WebhookInfo object. If the bot is using getUpdates, will return an object with the url field empty.
     /// See: https://core.telegram.org/bots/api#getwebhookinfo
     pub async fn get_webhook_info(&self) -> Result<WebhookInfo, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("getWebhookInfo", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("getWebhookInfo", &Request {}).await
     }
 }
 
@@ -3645,31 +3566,24 @@ impl Bot {
         star_count: i64,
         params: Option<GiftPremiumSubscriptionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "month_count".into(),
-            serde_json::to_value(month_count).unwrap_or_default(),
-        );
-        req.insert(
-            "star_count".into(),
-            serde_json::to_value(star_count).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("giftPremiumSubscription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            month_count: &'a i64,
+            star_count: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a GiftPremiumSubscriptionParams>,
+        }
+        self.call_api(
+            "giftPremiumSubscription",
+            &Request {
+                user_id: &user_id,
+                month_count: &month_count,
+                star_count: &star_count,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3680,12 +3594,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("hideGeneralForumTopic", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("hideGeneralForumTopic", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -3694,12 +3608,12 @@ impl Bot {
     /// Use this method for your bot to leave a group, supergroup or channel. Returns True on success.
     /// See: https://core.telegram.org/bots/api#leavechat
     pub async fn leave_chat(&self, chat_id: impl Into<ChatId>) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("leaveChat", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("leaveChat", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -3708,9 +3622,9 @@ impl Bot {
     /// Use this method to log out from the cloud Bot API server before launching the bot locally. You must log out the bot before running it locally, otherwise there is no guarantee that the bot will receive updates. After a successful call, you can immediately log in on a local server, but will not be able to log in back to the cloud Bot API server for 10 minutes. Returns True on success. Requires no parameters.
     /// See: https://core.telegram.org/bots/api#logout
     pub async fn log_out(&self) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("logOut", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("logOut", &Request {}).await
     }
 }
 
@@ -3748,27 +3662,23 @@ impl Bot {
         message_id: i64,
         params: Option<PinChatMessageParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("pinChatMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a PinChatMessageParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "pinChatMessage",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3835,31 +3745,25 @@ impl Bot {
         active_period: i64,
         params: Option<PostStoryParams>,
     ) -> Result<Story, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "content".into(),
-            serde_json::to_value(content).unwrap_or_default(),
-        );
-        req.insert(
-            "active_period".into(),
-            serde_json::to_value(active_period).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("postStory", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            content: &'a InputStoryContent,
+            active_period: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a PostStoryParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "postStory",
+            &Request {
+                business_connection_id: &business_connection_id,
+                content: &content,
+                active_period: &active_period,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -3995,27 +3899,23 @@ impl Bot {
         user_id: i64,
         params: Option<PromoteChatMemberParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("promoteChatMember", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a PromoteChatMemberParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "promoteChatMember",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4028,21 +3928,22 @@ impl Bot {
         chat_id: i64,
         message_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        self.call_api("readBusinessMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            chat_id: &'a i64,
+            message_id: &'a i64,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "readBusinessMessage",
+            &Request {
+                business_connection_id: &business_connection_id,
+                chat_id: &chat_id,
+                message_id: &message_id,
+            },
+        )
+        .await
     }
 }
 
@@ -4054,17 +3955,20 @@ impl Bot {
         user_id: i64,
         telegram_payment_charge_id: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "telegram_payment_charge_id".into(),
-            serde_json::to_value(telegram_payment_charge_id.into()).unwrap_or_default(),
-        );
-        self.call_api("refundStarPayment", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            telegram_payment_charge_id: &'a String,
+        }
+        let telegram_payment_charge_id: String = telegram_payment_charge_id.into();
+        self.call_api(
+            "refundStarPayment",
+            &Request {
+                user_id: &user_id,
+                telegram_payment_charge_id: &telegram_payment_charge_id,
+            },
+        )
+        .await
     }
 }
 
@@ -4094,24 +3998,19 @@ impl Bot {
         business_connection_id: impl Into<String>,
         params: Option<RemoveBusinessAccountProfilePhotoParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a RemoveBusinessAccountProfilePhotoParams>,
         }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "removeBusinessAccountProfilePhoto",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -4124,12 +4023,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("removeChatVerification", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("removeChatVerification", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -4138,9 +4037,9 @@ impl Bot {
     /// Removes the profile photo of the bot. Requires no parameters. Returns True on success.
     /// See: https://core.telegram.org/bots/api#removemyprofilephoto
     pub async fn remove_my_profile_photo(&self) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        self.call_api("removeMyProfilePhoto", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request {}
+        self.call_api("removeMyProfilePhoto", &Request {}).await
     }
 }
 
@@ -4148,12 +4047,11 @@ impl Bot {
     /// Removes verification from a user who is currently verified on behalf of the organization represented by the bot. Returns True on success.
     /// See: https://core.telegram.org/bots/api#removeuserverification
     pub async fn remove_user_verification(&self, user_id: i64) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        self.call_api("removeUserVerification", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+        }
+        self.call_api("removeUserVerification", &Request { user_id: &user_id })
             .await
     }
 }
@@ -4166,17 +4064,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_thread_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_thread_id".into(),
-            serde_json::to_value(message_thread_id).unwrap_or_default(),
-        );
-        self.call_api("reopenForumTopic", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_thread_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "reopenForumTopic",
+            &Request {
+                chat_id: &chat_id,
+                message_thread_id: &message_thread_id,
+            },
+        )
+        .await
     }
 }
 
@@ -4187,12 +4088,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("reopenGeneralForumTopic", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("reopenGeneralForumTopic", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -4207,25 +4108,25 @@ impl Bot {
         old_sticker: impl Into<String>,
         sticker: InputSticker,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "old_sticker".into(),
-            serde_json::to_value(old_sticker.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker).unwrap_or_default(),
-        );
-        self.call_api("replaceStickerInSet", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            name: &'a String,
+            old_sticker: &'a String,
+            sticker: &'a InputSticker,
+        }
+        let name: String = name.into();
+        let old_sticker: String = old_sticker.into();
+        self.call_api(
+            "replaceStickerInSet",
+            &Request {
+                user_id: &user_id,
+                name: &name,
+                old_sticker: &old_sticker,
+                sticker: &sticker,
+            },
+        )
+        .await
     }
 }
 
@@ -4265,35 +4166,27 @@ impl Bot {
         active_period: i64,
         params: Option<RepostStoryParams>,
     ) -> Result<Story, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "from_chat_id".into(),
-            serde_json::to_value(from_chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "from_story_id".into(),
-            serde_json::to_value(from_story_id).unwrap_or_default(),
-        );
-        req.insert(
-            "active_period".into(),
-            serde_json::to_value(active_period).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("repostStory", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            from_chat_id: &'a i64,
+            from_story_id: &'a i64,
+            active_period: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a RepostStoryParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "repostStory",
+            &Request {
+                business_connection_id: &business_connection_id,
+                from_chat_id: &from_chat_id,
+                from_story_id: &from_story_id,
+                active_period: &active_period,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4332,31 +4225,25 @@ impl Bot {
         permissions: ChatPermissions,
         params: Option<RestrictChatMemberParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "permissions".into(),
-            serde_json::to_value(permissions).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("restrictChatMember", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+            permissions: &'a ChatPermissions,
+            #[serde(flatten)]
+            params: Option<&'a RestrictChatMemberParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "restrictChatMember",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+                permissions: &permissions,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4368,17 +4255,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         invite_link: impl Into<String>,
     ) -> Result<ChatInviteLink, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "invite_link".into(),
-            serde_json::to_value(invite_link.into()).unwrap_or_default(),
-        );
-        self.call_api("revokeChatInviteLink", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            invite_link: &'a String,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let invite_link: String = invite_link.into();
+        self.call_api(
+            "revokeChatInviteLink",
+            &Request {
+                chat_id: &chat_id,
+                invite_link: &invite_link,
+            },
+        )
+        .await
     }
 }
 
@@ -4430,27 +4321,22 @@ impl Bot {
         result: InlineQueryResult,
         params: Option<SavePreparedInlineMessageParams>,
     ) -> Result<PreparedInlineMessage, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "result".into(),
-            serde_json::to_value(result).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("savePreparedInlineMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            result: &'a InlineQueryResult,
+            #[serde(flatten)]
+            params: Option<&'a SavePreparedInlineMessageParams>,
+        }
+        self.call_api(
+            "savePreparedInlineMessage",
+            &Request {
+                user_id: &user_id,
+                result: &result,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4607,27 +4493,24 @@ impl Bot {
         animation: impl Into<InputFileOrString>,
         params: Option<SendAnimationParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "animation".into(),
-            serde_json::to_value(animation.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendAnimation", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            animation: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendAnimationParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let animation: InputFileOrString = animation.into();
+        self.call_api(
+            "sendAnimation",
+            &Request {
+                chat_id: &chat_id,
+                animation: &animation,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4771,27 +4654,24 @@ impl Bot {
         audio: impl Into<InputFileOrString>,
         params: Option<SendAudioParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "audio".into(),
-            serde_json::to_value(audio.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendAudio", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            audio: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendAudioParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let audio: InputFileOrString = audio.into();
+        self.call_api(
+            "sendAudio",
+            &Request {
+                chat_id: &chat_id,
+                audio: &audio,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4830,27 +4710,24 @@ impl Bot {
         action: impl Into<String>,
         params: Option<SendChatActionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "action".into(),
-            serde_json::to_value(action.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendChatAction", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            action: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendChatActionParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let action: String = action.into();
+        self.call_api(
+            "sendChatAction",
+            &Request {
+                chat_id: &chat_id,
+                action: &action,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -4910,31 +4787,25 @@ impl Bot {
         checklist: InputChecklist,
         params: Option<SendChecklistParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "checklist".into(),
-            serde_json::to_value(checklist).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendChecklist", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            chat_id: &'a i64,
+            checklist: &'a InputChecklist,
+            #[serde(flatten)]
+            params: Option<&'a SendChecklistParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "sendChecklist",
+            &Request {
+                business_connection_id: &business_connection_id,
+                chat_id: &chat_id,
+                checklist: &checklist,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5043,31 +4914,27 @@ impl Bot {
         first_name: impl Into<String>,
         params: Option<SendContactParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "phone_number".into(),
-            serde_json::to_value(phone_number.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "first_name".into(),
-            serde_json::to_value(first_name.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendContact", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            phone_number: &'a String,
+            first_name: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendContactParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let phone_number: String = phone_number.into();
+        let first_name: String = first_name.into();
+        self.call_api(
+            "sendContact",
+            &Request {
+                chat_id: &chat_id,
+                phone_number: &phone_number,
+                first_name: &first_name,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5167,23 +5034,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<SendDiceParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendDice", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a SendDiceParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "sendDice",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5312,27 +5177,24 @@ impl Bot {
         document: impl Into<InputFileOrString>,
         params: Option<SendDocumentParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "document".into(),
-            serde_json::to_value(document.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendDocument", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            document: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendDocumentParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let document: InputFileOrString = document.into();
+        self.call_api(
+            "sendDocument",
+            &Request {
+                chat_id: &chat_id,
+                document: &document,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5412,27 +5274,23 @@ impl Bot {
         game_short_name: impl Into<String>,
         params: Option<SendGameParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "game_short_name".into(),
-            serde_json::to_value(game_short_name.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendGame", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a i64,
+            game_short_name: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendGameParams>,
+        }
+        let game_short_name: String = game_short_name.into();
+        self.call_api(
+            "sendGame",
+            &Request {
+                chat_id: &chat_id,
+                game_short_name: &game_short_name,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5497,23 +5355,21 @@ impl Bot {
         gift_id: impl Into<String>,
         params: Option<SendGiftParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "gift_id".into(),
-            serde_json::to_value(gift_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendGift", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            gift_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendGiftParams>,
+        }
+        let gift_id: String = gift_id.into();
+        self.call_api(
+            "sendGift",
+            &Request {
+                gift_id: &gift_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5716,43 +5572,35 @@ impl Bot {
         prices: Vec<LabeledPrice>,
         params: Option<SendInvoiceParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "description".into(),
-            serde_json::to_value(description.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "payload".into(),
-            serde_json::to_value(payload.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "currency".into(),
-            serde_json::to_value(currency.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "prices".into(),
-            serde_json::to_value(prices).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendInvoice", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            title: &'a String,
+            description: &'a String,
+            payload: &'a String,
+            currency: &'a String,
+            prices: &'a Vec<LabeledPrice>,
+            #[serde(flatten)]
+            params: Option<&'a SendInvoiceParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let title: String = title.into();
+        let description: String = description.into();
+        let payload: String = payload.into();
+        let currency: String = currency.into();
+        self.call_api(
+            "sendInvoice",
+            &Request {
+                chat_id: &chat_id,
+                title: &title,
+                description: &description,
+                payload: &payload,
+                currency: &currency,
+                prices: &prices,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5875,31 +5723,25 @@ impl Bot {
         longitude: f64,
         params: Option<SendLocationParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "latitude".into(),
-            serde_json::to_value(latitude).unwrap_or_default(),
-        );
-        req.insert(
-            "longitude".into(),
-            serde_json::to_value(longitude).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendLocation", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            latitude: &'a f64,
+            longitude: &'a f64,
+            #[serde(flatten)]
+            params: Option<&'a SendLocationParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "sendLocation",
+            &Request {
+                chat_id: &chat_id,
+                latitude: &latitude,
+                longitude: &longitude,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -5979,27 +5821,24 @@ impl Bot {
         media: impl Into<InputMedia>,
         params: Option<SendMediaGroupParams>,
     ) -> Result<Vec<Message>, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "media".into(),
-            serde_json::to_value(media.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendMediaGroup", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            media: &'a InputMedia,
+            #[serde(flatten)]
+            params: Option<&'a SendMediaGroupParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let media: InputMedia = media.into();
+        self.call_api(
+            "sendMediaGroup",
+            &Request {
+                chat_id: &chat_id,
+                media: &media,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6114,27 +5953,24 @@ impl Bot {
         text: impl Into<String>,
         params: Option<SendMessageParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "text".into(),
-            serde_json::to_value(text.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            text: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendMessageParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let text: String = text.into();
+        self.call_api(
+            "sendMessage",
+            &Request {
+                chat_id: &chat_id,
+                text: &text,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6180,31 +6016,25 @@ impl Bot {
         text: impl Into<String>,
         params: Option<SendMessageDraftParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id).unwrap_or_default(),
-        );
-        req.insert(
-            "draft_id".into(),
-            serde_json::to_value(draft_id).unwrap_or_default(),
-        );
-        req.insert(
-            "text".into(),
-            serde_json::to_value(text.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendMessageDraft", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a i64,
+            draft_id: &'a i64,
+            text: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendMessageDraftParams>,
+        }
+        let text: String = text.into();
+        self.call_api(
+            "sendMessageDraft",
+            &Request {
+                chat_id: &chat_id,
+                draft_id: &draft_id,
+                text: &text,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6327,31 +6157,25 @@ impl Bot {
         media: Vec<InputPaidMedia>,
         params: Option<SendPaidMediaParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "star_count".into(),
-            serde_json::to_value(star_count).unwrap_or_default(),
-        );
-        req.insert(
-            "media".into(),
-            serde_json::to_value(media).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendPaidMedia", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            star_count: &'a i64,
+            media: &'a Vec<InputPaidMedia>,
+            #[serde(flatten)]
+            params: Option<&'a SendPaidMediaParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "sendPaidMedia",
+            &Request {
+                chat_id: &chat_id,
+                star_count: &star_count,
+                media: &media,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6480,27 +6304,24 @@ impl Bot {
         photo: impl Into<InputFileOrString>,
         params: Option<SendPhotoParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "photo".into(),
-            serde_json::to_value(photo.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendPhoto", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            photo: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendPhotoParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let photo: InputFileOrString = photo.into();
+        self.call_api(
+            "sendPhoto",
+            &Request {
+                chat_id: &chat_id,
+                photo: &photo,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6666,31 +6487,26 @@ impl Bot {
         options: Vec<InputPollOption>,
         params: Option<SendPollParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "question".into(),
-            serde_json::to_value(question.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "options".into(),
-            serde_json::to_value(options).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendPoll", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            question: &'a String,
+            options: &'a Vec<InputPollOption>,
+            #[serde(flatten)]
+            params: Option<&'a SendPollParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let question: String = question.into();
+        self.call_api(
+            "sendPoll",
+            &Request {
+                chat_id: &chat_id,
+                question: &question,
+                options: &options,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6791,27 +6607,24 @@ impl Bot {
         sticker: impl Into<InputFileOrString>,
         params: Option<SendStickerParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendSticker", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            sticker: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendStickerParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let sticker: InputFileOrString = sticker.into();
+        self.call_api(
+            "sendSticker",
+            &Request {
+                chat_id: &chat_id,
+                sticker: &sticker,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -6936,39 +6749,31 @@ impl Bot {
         address: impl Into<String>,
         params: Option<SendVenueParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "latitude".into(),
-            serde_json::to_value(latitude).unwrap_or_default(),
-        );
-        req.insert(
-            "longitude".into(),
-            serde_json::to_value(longitude).unwrap_or_default(),
-        );
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "address".into(),
-            serde_json::to_value(address.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendVenue", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            latitude: &'a f64,
+            longitude: &'a f64,
+            title: &'a String,
+            address: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SendVenueParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let title: String = title.into();
+        let address: String = address.into();
+        self.call_api(
+            "sendVenue",
+            &Request {
+                chat_id: &chat_id,
+                latitude: &latitude,
+                longitude: &longitude,
+                title: &title,
+                address: &address,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7146,27 +6951,24 @@ impl Bot {
         video: impl Into<InputFileOrString>,
         params: Option<SendVideoParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "video".into(),
-            serde_json::to_value(video.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendVideo", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            video: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendVideoParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let video: InputFileOrString = video.into();
+        self.call_api(
+            "sendVideo",
+            &Request {
+                chat_id: &chat_id,
+                video: &video,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7281,27 +7083,24 @@ impl Bot {
         video_note: impl Into<InputFileOrString>,
         params: Option<SendVideoNoteParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "video_note".into(),
-            serde_json::to_value(video_note.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendVideoNote", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            video_note: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendVideoNoteParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let video_note: InputFileOrString = video_note.into();
+        self.call_api(
+            "sendVideoNote",
+            &Request {
+                chat_id: &chat_id,
+                video_note: &video_note,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7423,27 +7222,24 @@ impl Bot {
         voice: impl Into<InputFileOrString>,
         params: Option<SendVoiceParams>,
     ) -> Result<Message, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "voice".into(),
-            serde_json::to_value(voice.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("sendVoice", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            voice: &'a InputFileOrString,
+            #[serde(flatten)]
+            params: Option<&'a SendVoiceParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let voice: InputFileOrString = voice.into();
+        self.call_api(
+            "sendVoice",
+            &Request {
+                chat_id: &chat_id,
+                voice: &voice,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7473,23 +7269,21 @@ impl Bot {
         business_connection_id: impl Into<String>,
         params: Option<SetBusinessAccountBioParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setBusinessAccountBio", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetBusinessAccountBioParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        self.call_api(
+            "setBusinessAccountBio",
+            &Request {
+                business_connection_id: &business_connection_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7502,22 +7296,20 @@ impl Bot {
         show_gift_button: bool,
         accepted_gift_types: AcceptedGiftTypes,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "show_gift_button".into(),
-            serde_json::to_value(show_gift_button).unwrap_or_default(),
-        );
-        req.insert(
-            "accepted_gift_types".into(),
-            serde_json::to_value(accepted_gift_types).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            show_gift_button: &'a bool,
+            accepted_gift_types: &'a AcceptedGiftTypes,
+        }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "setBusinessAccountGiftSettings",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+                show_gift_button: &show_gift_button,
+                accepted_gift_types: &accepted_gift_types,
+            },
         )
         .await
     }
@@ -7550,27 +7342,24 @@ impl Bot {
         first_name: impl Into<String>,
         params: Option<SetBusinessAccountNameParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "first_name".into(),
-            serde_json::to_value(first_name.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setBusinessAccountName", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            first_name: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetBusinessAccountNameParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        let first_name: String = first_name.into();
+        self.call_api(
+            "setBusinessAccountName",
+            &Request {
+                business_connection_id: &business_connection_id,
+                first_name: &first_name,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7601,28 +7390,21 @@ impl Bot {
         photo: InputProfilePhoto,
         params: Option<SetBusinessAccountProfilePhotoParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "photo".into(),
-            serde_json::to_value(photo).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            photo: &'a InputProfilePhoto,
+            #[serde(flatten)]
+            params: Option<&'a SetBusinessAccountProfilePhotoParams>,
         }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "setBusinessAccountProfilePhoto",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+                photo: &photo,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -7654,24 +7436,19 @@ impl Bot {
         business_connection_id: impl Into<String>,
         params: Option<SetBusinessAccountUsernameParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetBusinessAccountUsernameParams>,
         }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "setBusinessAccountUsername",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -7686,22 +7463,21 @@ impl Bot {
         user_id: i64,
         custom_title: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "custom_title".into(),
-            serde_json::to_value(custom_title.into()).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+            custom_title: &'a String,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let custom_title: String = custom_title.into();
         self.call_api(
             "setChatAdministratorCustomTitle",
-            &serde_json::Value::Object(req),
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+                custom_title: &custom_title,
+            },
         )
         .await
     }
@@ -7733,23 +7509,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<SetChatDescriptionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setChatDescription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a SetChatDescriptionParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "setChatDescription",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7785,19 +7559,18 @@ impl Bot {
         &self,
         params: Option<SetChatMenuButtonParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setChatMenuButton", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a SetChatMenuButtonParams>,
+        }
+        self.call_api(
+            "setChatMenuButton",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7828,27 +7601,23 @@ impl Bot {
         permissions: ChatPermissions,
         params: Option<SetChatPermissionsParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "permissions".into(),
-            serde_json::to_value(permissions).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setChatPermissions", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            permissions: &'a ChatPermissions,
+            #[serde(flatten)]
+            params: Option<&'a SetChatPermissionsParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "setChatPermissions",
+            &Request {
+                chat_id: &chat_id,
+                permissions: &permissions,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -7860,17 +7629,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         photo: InputFile,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "photo".into(),
-            serde_json::to_value(photo).unwrap_or_default(),
-        );
-        self.call_api("setChatPhoto", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            photo: &'a InputFile,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "setChatPhoto",
+            &Request {
+                chat_id: &chat_id,
+                photo: &photo,
+            },
+        )
+        .await
     }
 }
 
@@ -7882,17 +7654,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         sticker_set_name: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker_set_name".into(),
-            serde_json::to_value(sticker_set_name.into()).unwrap_or_default(),
-        );
-        self.call_api("setChatStickerSet", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            sticker_set_name: &'a String,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let sticker_set_name: String = sticker_set_name.into();
+        self.call_api(
+            "setChatStickerSet",
+            &Request {
+                chat_id: &chat_id,
+                sticker_set_name: &sticker_set_name,
+            },
+        )
+        .await
     }
 }
 
@@ -7904,17 +7680,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         title: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        self.call_api("setChatTitle", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            title: &'a String,
+        }
+        let chat_id: ChatId = chat_id.into();
+        let title: String = title.into();
+        self.call_api(
+            "setChatTitle",
+            &Request {
+                chat_id: &chat_id,
+                title: &title,
+            },
+        )
+        .await
     }
 }
 
@@ -7944,24 +7724,19 @@ impl Bot {
         name: impl Into<String>,
         params: Option<SetCustomEmojiStickerSetThumbnailParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            name: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetCustomEmojiStickerSetThumbnailParams>,
         }
+        let name: String = name.into();
         self.call_api(
             "setCustomEmojiStickerSetThumbnail",
-            &serde_json::Value::Object(req),
+            &Request {
+                name: &name,
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -8022,27 +7797,22 @@ impl Bot {
         score: i64,
         params: Option<SetGameScoreParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "score".into(),
-            serde_json::to_value(score).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setGameScore", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            score: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a SetGameScoreParams>,
+        }
+        self.call_api(
+            "setGameScore",
+            &Request {
+                user_id: &user_id,
+                score: &score,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8080,27 +7850,23 @@ impl Bot {
         message_id: i64,
         params: Option<SetMessageReactionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setMessageReaction", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a SetMessageReactionParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "setMessageReaction",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8137,23 +7903,20 @@ impl Bot {
         commands: Vec<BotCommand>,
         params: Option<SetMyCommandsParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "commands".into(),
-            serde_json::to_value(commands).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setMyCommands", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            commands: &'a Vec<BotCommand>,
+            #[serde(flatten)]
+            params: Option<&'a SetMyCommandsParams>,
+        }
+        self.call_api(
+            "setMyCommands",
+            &Request {
+                commands: &commands,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8189,20 +7952,16 @@ impl Bot {
         &self,
         params: Option<SetMyDefaultAdministratorRightsParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a SetMyDefaultAdministratorRightsParams>,
         }
         self.call_api(
             "setMyDefaultAdministratorRights",
-            &serde_json::Value::Object(req),
+            &Request {
+                params: params.as_ref(),
+            },
         )
         .await
     }
@@ -8240,19 +7999,18 @@ impl Bot {
         &self,
         params: Option<SetMyDescriptionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setMyDescription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a SetMyDescriptionParams>,
+        }
+        self.call_api(
+            "setMyDescription",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8285,19 +8043,18 @@ impl Bot {
     /// Use this method to change the bot's name. Returns True on success.
     /// See: https://core.telegram.org/bots/api#setmyname
     pub async fn set_my_name(&self, params: Option<SetMyNameParams>) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setMyName", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a SetMyNameParams>,
+        }
+        self.call_api(
+            "setMyName",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8305,12 +8062,11 @@ impl Bot {
     /// Changes the profile photo of the bot. Returns True on success.
     /// See: https://core.telegram.org/bots/api#setmyprofilephoto
     pub async fn set_my_profile_photo(&self, photo: InputProfilePhoto) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "photo".into(),
-            serde_json::to_value(photo).unwrap_or_default(),
-        );
-        self.call_api("setMyProfilePhoto", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            photo: &'a InputProfilePhoto,
+        }
+        self.call_api("setMyProfilePhoto", &Request { photo: &photo })
             .await
     }
 }
@@ -8347,19 +8103,18 @@ impl Bot {
         &self,
         params: Option<SetMyShortDescriptionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setMyShortDescription", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a SetMyShortDescriptionParams>,
+        }
+        self.call_api(
+            "setMyShortDescription",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8372,17 +8127,19 @@ impl Bot {
         user_id: i64,
         errors: Vec<PassportElementError>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "errors".into(),
-            serde_json::to_value(errors).unwrap_or_default(),
-        );
-        self.call_api("setPassportDataErrors", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            errors: &'a Vec<PassportElementError>,
+        }
+        self.call_api(
+            "setPassportDataErrors",
+            &Request {
+                user_id: &user_id,
+                errors: &errors,
+            },
+        )
+        .await
     }
 }
 
@@ -8394,17 +8151,20 @@ impl Bot {
         sticker: impl Into<String>,
         emoji_list: Vec<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "emoji_list".into(),
-            serde_json::to_value(emoji_list).unwrap_or_default(),
-        );
-        self.call_api("setStickerEmojiList", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            sticker: &'a String,
+            emoji_list: &'a Vec<String>,
+        }
+        let sticker: String = sticker.into();
+        self.call_api(
+            "setStickerEmojiList",
+            &Request {
+                sticker: &sticker,
+                emoji_list: &emoji_list,
+            },
+        )
+        .await
     }
 }
 
@@ -8434,23 +8194,21 @@ impl Bot {
         sticker: impl Into<String>,
         params: Option<SetStickerKeywordsParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setStickerKeywords", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            sticker: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetStickerKeywordsParams>,
+        }
+        let sticker: String = sticker.into();
+        self.call_api(
+            "setStickerKeywords",
+            &Request {
+                sticker: &sticker,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8480,23 +8238,21 @@ impl Bot {
         sticker: impl Into<String>,
         params: Option<SetStickerMaskPositionParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setStickerMaskPosition", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            sticker: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetStickerMaskPositionParams>,
+        }
+        let sticker: String = sticker.into();
+        self.call_api(
+            "setStickerMaskPosition",
+            &Request {
+                sticker: &sticker,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8508,17 +8264,20 @@ impl Bot {
         sticker: impl Into<String>,
         position: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "position".into(),
-            serde_json::to_value(position).unwrap_or_default(),
-        );
-        self.call_api("setStickerPositionInSet", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            sticker: &'a String,
+            position: &'a i64,
+        }
+        let sticker: String = sticker.into();
+        self.call_api(
+            "setStickerPositionInSet",
+            &Request {
+                sticker: &sticker,
+                position: &position,
+            },
+        )
+        .await
     }
 }
 
@@ -8550,31 +8309,26 @@ impl Bot {
         format: impl Into<String>,
         params: Option<SetStickerSetThumbnailParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "format".into(),
-            serde_json::to_value(format.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setStickerSetThumbnail", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            name: &'a String,
+            user_id: &'a i64,
+            format: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetStickerSetThumbnailParams>,
+        }
+        let name: String = name.into();
+        let format: String = format.into();
+        self.call_api(
+            "setStickerSetThumbnail",
+            &Request {
+                name: &name,
+                user_id: &user_id,
+                format: &format,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8586,17 +8340,21 @@ impl Bot {
         name: impl Into<String>,
         title: impl Into<String>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "name".into(),
-            serde_json::to_value(name.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "title".into(),
-            serde_json::to_value(title.into()).unwrap_or_default(),
-        );
-        self.call_api("setStickerSetTitle", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            name: &'a String,
+            title: &'a String,
+        }
+        let name: String = name.into();
+        let title: String = title.into();
+        self.call_api(
+            "setStickerSetTitle",
+            &Request {
+                name: &name,
+                title: &title,
+            },
+        )
+        .await
     }
 }
 
@@ -8633,23 +8391,20 @@ impl Bot {
         user_id: i64,
         params: Option<SetUserEmojiStatusParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setUserEmojiStatus", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a SetUserEmojiStatusParams>,
+        }
+        self.call_api(
+            "setUserEmojiStatus",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8715,23 +8470,21 @@ impl Bot {
         url: impl Into<String>,
         params: Option<SetWebhookParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "url".into(),
-            serde_json::to_value(url.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("setWebhook", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            url: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a SetWebhookParams>,
+        }
+        let url: String = url.into();
+        self.call_api(
+            "setWebhook",
+            &Request {
+                url: &url,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8788,19 +8541,18 @@ impl Bot {
         &self,
         params: Option<StopMessageLiveLocationParams>,
     ) -> Result<serde_json::Value, BotError> {
-        let mut req = serde_json::Map::new();
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("stopMessageLiveLocation", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            #[serde(flatten)]
+            params: Option<&'a StopMessageLiveLocationParams>,
+        }
+        self.call_api(
+            "stopMessageLiveLocation",
+            &Request {
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8838,27 +8590,23 @@ impl Bot {
         message_id: i64,
         params: Option<StopPollParams>,
     ) -> Result<Poll, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_id".into(),
-            serde_json::to_value(message_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("stopPoll", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a StopPollParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "stopPoll",
+            &Request {
+                chat_id: &chat_id,
+                message_id: &message_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8870,18 +8618,18 @@ impl Bot {
         business_connection_id: impl Into<String>,
         star_count: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "star_count".into(),
-            serde_json::to_value(star_count).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            star_count: &'a i64,
+        }
+        let business_connection_id: String = business_connection_id.into();
         self.call_api(
             "transferBusinessAccountStars",
-            &serde_json::Value::Object(req),
+            &Request {
+                business_connection_id: &business_connection_id,
+                star_count: &star_count,
+            },
         )
         .await
     }
@@ -8915,31 +8663,26 @@ impl Bot {
         new_owner_chat_id: i64,
         params: Option<TransferGiftParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "owned_gift_id".into(),
-            serde_json::to_value(owned_gift_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "new_owner_chat_id".into(),
-            serde_json::to_value(new_owner_chat_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("transferGift", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            owned_gift_id: &'a String,
+            new_owner_chat_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a TransferGiftParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        let owned_gift_id: String = owned_gift_id.into();
+        self.call_api(
+            "transferGift",
+            &Request {
+                business_connection_id: &business_connection_id,
+                owned_gift_id: &owned_gift_id,
+                new_owner_chat_id: &new_owner_chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -8970,27 +8713,23 @@ impl Bot {
         user_id: i64,
         params: Option<UnbanChatMemberParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("unbanChatMember", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a UnbanChatMemberParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "unbanChatMember",
+            &Request {
+                chat_id: &chat_id,
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -9002,17 +8741,20 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         sender_chat_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "sender_chat_id".into(),
-            serde_json::to_value(sender_chat_id).unwrap_or_default(),
-        );
-        self.call_api("unbanChatSenderChat", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            sender_chat_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "unbanChatSenderChat",
+            &Request {
+                chat_id: &chat_id,
+                sender_chat_id: &sender_chat_id,
+            },
+        )
+        .await
     }
 }
 
@@ -9023,12 +8765,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("unhideGeneralForumTopic", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("unhideGeneralForumTopic", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -9040,12 +8782,12 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        self.call_api("unpinAllChatMessages", &serde_json::Value::Object(req))
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api("unpinAllChatMessages", &Request { chat_id: &chat_id })
             .await
     }
 }
@@ -9058,18 +8800,18 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         message_thread_id: i64,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "message_thread_id".into(),
-            serde_json::to_value(message_thread_id).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            message_thread_id: &'a i64,
+        }
+        let chat_id: ChatId = chat_id.into();
         self.call_api(
             "unpinAllForumTopicMessages",
-            &serde_json::Value::Object(req),
+            &Request {
+                chat_id: &chat_id,
+                message_thread_id: &message_thread_id,
+            },
         )
         .await
     }
@@ -9082,14 +8824,14 @@ impl Bot {
         &self,
         chat_id: impl Into<ChatId>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+        }
+        let chat_id: ChatId = chat_id.into();
         self.call_api(
             "unpinAllGeneralForumTopicMessages",
-            &serde_json::Value::Object(req),
+            &Request { chat_id: &chat_id },
         )
         .await
     }
@@ -9128,23 +8870,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<UnpinChatMessageParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("unpinChatMessage", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a UnpinChatMessageParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "unpinChatMessage",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -9182,27 +8922,24 @@ impl Bot {
         owned_gift_id: impl Into<String>,
         params: Option<UpgradeGiftParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "business_connection_id".into(),
-            serde_json::to_value(business_connection_id.into()).unwrap_or_default(),
-        );
-        req.insert(
-            "owned_gift_id".into(),
-            serde_json::to_value(owned_gift_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("upgradeGift", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            business_connection_id: &'a String,
+            owned_gift_id: &'a String,
+            #[serde(flatten)]
+            params: Option<&'a UpgradeGiftParams>,
+        }
+        let business_connection_id: String = business_connection_id.into();
+        let owned_gift_id: String = owned_gift_id.into();
+        self.call_api(
+            "upgradeGift",
+            &Request {
+                business_connection_id: &business_connection_id,
+                owned_gift_id: &owned_gift_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -9215,21 +8952,22 @@ impl Bot {
         sticker: InputFile,
         sticker_format: impl Into<String>,
     ) -> Result<File, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker".into(),
-            serde_json::to_value(sticker).unwrap_or_default(),
-        );
-        req.insert(
-            "sticker_format".into(),
-            serde_json::to_value(sticker_format.into()).unwrap_or_default(),
-        );
-        self.call_api("uploadStickerFile", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            sticker: &'a InputFile,
+            sticker_format: &'a String,
+        }
+        let sticker_format: String = sticker_format.into();
+        self.call_api(
+            "uploadStickerFile",
+            &Request {
+                user_id: &user_id,
+                sticker: &sticker,
+                sticker_format: &sticker_format,
+            },
+        )
+        .await
     }
 }
 
@@ -9259,23 +8997,21 @@ impl Bot {
         chat_id: impl Into<ChatId>,
         params: Option<VerifyChatParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "chat_id".into(),
-            serde_json::to_value(chat_id.into()).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("verifyChat", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            chat_id: &'a ChatId,
+            #[serde(flatten)]
+            params: Option<&'a VerifyChatParams>,
+        }
+        let chat_id: ChatId = chat_id.into();
+        self.call_api(
+            "verifyChat",
+            &Request {
+                chat_id: &chat_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
 
@@ -9305,22 +9041,19 @@ impl Bot {
         user_id: i64,
         params: Option<VerifyUserParams>,
     ) -> Result<bool, BotError> {
-        let mut req = serde_json::Map::new();
-        req.insert(
-            "user_id".into(),
-            serde_json::to_value(user_id).unwrap_or_default(),
-        );
-        if let Some(p) = params {
-            let extra = serde_json::to_value(&p).unwrap_or_default();
-            if let serde_json::Value::Object(m) = extra {
-                for (k, v) in m {
-                    if !v.is_null() {
-                        req.insert(k, v);
-                    }
-                }
-            }
-        }
-        self.call_api("verifyUser", &serde_json::Value::Object(req))
-            .await
+        #[derive(Serialize)]
+        struct Request<'a> {
+            user_id: &'a i64,
+            #[serde(flatten)]
+            params: Option<&'a VerifyUserParams>,
+        }
+        self.call_api(
+            "verifyUser",
+            &Request {
+                user_id: &user_id,
+                params: params.as_ref(),
+            },
+        )
+        .await
     }
 }
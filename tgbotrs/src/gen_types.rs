@@ -9,8 +9,19 @@
 #![allow(clippy::all, dead_code, unused_imports)]
 
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
+use std::borrow::Cow;
 #[rustfmt::skip]
-use crate::{ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia};
+use crate::{ChatId, InputFile, InputFileOrString, ReplyMarkup, InputMedia, ShortString, ShortVec};
+
+/// `Option<Cow<str>>` that borrows from the input like a bare `#[serde(borrow)] Cow<str>` does.
+fn borrow_opt_str<'de: 'a, 'a, D: serde::Deserializer<'de>>(
+    deserializer: D,
+) -> Result<Option<Cow<'a, str>>, D::Error> {
+    #[derive(Deserialize)]
+    struct Str<'a>(#[serde(borrow)] Cow<'a, str>);
+    Ok(Option::<Str>::deserialize(deserializer)?.map(|s| s.0))
+}
 
 /// This object describes the types of gifts that can be gifted to a user or a chat.
 /// https://core.telegram.org/bots/api#acceptedgifttypes
@@ -34,7 +45,7 @@ pub struct AcceptedGiftTypes {
 pub struct AffiliateInfo {
     /// Optional. The bot or the user that received an affiliate commission if it was received by a bot or a user
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub affiliate_user: Option<Box<User>>,
+    pub affiliate_user: Option<User>,
     /// Optional. The chat that received an affiliate commission if it was received by a chat
     #[serde(skip_serializing_if = "Option::is_none")]
     pub affiliate_chat: Option<Box<Chat>>,
@@ -63,7 +74,7 @@ pub struct Animation {
     pub duration: i64,
     /// Optional. Animation thumbnail as defined by the sender
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail: Option<Box<PhotoSize>>,
+    pub thumbnail: Option<PhotoSize>,
     /// Optional. Original animation filename as defined by the sender
     #[serde(skip_serializing_if = "Option::is_none")]
     pub file_name: Option<String>,
@@ -102,7 +113,7 @@ pub struct Audio {
     pub file_size: Option<i64>,
     /// Optional. Thumbnail of the album cover to which the music file belongs
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail: Option<Box<PhotoSize>>,
+    pub thumbnail: Option<PhotoSize>,
 }
 
 /// This object describes the way a background is filled based on the selected colors. Currently, it can be one of
@@ -110,7 +121,7 @@ pub struct Audio {
 /// - BackgroundFillGradient
 /// - BackgroundFillFreeformGradient
 /// https://core.telegram.org/bots/api#backgroundfill
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum BackgroundFill {
     BackgroundFillSolid(BackgroundFillSolid),
@@ -118,6 +129,30 @@ pub enum BackgroundFill {
     BackgroundFillFreeformGradient(BackgroundFillFreeformGradient),
 }
 
+impl<'de> Deserialize<'de> for BackgroundFill {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["solid", "gradient", "freeform_gradient"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("solid") => serde_json::from_str(raw.get()).map(Self::BackgroundFillSolid),
+            Some("gradient") => serde_json::from_str(raw.get()).map(Self::BackgroundFillGradient),
+            Some("freeform_gradient") => {
+                serde_json::from_str(raw.get()).map(Self::BackgroundFillFreeformGradient)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The background is a freeform gradient that rotates after every message in the chat.
 /// https://core.telegram.org/bots/api#backgroundfillfreeformgradient
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -161,7 +196,7 @@ pub struct BackgroundFillSolid {
 /// - BackgroundTypePattern
 /// - BackgroundTypeChatTheme
 /// https://core.telegram.org/bots/api#backgroundtype
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum BackgroundType {
     BackgroundTypeFill(BackgroundTypeFill),
@@ -170,6 +205,31 @@ pub enum BackgroundType {
     BackgroundTypeChatTheme(BackgroundTypeChatTheme),
 }
 
+impl<'de> Deserialize<'de> for BackgroundType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["fill", "wallpaper", "pattern", "chat_theme"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("fill") => serde_json::from_str(raw.get()).map(Self::BackgroundTypeFill),
+            Some("wallpaper") => serde_json::from_str(raw.get()).map(Self::BackgroundTypeWallpaper),
+            Some("pattern") => serde_json::from_str(raw.get()).map(Self::BackgroundTypePattern),
+            Some("chat_theme") => {
+                serde_json::from_str(raw.get()).map(Self::BackgroundTypeChatTheme)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The background is taken directly from a built-in chat theme.
 /// https://core.telegram.org/bots/api#backgroundtypechattheme
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -266,7 +326,7 @@ pub struct BotCommand {
 /// - BotCommandScopeChatAdministrators
 /// - BotCommandScopeChatMember
 /// https://core.telegram.org/bots/api#botcommandscope
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum BotCommandScope {
     BotCommandScopeDefault(BotCommandScopeDefault),
@@ -278,6 +338,50 @@ pub enum BotCommandScope {
     BotCommandScopeChatMember(BotCommandScopeChatMember),
 }
 
+impl<'de> Deserialize<'de> for BotCommandScope {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "default",
+            "all_private_chats",
+            "all_group_chats",
+            "all_chat_administrators",
+            "chat",
+            "chat_administrators",
+            "chat_member",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("default") => serde_json::from_str(raw.get()).map(Self::BotCommandScopeDefault),
+            Some("all_private_chats") => {
+                serde_json::from_str(raw.get()).map(Self::BotCommandScopeAllPrivateChats)
+            }
+            Some("all_group_chats") => {
+                serde_json::from_str(raw.get()).map(Self::BotCommandScopeAllGroupChats)
+            }
+            Some("all_chat_administrators") => {
+                serde_json::from_str(raw.get()).map(Self::BotCommandScopeAllChatAdministrators)
+            }
+            Some("chat") => serde_json::from_str(raw.get()).map(Self::BotCommandScopeChat),
+            Some("chat_administrators") => {
+                serde_json::from_str(raw.get()).map(Self::BotCommandScopeChatAdministrators)
+            }
+            Some("chat_member") => {
+                serde_json::from_str(raw.get()).map(Self::BotCommandScopeChatMember)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Represents the scope of bot commands, covering all group and supergroup chat administrators.
 /// https://core.telegram.org/bots/api#botcommandscopeallchatadministrators
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -435,7 +539,7 @@ pub struct BusinessConnection {
     pub date: i64,
     /// Optional. Rights of the business bot
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub rights: Option<Box<BusinessBotRights>>,
+    pub rights: Option<BusinessBotRights>,
     /// True, if the connection is active
     pub is_enabled: bool,
 }
@@ -463,7 +567,7 @@ pub struct BusinessLocation {
     pub address: String,
     /// Optional. Location of the business
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub location: Option<Box<Location>>,
+    pub location: Option<Location>,
 }
 
 /// This object is received when messages are deleted from a connected business account.
@@ -535,7 +639,7 @@ pub struct Chat {
     pub id: i64,
     /// Type of the chat, can be either "private", "group", "supergroup" or "channel"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: ChatType,
     /// Optional. Title, for supergroups, channels and group chats
     #[serde(skip_serializing_if = "Option::is_none")]
     pub title: Option<String>,
@@ -556,6 +660,89 @@ pub struct Chat {
     pub is_direct_messages: Option<bool>,
 }
 
+/// Values of `Chat.type`, `ChatFullInfo.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum ChatType {
+    /// `"private"`
+    Private,
+    /// `"group"`
+    Group,
+    /// `"supergroup"`
+    Supergroup,
+    /// `"channel"`
+    Channel,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl ChatType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Private => "private",
+            Self::Group => "group",
+            Self::Supergroup => "supergroup",
+            Self::Channel => "channel",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for ChatType {
+    fn from(value: &str) -> Self {
+        match value {
+            "private" => Self::Private,
+            "group" => Self::Group,
+            "supergroup" => Self::Supergroup,
+            "channel" => Self::Channel,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for ChatType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for ChatType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for ChatType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for ChatType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for ChatType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = ChatType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<ChatType, E> {
+                Ok(ChatType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents the rights of an administrator in a chat.
 /// https://core.telegram.org/bots/api#chatadministratorrights
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -649,7 +836,7 @@ pub struct ChatBoostRemoved {
 /// - ChatBoostSourceGiftCode
 /// - ChatBoostSourceGiveaway
 /// https://core.telegram.org/bots/api#chatboostsource
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum ChatBoostSource {
     ChatBoostSourcePremium(ChatBoostSourcePremium),
@@ -657,6 +844,33 @@ pub enum ChatBoostSource {
     ChatBoostSourceGiveaway(ChatBoostSourceGiveaway),
 }
 
+impl<'de> Deserialize<'de> for ChatBoostSource {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["premium", "gift_code", "giveaway"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(
+                rename = "source",
+                borrow,
+                default,
+                deserialize_with = "borrow_opt_str"
+            )]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("premium") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourcePremium),
+            Some("gift_code") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourceGiftCode),
+            Some("giveaway") => serde_json::from_str(raw.get()).map(Self::ChatBoostSourceGiveaway),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("source")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The boost was obtained by the creation of Telegram Premium gift codes to boost a chat. Each such code boosts the chat 4 times for the duration of the corresponding Telegram Premium subscription.
 /// https://core.telegram.org/bots/api#chatboostsourcegiftcode
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -677,7 +891,7 @@ pub struct ChatBoostSourceGiveaway {
     pub giveaway_message_id: i64,
     /// Optional. User that won the prize in the giveaway if any; for Telegram Premium giveaways only
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub user: Option<Box<User>>,
+    pub user: Option<User>,
     /// Optional. The number of Telegram Stars to be split between giveaway winners; for Telegram Star giveaways only
     #[serde(skip_serializing_if = "Option::is_none")]
     pub prize_star_count: Option<i64>,
@@ -714,7 +928,7 @@ pub struct ChatFullInfo {
     pub id: i64,
     /// Type of the chat, can be either "private", "group", "supergroup" or "channel"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: ChatType,
     /// Optional. Title, for supergroups, channels and group chats
     #[serde(skip_serializing_if = "Option::is_none")]
     pub title: Option<String>,
@@ -763,19 +977,19 @@ pub struct ChatFullInfo {
     pub parent_chat: Option<Box<Chat>>,
     /// Optional. List of available reactions allowed in the chat. If omitted, then all emoji reactions are allowed.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub available_reactions: Option<Vec<ReactionType>>,
+    pub available_reactions: Option<ShortVec<ReactionType, 2>>,
     /// Optional. Custom emoji identifier of the emoji chosen by the chat for the reply header and link preview background
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub background_custom_emoji_id: Option<String>,
+    pub background_custom_emoji_id: Option<ShortString>,
     /// Optional. Identifier of the accent color for the chat's profile background. See profile accent colors for more details.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub profile_accent_color_id: Option<i64>,
     /// Optional. Custom emoji identifier of the emoji chosen by the chat for its profile background
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub profile_background_custom_emoji_id: Option<String>,
+    pub profile_background_custom_emoji_id: Option<ShortString>,
     /// Optional. Custom emoji identifier of the emoji status of the chat or the other party in a private chat
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub emoji_status_custom_emoji_id: Option<String>,
+    pub emoji_status_custom_emoji_id: Option<ShortString>,
     /// Optional. Expiration date of the emoji status of the chat or the other party in a private chat, in Unix time, if any
     #[serde(skip_serializing_if = "Option::is_none")]
     pub emoji_status_expiration_date: Option<i64>,
@@ -933,7 +1147,7 @@ pub struct ChatLocation {
 /// - ChatMemberLeft
 /// - ChatMemberBanned
 /// https://core.telegram.org/bots/api#chatmember
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum ChatMember {
     ChatMemberOwner(ChatMemberOwner),
@@ -944,6 +1158,45 @@ pub enum ChatMember {
     ChatMemberBanned(ChatMemberBanned),
 }
 
+impl<'de> Deserialize<'de> for ChatMember {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "creator",
+            "administrator",
+            "member",
+            "restricted",
+            "left",
+            "kicked",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(
+                rename = "status",
+                borrow,
+                default,
+                deserialize_with = "borrow_opt_str"
+            )]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("creator") => serde_json::from_str(raw.get()).map(Self::ChatMemberOwner),
+            Some("administrator") => {
+                serde_json::from_str(raw.get()).map(Self::ChatMemberAdministrator)
+            }
+            Some("member") => serde_json::from_str(raw.get()).map(Self::ChatMemberMember),
+            Some("restricted") => serde_json::from_str(raw.get()).map(Self::ChatMemberRestricted),
+            Some("left") => serde_json::from_str(raw.get()).map(Self::ChatMemberLeft),
+            Some("kicked") => serde_json::from_str(raw.get()).map(Self::ChatMemberBanned),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("status")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Represents a chat member that has some additional privileges.
 /// https://core.telegram.org/bots/api#chatmemberadministrator
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -1127,7 +1380,7 @@ pub struct ChatOwnerChanged {
 pub struct ChatOwnerLeft {
     /// Optional. The user which will be the new owner of the chat if the previous owner does not return to the chat
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub new_owner: Option<Box<User>>,
+    pub new_owner: Option<User>,
 }
 
 /// Describes actions that a non-administrator user is allowed to take in a chat.
@@ -1208,7 +1461,7 @@ pub struct ChatShared {
     pub username: Option<String>,
     /// Optional. Available sizes of the chat photo, if the photo was requested by the bot
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub photo: Option<Vec<PhotoSize>>,
+    pub photo: Option<ShortVec<PhotoSize, 4>>,
 }
 
 /// Describes a checklist.
@@ -1219,7 +1472,7 @@ pub struct Checklist {
     pub title: String,
     /// Optional. Special entities that appear in the checklist title
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub title_entities: Option<Vec<MessageEntity>>,
+    pub title_entities: Option<ShortVec<MessageEntity, 2>>,
     /// List of tasks in the checklist
     pub tasks: Vec<ChecklistTask>,
     /// Optional. True, if users other than the creator of the list can add tasks to the list
@@ -1240,10 +1493,10 @@ pub struct ChecklistTask {
     pub text: String,
     /// Optional. Special entities that appear in the task text
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub text_entities: Option<Vec<MessageEntity>>,
+    pub text_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. User that completed the task; omitted if the task wasn't completed by a user
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub completed_by_user: Option<Box<User>>,
+    pub completed_by_user: Option<User>,
     /// Optional. Chat that completed the task; omitted if the task wasn't completed by a chat
     #[serde(skip_serializing_if = "Option::is_none")]
     pub completed_by_chat: Option<Box<Chat>>,
@@ -1353,7 +1606,7 @@ pub struct DirectMessagesTopic {
     pub topic_id: i64,
     /// Optional. Information about the user that created the topic. Currently, it is always present
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub user: Option<Box<User>>,
+    pub user: Option<User>,
 }
 
 /// This object represents a general file (as opposed to photos, voice messages and audio files).
@@ -1366,7 +1619,7 @@ pub struct Document {
     pub file_unique_id: String,
     /// Optional. Document thumbnail as defined by the sender
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail: Option<Box<PhotoSize>>,
+    pub thumbnail: Option<PhotoSize>,
     /// Optional. Original filename as defined by the sender
     #[serde(skip_serializing_if = "Option::is_none")]
     pub file_name: Option<String>,
@@ -1396,7 +1649,7 @@ pub struct EncryptedCredentials {
 pub struct EncryptedPassportElement {
     /// Element type. One of "personal_details", "passport", "driver_license", "identity_card", "internal_passport", "address", "utility_bill", "bank_statement", "rental_agreement", "passport_registration", "temporary_registration", "phone_number", "email".
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: EncryptedPassportElementType,
     /// Optional. Base64-encoded encrypted Telegram Passport element data provided by the user; available only for "personal_details", "passport", "driver_license", "identity_card", "internal_passport" and "address" types. Can be decrypted and verified using the accompanying EncryptedCredentials.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub data: Option<String>,
@@ -1411,7 +1664,7 @@ pub struct EncryptedPassportElement {
     pub files: Option<Vec<PassportFile>>,
     /// Optional. Encrypted file with the front side of the document, provided by the user; available only for "passport", "driver_license", "identity_card" and "internal_passport". The file can be decrypted and verified using the accompanying EncryptedCredentials.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub front_side: Option<Box<PassportFile>>,
+    pub front_side: Option<PassportFile>,
     /// Optional. Encrypted file with the reverse side of the document, provided by the user; available only for "driver_license" and "identity_card". The file can be decrypted and verified using the accompanying EncryptedCredentials.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub reverse_side: Option<Box<PassportFile>>,
@@ -1425,6 +1678,128 @@ pub struct EncryptedPassportElement {
     pub hash: String,
 }
 
+/// Values of `EncryptedPassportElement.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum EncryptedPassportElementType {
+    /// `"personal_details"`
+    PersonalDetails,
+    /// `"passport"`
+    Passport,
+    /// `"driver_license"`
+    DriverLicense,
+    /// `"identity_card"`
+    IdentityCard,
+    /// `"internal_passport"`
+    InternalPassport,
+    /// `"address"`
+    Address,
+    /// `"utility_bill"`
+    UtilityBill,
+    /// `"bank_statement"`
+    BankStatement,
+    /// `"rental_agreement"`
+    RentalAgreement,
+    /// `"passport_registration"`
+    PassportRegistration,
+    /// `"temporary_registration"`
+    TemporaryRegistration,
+    /// `"phone_number"`
+    PhoneNumber,
+    /// `"email"`
+    Email,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl EncryptedPassportElementType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::PersonalDetails => "personal_details",
+            Self::Passport => "passport",
+            Self::DriverLicense => "driver_license",
+            Self::IdentityCard => "identity_card",
+            Self::InternalPassport => "internal_passport",
+            Self::Address => "address",
+            Self::UtilityBill => "utility_bill",
+            Self::BankStatement => "bank_statement",
+            Self::RentalAgreement => "rental_agreement",
+            Self::PassportRegistration => "passport_registration",
+            Self::TemporaryRegistration => "temporary_registration",
+            Self::PhoneNumber => "phone_number",
+            Self::Email => "email",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for EncryptedPassportElementType {
+    fn from(value: &str) -> Self {
+        match value {
+            "personal_details" => Self::PersonalDetails,
+            "passport" => Self::Passport,
+            "driver_license" => Self::DriverLicense,
+            "identity_card" => Self::IdentityCard,
+            "internal_passport" => Self::InternalPassport,
+            "address" => Self::Address,
+            "utility_bill" => Self::UtilityBill,
+            "bank_statement" => Self::BankStatement,
+            "rental_agreement" => Self::RentalAgreement,
+            "passport_registration" => Self::PassportRegistration,
+            "temporary_registration" => Self::TemporaryRegistration,
+            "phone_number" => Self::PhoneNumber,
+            "email" => Self::Email,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for EncryptedPassportElementType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for EncryptedPassportElementType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for EncryptedPassportElementType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for EncryptedPassportElementType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for EncryptedPassportElementType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = EncryptedPassportElementType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<EncryptedPassportElementType, E> {
+                Ok(EncryptedPassportElementType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object contains information about a message that is being replied to, which may come from another chat or forum topic.
 /// https://core.telegram.org/bots/api#externalreplyinfo
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -1454,7 +1829,7 @@ pub struct ExternalReplyInfo {
     pub paid_media: Option<Box<PaidMediaInfo>>,
     /// Optional. Message is a photo, available sizes of the photo
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub photo: Option<Vec<PhotoSize>>,
+    pub photo: Option<ShortVec<PhotoSize, 4>>,
     /// Optional. Message is a sticker, information about the sticker
     #[serde(skip_serializing_if = "Option::is_none")]
     pub sticker: Option<Box<Sticker>>,
@@ -1547,7 +1922,7 @@ pub struct ForumTopic {
     pub icon_color: i64,
     /// Optional. Unique identifier of the custom emoji shown as the topic icon
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub icon_custom_emoji_id: Option<String>,
+    pub icon_custom_emoji_id: Option<ShortString>,
     /// Optional. True, if the name of the topic wasn't specified explicitly by its creator and likely needs to be changed by the bot
     #[serde(skip_serializing_if = "Option::is_none")]
     pub is_name_implicit: Option<bool>,
@@ -1568,7 +1943,7 @@ pub struct ForumTopicCreated {
     pub icon_color: i64,
     /// Optional. Unique identifier of the custom emoji shown as the topic icon
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub icon_custom_emoji_id: Option<String>,
+    pub icon_custom_emoji_id: Option<ShortString>,
     /// Optional. True, if the name of the topic wasn't specified explicitly by its creator and likely needs to be changed by the bot
     #[serde(skip_serializing_if = "Option::is_none")]
     pub is_name_implicit: Option<bool>,
@@ -1583,7 +1958,7 @@ pub struct ForumTopicEdited {
     pub name: Option<String>,
     /// Optional. New identifier of the custom emoji shown as the topic icon, if it was edited; an empty string if the icon was removed
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub icon_custom_emoji_id: Option<String>,
+    pub icon_custom_emoji_id: Option<ShortString>,
 }
 
 /// This object represents a service message about a forum topic reopened in the chat. Currently holds no information.
@@ -1600,13 +1975,13 @@ pub struct Game {
     /// Description of the game
     pub description: String,
     /// Photo that will be displayed in the game message in chats.
-    pub photo: Vec<PhotoSize>,
+    pub photo: ShortVec<PhotoSize, 4>,
     /// Optional. Brief description of the game or high scores included in the game message. Can be automatically edited to include current high scores for the game when the bot calls setGameScore, or manually edited using editMessageText. 0-4096 characters.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub text: Option<String>,
     /// Optional. Special entities that appear in text, such as usernames, URLs, bot commands, etc.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub text_entities: Option<Vec<MessageEntity>>,
+    pub text_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Animation that will be displayed in the game message in chats. Upload via BotFather
     #[serde(skip_serializing_if = "Option::is_none")]
     pub animation: Option<Box<Animation>>,
@@ -1714,7 +2089,7 @@ pub struct GiftInfo {
     pub text: Option<String>,
     /// Optional. Special entities that appear in the text
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub entities: Option<Vec<MessageEntity>>,
+    pub entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. True, if the sender and gift text are shown only to the gift receiver; otherwise, everyone will be able to see them
     #[serde(skip_serializing_if = "Option::is_none")]
     pub is_private: Option<bool>,
@@ -1844,10 +2219,10 @@ pub struct InlineKeyboardButton {
     pub text: String,
     /// Optional. Unique identifier of the custom emoji shown before the text of the button. Can only be used by bots that purchased additional usernames on Fragment or in the messages directly sent by the bot to private, group and supergroup chats if the owner of the bot has a Telegram Premium subscription.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub icon_custom_emoji_id: Option<String>,
+    pub icon_custom_emoji_id: Option<ShortString>,
     /// Optional. Style of the button. Must be one of "danger" (red), "success" (green) or "primary" (blue). If omitted, then an app-specific style is used.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub style: Option<String>,
+    pub style: Option<InlineKeyboardButtonStyle>,
     /// Optional. HTTP or tg:// URL to be opened when the button is pressed. Links tg://user?id=<user_id> can be used to mention a user by their identifier without using a username, if this is allowed by their privacy settings.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub url: Option<String>,
@@ -1856,7 +2231,7 @@ pub struct InlineKeyboardButton {
     pub callback_data: Option<String>,
     /// Optional. Description of the Web App that will be launched when the user presses the button. The Web App will be able to send an arbitrary message on behalf of the user using the method answerWebAppQuery. Available only in private chats between a user and the bot. Not supported for messages sent on behalf of a Telegram Business account.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub web_app: Option<Box<WebAppInfo>>,
+    pub web_app: Option<WebAppInfo>,
     /// Optional. An HTTPS URL used to automatically authorize the user. Can be used as a replacement for the Telegram Login Widget.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub login_url: Option<Box<LoginUrl>>,
@@ -1871,15 +2246,97 @@ pub struct InlineKeyboardButton {
     pub switch_inline_query_chosen_chat: Option<Box<SwitchInlineQueryChosenChat>>,
     /// Optional. Description of the button that copies the specified text to the clipboard.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub copy_text: Option<Box<CopyTextButton>>,
+    pub copy_text: Option<CopyTextButton>,
     /// Optional. Description of the game that will be launched when the user presses the button. NOTE: This type of button must always be the first button in the first row.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub callback_game: Option<Box<CallbackGame>>,
+    pub callback_game: Option<CallbackGame>,
     /// Optional. Specify True, to send a Pay button. Substrings "⭐" and "XTR" in the buttons's text will be replaced with a Telegram Star icon. NOTE: This type of button must always be the first button in the first row and can only be used in invoice messages.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub pay: Option<bool>,
 }
 
+/// Values of `InlineKeyboardButton.style`, `KeyboardButton.style`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InlineKeyboardButtonStyle {
+    /// `"danger"`
+    Danger,
+    /// `"success"`
+    Success,
+    /// `"primary"`
+    Primary,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InlineKeyboardButtonStyle {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Danger => "danger",
+            Self::Success => "success",
+            Self::Primary => "primary",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InlineKeyboardButtonStyle {
+    fn from(value: &str) -> Self {
+        match value {
+            "danger" => Self::Danger,
+            "success" => Self::Success,
+            "primary" => Self::Primary,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InlineKeyboardButtonStyle {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InlineKeyboardButtonStyle {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InlineKeyboardButtonStyle {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InlineKeyboardButtonStyle {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InlineKeyboardButtonStyle {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InlineKeyboardButtonStyle;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<InlineKeyboardButtonStyle, E> {
+                Ok(InlineKeyboardButtonStyle::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object represents an inline keyboard that appears right next to the message it belongs to.
 /// https://core.telegram.org/bots/api#inlinekeyboardmarkup
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -1902,12 +2359,99 @@ pub struct InlineQuery {
     pub offset: String,
     /// Optional. Type of the chat from which the inline query was sent. Can be either "sender" for a private chat with the inline query sender, "private", "group", "supergroup", or "channel". The chat type should be always known for requests sent from official clients and most third-party clients, unless the request was sent from a secret chat
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub chat_type: Option<String>,
+    pub chat_type: Option<InlineQueryChatType>,
     /// Optional. Sender location, only for bots that request user location
     #[serde(skip_serializing_if = "Option::is_none")]
     pub location: Option<Box<Location>>,
 }
 
+/// Values of `InlineQuery.chat_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InlineQueryChatType {
+    /// `"sender"`
+    Sender,
+    /// `"private"`
+    Private,
+    /// `"group"`
+    Group,
+    /// `"supergroup"`
+    Supergroup,
+    /// `"channel"`
+    Channel,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InlineQueryChatType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Sender => "sender",
+            Self::Private => "private",
+            Self::Group => "group",
+            Self::Supergroup => "supergroup",
+            Self::Channel => "channel",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InlineQueryChatType {
+    fn from(value: &str) -> Self {
+        match value {
+            "sender" => Self::Sender,
+            "private" => Self::Private,
+            "group" => Self::Group,
+            "supergroup" => Self::Supergroup,
+            "channel" => Self::Channel,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InlineQueryChatType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InlineQueryChatType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InlineQueryChatType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InlineQueryChatType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InlineQueryChatType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InlineQueryChatType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<InlineQueryChatType, E> {
+                Ok(InlineQueryChatType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object represents one result of an inline query. Telegram clients currently support results of the following 20 types:
 /// - InlineQueryResultCachedAudio
 /// - InlineQueryResultCachedDocument
@@ -1931,7 +2475,7 @@ pub struct InlineQuery {
 /// - InlineQueryResultVoice
 /// Note: All URLs passed in inline query results will be available to end users and therefore must be assumed to be public.
 /// https://core.telegram.org/bots/api#inlinequeryresult
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum InlineQueryResult {
     InlineQueryResultCachedAudio(InlineQueryResultCachedAudio),
@@ -1956,6 +2500,76 @@ pub enum InlineQueryResult {
     InlineQueryResultVoice(InlineQueryResultVoice),
 }
 
+impl<'de> Deserialize<'de> for InlineQueryResult {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedAudio(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedDocument(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedGif(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedMpeg4Gif(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedPhoto(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedSticker(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedVideo(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultCachedVoice(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultArticle(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultAudio(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultContact(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultGame(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultDocument(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultGif(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultLocation(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultMpeg4Gif(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultPhoto(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultVenue(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultVideo(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InlineQueryResultVoice(v));
+        }
+        Err(D::Error::custom(
+            "data did not match any variant of untagged enum InlineQueryResult",
+        ))
+    }
+}
+
 /// Represents a link to an article or web page.
 /// https://core.telegram.org/bots/api#inlinequeryresultarticle
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -2010,7 +2624,7 @@ pub struct InlineQueryResultAudio {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Performer
     #[serde(skip_serializing_if = "Option::is_none")]
     pub performer: Option<String>,
@@ -2019,7 +2633,7 @@ pub struct InlineQueryResultAudio {
     pub audio_duration: Option<i64>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the audio
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2044,10 +2658,10 @@ pub struct InlineQueryResultCachedAudio {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the audio
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2077,10 +2691,10 @@ pub struct InlineQueryResultCachedDocument {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the file
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2108,13 +2722,13 @@ pub struct InlineQueryResultCachedGif {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the GIF animation
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2142,13 +2756,13 @@ pub struct InlineQueryResultCachedMpeg4Gif {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the video animation
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2179,13 +2793,13 @@ pub struct InlineQueryResultCachedPhoto {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the photo
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2204,7 +2818,7 @@ pub struct InlineQueryResultCachedSticker {
     pub sticker_file_id: String,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the sticker
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2234,13 +2848,13 @@ pub struct InlineQueryResultCachedVideo {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the video
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2267,10 +2881,10 @@ pub struct InlineQueryResultCachedVoice {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the voice message
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2297,7 +2911,7 @@ pub struct InlineQueryResultContact {
     pub vcard: Option<String>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the contact
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2331,11 +2945,11 @@ pub struct InlineQueryResultDocument {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// A valid URL for the file
     pub document_url: String,
     /// MIME type of the content of the file, either "application/pdf" or "application/zip"
-    pub mime_type: String,
+    pub mime_type: InlineQueryResultDocumentMimeType,
     /// Optional. Short description of the result
     #[serde(skip_serializing_if = "Option::is_none")]
     pub description: Option<String>,
@@ -2356,6 +2970,84 @@ pub struct InlineQueryResultDocument {
     pub thumbnail_height: Option<i64>,
 }
 
+/// Values of `InlineQueryResultDocument.mime_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InlineQueryResultDocumentMimeType {
+    /// `"application/pdf"`
+    ApplicationPdf,
+    /// `"application/zip"`
+    ApplicationZip,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InlineQueryResultDocumentMimeType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::ApplicationPdf => "application/pdf",
+            Self::ApplicationZip => "application/zip",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InlineQueryResultDocumentMimeType {
+    fn from(value: &str) -> Self {
+        match value {
+            "application/pdf" => Self::ApplicationPdf,
+            "application/zip" => Self::ApplicationZip,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InlineQueryResultDocumentMimeType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InlineQueryResultDocumentMimeType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InlineQueryResultDocumentMimeType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InlineQueryResultDocumentMimeType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InlineQueryResultDocumentMimeType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InlineQueryResultDocumentMimeType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<InlineQueryResultDocumentMimeType, E> {
+                Ok(InlineQueryResultDocumentMimeType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents a Game.
 /// https://core.telegram.org/bots/api#inlinequeryresultgame
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -2369,7 +3061,7 @@ pub struct InlineQueryResultGame {
     pub game_short_name: String,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
 }
 
 /// Represents a link to an animated GIF file. By default, this animated GIF file will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation.
@@ -2396,7 +3088,7 @@ pub struct InlineQueryResultGif {
     pub thumbnail_url: String,
     /// Optional. MIME type of the thumbnail, must be one of "image/jpeg", "image/gif", or "video/mp4". Defaults to "image/jpeg"
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail_mime_type: Option<String>,
+    pub thumbnail_mime_type: Option<InlineQueryResultGifThumbnailMimeType>,
     /// Optional. Title for the result
     #[serde(skip_serializing_if = "Option::is_none")]
     pub title: Option<String>,
@@ -2408,7 +3100,7 @@ pub struct InlineQueryResultGif {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2420,6 +3112,88 @@ pub struct InlineQueryResultGif {
     pub input_message_content: Option<Box<InputMessageContent>>,
 }
 
+/// Values of `InlineQueryResultGif.thumbnail_mime_type`, `InlineQueryResultMpeg4Gif.thumbnail_mime_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InlineQueryResultGifThumbnailMimeType {
+    /// `"image/jpeg"`
+    ImageJpeg,
+    /// `"image/gif"`
+    ImageGif,
+    /// `"video/mp4"`
+    VideoMp4,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InlineQueryResultGifThumbnailMimeType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::ImageJpeg => "image/jpeg",
+            Self::ImageGif => "image/gif",
+            Self::VideoMp4 => "video/mp4",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InlineQueryResultGifThumbnailMimeType {
+    fn from(value: &str) -> Self {
+        match value {
+            "image/jpeg" => Self::ImageJpeg,
+            "image/gif" => Self::ImageGif,
+            "video/mp4" => Self::VideoMp4,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InlineQueryResultGifThumbnailMimeType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InlineQueryResultGifThumbnailMimeType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InlineQueryResultGifThumbnailMimeType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InlineQueryResultGifThumbnailMimeType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InlineQueryResultGifThumbnailMimeType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InlineQueryResultGifThumbnailMimeType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<InlineQueryResultGifThumbnailMimeType, E> {
+                Ok(InlineQueryResultGifThumbnailMimeType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents a location on a map. By default, the location will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the location.
 /// https://core.telegram.org/bots/api#inlinequeryresultlocation
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -2449,7 +3223,7 @@ pub struct InlineQueryResultLocation {
     pub proximity_alert_radius: Option<i64>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the location
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2488,7 +3262,7 @@ pub struct InlineQueryResultMpeg4Gif {
     pub thumbnail_url: String,
     /// Optional. MIME type of the thumbnail, must be one of "image/jpeg", "image/gif", or "video/mp4". Defaults to "image/jpeg"
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail_mime_type: Option<String>,
+    pub thumbnail_mime_type: Option<InlineQueryResultGifThumbnailMimeType>,
     /// Optional. Title for the result
     #[serde(skip_serializing_if = "Option::is_none")]
     pub title: Option<String>,
@@ -2500,7 +3274,7 @@ pub struct InlineQueryResultMpeg4Gif {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2545,7 +3319,7 @@ pub struct InlineQueryResultPhoto {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2615,7 +3389,7 @@ pub struct InlineQueryResultVideo {
     /// A valid URL for the embedded video player or video file
     pub video_url: String,
     /// MIME type of the content of the video URL, "text/html" or "video/mp4"
-    pub mime_type: String,
+    pub mime_type: InlineQueryResultVideoMimeType,
     /// URL of the thumbnail (JPEG only) for the video
     pub thumbnail_url: String,
     /// Title for the result
@@ -2628,7 +3402,7 @@ pub struct InlineQueryResultVideo {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2652,6 +3426,84 @@ pub struct InlineQueryResultVideo {
     pub input_message_content: Option<Box<InputMessageContent>>,
 }
 
+/// Values of `InlineQueryResultVideo.mime_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InlineQueryResultVideoMimeType {
+    /// `"text/html"`
+    TextHtml,
+    /// `"video/mp4"`
+    VideoMp4,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InlineQueryResultVideoMimeType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::TextHtml => "text/html",
+            Self::VideoMp4 => "video/mp4",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InlineQueryResultVideoMimeType {
+    fn from(value: &str) -> Self {
+        match value {
+            "text/html" => Self::TextHtml,
+            "video/mp4" => Self::VideoMp4,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InlineQueryResultVideoMimeType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InlineQueryResultVideoMimeType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InlineQueryResultVideoMimeType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InlineQueryResultVideoMimeType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InlineQueryResultVideoMimeType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InlineQueryResultVideoMimeType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<InlineQueryResultVideoMimeType, E> {
+                Ok(InlineQueryResultVideoMimeType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents a link to a voice recording in an .OGG container encoded with OPUS. By default, this voice recording will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the the voice message.
 /// https://core.telegram.org/bots/api#inlinequeryresultvoice
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -2673,13 +3525,13 @@ pub struct InlineQueryResultVoice {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Recording duration in seconds
     #[serde(skip_serializing_if = "Option::is_none")]
     pub voice_duration: Option<i64>,
     /// Optional. Inline keyboard attached to the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    pub reply_markup: Option<InlineKeyboardMarkup>,
     /// Optional. Content of the message to be sent instead of the voice recording
     #[serde(skip_serializing_if = "Option::is_none")]
     pub input_message_content: Option<Box<InputMessageContent>>,
@@ -2693,7 +3545,7 @@ pub struct InlineQueryResultsButton {
     pub text: String,
     /// Optional. Description of the Web App that will be launched when the user presses the button. The Web App will be able to switch back to the inline mode using the method switchInlineQuery inside the Web App.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub web_app: Option<Box<WebAppInfo>>,
+    pub web_app: Option<WebAppInfo>,
     /// Optional. Deep-linking parameter for the /start message sent to the bot when a user presses the button. 1-64 characters, only A-Z, a-z, 0-9, _ and - are allowed. Example: An inline bot that sends YouTube videos can ask the user to connect the bot to their YouTube account to adapt search results accordingly. To do this, it displays a 'Connect your YouTube account' button above the results, or even before showing any. The user presses the button, switches to a private chat with the bot and, in doing so, passes a start parameter that instructs the bot to return an OAuth link. Once done, the bot can offer a switch_inline button so that the user can easily return to the chat where they wanted to use the bot's inline capabilities.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub start_parameter: Option<String>,
@@ -2710,7 +3562,7 @@ pub struct InputChecklist {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the title, which can be specified instead of parse_mode. Currently, only bold, italic, underline, strikethrough, spoiler, and custom_emoji entities are allowed.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub title_entities: Option<Vec<MessageEntity>>,
+    pub title_entities: Option<ShortVec<MessageEntity, 2>>,
     /// List of 1-30 tasks in the checklist
     pub tasks: Vec<InputChecklistTask>,
     /// Optional. Pass True if other users can add tasks to the checklist
@@ -2734,7 +3586,7 @@ pub struct InputChecklistTask {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the text, which can be specified instead of parse_mode. Currently, only bold, italic, underline, strikethrough, spoiler, and custom_emoji entities are allowed.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub text_entities: Option<Vec<MessageEntity>>,
+    pub text_entities: Option<ShortVec<MessageEntity, 2>>,
 }
 
 /// Represents the content of a contact message to be sent as the result of an inline query.
@@ -2767,9 +3619,9 @@ pub struct InputInvoiceMessageContent {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub provider_token: Option<String>,
     /// Three-letter ISO 4217 currency code, see more on currencies. Pass "XTR" for payments in Telegram Stars.
-    pub currency: String,
+    pub currency: ShortString,
     /// Price breakdown, a JSON-serialized list of components (e.g. product price, tax, discount, delivery cost, delivery tax, bonus, etc.). Must contain exactly one item for payments in Telegram Stars.
-    pub prices: Vec<LabeledPrice>,
+    pub prices: ShortVec<LabeledPrice, 4>,
     /// Optional. The maximum accepted amount for tips in the smallest units of the currency (integer, not float/double). For example, for a maximum tip of US$ 1.45 pass max_tip_amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies). Defaults to 0. Not supported for payments in Telegram Stars.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub max_tip_amount: Option<i64>,
@@ -2856,7 +3708,7 @@ pub struct InputMediaAnimation {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2894,7 +3746,7 @@ pub struct InputMediaAudio {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Duration of the audio in seconds
     #[serde(skip_serializing_if = "Option::is_none")]
     pub duration: Option<i64>,
@@ -2926,7 +3778,7 @@ pub struct InputMediaDocument {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Disables automatic server-side content type detection for files uploaded using multipart/form-data. Always True, if the document is sent as part of an album.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub disable_content_type_detection: Option<bool>,
@@ -2949,7 +3801,7 @@ pub struct InputMediaPhoto {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -2984,7 +3836,7 @@ pub struct InputMediaVideo {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Pass True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -3012,7 +3864,7 @@ pub struct InputMediaVideo {
 /// - InputContactMessageContent
 /// - InputInvoiceMessageContent
 /// https://core.telegram.org/bots/api#inputmessagecontent
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum InputMessageContent {
     InputTextMessageContent(InputTextMessageContent),
@@ -3022,17 +3874,63 @@ pub enum InputMessageContent {
     InputInvoiceMessageContent(InputInvoiceMessageContent),
 }
 
+impl<'de> Deserialize<'de> for InputMessageContent {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InputTextMessageContent(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InputLocationMessageContent(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InputVenueMessageContent(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InputContactMessageContent(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InputInvoiceMessageContent(v));
+        }
+        Err(D::Error::custom(
+            "data did not match any variant of untagged enum InputMessageContent",
+        ))
+    }
+}
+
 /// This object describes the paid media to be sent. Currently, it can be one of
 /// - InputPaidMediaPhoto
 /// - InputPaidMediaVideo
 /// https://core.telegram.org/bots/api#inputpaidmedia
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum InputPaidMedia {
     InputPaidMediaPhoto(InputPaidMediaPhoto),
     InputPaidMediaVideo(InputPaidMediaVideo),
 }
 
+impl<'de> Deserialize<'de> for InputPaidMedia {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["photo", "video"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("photo") => serde_json::from_str(raw.get()).map(Self::InputPaidMediaPhoto),
+            Some("video") => serde_json::from_str(raw.get()).map(Self::InputPaidMediaVideo),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The paid media to send is a photo.
 /// https://core.telegram.org/bots/api#inputpaidmediaphoto
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3087,20 +3985,43 @@ pub struct InputPollOption {
     pub text_parse_mode: Option<String>,
     /// Optional. A JSON-serialized list of special entities that appear in the poll option text. It can be specified instead of text_parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub text_entities: Option<Vec<MessageEntity>>,
+    pub text_entities: Option<ShortVec<MessageEntity, 2>>,
 }
 
 /// This object describes a profile photo to set. Currently, it can be one of
 /// - InputProfilePhotoStatic
 /// - InputProfilePhotoAnimated
 /// https://core.telegram.org/bots/api#inputprofilephoto
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum InputProfilePhoto {
     InputProfilePhotoStatic(InputProfilePhotoStatic),
     InputProfilePhotoAnimated(InputProfilePhotoAnimated),
 }
 
+impl<'de> Deserialize<'de> for InputProfilePhoto {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["static", "animated"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("static") => serde_json::from_str(raw.get()).map(Self::InputProfilePhotoStatic),
+            Some("animated") => {
+                serde_json::from_str(raw.get()).map(Self::InputProfilePhotoAnimated)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// An animated profile photo in the MPEG4 format.
 /// https://core.telegram.org/bots/api#inputprofilephotoanimated
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3133,28 +4054,128 @@ pub struct InputSticker {
     /// The added sticker. Pass a file_id as a String to send a file that already exists on the Telegram servers, pass an HTTP URL as a String for Telegram to get a file from the Internet, or pass "attach://<file_attach_name>" to upload a new file using multipart/form-data under <file_attach_name> name. Animated and video stickers can't be uploaded via HTTP URL. More information on Sending Files: https://core.telegram.org/bots/api#sending-files
     pub sticker: String,
     /// Format of the added sticker, must be one of "static" for a .WEBP or .PNG image, "animated" for a .TGS animation, "video" for a .WEBM video
-    pub format: String,
+    pub format: InputStickerFormat,
     /// List of 1-20 emoji associated with the sticker
     pub emoji_list: Vec<String>,
     /// Optional. Position where the mask should be placed on faces. For "mask" stickers only.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub mask_position: Option<Box<MaskPosition>>,
+    pub mask_position: Option<MaskPosition>,
     /// Optional. List of 0-20 search keywords for the sticker with total length of up to 64 characters. For "regular" and "custom_emoji" stickers only.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub keywords: Option<Vec<String>>,
 }
 
+/// Values of `InputSticker.format`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum InputStickerFormat {
+    /// `"static"`
+    Static,
+    /// `"animated"`
+    Animated,
+    /// `"video"`
+    Video,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl InputStickerFormat {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Static => "static",
+            Self::Animated => "animated",
+            Self::Video => "video",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for InputStickerFormat {
+    fn from(value: &str) -> Self {
+        match value {
+            "static" => Self::Static,
+            "animated" => Self::Animated,
+            "video" => Self::Video,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for InputStickerFormat {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for InputStickerFormat {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for InputStickerFormat {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for InputStickerFormat {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for InputStickerFormat {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = InputStickerFormat;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<InputStickerFormat, E> {
+                Ok(InputStickerFormat::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object describes the content of a story to post. Currently, it can be one of
 /// - InputStoryContentPhoto
 /// - InputStoryContentVideo
 /// https://core.telegram.org/bots/api#inputstorycontent
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum InputStoryContent {
     InputStoryContentPhoto(InputStoryContentPhoto),
     InputStoryContentVideo(InputStoryContentVideo),
 }
 
+impl<'de> Deserialize<'de> for InputStoryContent {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["photo", "video"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("photo") => serde_json::from_str(raw.get()).map(Self::InputStoryContentPhoto),
+            Some("video") => serde_json::from_str(raw.get()).map(Self::InputStoryContentVideo),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Describes a photo to post as a story.
 /// https://core.telegram.org/bots/api#inputstorycontentphoto
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3197,10 +4218,10 @@ pub struct InputTextMessageContent {
     pub parse_mode: Option<String>,
     /// Optional. List of special entities that appear in message text, which can be specified instead of parse_mode
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub entities: Option<Vec<MessageEntity>>,
+    pub entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Link preview generation options for the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub link_preview_options: Option<Box<LinkPreviewOptions>>,
+    pub link_preview_options: Option<LinkPreviewOptions>,
 }
 
 /// Represents the content of a venue message to be sent as the result of an inline query.
@@ -3240,7 +4261,7 @@ pub struct Invoice {
     /// Unique bot deep-linking parameter that can be used to generate this invoice
     pub start_parameter: String,
     /// Three-letter ISO 4217 currency code, or "XTR" for payments in Telegram Stars
-    pub currency: String,
+    pub currency: ShortString,
     /// Total price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     pub total_amount: i64,
 }
@@ -3253,16 +4274,16 @@ pub struct KeyboardButton {
     pub text: String,
     /// Optional. Unique identifier of the custom emoji shown before the text of the button. Can only be used by bots that purchased additional usernames on Fragment or in the messages directly sent by the bot to private, group and supergroup chats if the owner of the bot has a Telegram Premium subscription.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub icon_custom_emoji_id: Option<String>,
+    pub icon_custom_emoji_id: Option<ShortString>,
     /// Optional. Style of the button. Must be one of "danger" (red), "success" (green) or "primary" (blue). If omitted, then an app-specific style is used.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub style: Option<String>,
+    pub style: Option<InlineKeyboardButtonStyle>,
     /// Optional. If specified, pressing the button will open a list of suitable users. Identifiers of selected users will be sent to the bot in a "users_shared" service message. Available in private chats only.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub request_users: Option<Box<KeyboardButtonRequestUsers>>,
+    pub request_users: Option<KeyboardButtonRequestUsers>,
     /// Optional. If specified, pressing the button will open a list of suitable chats. Tapping on a chat will send its identifier to the bot in a "chat_shared" service message. Available in private chats only.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub request_chat: Option<Box<KeyboardButtonRequestChat>>,
+    pub request_chat: Option<KeyboardButtonRequestChat>,
     /// Optional. If True, the user's phone number will be sent as a contact when the button is pressed. Available in private chats only.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub request_contact: Option<bool>,
@@ -3271,10 +4292,10 @@ pub struct KeyboardButton {
     pub request_location: Option<bool>,
     /// Optional. If specified, the user will be asked to create a poll and send it to the bot when the button is pressed. Available in private chats only.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub request_poll: Option<Box<KeyboardButtonPollType>>,
+    pub request_poll: Option<KeyboardButtonPollType>,
     /// Optional. If specified, the described Web App will be launched when the button is pressed. The Web App will be able to send a "web_app_data" service message. Available in private chats only.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub web_app: Option<Box<WebAppInfo>>,
+    pub web_app: Option<WebAppInfo>,
 }
 
 /// This object represents type of a poll, which is allowed to be created and sent when the corresponding button is pressed.
@@ -3306,10 +4327,10 @@ pub struct KeyboardButtonRequestChat {
     pub chat_is_created: Option<bool>,
     /// Optional. A JSON-serialized object listing the required administrator rights of the user in the chat. The rights must be a superset of bot_administrator_rights. If not specified, no additional restrictions are applied.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub user_administrator_rights: Option<Box<ChatAdministratorRights>>,
+    pub user_administrator_rights: Option<ChatAdministratorRights>,
     /// Optional. A JSON-serialized object listing the required administrator rights of the bot in the chat. The rights must be a subset of user_administrator_rights. If not specified, no additional restrictions are applied.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub bot_administrator_rights: Option<Box<ChatAdministratorRights>>,
+    pub bot_administrator_rights: Option<ChatAdministratorRights>,
     /// Optional. Pass True to request a chat with the bot as a member. Otherwise, no additional restrictions are applied.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub bot_is_member: Option<bool>,
@@ -3408,7 +4429,7 @@ pub struct Location {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct LocationAddress {
     /// The two-letter ISO 3166-1 alpha-2 country code of the country where the location is located
-    pub country_code: String,
+    pub country_code: ShortString,
     /// Optional. State of the location
     #[serde(skip_serializing_if = "Option::is_none")]
     pub state: Option<String>,
@@ -3443,7 +4464,7 @@ pub struct LoginUrl {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct MaskPosition {
     /// The part of the face relative to which the mask should be placed. One of "forehead", "eyes", "mouth", or "chin".
-    pub point: String,
+    pub point: MaskPositionPoint,
     /// Shift by X-axis measured in widths of the mask scaled to the face size, from left to right. For example, choosing -1.0 will place mask just to the left of the default mask position.
     pub x_shift: f64,
     /// Shift by Y-axis measured in heights of the mask scaled to the face size, from top to bottom. For example, 1.0 will place the mask just below the default mask position.
@@ -3452,24 +4473,123 @@ pub struct MaskPosition {
     pub scale: f64,
 }
 
+/// Values of `MaskPosition.point`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum MaskPositionPoint {
+    /// `"forehead"`
+    Forehead,
+    /// `"eyes"`
+    Eyes,
+    /// `"mouth"`
+    Mouth,
+    /// `"chin"`
+    Chin,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl MaskPositionPoint {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Forehead => "forehead",
+            Self::Eyes => "eyes",
+            Self::Mouth => "mouth",
+            Self::Chin => "chin",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for MaskPositionPoint {
+    fn from(value: &str) -> Self {
+        match value {
+            "forehead" => Self::Forehead,
+            "eyes" => Self::Eyes,
+            "mouth" => Self::Mouth,
+            "chin" => Self::Chin,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for MaskPositionPoint {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for MaskPositionPoint {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for MaskPositionPoint {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for MaskPositionPoint {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for MaskPositionPoint {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = MaskPositionPoint;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<MaskPositionPoint, E> {
+                Ok(MaskPositionPoint::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object describes a message that can be inaccessible to the bot. It can be one of
 /// - Message
 /// - InaccessibleMessage
 /// https://core.telegram.org/bots/api#maybeinaccessiblemessage
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum MaybeInaccessibleMessage {
     Message(Message),
     InaccessibleMessage(InaccessibleMessage),
 }
 
+impl<'de> Deserialize<'de> for MaybeInaccessibleMessage {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::Message(v));
+        }
+        if let Ok(v) = serde_json::from_str(raw.get()) {
+            return Ok(Self::InaccessibleMessage(v));
+        }
+        Err(D::Error::custom(
+            "data did not match any variant of untagged enum MaybeInaccessibleMessage",
+        ))
+    }
+}
+
 /// This object describes the bot's menu button in a private chat. It should be one of
 /// - MenuButtonCommands
 /// - MenuButtonWebApp
 /// - MenuButtonDefault
 /// If a menu button other than MenuButtonDefault is set for a private chat, then it is applied in the chat. Otherwise the default menu button is applied. By default, the menu button opens the list of bot commands.
 /// https://core.telegram.org/bots/api#menubutton
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum MenuButton {
     MenuButtonCommands(MenuButtonCommands),
@@ -3477,6 +4597,28 @@ pub enum MenuButton {
     MenuButtonDefault(MenuButtonDefault),
 }
 
+impl<'de> Deserialize<'de> for MenuButton {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["commands", "web_app", "default"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("commands") => serde_json::from_str(raw.get()).map(Self::MenuButtonCommands),
+            Some("web_app") => serde_json::from_str(raw.get()).map(Self::MenuButtonWebApp),
+            Some("default") => serde_json::from_str(raw.get()).map(Self::MenuButtonDefault),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Represents a menu button, which opens the bot's list of commands.
 /// https://core.telegram.org/bots/api#menubuttoncommands
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3510,7 +4652,7 @@ pub struct MenuButtonWebApp {
 
 /// This object represents a message.
 /// https://core.telegram.org/bots/api#message
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 pub struct Message {
     /// Unique message identifier inside this chat. In specific instances (e.g., message containing a video sent to a big chat), the server might automatically schedule a message instead of sending it immediately. In such cases, this field will be 0 and the relevant message will be unusable until it is actually sent
     pub message_id: i64,
@@ -3592,7 +4734,7 @@ pub struct Message {
     pub text: Option<String>,
     /// Optional. For text messages, special entities like usernames, URLs, bot commands, etc. that appear in the text
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub entities: Option<Vec<MessageEntity>>,
+    pub entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Options used for link preview generation for the message, if it is a text message and link preview options were changed
     #[serde(skip_serializing_if = "Option::is_none")]
     pub link_preview_options: Option<Box<LinkPreviewOptions>>,
@@ -3616,7 +4758,7 @@ pub struct Message {
     pub paid_media: Option<Box<PaidMediaInfo>>,
     /// Optional. Message is a photo, available sizes of the photo
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub photo: Option<Vec<PhotoSize>>,
+    pub photo: Option<ShortVec<PhotoSize, 4>>,
     /// Optional. Message is a sticker, information about the sticker
     #[serde(skip_serializing_if = "Option::is_none")]
     pub sticker: Option<Box<Sticker>>,
@@ -3637,7 +4779,7 @@ pub struct Message {
     pub caption: Option<String>,
     /// Optional. For messages with a caption, special entities like usernames, URLs, bot commands, etc. that appear in the caption
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub caption_entities: Option<Vec<MessageEntity>>,
+    pub caption_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. True, if the caption must be shown above the message media
     #[serde(skip_serializing_if = "Option::is_none")]
     pub show_caption_above_media: Option<bool>,
@@ -3667,7 +4809,7 @@ pub struct Message {
     pub location: Option<Box<Location>>,
     /// Optional. New members that were added to the group or supergroup and information about them (the bot itself may be one of these members)
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub new_chat_members: Option<Vec<User>>,
+    pub new_chat_members: Option<ShortVec<User, 1>>,
     /// Optional. A member was removed from the group, information about them (this member may be the bot itself)
     #[serde(skip_serializing_if = "Option::is_none")]
     pub left_chat_member: Option<Box<User>>,
@@ -3682,7 +4824,7 @@ pub struct Message {
     pub new_chat_title: Option<String>,
     /// Optional. A chat photo was change to this value
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub new_chat_photo: Option<Vec<PhotoSize>>,
+    pub new_chat_photo: Option<ShortVec<PhotoSize, 4>>,
     /// Optional. Service message: the chat photo was deleted
     #[serde(skip_serializing_if = "Option::is_none")]
     pub delete_chat_photo: Option<bool>,
@@ -3766,16 +4908,16 @@ pub struct Message {
     pub forum_topic_edited: Option<Box<ForumTopicEdited>>,
     /// Optional. Service message: forum topic closed
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub forum_topic_closed: Option<Box<ForumTopicClosed>>,
+    pub forum_topic_closed: Option<ForumTopicClosed>,
     /// Optional. Service message: forum topic reopened
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub forum_topic_reopened: Option<Box<ForumTopicReopened>>,
+    pub forum_topic_reopened: Option<ForumTopicReopened>,
     /// Optional. Service message: the 'General' forum topic hidden
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub general_forum_topic_hidden: Option<Box<GeneralForumTopicHidden>>,
+    pub general_forum_topic_hidden: Option<GeneralForumTopicHidden>,
     /// Optional. Service message: the 'General' forum topic unhidden
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub general_forum_topic_unhidden: Option<Box<GeneralForumTopicUnhidden>>,
+    pub general_forum_topic_unhidden: Option<GeneralForumTopicUnhidden>,
     /// Optional. Service message: a scheduled giveaway was created
     #[serde(skip_serializing_if = "Option::is_none")]
     pub giveaway_created: Option<Box<GiveawayCreated>>,
@@ -3811,7 +4953,7 @@ pub struct Message {
     pub video_chat_scheduled: Option<Box<VideoChatScheduled>>,
     /// Optional. Service message: video chat started
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub video_chat_started: Option<Box<VideoChatStarted>>,
+    pub video_chat_started: Option<VideoChatStarted>,
     /// Optional. Service message: video chat ended
     #[serde(skip_serializing_if = "Option::is_none")]
     pub video_chat_ended: Option<Box<VideoChatEnded>>,
@@ -3826,6 +4968,1973 @@ pub struct Message {
     pub reply_markup: Option<Box<InlineKeyboardMarkup>>,
 }
 
+impl<'de> Deserialize<'de> for Message {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::{Error, IgnoredAny, MapAccess, SeqAccess, Visitor};
+
+        const FIELDS: &[&str] = &[
+            "message_id",
+            "message_thread_id",
+            "direct_messages_topic",
+            "from",
+            "sender_chat",
+            "sender_boost_count",
+            "sender_business_bot",
+            "date",
+            "business_connection_id",
+            "chat",
+            "forward_origin",
+            "is_topic_message",
+            "is_automatic_forward",
+            "reply_to_message",
+            "external_reply",
+            "quote",
+            "reply_to_story",
+            "reply_to_checklist_task_id",
+            "via_bot",
+            "edit_date",
+            "has_protected_content",
+            "is_from_offline",
+            "is_paid_post",
+            "media_group_id",
+            "author_signature",
+            "paid_star_count",
+            "text",
+            "entities",
+            "link_preview_options",
+            "suggested_post_info",
+            "effect_id",
+            "animation",
+            "audio",
+            "document",
+            "paid_media",
+            "photo",
+            "sticker",
+            "story",
+            "video",
+            "video_note",
+            "voice",
+            "caption",
+            "caption_entities",
+            "show_caption_above_media",
+            "has_media_spoiler",
+            "checklist",
+            "contact",
+            "dice",
+            "game",
+            "poll",
+            "venue",
+            "location",
+            "new_chat_members",
+            "left_chat_member",
+            "chat_owner_left",
+            "chat_owner_changed",
+            "new_chat_title",
+            "new_chat_photo",
+            "delete_chat_photo",
+            "group_chat_created",
+            "supergroup_chat_created",
+            "channel_chat_created",
+            "message_auto_delete_timer_changed",
+            "migrate_to_chat_id",
+            "migrate_from_chat_id",
+            "pinned_message",
+            "invoice",
+            "successful_payment",
+            "refunded_payment",
+            "users_shared",
+            "chat_shared",
+            "gift",
+            "unique_gift",
+            "gift_upgrade_sent",
+            "connected_website",
+            "write_access_allowed",
+            "passport_data",
+            "proximity_alert_triggered",
+            "boost_added",
+            "chat_background_set",
+            "checklist_tasks_done",
+            "checklist_tasks_added",
+            "direct_message_price_changed",
+            "forum_topic_created",
+            "forum_topic_edited",
+            "forum_topic_closed",
+            "forum_topic_reopened",
+            "general_forum_topic_hidden",
+            "general_forum_topic_unhidden",
+            "giveaway_created",
+            "giveaway",
+            "giveaway_winners",
+            "giveaway_completed",
+            "paid_message_price_changed",
+            "suggested_post_approved",
+            "suggested_post_approval_failed",
+            "suggested_post_declined",
+            "suggested_post_paid",
+            "suggested_post_refunded",
+            "video_chat_scheduled",
+            "video_chat_started",
+            "video_chat_ended",
+            "video_chat_participants_invited",
+            "web_app_data",
+            "reply_markup",
+        ];
+        const IGNORE: usize = usize::MAX;
+
+        fn field_index(name: &[u8]) -> usize {
+            match (name.len(), name.first()) {
+                (4, Some(b'c')) => match name {
+                    b"chat" => 9,
+                    _ => IGNORE,
+                },
+                (4, Some(b'd')) => match name {
+                    b"date" => 7,
+                    b"dice" => 47,
+                    _ => IGNORE,
+                },
+                (4, Some(b'f')) => match name {
+                    b"from" => 3,
+                    _ => IGNORE,
+                },
+                (4, Some(b'g')) => match name {
+                    b"game" => 48,
+                    b"gift" => 71,
+                    _ => IGNORE,
+                },
+                (4, Some(b'p')) => match name {
+                    b"poll" => 49,
+                    _ => IGNORE,
+                },
+                (4, Some(b't')) => match name {
+                    b"text" => 26,
+                    _ => IGNORE,
+                },
+                (5, Some(b'a')) => match name {
+                    b"audio" => 32,
+                    _ => IGNORE,
+                },
+                (5, Some(b'p')) => match name {
+                    b"photo" => 35,
+                    _ => IGNORE,
+                },
+                (5, Some(b'q')) => match name {
+                    b"quote" => 15,
+                    _ => IGNORE,
+                },
+                (5, Some(b's')) => match name {
+                    b"story" => 37,
+                    _ => IGNORE,
+                },
+                (5, Some(b'v')) => match name {
+                    b"video" => 38,
+                    b"voice" => 40,
+                    b"venue" => 50,
+                    _ => IGNORE,
+                },
+                (7, Some(b'c')) => match name {
+                    b"caption" => 41,
+                    b"contact" => 46,
+                    _ => IGNORE,
+                },
+                (7, Some(b'i')) => match name {
+                    b"invoice" => 66,
+                    _ => IGNORE,
+                },
+                (7, Some(b's')) => match name {
+                    b"sticker" => 36,
+                    _ => IGNORE,
+                },
+                (7, Some(b'v')) => match name {
+                    b"via_bot" => 18,
+                    _ => IGNORE,
+                },
+                (8, Some(b'd')) => match name {
+                    b"document" => 33,
+                    _ => IGNORE,
+                },
+                (8, Some(b'e')) => match name {
+                    b"entities" => 27,
+                    _ => IGNORE,
+                },
+                (8, Some(b'g')) => match name {
+                    b"giveaway" => 90,
+                    _ => IGNORE,
+                },
+                (8, Some(b'l')) => match name {
+                    b"location" => 51,
+                    _ => IGNORE,
+                },
+                (9, Some(b'a')) => match name {
+                    b"animation" => 31,
+                    _ => IGNORE,
+                },
+                (9, Some(b'c')) => match name {
+                    b"checklist" => 45,
+                    _ => IGNORE,
+                },
+                (9, Some(b'e')) => match name {
+                    b"edit_date" => 19,
+                    b"effect_id" => 30,
+                    _ => IGNORE,
+                },
+                (10, Some(b'm')) => match name {
+                    b"message_id" => 0,
+                    _ => IGNORE,
+                },
+                (10, Some(b'p')) => match name {
+                    b"paid_media" => 34,
+                    _ => IGNORE,
+                },
+                (10, Some(b'v')) => match name {
+                    b"video_note" => 39,
+                    _ => IGNORE,
+                },
+                (11, Some(b'b')) => match name {
+                    b"boost_added" => 78,
+                    _ => IGNORE,
+                },
+                (11, Some(b'c')) => match name {
+                    b"chat_shared" => 70,
+                    _ => IGNORE,
+                },
+                (11, Some(b's')) => match name {
+                    b"sender_chat" => 4,
+                    _ => IGNORE,
+                },
+                (11, Some(b'u')) => match name {
+                    b"unique_gift" => 72,
+                    _ => IGNORE,
+                },
+                (12, Some(b'i')) => match name {
+                    b"is_paid_post" => 22,
+                    _ => IGNORE,
+                },
+                (12, Some(b'r')) => match name {
+                    b"reply_markup" => 104,
+                    _ => IGNORE,
+                },
+                (12, Some(b'u')) => match name {
+                    b"users_shared" => 69,
+                    _ => IGNORE,
+                },
+                (12, Some(b'w')) => match name {
+                    b"web_app_data" => 103,
+                    _ => IGNORE,
+                },
+                (13, Some(b'p')) => match name {
+                    b"passport_data" => 76,
+                    _ => IGNORE,
+                },
+                (14, Some(b'e')) => match name {
+                    b"external_reply" => 14,
+                    _ => IGNORE,
+                },
+                (14, Some(b'f')) => match name {
+                    b"forward_origin" => 10,
+                    _ => IGNORE,
+                },
+                (14, Some(b'm')) => match name {
+                    b"media_group_id" => 23,
+                    _ => IGNORE,
+                },
+                (14, Some(b'n')) => match name {
+                    b"new_chat_title" => 56,
+                    b"new_chat_photo" => 57,
+                    _ => IGNORE,
+                },
+                (14, Some(b'p')) => match name {
+                    b"pinned_message" => 65,
+                    _ => IGNORE,
+                },
+                (14, Some(b'r')) => match name {
+                    b"reply_to_story" => 16,
+                    _ => IGNORE,
+                },
+                (15, Some(b'c')) => match name {
+                    b"chat_owner_left" => 54,
+                    _ => IGNORE,
+                },
+                (15, Some(b'i')) => match name {
+                    b"is_from_offline" => 21,
+                    _ => IGNORE,
+                },
+                (15, Some(b'p')) => match name {
+                    b"paid_star_count" => 25,
+                    _ => IGNORE,
+                },
+                (16, Some(b'a')) => match name {
+                    b"author_signature" => 24,
+                    _ => IGNORE,
+                },
+                (16, Some(b'c')) => match name {
+                    b"caption_entities" => 42,
+                    _ => IGNORE,
+                },
+                (16, Some(b'g')) => match name {
+                    b"giveaway_created" => 89,
+                    b"giveaway_winners" => 91,
+                    _ => IGNORE,
+                },
+                (16, Some(b'i')) => match name {
+                    b"is_topic_message" => 11,
+                    _ => IGNORE,
+                },
+                (16, Some(b'l')) => match name {
+                    b"left_chat_member" => 53,
+                    _ => IGNORE,
+                },
+                (16, Some(b'n')) => match name {
+                    b"new_chat_members" => 52,
+                    _ => IGNORE,
+                },
+                (16, Some(b'r')) => match name {
+                    b"reply_to_message" => 13,
+                    b"refunded_payment" => 68,
+                    _ => IGNORE,
+                },
+                (16, Some(b'v')) => match name {
+                    b"video_chat_ended" => 101,
+                    _ => IGNORE,
+                },
+                (17, Some(b'c')) => match name {
+                    b"connected_website" => 74,
+                    _ => IGNORE,
+                },
+                (17, Some(b'd')) => match name {
+                    b"delete_chat_photo" => 58,
+                    _ => IGNORE,
+                },
+                (17, Some(b'g')) => match name {
+                    b"gift_upgrade_sent" => 73,
+                    _ => IGNORE,
+                },
+                (17, Some(b'h')) => match name {
+                    b"has_media_spoiler" => 44,
+                    _ => IGNORE,
+                },
+                (17, Some(b'm')) => match name {
+                    b"message_thread_id" => 1,
+                    _ => IGNORE,
+                },
+                (18, Some(b'c')) => match name {
+                    b"chat_owner_changed" => 55,
+                    _ => IGNORE,
+                },
+                (18, Some(b'f')) => match name {
+                    b"forum_topic_edited" => 84,
+                    b"forum_topic_closed" => 85,
+                    _ => IGNORE,
+                },
+                (18, Some(b'g')) => match name {
+                    b"group_chat_created" => 59,
+                    b"giveaway_completed" => 92,
+                    _ => IGNORE,
+                },
+                (18, Some(b'm')) => match name {
+                    b"migrate_to_chat_id" => 63,
+                    _ => IGNORE,
+                },
+                (18, Some(b's')) => match name {
+                    b"sender_boost_count" => 5,
+                    b"successful_payment" => 67,
+                    _ => IGNORE,
+                },
+                (18, Some(b'v')) => match name {
+                    b"video_chat_started" => 100,
+                    _ => IGNORE,
+                },
+                (19, Some(b'c')) => match name {
+                    b"chat_background_set" => 79,
+                    _ => IGNORE,
+                },
+                (19, Some(b'f')) => match name {
+                    b"forum_topic_created" => 83,
+                    _ => IGNORE,
+                },
+                (19, Some(b's')) => match name {
+                    b"sender_business_bot" => 6,
+                    b"suggested_post_info" => 29,
+                    b"suggested_post_paid" => 97,
+                    _ => IGNORE,
+                },
+                (20, Some(b'c')) => match name {
+                    b"channel_chat_created" => 61,
+                    b"checklist_tasks_done" => 80,
+                    _ => IGNORE,
+                },
+                (20, Some(b'f')) => match name {
+                    b"forum_topic_reopened" => 86,
+                    _ => IGNORE,
+                },
+                (20, Some(b'i')) => match name {
+                    b"is_automatic_forward" => 12,
+                    _ => IGNORE,
+                },
+                (20, Some(b'l')) => match name {
+                    b"link_preview_options" => 28,
+                    _ => IGNORE,
+                },
+                (20, Some(b'm')) => match name {
+                    b"migrate_from_chat_id" => 64,
+                    _ => IGNORE,
+                },
+                (20, Some(b'v')) => match name {
+                    b"video_chat_scheduled" => 99,
+                    _ => IGNORE,
+                },
+                (20, Some(b'w')) => match name {
+                    b"write_access_allowed" => 75,
+                    _ => IGNORE,
+                },
+                (21, Some(b'c')) => match name {
+                    b"checklist_tasks_added" => 81,
+                    _ => IGNORE,
+                },
+                (21, Some(b'd')) => match name {
+                    b"direct_messages_topic" => 2,
+                    _ => IGNORE,
+                },
+                (21, Some(b'h')) => match name {
+                    b"has_protected_content" => 20,
+                    _ => IGNORE,
+                },
+                (22, Some(b'b')) => match name {
+                    b"business_connection_id" => 8,
+                    _ => IGNORE,
+                },
+                (23, Some(b's')) => match name {
+                    b"supergroup_chat_created" => 60,
+                    b"suggested_post_approved" => 94,
+                    b"suggested_post_declined" => 96,
+                    b"suggested_post_refunded" => 98,
+                    _ => IGNORE,
+                },
+                (24, Some(b's')) => match name {
+                    b"show_caption_above_media" => 43,
+                    _ => IGNORE,
+                },
+                (25, Some(b'p')) => match name {
+                    b"proximity_alert_triggered" => 77,
+                    _ => IGNORE,
+                },
+                (26, Some(b'g')) => match name {
+                    b"general_forum_topic_hidden" => 87,
+                    _ => IGNORE,
+                },
+                (26, Some(b'p')) => match name {
+                    b"paid_message_price_changed" => 93,
+                    _ => IGNORE,
+                },
+                (26, Some(b'r')) => match name {
+                    b"reply_to_checklist_task_id" => 17,
+                    _ => IGNORE,
+                },
+                (28, Some(b'd')) => match name {
+                    b"direct_message_price_changed" => 82,
+                    _ => IGNORE,
+                },
+                (28, Some(b'g')) => match name {
+                    b"general_forum_topic_unhidden" => 88,
+                    _ => IGNORE,
+                },
+                (30, Some(b's')) => match name {
+                    b"suggested_post_approval_failed" => 95,
+                    _ => IGNORE,
+                },
+                (31, Some(b'v')) => match name {
+                    b"video_chat_participants_invited" => 102,
+                    _ => IGNORE,
+                },
+                (33, Some(b'm')) => match name {
+                    b"message_auto_delete_timer_changed" => 62,
+                    _ => IGNORE,
+                },
+                _ => IGNORE,
+            }
+        }
+
+        struct Field(usize);
+        impl<'de> Deserialize<'de> for Field {
+            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+                struct FieldVisitor;
+                impl<'de> Visitor<'de> for FieldVisitor {
+                    type Value = Field;
+                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                        f.write_str("field identifier")
+                    }
+                    fn visit_u64<E: Error>(self, value: u64) -> Result<Field, E> {
+                        Ok(Field(if value < FIELDS.len() as u64 {
+                            value as usize
+                        } else {
+                            IGNORE
+                        }))
+                    }
+                    fn visit_str<E: Error>(self, value: &str) -> Result<Field, E> {
+                        Ok(Field(field_index(value.as_bytes())))
+                    }
+                    fn visit_bytes<E: Error>(self, value: &[u8]) -> Result<Field, E> {
+                        Ok(Field(field_index(value)))
+                    }
+                }
+                deserializer.deserialize_identifier(FieldVisitor)
+            }
+        }
+
+        struct StructVisitor;
+        impl<'de> Visitor<'de> for StructVisitor {
+            type Value = Message;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("struct Message")
+            }
+
+            fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Message, A::Error> {
+                Ok(Message {
+                    message_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(0, &"struct Message with 105 elements")
+                    })?,
+                    message_thread_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(1, &"struct Message with 105 elements")
+                    })?,
+                    direct_messages_topic: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(2, &"struct Message with 105 elements")
+                    })?,
+                    from: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(3, &"struct Message with 105 elements")
+                    })?,
+                    sender_chat: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(4, &"struct Message with 105 elements")
+                    })?,
+                    sender_boost_count: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(5, &"struct Message with 105 elements")
+                    })?,
+                    sender_business_bot: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(6, &"struct Message with 105 elements")
+                    })?,
+                    date: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(7, &"struct Message with 105 elements")
+                    })?,
+                    business_connection_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(8, &"struct Message with 105 elements")
+                    })?,
+                    chat: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(9, &"struct Message with 105 elements")
+                    })?,
+                    forward_origin: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(10, &"struct Message with 105 elements")
+                    })?,
+                    is_topic_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(11, &"struct Message with 105 elements")
+                    })?,
+                    is_automatic_forward: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(12, &"struct Message with 105 elements")
+                    })?,
+                    reply_to_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(13, &"struct Message with 105 elements")
+                    })?,
+                    external_reply: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(14, &"struct Message with 105 elements")
+                    })?,
+                    quote: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(15, &"struct Message with 105 elements")
+                    })?,
+                    reply_to_story: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(16, &"struct Message with 105 elements")
+                    })?,
+                    reply_to_checklist_task_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(17, &"struct Message with 105 elements")
+                    })?,
+                    via_bot: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(18, &"struct Message with 105 elements")
+                    })?,
+                    edit_date: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(19, &"struct Message with 105 elements")
+                    })?,
+                    has_protected_content: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(20, &"struct Message with 105 elements")
+                    })?,
+                    is_from_offline: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(21, &"struct Message with 105 elements")
+                    })?,
+                    is_paid_post: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(22, &"struct Message with 105 elements")
+                    })?,
+                    media_group_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(23, &"struct Message with 105 elements")
+                    })?,
+                    author_signature: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(24, &"struct Message with 105 elements")
+                    })?,
+                    paid_star_count: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(25, &"struct Message with 105 elements")
+                    })?,
+                    text: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(26, &"struct Message with 105 elements")
+                    })?,
+                    entities: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(27, &"struct Message with 105 elements")
+                    })?,
+                    link_preview_options: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(28, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_info: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(29, &"struct Message with 105 elements")
+                    })?,
+                    effect_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(30, &"struct Message with 105 elements")
+                    })?,
+                    animation: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(31, &"struct Message with 105 elements")
+                    })?,
+                    audio: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(32, &"struct Message with 105 elements")
+                    })?,
+                    document: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(33, &"struct Message with 105 elements")
+                    })?,
+                    paid_media: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(34, &"struct Message with 105 elements")
+                    })?,
+                    photo: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(35, &"struct Message with 105 elements")
+                    })?,
+                    sticker: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(36, &"struct Message with 105 elements")
+                    })?,
+                    story: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(37, &"struct Message with 105 elements")
+                    })?,
+                    video: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(38, &"struct Message with 105 elements")
+                    })?,
+                    video_note: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(39, &"struct Message with 105 elements")
+                    })?,
+                    voice: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(40, &"struct Message with 105 elements")
+                    })?,
+                    caption: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(41, &"struct Message with 105 elements")
+                    })?,
+                    caption_entities: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(42, &"struct Message with 105 elements")
+                    })?,
+                    show_caption_above_media: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(43, &"struct Message with 105 elements")
+                    })?,
+                    has_media_spoiler: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(44, &"struct Message with 105 elements")
+                    })?,
+                    checklist: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(45, &"struct Message with 105 elements")
+                    })?,
+                    contact: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(46, &"struct Message with 105 elements")
+                    })?,
+                    dice: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(47, &"struct Message with 105 elements")
+                    })?,
+                    game: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(48, &"struct Message with 105 elements")
+                    })?,
+                    poll: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(49, &"struct Message with 105 elements")
+                    })?,
+                    venue: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(50, &"struct Message with 105 elements")
+                    })?,
+                    location: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(51, &"struct Message with 105 elements")
+                    })?,
+                    new_chat_members: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(52, &"struct Message with 105 elements")
+                    })?,
+                    left_chat_member: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(53, &"struct Message with 105 elements")
+                    })?,
+                    chat_owner_left: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(54, &"struct Message with 105 elements")
+                    })?,
+                    chat_owner_changed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(55, &"struct Message with 105 elements")
+                    })?,
+                    new_chat_title: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(56, &"struct Message with 105 elements")
+                    })?,
+                    new_chat_photo: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(57, &"struct Message with 105 elements")
+                    })?,
+                    delete_chat_photo: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(58, &"struct Message with 105 elements")
+                    })?,
+                    group_chat_created: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(59, &"struct Message with 105 elements")
+                    })?,
+                    supergroup_chat_created: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(60, &"struct Message with 105 elements")
+                    })?,
+                    channel_chat_created: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(61, &"struct Message with 105 elements")
+                    })?,
+                    message_auto_delete_timer_changed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(62, &"struct Message with 105 elements")
+                    })?,
+                    migrate_to_chat_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(63, &"struct Message with 105 elements")
+                    })?,
+                    migrate_from_chat_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(64, &"struct Message with 105 elements")
+                    })?,
+                    pinned_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(65, &"struct Message with 105 elements")
+                    })?,
+                    invoice: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(66, &"struct Message with 105 elements")
+                    })?,
+                    successful_payment: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(67, &"struct Message with 105 elements")
+                    })?,
+                    refunded_payment: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(68, &"struct Message with 105 elements")
+                    })?,
+                    users_shared: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(69, &"struct Message with 105 elements")
+                    })?,
+                    chat_shared: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(70, &"struct Message with 105 elements")
+                    })?,
+                    gift: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(71, &"struct Message with 105 elements")
+                    })?,
+                    unique_gift: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(72, &"struct Message with 105 elements")
+                    })?,
+                    gift_upgrade_sent: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(73, &"struct Message with 105 elements")
+                    })?,
+                    connected_website: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(74, &"struct Message with 105 elements")
+                    })?,
+                    write_access_allowed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(75, &"struct Message with 105 elements")
+                    })?,
+                    passport_data: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(76, &"struct Message with 105 elements")
+                    })?,
+                    proximity_alert_triggered: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(77, &"struct Message with 105 elements")
+                    })?,
+                    boost_added: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(78, &"struct Message with 105 elements")
+                    })?,
+                    chat_background_set: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(79, &"struct Message with 105 elements")
+                    })?,
+                    checklist_tasks_done: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(80, &"struct Message with 105 elements")
+                    })?,
+                    checklist_tasks_added: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(81, &"struct Message with 105 elements")
+                    })?,
+                    direct_message_price_changed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(82, &"struct Message with 105 elements")
+                    })?,
+                    forum_topic_created: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(83, &"struct Message with 105 elements")
+                    })?,
+                    forum_topic_edited: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(84, &"struct Message with 105 elements")
+                    })?,
+                    forum_topic_closed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(85, &"struct Message with 105 elements")
+                    })?,
+                    forum_topic_reopened: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(86, &"struct Message with 105 elements")
+                    })?,
+                    general_forum_topic_hidden: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(87, &"struct Message with 105 elements")
+                    })?,
+                    general_forum_topic_unhidden: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(88, &"struct Message with 105 elements")
+                    })?,
+                    giveaway_created: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(89, &"struct Message with 105 elements")
+                    })?,
+                    giveaway: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(90, &"struct Message with 105 elements")
+                    })?,
+                    giveaway_winners: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(91, &"struct Message with 105 elements")
+                    })?,
+                    giveaway_completed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(92, &"struct Message with 105 elements")
+                    })?,
+                    paid_message_price_changed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(93, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_approved: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(94, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_approval_failed: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(95, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_declined: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(96, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_paid: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(97, &"struct Message with 105 elements")
+                    })?,
+                    suggested_post_refunded: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(98, &"struct Message with 105 elements")
+                    })?,
+                    video_chat_scheduled: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(99, &"struct Message with 105 elements")
+                    })?,
+                    video_chat_started: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(100, &"struct Message with 105 elements")
+                    })?,
+                    video_chat_ended: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(101, &"struct Message with 105 elements")
+                    })?,
+                    video_chat_participants_invited: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(102, &"struct Message with 105 elements")
+                    })?,
+                    web_app_data: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(103, &"struct Message with 105 elements")
+                    })?,
+                    reply_markup: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(104, &"struct Message with 105 elements")
+                    })?,
+                })
+            }
+
+            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Message, A::Error> {
+                let mut message_id: Option<i64> = None;
+                let mut message_thread_id: Option<Option<i64>> = None;
+                let mut direct_messages_topic: Option<Option<Box<DirectMessagesTopic>>> = None;
+                let mut from: Option<Option<Box<User>>> = None;
+                let mut sender_chat: Option<Option<Box<Chat>>> = None;
+                let mut sender_boost_count: Option<Option<i64>> = None;
+                let mut sender_business_bot: Option<Option<Box<User>>> = None;
+                let mut date: Option<i64> = None;
+                let mut business_connection_id: Option<Option<String>> = None;
+                let mut chat: Option<Chat> = None;
+                let mut forward_origin: Option<Option<Box<MessageOrigin>>> = None;
+                let mut is_topic_message: Option<Option<bool>> = None;
+                let mut is_automatic_forward: Option<Option<bool>> = None;
+                let mut reply_to_message: Option<Option<Box<Message>>> = None;
+                let mut external_reply: Option<Option<Box<ExternalReplyInfo>>> = None;
+                let mut quote: Option<Option<Box<TextQuote>>> = None;
+                let mut reply_to_story: Option<Option<Box<Story>>> = None;
+                let mut reply_to_checklist_task_id: Option<Option<i64>> = None;
+                let mut via_bot: Option<Option<Box<User>>> = None;
+                let mut edit_date: Option<Option<i64>> = None;
+                let mut has_protected_content: Option<Option<bool>> = None;
+                let mut is_from_offline: Option<Option<bool>> = None;
+                let mut is_paid_post: Option<Option<bool>> = None;
+                let mut media_group_id: Option<Option<String>> = None;
+                let mut author_signature: Option<Option<String>> = None;
+                let mut paid_star_count: Option<Option<i64>> = None;
+                let mut text: Option<Option<String>> = None;
+                let mut entities: Option<Option<ShortVec<MessageEntity, 2>>> = None;
+                let mut link_preview_options: Option<Option<Box<LinkPreviewOptions>>> = None;
+                let mut suggested_post_info: Option<Option<Box<SuggestedPostInfo>>> = None;
+                let mut effect_id: Option<Option<String>> = None;
+                let mut animation: Option<Option<Box<Animation>>> = None;
+                let mut audio: Option<Option<Box<Audio>>> = None;
+                let mut document: Option<Option<Box<Document>>> = None;
+                let mut paid_media: Option<Option<Box<PaidMediaInfo>>> = None;
+                let mut photo: Option<Option<ShortVec<PhotoSize, 4>>> = None;
+                let mut sticker: Option<Option<Box<Sticker>>> = None;
+                let mut story: Option<Option<Box<Story>>> = None;
+                let mut video: Option<Option<Box<Video>>> = None;
+                let mut video_note: Option<Option<Box<VideoNote>>> = None;
+                let mut voice: Option<Option<Box<Voice>>> = None;
+                let mut caption: Option<Option<String>> = None;
+                let mut caption_entities: Option<Option<ShortVec<MessageEntity, 2>>> = None;
+                let mut show_caption_above_media: Option<Option<bool>> = None;
+                let mut has_media_spoiler: Option<Option<bool>> = None;
+                let mut checklist: Option<Option<Box<Checklist>>> = None;
+                let mut contact: Option<Option<Box<Contact>>> = None;
+                let mut dice: Option<Option<Box<Dice>>> = None;
+                let mut game: Option<Option<Box<Game>>> = None;
+                let mut poll: Option<Option<Box<Poll>>> = None;
+                let mut venue: Option<Option<Box<Venue>>> = None;
+                let mut location: Option<Option<Box<Location>>> = None;
+                let mut new_chat_members: Option<Option<ShortVec<User, 1>>> = None;
+                let mut left_chat_member: Option<Option<Box<User>>> = None;
+                let mut chat_owner_left: Option<Option<Box<ChatOwnerLeft>>> = None;
+                let mut chat_owner_changed: Option<Option<Box<ChatOwnerChanged>>> = None;
+                let mut new_chat_title: Option<Option<String>> = None;
+                let mut new_chat_photo: Option<Option<ShortVec<PhotoSize, 4>>> = None;
+                let mut delete_chat_photo: Option<Option<bool>> = None;
+                let mut group_chat_created: Option<Option<bool>> = None;
+                let mut supergroup_chat_created: Option<Option<bool>> = None;
+                let mut channel_chat_created: Option<Option<bool>> = None;
+                let mut message_auto_delete_timer_changed: Option<
+                    Option<Box<MessageAutoDeleteTimerChanged>>,
+                > = None;
+                let mut migrate_to_chat_id: Option<Option<i64>> = None;
+                let mut migrate_from_chat_id: Option<Option<i64>> = None;
+                let mut pinned_message: Option<Option<Box<MaybeInaccessibleMessage>>> = None;
+                let mut invoice: Option<Option<Box<Invoice>>> = None;
+                let mut successful_payment: Option<Option<Box<SuccessfulPayment>>> = None;
+                let mut refunded_payment: Option<Option<Box<RefundedPayment>>> = None;
+                let mut users_shared: Option<Option<Box<UsersShared>>> = None;
+                let mut chat_shared: Option<Option<Box<ChatShared>>> = None;
+                let mut gift: Option<Option<Box<GiftInfo>>> = None;
+                let mut unique_gift: Option<Option<Box<UniqueGiftInfo>>> = None;
+                let mut gift_upgrade_sent: Option<Option<Box<GiftInfo>>> = None;
+                let mut connected_website: Option<Option<String>> = None;
+                let mut write_access_allowed: Option<Option<Box<WriteAccessAllowed>>> = None;
+                let mut passport_data: Option<Option<Box<PassportData>>> = None;
+                let mut proximity_alert_triggered: Option<Option<Box<ProximityAlertTriggered>>> =
+                    None;
+                let mut boost_added: Option<Option<Box<ChatBoostAdded>>> = None;
+                let mut chat_background_set: Option<Option<Box<ChatBackground>>> = None;
+                let mut checklist_tasks_done: Option<Option<Box<ChecklistTasksDone>>> = None;
+                let mut checklist_tasks_added: Option<Option<Box<ChecklistTasksAdded>>> = None;
+                let mut direct_message_price_changed: Option<
+                    Option<Box<DirectMessagePriceChanged>>,
+                > = None;
+                let mut forum_topic_created: Option<Option<Box<ForumTopicCreated>>> = None;
+                let mut forum_topic_edited: Option<Option<Box<ForumTopicEdited>>> = None;
+                let mut forum_topic_closed: Option<Option<ForumTopicClosed>> = None;
+                let mut forum_topic_reopened: Option<Option<ForumTopicReopened>> = None;
+                let mut general_forum_topic_hidden: Option<Option<GeneralForumTopicHidden>> = None;
+                let mut general_forum_topic_unhidden: Option<Option<GeneralForumTopicUnhidden>> =
+                    None;
+                let mut giveaway_created: Option<Option<Box<GiveawayCreated>>> = None;
+                let mut giveaway: Option<Option<Box<Giveaway>>> = None;
+                let mut giveaway_winners: Option<Option<Box<GiveawayWinners>>> = None;
+                let mut giveaway_completed: Option<Option<Box<GiveawayCompleted>>> = None;
+                let mut paid_message_price_changed: Option<Option<Box<PaidMessagePriceChanged>>> =
+                    None;
+                let mut suggested_post_approved: Option<Option<Box<SuggestedPostApproved>>> = None;
+                let mut suggested_post_approval_failed: Option<
+                    Option<Box<SuggestedPostApprovalFailed>>,
+                > = None;
+                let mut suggested_post_declined: Option<Option<Box<SuggestedPostDeclined>>> = None;
+                let mut suggested_post_paid: Option<Option<Box<SuggestedPostPaid>>> = None;
+                let mut suggested_post_refunded: Option<Option<Box<SuggestedPostRefunded>>> = None;
+                let mut video_chat_scheduled: Option<Option<Box<VideoChatScheduled>>> = None;
+                let mut video_chat_started: Option<Option<VideoChatStarted>> = None;
+                let mut video_chat_ended: Option<Option<Box<VideoChatEnded>>> = None;
+                let mut video_chat_participants_invited: Option<
+                    Option<Box<VideoChatParticipantsInvited>>,
+                > = None;
+                let mut web_app_data: Option<Option<Box<WebAppData>>> = None;
+                let mut reply_markup: Option<Option<Box<InlineKeyboardMarkup>>> = None;
+                while let Some(Field(index)) = map.next_key()? {
+                    match index {
+                        0 => {
+                            if message_id.is_some() {
+                                return Err(A::Error::duplicate_field("message_id"));
+                            }
+                            message_id = Some(map.next_value()?);
+                        }
+                        1 => {
+                            if message_thread_id.is_some() {
+                                return Err(A::Error::duplicate_field("message_thread_id"));
+                            }
+                            message_thread_id = Some(map.next_value()?);
+                        }
+                        2 => {
+                            if direct_messages_topic.is_some() {
+                                return Err(A::Error::duplicate_field("direct_messages_topic"));
+                            }
+                            direct_messages_topic = Some(map.next_value()?);
+                        }
+                        3 => {
+                            if from.is_some() {
+                                return Err(A::Error::duplicate_field("from"));
+                            }
+                            from = Some(map.next_value()?);
+                        }
+                        4 => {
+                            if sender_chat.is_some() {
+                                return Err(A::Error::duplicate_field("sender_chat"));
+                            }
+                            sender_chat = Some(map.next_value()?);
+                        }
+                        5 => {
+                            if sender_boost_count.is_some() {
+                                return Err(A::Error::duplicate_field("sender_boost_count"));
+                            }
+                            sender_boost_count = Some(map.next_value()?);
+                        }
+                        6 => {
+                            if sender_business_bot.is_some() {
+                                return Err(A::Error::duplicate_field("sender_business_bot"));
+                            }
+                            sender_business_bot = Some(map.next_value()?);
+                        }
+                        7 => {
+                            if date.is_some() {
+                                return Err(A::Error::duplicate_field("date"));
+                            }
+                            date = Some(map.next_value()?);
+                        }
+                        8 => {
+                            if business_connection_id.is_some() {
+                                return Err(A::Error::duplicate_field("business_connection_id"));
+                            }
+                            business_connection_id = Some(map.next_value()?);
+                        }
+                        9 => {
+                            if chat.is_some() {
+                                return Err(A::Error::duplicate_field("chat"));
+                            }
+                            chat = Some(map.next_value()?);
+                        }
+                        10 => {
+                            if forward_origin.is_some() {
+                                return Err(A::Error::duplicate_field("forward_origin"));
+                            }
+                            forward_origin = Some(map.next_value()?);
+                        }
+                        11 => {
+                            if is_topic_message.is_some() {
+                                return Err(A::Error::duplicate_field("is_topic_message"));
+                            }
+                            is_topic_message = Some(map.next_value()?);
+                        }
+                        12 => {
+                            if is_automatic_forward.is_some() {
+                                return Err(A::Error::duplicate_field("is_automatic_forward"));
+                            }
+                            is_automatic_forward = Some(map.next_value()?);
+                        }
+                        13 => {
+                            if reply_to_message.is_some() {
+                                return Err(A::Error::duplicate_field("reply_to_message"));
+                            }
+                            reply_to_message = Some(map.next_value()?);
+                        }
+                        14 => {
+                            if external_reply.is_some() {
+                                return Err(A::Error::duplicate_field("external_reply"));
+                            }
+                            external_reply = Some(map.next_value()?);
+                        }
+                        15 => {
+                            if quote.is_some() {
+                                return Err(A::Error::duplicate_field("quote"));
+                            }
+                            quote = Some(map.next_value()?);
+                        }
+                        16 => {
+                            if reply_to_story.is_some() {
+                                return Err(A::Error::duplicate_field("reply_to_story"));
+                            }
+                            reply_to_story = Some(map.next_value()?);
+                        }
+                        17 => {
+                            if reply_to_checklist_task_id.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "reply_to_checklist_task_id",
+                                ));
+                            }
+                            reply_to_checklist_task_id = Some(map.next_value()?);
+                        }
+                        18 => {
+                            if via_bot.is_some() {
+                                return Err(A::Error::duplicate_field("via_bot"));
+                            }
+                            via_bot = Some(map.next_value()?);
+                        }
+                        19 => {
+                            if edit_date.is_some() {
+                                return Err(A::Error::duplicate_field("edit_date"));
+                            }
+                            edit_date = Some(map.next_value()?);
+                        }
+                        20 => {
+                            if has_protected_content.is_some() {
+                                return Err(A::Error::duplicate_field("has_protected_content"));
+                            }
+                            has_protected_content = Some(map.next_value()?);
+                        }
+                        21 => {
+                            if is_from_offline.is_some() {
+                                return Err(A::Error::duplicate_field("is_from_offline"));
+                            }
+                            is_from_offline = Some(map.next_value()?);
+                        }
+                        22 => {
+                            if is_paid_post.is_some() {
+                                return Err(A::Error::duplicate_field("is_paid_post"));
+                            }
+                            is_paid_post = Some(map.next_value()?);
+                        }
+                        23 => {
+                            if media_group_id.is_some() {
+                                return Err(A::Error::duplicate_field("media_group_id"));
+                            }
+                            media_group_id = Some(map.next_value()?);
+                        }
+                        24 => {
+                            if author_signature.is_some() {
+                                return Err(A::Error::duplicate_field("author_signature"));
+                            }
+                            author_signature = Some(map.next_value()?);
+                        }
+                        25 => {
+                            if paid_star_count.is_some() {
+                                return Err(A::Error::duplicate_field("paid_star_count"));
+                            }
+                            paid_star_count = Some(map.next_value()?);
+                        }
+                        26 => {
+                            if text.is_some() {
+                                return Err(A::Error::duplicate_field("text"));
+                            }
+                            text = Some(map.next_value()?);
+                        }
+                        27 => {
+                            if entities.is_some() {
+                                return Err(A::Error::duplicate_field("entities"));
+                            }
+                            entities = Some(map.next_value()?);
+                        }
+                        28 => {
+                            if link_preview_options.is_some() {
+                                return Err(A::Error::duplicate_field("link_preview_options"));
+                            }
+                            link_preview_options = Some(map.next_value()?);
+                        }
+                        29 => {
+                            if suggested_post_info.is_some() {
+                                return Err(A::Error::duplicate_field("suggested_post_info"));
+                            }
+                            suggested_post_info = Some(map.next_value()?);
+                        }
+                        30 => {
+                            if effect_id.is_some() {
+                                return Err(A::Error::duplicate_field("effect_id"));
+                            }
+                            effect_id = Some(map.next_value()?);
+                        }
+                        31 => {
+                            if animation.is_some() {
+                                return Err(A::Error::duplicate_field("animation"));
+                            }
+                            animation = Some(map.next_value()?);
+                        }
+                        32 => {
+                            if audio.is_some() {
+                                return Err(A::Error::duplicate_field("audio"));
+                            }
+                            audio = Some(map.next_value()?);
+                        }
+                        33 => {
+                            if document.is_some() {
+                                return Err(A::Error::duplicate_field("document"));
+                            }
+                            document = Some(map.next_value()?);
+                        }
+                        34 => {
+                            if paid_media.is_some() {
+                                return Err(A::Error::duplicate_field("paid_media"));
+                            }
+                            paid_media = Some(map.next_value()?);
+                        }
+                        35 => {
+                            if photo.is_some() {
+                                return Err(A::Error::duplicate_field("photo"));
+                            }
+                            photo = Some(map.next_value()?);
+                        }
+                        36 => {
+                            if sticker.is_some() {
+                                return Err(A::Error::duplicate_field("sticker"));
+                            }
+                            sticker = Some(map.next_value()?);
+                        }
+                        37 => {
+                            if story.is_some() {
+                                return Err(A::Error::duplicate_field("story"));
+                            }
+                            story = Some(map.next_value()?);
+                        }
+                        38 => {
+                            if video.is_some() {
+                                return Err(A::Error::duplicate_field("video"));
+                            }
+                            video = Some(map.next_value()?);
+                        }
+                        39 => {
+                            if video_note.is_some() {
+                                return Err(A::Error::duplicate_field("video_note"));
+                            }
+                            video_note = Some(map.next_value()?);
+                        }
+                        40 => {
+                            if voice.is_some() {
+                                return Err(A::Error::duplicate_field("voice"));
+                            }
+                            voice = Some(map.next_value()?);
+                        }
+                        41 => {
+                            if caption.is_some() {
+                                return Err(A::Error::duplicate_field("caption"));
+                            }
+                            caption = Some(map.next_value()?);
+                        }
+                        42 => {
+                            if caption_entities.is_some() {
+                                return Err(A::Error::duplicate_field("caption_entities"));
+                            }
+                            caption_entities = Some(map.next_value()?);
+                        }
+                        43 => {
+                            if show_caption_above_media.is_some() {
+                                return Err(A::Error::duplicate_field("show_caption_above_media"));
+                            }
+                            show_caption_above_media = Some(map.next_value()?);
+                        }
+                        44 => {
+                            if has_media_spoiler.is_some() {
+                                return Err(A::Error::duplicate_field("has_media_spoiler"));
+                            }
+                            has_media_spoiler = Some(map.next_value()?);
+                        }
+                        45 => {
+                            if checklist.is_some() {
+                                return Err(A::Error::duplicate_field("checklist"));
+                            }
+                            checklist = Some(map.next_value()?);
+                        }
+                        46 => {
+                            if contact.is_some() {
+                                return Err(A::Error::duplicate_field("contact"));
+                            }
+                            contact = Some(map.next_value()?);
+                        }
+                        47 => {
+                            if dice.is_some() {
+                                return Err(A::Error::duplicate_field("dice"));
+                            }
+                            dice = Some(map.next_value()?);
+                        }
+                        48 => {
+                            if game.is_some() {
+                                return Err(A::Error::duplicate_field("game"));
+                            }
+                            game = Some(map.next_value()?);
+                        }
+                        49 => {
+                            if poll.is_some() {
+                                return Err(A::Error::duplicate_field("poll"));
+                            }
+                            poll = Some(map.next_value()?);
+                        }
+                        50 => {
+                            if venue.is_some() {
+                                return Err(A::Error::duplicate_field("venue"));
+                            }
+                            venue = Some(map.next_value()?);
+                        }
+                        51 => {
+                            if location.is_some() {
+                                return Err(A::Error::duplicate_field("location"));
+                            }
+                            location = Some(map.next_value()?);
+                        }
+                        52 => {
+                            if new_chat_members.is_some() {
+                                return Err(A::Error::duplicate_field("new_chat_members"));
+                            }
+                            new_chat_members = Some(map.next_value()?);
+                        }
+                        53 => {
+                            if left_chat_member.is_some() {
+                                return Err(A::Error::duplicate_field("left_chat_member"));
+                            }
+                            left_chat_member = Some(map.next_value()?);
+                        }
+                        54 => {
+                            if chat_owner_left.is_some() {
+                                return Err(A::Error::duplicate_field("chat_owner_left"));
+                            }
+                            chat_owner_left = Some(map.next_value()?);
+                        }
+                        55 => {
+                            if chat_owner_changed.is_some() {
+                                return Err(A::Error::duplicate_field("chat_owner_changed"));
+                            }
+                            chat_owner_changed = Some(map.next_value()?);
+                        }
+                        56 => {
+                            if new_chat_title.is_some() {
+                                return Err(A::Error::duplicate_field("new_chat_title"));
+                            }
+                            new_chat_title = Some(map.next_value()?);
+                        }
+                        57 => {
+                            if new_chat_photo.is_some() {
+                                return Err(A::Error::duplicate_field("new_chat_photo"));
+                            }
+                            new_chat_photo = Some(map.next_value()?);
+                        }
+                        58 => {
+                            if delete_chat_photo.is_some() {
+                                return Err(A::Error::duplicate_field("delete_chat_photo"));
+                            }
+                            delete_chat_photo = Some(map.next_value()?);
+                        }
+                        59 => {
+                            if group_chat_created.is_some() {
+                                return Err(A::Error::duplicate_field("group_chat_created"));
+                            }
+                            group_chat_created = Some(map.next_value()?);
+                        }
+                        60 => {
+                            if supergroup_chat_created.is_some() {
+                                return Err(A::Error::duplicate_field("supergroup_chat_created"));
+                            }
+                            supergroup_chat_created = Some(map.next_value()?);
+                        }
+                        61 => {
+                            if channel_chat_created.is_some() {
+                                return Err(A::Error::duplicate_field("channel_chat_created"));
+                            }
+                            channel_chat_created = Some(map.next_value()?);
+                        }
+                        62 => {
+                            if message_auto_delete_timer_changed.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "message_auto_delete_timer_changed",
+                                ));
+                            }
+                            message_auto_delete_timer_changed = Some(map.next_value()?);
+                        }
+                        63 => {
+                            if migrate_to_chat_id.is_some() {
+                                return Err(A::Error::duplicate_field("migrate_to_chat_id"));
+                            }
+                            migrate_to_chat_id = Some(map.next_value()?);
+                        }
+                        64 => {
+                            if migrate_from_chat_id.is_some() {
+                                return Err(A::Error::duplicate_field("migrate_from_chat_id"));
+                            }
+                            migrate_from_chat_id = Some(map.next_value()?);
+                        }
+                        65 => {
+                            if pinned_message.is_some() {
+                                return Err(A::Error::duplicate_field("pinned_message"));
+                            }
+                            pinned_message = Some(map.next_value()?);
+                        }
+                        66 => {
+                            if invoice.is_some() {
+                                return Err(A::Error::duplicate_field("invoice"));
+                            }
+                            invoice = Some(map.next_value()?);
+                        }
+                        67 => {
+                            if successful_payment.is_some() {
+                                return Err(A::Error::duplicate_field("successful_payment"));
+                            }
+                            successful_payment = Some(map.next_value()?);
+                        }
+                        68 => {
+                            if refunded_payment.is_some() {
+                                return Err(A::Error::duplicate_field("refunded_payment"));
+                            }
+                            refunded_payment = Some(map.next_value()?);
+                        }
+                        69 => {
+                            if users_shared.is_some() {
+                                return Err(A::Error::duplicate_field("users_shared"));
+                            }
+                            users_shared = Some(map.next_value()?);
+                        }
+                        70 => {
+                            if chat_shared.is_some() {
+                                return Err(A::Error::duplicate_field("chat_shared"));
+                            }
+                            chat_shared = Some(map.next_value()?);
+                        }
+                        71 => {
+                            if gift.is_some() {
+                                return Err(A::Error::duplicate_field("gift"));
+                            }
+                            gift = Some(map.next_value()?);
+                        }
+                        72 => {
+                            if unique_gift.is_some() {
+                                return Err(A::Error::duplicate_field("unique_gift"));
+                            }
+                            unique_gift = Some(map.next_value()?);
+                        }
+                        73 => {
+                            if gift_upgrade_sent.is_some() {
+                                return Err(A::Error::duplicate_field("gift_upgrade_sent"));
+                            }
+                            gift_upgrade_sent = Some(map.next_value()?);
+                        }
+                        74 => {
+                            if connected_website.is_some() {
+                                return Err(A::Error::duplicate_field("connected_website"));
+                            }
+                            connected_website = Some(map.next_value()?);
+                        }
+                        75 => {
+                            if write_access_allowed.is_some() {
+                                return Err(A::Error::duplicate_field("write_access_allowed"));
+                            }
+                            write_access_allowed = Some(map.next_value()?);
+                        }
+                        76 => {
+                            if passport_data.is_some() {
+                                return Err(A::Error::duplicate_field("passport_data"));
+                            }
+                            passport_data = Some(map.next_value()?);
+                        }
+                        77 => {
+                            if proximity_alert_triggered.is_some() {
+                                return Err(A::Error::duplicate_field("proximity_alert_triggered"));
+                            }
+                            proximity_alert_triggered = Some(map.next_value()?);
+                        }
+                        78 => {
+                            if boost_added.is_some() {
+                                return Err(A::Error::duplicate_field("boost_added"));
+                            }
+                            boost_added = Some(map.next_value()?);
+                        }
+                        79 => {
+                            if chat_background_set.is_some() {
+                                return Err(A::Error::duplicate_field("chat_background_set"));
+                            }
+                            chat_background_set = Some(map.next_value()?);
+                        }
+                        80 => {
+                            if checklist_tasks_done.is_some() {
+                                return Err(A::Error::duplicate_field("checklist_tasks_done"));
+                            }
+                            checklist_tasks_done = Some(map.next_value()?);
+                        }
+                        81 => {
+                            if checklist_tasks_added.is_some() {
+                                return Err(A::Error::duplicate_field("checklist_tasks_added"));
+                            }
+                            checklist_tasks_added = Some(map.next_value()?);
+                        }
+                        82 => {
+                            if direct_message_price_changed.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "direct_message_price_changed",
+                                ));
+                            }
+                            direct_message_price_changed = Some(map.next_value()?);
+                        }
+                        83 => {
+                            if forum_topic_created.is_some() {
+                                return Err(A::Error::duplicate_field("forum_topic_created"));
+                            }
+                            forum_topic_created = Some(map.next_value()?);
+                        }
+                        84 => {
+                            if forum_topic_edited.is_some() {
+                                return Err(A::Error::duplicate_field("forum_topic_edited"));
+                            }
+                            forum_topic_edited = Some(map.next_value()?);
+                        }
+                        85 => {
+                            if forum_topic_closed.is_some() {
+                                return Err(A::Error::duplicate_field("forum_topic_closed"));
+                            }
+                            forum_topic_closed = Some(map.next_value()?);
+                        }
+                        86 => {
+                            if forum_topic_reopened.is_some() {
+                                return Err(A::Error::duplicate_field("forum_topic_reopened"));
+                            }
+                            forum_topic_reopened = Some(map.next_value()?);
+                        }
+                        87 => {
+                            if general_forum_topic_hidden.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "general_forum_topic_hidden",
+                                ));
+                            }
+                            general_forum_topic_hidden = Some(map.next_value()?);
+                        }
+                        88 => {
+                            if general_forum_topic_unhidden.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "general_forum_topic_unhidden",
+                                ));
+                            }
+                            general_forum_topic_unhidden = Some(map.next_value()?);
+                        }
+                        89 => {
+                            if giveaway_created.is_some() {
+                                return Err(A::Error::duplicate_field("giveaway_created"));
+                            }
+                            giveaway_created = Some(map.next_value()?);
+                        }
+                        90 => {
+                            if giveaway.is_some() {
+                                return Err(A::Error::duplicate_field("giveaway"));
+                            }
+                            giveaway = Some(map.next_value()?);
+                        }
+                        91 => {
+                            if giveaway_winners.is_some() {
+                                return Err(A::Error::duplicate_field("giveaway_winners"));
+                            }
+                            giveaway_winners = Some(map.next_value()?);
+                        }
+                        92 => {
+                            if giveaway_completed.is_some() {
+                                return Err(A::Error::duplicate_field("giveaway_completed"));
+                            }
+                            giveaway_completed = Some(map.next_value()?);
+                        }
+                        93 => {
+                            if paid_message_price_changed.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "paid_message_price_changed",
+                                ));
+                            }
+                            paid_message_price_changed = Some(map.next_value()?);
+                        }
+                        94 => {
+                            if suggested_post_approved.is_some() {
+                                return Err(A::Error::duplicate_field("suggested_post_approved"));
+                            }
+                            suggested_post_approved = Some(map.next_value()?);
+                        }
+                        95 => {
+                            if suggested_post_approval_failed.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "suggested_post_approval_failed",
+                                ));
+                            }
+                            suggested_post_approval_failed = Some(map.next_value()?);
+                        }
+                        96 => {
+                            if suggested_post_declined.is_some() {
+                                return Err(A::Error::duplicate_field("suggested_post_declined"));
+                            }
+                            suggested_post_declined = Some(map.next_value()?);
+                        }
+                        97 => {
+                            if suggested_post_paid.is_some() {
+                                return Err(A::Error::duplicate_field("suggested_post_paid"));
+                            }
+                            suggested_post_paid = Some(map.next_value()?);
+                        }
+                        98 => {
+                            if suggested_post_refunded.is_some() {
+                                return Err(A::Error::duplicate_field("suggested_post_refunded"));
+                            }
+                            suggested_post_refunded = Some(map.next_value()?);
+                        }
+                        99 => {
+                            if video_chat_scheduled.is_some() {
+                                return Err(A::Error::duplicate_field("video_chat_scheduled"));
+                            }
+                            video_chat_scheduled = Some(map.next_value()?);
+                        }
+                        100 => {
+                            if video_chat_started.is_some() {
+                                return Err(A::Error::duplicate_field("video_chat_started"));
+                            }
+                            video_chat_started = Some(map.next_value()?);
+                        }
+                        101 => {
+                            if video_chat_ended.is_some() {
+                                return Err(A::Error::duplicate_field("video_chat_ended"));
+                            }
+                            video_chat_ended = Some(map.next_value()?);
+                        }
+                        102 => {
+                            if video_chat_participants_invited.is_some() {
+                                return Err(A::Error::duplicate_field(
+                                    "video_chat_participants_invited",
+                                ));
+                            }
+                            video_chat_participants_invited = Some(map.next_value()?);
+                        }
+                        103 => {
+                            if web_app_data.is_some() {
+                                return Err(A::Error::duplicate_field("web_app_data"));
+                            }
+                            web_app_data = Some(map.next_value()?);
+                        }
+                        104 => {
+                            if reply_markup.is_some() {
+                                return Err(A::Error::duplicate_field("reply_markup"));
+                            }
+                            reply_markup = Some(map.next_value()?);
+                        }
+                        _ => {
+                            map.next_value::<IgnoredAny>()?;
+                        }
+                    }
+                }
+                Ok(Message {
+                    message_id: message_id.ok_or_else(|| A::Error::missing_field("message_id"))?,
+                    message_thread_id: message_thread_id.unwrap_or(None),
+                    direct_messages_topic: direct_messages_topic.unwrap_or(None),
+                    from: from.unwrap_or(None),
+                    sender_chat: sender_chat.unwrap_or(None),
+                    sender_boost_count: sender_boost_count.unwrap_or(None),
+                    sender_business_bot: sender_business_bot.unwrap_or(None),
+                    date: date.ok_or_else(|| A::Error::missing_field("date"))?,
+                    business_connection_id: business_connection_id.unwrap_or(None),
+                    chat: chat.ok_or_else(|| A::Error::missing_field("chat"))?,
+                    forward_origin: forward_origin.unwrap_or(None),
+                    is_topic_message: is_topic_message.unwrap_or(None),
+                    is_automatic_forward: is_automatic_forward.unwrap_or(None),
+                    reply_to_message: reply_to_message.unwrap_or(None),
+                    external_reply: external_reply.unwrap_or(None),
+                    quote: quote.unwrap_or(None),
+                    reply_to_story: reply_to_story.unwrap_or(None),
+                    reply_to_checklist_task_id: reply_to_checklist_task_id.unwrap_or(None),
+                    via_bot: via_bot.unwrap_or(None),
+                    edit_date: edit_date.unwrap_or(None),
+                    has_protected_content: has_protected_content.unwrap_or(None),
+                    is_from_offline: is_from_offline.unwrap_or(None),
+                    is_paid_post: is_paid_post.unwrap_or(None),
+                    media_group_id: media_group_id.unwrap_or(None),
+                    author_signature: author_signature.unwrap_or(None),
+                    paid_star_count: paid_star_count.unwrap_or(None),
+                    text: text.unwrap_or(None),
+                    entities: entities.unwrap_or(None),
+                    link_preview_options: link_preview_options.unwrap_or(None),
+                    suggested_post_info: suggested_post_info.unwrap_or(None),
+                    effect_id: effect_id.unwrap_or(None),
+                    animation: animation.unwrap_or(None),
+                    audio: audio.unwrap_or(None),
+                    document: document.unwrap_or(None),
+                    paid_media: paid_media.unwrap_or(None),
+                    photo: photo.unwrap_or(None),
+                    sticker: sticker.unwrap_or(None),
+                    story: story.unwrap_or(None),
+                    video: video.unwrap_or(None),
+                    video_note: video_note.unwrap_or(None),
+                    voice: voice.unwrap_or(None),
+                    caption: caption.unwrap_or(None),
+                    caption_entities: caption_entities.unwrap_or(None),
+                    show_caption_above_media: show_caption_above_media.unwrap_or(None),
+                    has_media_spoiler: has_media_spoiler.unwrap_or(None),
+                    checklist: checklist.unwrap_or(None),
+                    contact: contact.unwrap_or(None),
+                    dice: dice.unwrap_or(None),
+                    game: game.unwrap_or(None),
+                    poll: poll.unwrap_or(None),
+                    venue: venue.unwrap_or(None),
+                    location: location.unwrap_or(None),
+                    new_chat_members: new_chat_members.unwrap_or(None),
+                    left_chat_member: left_chat_member.unwrap_or(None),
+                    chat_owner_left: chat_owner_left.unwrap_or(None),
+                    chat_owner_changed: chat_owner_changed.unwrap_or(None),
+                    new_chat_title: new_chat_title.unwrap_or(None),
+                    new_chat_photo: new_chat_photo.unwrap_or(None),
+                    delete_chat_photo: delete_chat_photo.unwrap_or(None),
+                    group_chat_created: group_chat_created.unwrap_or(None),
+                    supergroup_chat_created: supergroup_chat_created.unwrap_or(None),
+                    channel_chat_created: channel_chat_created.unwrap_or(None),
+                    message_auto_delete_timer_changed: message_auto_delete_timer_changed
+                        .unwrap_or(None),
+                    migrate_to_chat_id: migrate_to_chat_id.unwrap_or(None),
+                    migrate_from_chat_id: migrate_from_chat_id.unwrap_or(None),
+                    pinned_message: pinned_message.unwrap_or(None),
+                    invoice: invoice.unwrap_or(None),
+                    successful_payment: successful_payment.unwrap_or(None),
+                    refunded_payment: refunded_payment.unwrap_or(None),
+                    users_shared: users_shared.unwrap_or(None),
+                    chat_shared: chat_shared.unwrap_or(None),
+                    gift: gift.unwrap_or(None),
+                    unique_gift: unique_gift.unwrap_or(None),
+                    gift_upgrade_sent: gift_upgrade_sent.unwrap_or(None),
+                    connected_website: connected_website.unwrap_or(None),
+                    write_access_allowed: write_access_allowed.unwrap_or(None),
+                    passport_data: passport_data.unwrap_or(None),
+                    proximity_alert_triggered: proximity_alert_triggered.unwrap_or(None),
+                    boost_added: boost_added.unwrap_or(None),
+                    chat_background_set: chat_background_set.unwrap_or(None),
+                    checklist_tasks_done: checklist_tasks_done.unwrap_or(None),
+                    checklist_tasks_added: checklist_tasks_added.unwrap_or(None),
+                    direct_message_price_changed: direct_message_price_changed.unwrap_or(None),
+                    forum_topic_created: forum_topic_created.unwrap_or(None),
+                    forum_topic_edited: forum_topic_edited.unwrap_or(None),
+                    forum_topic_closed: forum_topic_closed.unwrap_or(None),
+                    forum_topic_reopened: forum_topic_reopened.unwrap_or(None),
+                    general_forum_topic_hidden: general_forum_topic_hidden.unwrap_or(None),
+                    general_forum_topic_unhidden: general_forum_topic_unhidden.unwrap_or(None),
+                    giveaway_created: giveaway_created.unwrap_or(None),
+                    giveaway: giveaway.unwrap_or(None),
+                    giveaway_winners: giveaway_winners.unwrap_or(None),
+                    giveaway_completed: giveaway_completed.unwrap_or(None),
+                    paid_message_price_changed: paid_message_price_changed.unwrap_or(None),
+                    suggested_post_approved: suggested_post_approved.unwrap_or(None),
+                    suggested_post_approval_failed: suggested_post_approval_failed.unwrap_or(None),
+                    suggested_post_declined: suggested_post_declined.unwrap_or(None),
+                    suggested_post_paid: suggested_post_paid.unwrap_or(None),
+                    suggested_post_refunded: suggested_post_refunded.unwrap_or(None),
+                    video_chat_scheduled: video_chat_scheduled.unwrap_or(None),
+                    video_chat_started: video_chat_started.unwrap_or(None),
+                    video_chat_ended: video_chat_ended.unwrap_or(None),
+                    video_chat_participants_invited: video_chat_participants_invited
+                        .unwrap_or(None),
+                    web_app_data: web_app_data.unwrap_or(None),
+                    reply_markup: reply_markup.unwrap_or(None),
+                })
+            }
+        }
+
+        deserializer.deserialize_struct("Message", FIELDS, StructVisitor)
+    }
+}
+
+#[cfg(test)]
+mod message_deserialize_tests {
+    use super::*;
+
+    /// Message with the derived Deserialize impl (same name, so error messages match).
+    #[derive(Serialize, Deserialize)]
+    struct Message {
+        message_id: i64,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        message_thread_id: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        direct_messages_topic: Option<Box<DirectMessagesTopic>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        from: Option<Box<User>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        sender_chat: Option<Box<Chat>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        sender_boost_count: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        sender_business_bot: Option<Box<User>>,
+        date: i64,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        business_connection_id: Option<String>,
+        chat: Chat,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        forward_origin: Option<Box<MessageOrigin>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        is_topic_message: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        is_automatic_forward: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        reply_to_message: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        external_reply: Option<Box<ExternalReplyInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        quote: Option<Box<TextQuote>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        reply_to_story: Option<Box<Story>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        reply_to_checklist_task_id: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        via_bot: Option<Box<User>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        edit_date: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        has_protected_content: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        is_from_offline: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        is_paid_post: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        media_group_id: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        author_signature: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        paid_star_count: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        text: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        entities: Option<ShortVec<MessageEntity, 2>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        link_preview_options: Option<Box<LinkPreviewOptions>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_info: Option<Box<SuggestedPostInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        effect_id: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        animation: Option<Box<Animation>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        audio: Option<Box<Audio>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        document: Option<Box<Document>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        paid_media: Option<Box<PaidMediaInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        photo: Option<ShortVec<PhotoSize, 4>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        sticker: Option<Box<Sticker>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        story: Option<Box<Story>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video: Option<Box<Video>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video_note: Option<Box<VideoNote>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        voice: Option<Box<Voice>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        caption: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        caption_entities: Option<ShortVec<MessageEntity, 2>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        show_caption_above_media: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        has_media_spoiler: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        checklist: Option<Box<Checklist>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        contact: Option<Box<Contact>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        dice: Option<Box<Dice>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        game: Option<Box<Game>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        poll: Option<Box<Poll>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        venue: Option<Box<Venue>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        location: Option<Box<Location>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        new_chat_members: Option<ShortVec<User, 1>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        left_chat_member: Option<Box<User>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_owner_left: Option<Box<ChatOwnerLeft>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_owner_changed: Option<Box<ChatOwnerChanged>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        new_chat_title: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        new_chat_photo: Option<ShortVec<PhotoSize, 4>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        delete_chat_photo: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        group_chat_created: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        supergroup_chat_created: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        channel_chat_created: Option<bool>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        message_auto_delete_timer_changed: Option<Box<MessageAutoDeleteTimerChanged>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        migrate_to_chat_id: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        migrate_from_chat_id: Option<i64>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        pinned_message: Option<Box<MaybeInaccessibleMessage>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        invoice: Option<Box<Invoice>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        successful_payment: Option<Box<SuccessfulPayment>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        refunded_payment: Option<Box<RefundedPayment>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        users_shared: Option<Box<UsersShared>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_shared: Option<Box<ChatShared>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        gift: Option<Box<GiftInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        unique_gift: Option<Box<UniqueGiftInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        gift_upgrade_sent: Option<Box<GiftInfo>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        connected_website: Option<String>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        write_access_allowed: Option<Box<WriteAccessAllowed>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        passport_data: Option<Box<PassportData>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        proximity_alert_triggered: Option<Box<ProximityAlertTriggered>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        boost_added: Option<Box<ChatBoostAdded>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_background_set: Option<Box<ChatBackground>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        checklist_tasks_done: Option<Box<ChecklistTasksDone>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        checklist_tasks_added: Option<Box<ChecklistTasksAdded>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        direct_message_price_changed: Option<Box<DirectMessagePriceChanged>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        forum_topic_created: Option<Box<ForumTopicCreated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        forum_topic_edited: Option<Box<ForumTopicEdited>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        forum_topic_closed: Option<ForumTopicClosed>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        forum_topic_reopened: Option<ForumTopicReopened>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        general_forum_topic_hidden: Option<GeneralForumTopicHidden>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        general_forum_topic_unhidden: Option<GeneralForumTopicUnhidden>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        giveaway_created: Option<Box<GiveawayCreated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        giveaway: Option<Box<Giveaway>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        giveaway_winners: Option<Box<GiveawayWinners>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        giveaway_completed: Option<Box<GiveawayCompleted>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        paid_message_price_changed: Option<Box<PaidMessagePriceChanged>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_approved: Option<Box<SuggestedPostApproved>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_approval_failed: Option<Box<SuggestedPostApprovalFailed>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_declined: Option<Box<SuggestedPostDeclined>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_paid: Option<Box<SuggestedPostPaid>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        suggested_post_refunded: Option<Box<SuggestedPostRefunded>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video_chat_scheduled: Option<Box<VideoChatScheduled>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video_chat_started: Option<VideoChatStarted>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video_chat_ended: Option<Box<VideoChatEnded>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        video_chat_participants_invited: Option<Box<VideoChatParticipantsInvited>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        web_app_data: Option<Box<WebAppData>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        reply_markup: Option<Box<InlineKeyboardMarkup>>,
+    }
+
+    #[test]
+    fn matches_derived() {
+        for json in [
+            r##"{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}}"##,
+            r##"{"message_id":1,"message_thread_id":1,"direct_messages_topic":{"topic_id":1},"from":{"id":1,"is_bot":true,"first_name":"x"},"sender_chat":{"id":1,"type":"private"},"sender_boost_count":1,"sender_business_bot":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"business_connection_id":"x","chat":{"id":1,"type":"private"},"forward_origin":{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}},"is_topic_message":true,"is_automatic_forward":true,"reply_to_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"external_reply":{"origin":{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}}},"quote":{"text":"x","position":1},"reply_to_story":{"chat":{"id":1,"type":"private"},"id":1},"reply_to_checklist_task_id":1,"via_bot":{"id":1,"is_bot":true,"first_name":"x"},"edit_date":1,"has_protected_content":true,"is_from_offline":true,"is_paid_post":true,"media_group_id":"x","author_signature":"x","paid_star_count":1,"text":"x","entities":[{"type":"mention","offset":1,"length":1}],"link_preview_options":{},"suggested_post_info":{"state":"pending"},"effect_id":"x","animation":{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},"audio":{"file_id":"x","file_unique_id":"x","duration":1},"document":{"file_id":"x","file_unique_id":"x"},"paid_media":{"star_count":1,"paid_media":[{"type":"preview"}]},"photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],"sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"story":{"chat":{"id":1,"type":"private"},"id":1},"video":{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},"video_note":{"file_id":"x","file_unique_id":"x","length":1,"duration":1},"voice":{"file_id":"x","file_unique_id":"x","duration":1},"caption":"x","caption_entities":[{"type":"mention","offset":1,"length":1}],"show_caption_above_media":true,"has_media_spoiler":true,"checklist":{"title":"x","tasks":[{"id":1,"text":"x"}]},"contact":{"phone_number":"x","first_name":"x"},"dice":{"emoji":"x","value":1},"game":{"title":"x","description":"x","photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}]},"poll":{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},"venue":{"location":{"latitude":1.5,"longitude":1.5},"title":"x","address":"x"},"location":{"latitude":1.5,"longitude":1.5},"new_chat_members":[{"id":1,"is_bot":true,"first_name":"x"}],"left_chat_member":{"id":1,"is_bot":true,"first_name":"x"},"chat_owner_left":{},"chat_owner_changed":{"new_owner":{"id":1,"is_bot":true,"first_name":"x"}},"new_chat_title":"x","new_chat_photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],"delete_chat_photo":true,"group_chat_created":true,"supergroup_chat_created":true,"channel_chat_created":true,"message_auto_delete_timer_changed":{"message_auto_delete_time":1},"migrate_to_chat_id":1,"migrate_from_chat_id":1,"pinned_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"invoice":{"title":"x","description":"x","start_parameter":"x","currency":"x","total_amount":1},"successful_payment":{"currency":"x","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x","provider_payment_charge_id":"x"},"refunded_payment":{"currency":"XTR","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x"},"users_shared":{"request_id":1,"users":[{"user_id":1}]},"chat_shared":{"request_id":1,"chat_id":1},"gift":{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},"unique_gift":{"gift":{"gift_id":"x","base_name":"x","name":"x","number":1,"model":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"symbol":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"backdrop":{"name":"x","colors":{"center_color":1,"edge_color":1,"symbol_color":1,"text_color":1},"rarity_per_mille":1}},"origin":"upgrade"},"gift_upgrade_sent":{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},"connected_website":"x","write_access_allowed":{},"passport_data":{"data":[{"type":"personal_details","hash":"x"}],"credentials":{"data":"x","hash":"x","secret":"x"}},"proximity_alert_triggered":{"traveler":{"id":1,"is_bot":true,"first_name":"x"},"watcher":{"id":1,"is_bot":true,"first_name":"x"},"distance":1},"boost_added":{"boost_count":1},"chat_background_set":{"type":{"type":"fill","fill":{"type":"solid","color":1},"dark_theme_dimming":1}},"checklist_tasks_done":{},"checklist_tasks_added":{"tasks":[{"id":1,"text":"x"}]},"direct_message_price_changed":{"are_direct_messages_enabled":true},"forum_topic_created":{"name":"x","icon_color":1},"forum_topic_edited":{},"forum_topic_closed":{},"forum_topic_reopened":{},"general_forum_topic_hidden":{},"general_forum_topic_unhidden":{},"giveaway_created":{},"giveaway":{"chats":[{"id":1,"type":"private"}],"winners_selection_date":1,"winner_count":1},"giveaway_winners":{"chat":{"id":1,"type":"private"},"giveaway_message_id":1,"winners_selection_date":1,"winner_count":1,"winners":[{"id":1,"is_bot":true,"first_name":"x"}]},"giveaway_completed":{"winner_count":1},"paid_message_price_changed":{"paid_message_star_count":1},"suggested_post_approved":{"send_date":1},"suggested_post_approval_failed":{"price":{"currency":"XTR","amount":1}},"suggested_post_declined":{},"suggested_post_paid":{"currency":"XTR"},"suggested_post_refunded":{"reason":"post_deleted"},"video_chat_scheduled":{"start_date":1},"video_chat_started":{},"video_chat_ended":{"duration":1},"video_chat_participants_invited":{"users":[{"id":1,"is_bot":true,"first_name":"x"}]},"web_app_data":{"data":"x","button_text":"x"},"reply_markup":{"inline_keyboard":[[{"text":"x"}]]}}"##,
+            r##"{"message_id":1,"message_thread_id":1,"direct_messages_topic":{"topic_id":1},"from":{"id":1,"is_bot":true,"first_name":"x"},"sender_chat":{"id":1,"type":"private"},"sender_boost_count":1,"sender_business_bot":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"business_connection_id":"x","chat":{"id":1,"type":"private"},"forward_origin":{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}},"is_topic_message":true,"is_automatic_forward":true,"reply_to_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"external_reply":{"origin":{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}}},"quote":{"text":"x","position":1},"reply_to_story":{"chat":{"id":1,"type":"private"},"id":1},"reply_to_checklist_task_id":1,"via_bot":{"id":1,"is_bot":true,"first_name":"x"},"edit_date":1,"has_protected_content":true,"is_from_offline":true,"is_paid_post":true,"media_group_id":"x","author_signature":"x","paid_star_count":1,"text":"x","entities":[{"type":"mention","offset":1,"length":1}],"link_preview_options":{},"suggested_post_info":{"state":"pending"},"effect_id":"x","animation":{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},"audio":{"file_id":"x","file_unique_id":"x","duration":1},"document":{"file_id":"x","file_unique_id":"x"},"paid_media":{"star_count":1,"paid_media":[{"type":"preview"}]},"photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],"sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"story":{"chat":{"id":1,"type":"private"},"id":1},"video":{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},"video_note":{"file_id":"x","file_unique_id":"x","length":1,"duration":1},"voice":{"file_id":"x","file_unique_id":"x","duration":1},"caption":"x","caption_entities":[{"type":"mention","offset":1,"length":1}],"show_caption_above_media":true,"has_media_spoiler":true,"checklist":{"title":"x","tasks":[{"id":1,"text":"x"}]},"contact":{"phone_number":"x","first_name":"x"},"dice":{"emoji":"x","value":1},"game":{"title":"x","description":"x","photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}]},"poll":{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},"venue":{"location":{"latitude":1.5,"longitude":1.5},"title":"x","address":"x"},"location":{"latitude":1.5,"longitude":1.5},"new_chat_members":[{"id":1,"is_bot":true,"first_name":"x"}],"left_chat_member":{"id":1,"is_bot":true,"first_name":"x"},"chat_owner_left":{},"chat_owner_changed":{"new_owner":{"id":1,"is_bot":true,"first_name":"x"}},"new_chat_title":"x","new_chat_photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],"delete_chat_photo":true,"group_chat_created":true,"supergroup_chat_created":true,"channel_chat_created":true,"message_auto_delete_timer_changed":{"message_auto_delete_time":1},"migrate_to_chat_id":1,"migrate_from_chat_id":1,"pinned_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"invoice":{"title":"x","description":"x","start_parameter":"x","currency":"x","total_amount":1},"successful_payment":{"currency":"x","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x","provider_payment_charge_id":"x"},"refunded_payment":{"currency":"XTR","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x"},"users_shared":{"request_id":1,"users":[{"user_id":1}]},"chat_shared":{"request_id":1,"chat_id":1},"gift":{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},"unique_gift":{"gift":{"gift_id":"x","base_name":"x","name":"x","number":1,"model":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"symbol":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"backdrop":{"name":"x","colors":{"center_color":1,"edge_color":1,"symbol_color":1,"text_color":1},"rarity_per_mille":1}},"origin":"upgrade"},"gift_upgrade_sent":{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},"connected_website":"x","write_access_allowed":{},"passport_data":{"data":[{"type":"personal_details","hash":"x"}],"credentials":{"data":"x","hash":"x","secret":"x"}},"proximity_alert_triggered":{"traveler":{"id":1,"is_bot":true,"first_name":"x"},"watcher":{"id":1,"is_bot":true,"first_name":"x"},"distance":1},"boost_added":{"boost_count":1},"chat_background_set":{"type":{"type":"fill","fill":{"type":"solid","color":1},"dark_theme_dimming":1}},"checklist_tasks_done":{},"checklist_tasks_added":{"tasks":[{"id":1,"text":"x"}]},"direct_message_price_changed":{"are_direct_messages_enabled":true},"forum_topic_created":{"name":"x","icon_color":1},"forum_topic_edited":{},"forum_topic_closed":{},"forum_topic_reopened":{},"general_forum_topic_hidden":{},"general_forum_topic_unhidden":{},"giveaway_created":{},"giveaway":{"chats":[{"id":1,"type":"private"}],"winners_selection_date":1,"winner_count":1},"giveaway_winners":{"chat":{"id":1,"type":"private"},"giveaway_message_id":1,"winners_selection_date":1,"winner_count":1,"winners":[{"id":1,"is_bot":true,"first_name":"x"}]},"giveaway_completed":{"winner_count":1},"paid_message_price_changed":{"paid_message_star_count":1},"suggested_post_approved":{"send_date":1},"suggested_post_approval_failed":{"price":{"currency":"XTR","amount":1}},"suggested_post_declined":{},"suggested_post_paid":{"currency":"XTR"},"suggested_post_refunded":{"reason":"post_deleted"},"video_chat_scheduled":{"start_date":1},"video_chat_started":{},"video_chat_ended":{"duration":1},"video_chat_participants_invited":{"users":[{"id":1,"is_bot":true,"first_name":"x"}]},"web_app_data":{"data":"x","button_text":"x"},"reply_markup":{"inline_keyboard":[[{"text":"x"}]]},"unknown_field":{"nested":[1,null]}}"##,
+            r##"{"message_id":1,"date":1,"chat":{"id":1,"type":"private"},"message_thread_id":null,"direct_messages_topic":null,"from":null,"sender_chat":null,"sender_boost_count":null,"sender_business_bot":null,"business_connection_id":null,"forward_origin":null,"is_topic_message":null,"is_automatic_forward":null,"reply_to_message":null,"external_reply":null,"quote":null,"reply_to_story":null,"reply_to_checklist_task_id":null,"via_bot":null,"edit_date":null,"has_protected_content":null,"is_from_offline":null,"is_paid_post":null,"media_group_id":null,"author_signature":null,"paid_star_count":null,"text":null,"entities":null,"link_preview_options":null,"suggested_post_info":null,"effect_id":null,"animation":null,"audio":null,"document":null,"paid_media":null,"photo":null,"sticker":null,"story":null,"video":null,"video_note":null,"voice":null,"caption":null,"caption_entities":null,"show_caption_above_media":null,"has_media_spoiler":null,"checklist":null,"contact":null,"dice":null,"game":null,"poll":null,"venue":null,"location":null,"new_chat_members":null,"left_chat_member":null,"chat_owner_left":null,"chat_owner_changed":null,"new_chat_title":null,"new_chat_photo":null,"delete_chat_photo":null,"group_chat_created":null,"supergroup_chat_created":null,"channel_chat_created":null,"message_auto_delete_timer_changed":null,"migrate_to_chat_id":null,"migrate_from_chat_id":null,"pinned_message":null,"invoice":null,"successful_payment":null,"refunded_payment":null,"users_shared":null,"chat_shared":null,"gift":null,"unique_gift":null,"gift_upgrade_sent":null,"connected_website":null,"write_access_allowed":null,"passport_data":null,"proximity_alert_triggered":null,"boost_added":null,"chat_background_set":null,"checklist_tasks_done":null,"checklist_tasks_added":null,"direct_message_price_changed":null,"forum_topic_created":null,"forum_topic_edited":null,"forum_topic_closed":null,"forum_topic_reopened":null,"general_forum_topic_hidden":null,"general_forum_topic_unhidden":null,"giveaway_created":null,"giveaway":null,"giveaway_winners":null,"giveaway_completed":null,"paid_message_price_changed":null,"suggested_post_approved":null,"suggested_post_approval_failed":null,"suggested_post_declined":null,"suggested_post_paid":null,"suggested_post_refunded":null,"video_chat_scheduled":null,"video_chat_started":null,"video_chat_ended":null,"video_chat_participants_invited":null,"web_app_data":null,"reply_markup":null}"##,
+            r##"[]"##,
+            r##"[1,1,{"topic_id":1},{"id":1,"is_bot":true,"first_name":"x"},{"id":1,"type":"private"},1,{"id":1,"is_bot":true,"first_name":"x"},1,"x",{"id":1,"type":"private"},{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}},true,true,{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"origin":{"type":"user","date":1,"sender_user":{"id":1,"is_bot":true,"first_name":"x"}}},{"text":"x","position":1},{"chat":{"id":1,"type":"private"},"id":1},1,{"id":1,"is_bot":true,"first_name":"x"},1,true,true,true,"x","x",1,"x",[{"type":"mention","offset":1,"length":1}],{},{"state":"pending"},"x",{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},{"file_id":"x","file_unique_id":"x","duration":1},{"file_id":"x","file_unique_id":"x"},{"star_count":1,"paid_media":[{"type":"preview"}]},[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},{"chat":{"id":1,"type":"private"},"id":1},{"file_id":"x","file_unique_id":"x","width":1,"height":1,"duration":1},{"file_id":"x","file_unique_id":"x","length":1,"duration":1},{"file_id":"x","file_unique_id":"x","duration":1},"x",[{"type":"mention","offset":1,"length":1}],true,true,{"title":"x","tasks":[{"id":1,"text":"x"}]},{"phone_number":"x","first_name":"x"},{"emoji":"x","value":1},{"title":"x","description":"x","photo":[{"file_id":"x","file_unique_id":"x","width":1,"height":1}]},{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},{"location":{"latitude":1.5,"longitude":1.5},"title":"x","address":"x"},{"latitude":1.5,"longitude":1.5},[{"id":1,"is_bot":true,"first_name":"x"}],{"id":1,"is_bot":true,"first_name":"x"},{},{"new_owner":{"id":1,"is_bot":true,"first_name":"x"}},"x",[{"file_id":"x","file_unique_id":"x","width":1,"height":1}],true,true,true,true,{"message_auto_delete_time":1},1,1,{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"title":"x","description":"x","start_parameter":"x","currency":"x","total_amount":1},{"currency":"x","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x","provider_payment_charge_id":"x"},{"currency":"XTR","total_amount":1,"invoice_payload":"x","telegram_payment_charge_id":"x"},{"request_id":1,"users":[{"user_id":1}]},{"request_id":1,"chat_id":1},{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},{"gift":{"gift_id":"x","base_name":"x","name":"x","number":1,"model":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"symbol":{"name":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"rarity_per_mille":1},"backdrop":{"name":"x","colors":{"center_color":1,"edge_color":1,"symbol_color":1,"text_color":1},"rarity_per_mille":1}},"origin":"upgrade"},{"gift":{"id":"x","sticker":{"file_id":"x","file_unique_id":"x","type":"regular","width":1,"height":1,"is_animated":true,"is_video":true},"star_count":1}},"x",{},{"data":[{"type":"personal_details","hash":"x"}],"credentials":{"data":"x","hash":"x","secret":"x"}},{"traveler":{"id":1,"is_bot":true,"first_name":"x"},"watcher":{"id":1,"is_bot":true,"first_name":"x"},"distance":1},{"boost_count":1},{"type":{"type":"fill","fill":{"type":"solid","color":1},"dark_theme_dimming":1}},{},{"tasks":[{"id":1,"text":"x"}]},{"are_direct_messages_enabled":true},{"name":"x","icon_color":1},{},{},{},{},{},{},{"chats":[{"id":1,"type":"private"}],"winners_selection_date":1,"winner_count":1},{"chat":{"id":1,"type":"private"},"giveaway_message_id":1,"winners_selection_date":1,"winner_count":1,"winners":[{"id":1,"is_bot":true,"first_name":"x"}]},{"winner_count":1},{"paid_message_star_count":1},{"send_date":1},{"price":{"currency":"XTR","amount":1}},{},{"currency":"XTR"},{"reason":"post_deleted"},{"start_date":1},{},{"duration":1},{"users":[{"id":1,"is_bot":true,"first_name":"x"}]},{"data":"x","button_text":"x"},{"inline_keyboard":[[{"text":"x"}]]}]"##,
+            r##"{"date":1,"chat":{"id":1,"type":"private"}}"##,
+            r##"{"message_id":1,"chat":{"id":1,"type":"private"}}"##,
+            r##"{"message_id":1,"date":1}"##,
+            r##"{"message_id":1,"date":1,"chat":{"id":1,"type":"private"},"reply_markup":{"inline_keyboard": [[{"text": "x"}]]},"reply_markup":{"inline_keyboard": [[{"text": "x"}]]}}"##,
+            r##"{"reply_markup":"##,
+        ] {
+            let fast = serde_json::from_str::<super::Message>(json)
+                .map(|v| serde_json::to_value(v).unwrap())
+                .map_err(|e| e.to_string());
+            let derived = serde_json::from_str::<Message>(json)
+                .map(|v| serde_json::to_value(v).unwrap())
+                .map_err(|e| e.to_string());
+            assert_eq!(fast, derived, "{}", json);
+        }
+    }
+}
+
 /// This object represents a service message about a change in auto-delete timer settings.
 /// https://core.telegram.org/bots/api#messageautodeletetimerchanged
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3840,7 +6949,7 @@ pub struct MessageAutoDeleteTimerChanged {
 pub struct MessageEntity {
     /// Type of the entity. Currently, can be "mention" (@username), "hashtag" (#hashtag or #hashtag@chatusername), "cashtag" ($USD or $USD@chatusername), "bot_command" (/start@jobs_bot), "url" (https://telegram.org), "email" (do-not-reply@telegram.org), "phone_number" (+1-212-555-0123), "bold" (bold text), "italic" (italic text), "underline" (underlined text), "strikethrough" (strikethrough text), "spoiler" (spoiler message), "blockquote" (block quotation), "expandable_blockquote" (collapsed-by-default block quotation), "code" (monowidth string), "pre" (monowidth block), "text_link" (for clickable text URLs), "text_mention" (for users without usernames), "custom_emoji" (for inline custom emoji stickers)
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: MessageEntityType,
     /// Offset in UTF-16 code units to the start of the entity
     pub offset: i64,
     /// Length of the entity in UTF-16 code units
@@ -3850,13 +6959,156 @@ pub struct MessageEntity {
     pub url: Option<String>,
     /// Optional. For "text_mention" only, the mentioned user
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub user: Option<Box<User>>,
+    pub user: Option<User>,
     /// Optional. For "pre" only, the programming language of the entity text
     #[serde(skip_serializing_if = "Option::is_none")]
     pub language: Option<String>,
     /// Optional. For "custom_emoji" only, unique identifier of the custom emoji. Use getCustomEmojiStickers to get full information about the sticker
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub custom_emoji_id: Option<String>,
+    pub custom_emoji_id: Option<ShortString>,
+}
+
+/// Values of `MessageEntity.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum MessageEntityType {
+    /// `"mention"`
+    Mention,
+    /// `"hashtag"`
+    Hashtag,
+    /// `"cashtag"`
+    Cashtag,
+    /// `"bot_command"`
+    BotCommand,
+    /// `"url"`
+    Url,
+    /// `"email"`
+    Email,
+    /// `"phone_number"`
+    PhoneNumber,
+    /// `"bold"`
+    Bold,
+    /// `"italic"`
+    Italic,
+    /// `"underline"`
+    Underline,
+    /// `"strikethrough"`
+    Strikethrough,
+    /// `"spoiler"`
+    Spoiler,
+    /// `"blockquote"`
+    Blockquote,
+    /// `"expandable_blockquote"`
+    ExpandableBlockquote,
+    /// `"code"`
+    Code,
+    /// `"pre"`
+    Pre,
+    /// `"text_link"`
+    TextLink,
+    /// `"text_mention"`
+    TextMention,
+    /// `"custom_emoji"`
+    CustomEmoji,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl MessageEntityType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Mention => "mention",
+            Self::Hashtag => "hashtag",
+            Self::Cashtag => "cashtag",
+            Self::BotCommand => "bot_command",
+            Self::Url => "url",
+            Self::Email => "email",
+            Self::PhoneNumber => "phone_number",
+            Self::Bold => "bold",
+            Self::Italic => "italic",
+            Self::Underline => "underline",
+            Self::Strikethrough => "strikethrough",
+            Self::Spoiler => "spoiler",
+            Self::Blockquote => "blockquote",
+            Self::ExpandableBlockquote => "expandable_blockquote",
+            Self::Code => "code",
+            Self::Pre => "pre",
+            Self::TextLink => "text_link",
+            Self::TextMention => "text_mention",
+            Self::CustomEmoji => "custom_emoji",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for MessageEntityType {
+    fn from(value: &str) -> Self {
+        match value {
+            "mention" => Self::Mention,
+            "hashtag" => Self::Hashtag,
+            "cashtag" => Self::Cashtag,
+            "bot_command" => Self::BotCommand,
+            "url" => Self::Url,
+            "email" => Self::Email,
+            "phone_number" => Self::PhoneNumber,
+            "bold" => Self::Bold,
+            "italic" => Self::Italic,
+            "underline" => Self::Underline,
+            "strikethrough" => Self::Strikethrough,
+            "spoiler" => Self::Spoiler,
+            "blockquote" => Self::Blockquote,
+            "expandable_blockquote" => Self::ExpandableBlockquote,
+            "code" => Self::Code,
+            "pre" => Self::Pre,
+            "text_link" => Self::TextLink,
+            "text_mention" => Self::TextMention,
+            "custom_emoji" => Self::CustomEmoji,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for MessageEntityType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for MessageEntityType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for MessageEntityType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for MessageEntityType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for MessageEntityType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = MessageEntityType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<MessageEntityType, E> {
+                Ok(MessageEntityType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
 }
 
 /// This object represents a unique message identifier.
@@ -3873,7 +7125,7 @@ pub struct MessageId {
 /// - MessageOriginChat
 /// - MessageOriginChannel
 /// https://core.telegram.org/bots/api#messageorigin
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum MessageOrigin {
     MessageOriginUser(MessageOriginUser),
@@ -3882,6 +7134,31 @@ pub enum MessageOrigin {
     MessageOriginChannel(MessageOriginChannel),
 }
 
+impl<'de> Deserialize<'de> for MessageOrigin {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["user", "hidden_user", "chat", "channel"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("user") => serde_json::from_str(raw.get()).map(Self::MessageOriginUser),
+            Some("hidden_user") => {
+                serde_json::from_str(raw.get()).map(Self::MessageOriginHiddenUser)
+            }
+            Some("chat") => serde_json::from_str(raw.get()).map(Self::MessageOriginChat),
+            Some("channel") => serde_json::from_str(raw.get()).map(Self::MessageOriginChannel),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The message was originally sent to a channel chat.
 /// https://core.telegram.org/bots/api#messageoriginchannel
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -3953,7 +7230,7 @@ pub struct MessageReactionCountUpdated {
     /// Date of the change in Unix time
     pub date: i64,
     /// List of reactions that are present on the message
-    pub reactions: Vec<ReactionCount>,
+    pub reactions: ShortVec<ReactionCount, 4>,
 }
 
 /// This object represents a change of a reaction on a message performed by a user.
@@ -3973,9 +7250,9 @@ pub struct MessageReactionUpdated {
     /// Date of the change in Unix time
     pub date: i64,
     /// Previous list of reaction types that were set by the user
-    pub old_reaction: Vec<ReactionType>,
+    pub old_reaction: ShortVec<ReactionType, 2>,
     /// New list of reaction types that have been set by the user
-    pub new_reaction: Vec<ReactionType>,
+    pub new_reaction: ShortVec<ReactionType, 2>,
 }
 
 /// This object represents information about an order.
@@ -3993,20 +7270,41 @@ pub struct OrderInfo {
     pub email: Option<String>,
     /// Optional. User shipping address
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub shipping_address: Option<Box<ShippingAddress>>,
+    pub shipping_address: Option<ShippingAddress>,
 }
 
 /// This object describes a gift received and owned by a user or a chat. Currently, it can be one of
 /// - OwnedGiftRegular
 /// - OwnedGiftUnique
 /// https://core.telegram.org/bots/api#ownedgift
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum OwnedGift {
     OwnedGiftRegular(OwnedGiftRegular),
     OwnedGiftUnique(OwnedGiftUnique),
 }
 
+impl<'de> Deserialize<'de> for OwnedGift {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["regular", "unique"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("regular") => serde_json::from_str(raw.get()).map(Self::OwnedGiftRegular),
+            Some("unique") => serde_json::from_str(raw.get()).map(Self::OwnedGiftUnique),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Describes a regular gift owned by a user or a chat.
 /// https://core.telegram.org/bots/api#ownedgiftregular
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4029,7 +7327,7 @@ pub struct OwnedGiftRegular {
     pub text: Option<String>,
     /// Optional. Special entities that appear in the text
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub entities: Option<Vec<MessageEntity>>,
+    pub entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. True, if the sender and gift text are shown only to the gift receiver; otherwise, everyone will be able to see them
     #[serde(skip_serializing_if = "Option::is_none")]
     pub is_private: Option<bool>,
@@ -4105,7 +7403,7 @@ pub struct OwnedGifts {
 /// - PaidMediaPhoto
 /// - PaidMediaVideo
 /// https://core.telegram.org/bots/api#paidmedia
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum PaidMedia {
     PaidMediaPreview(PaidMediaPreview),
@@ -4113,6 +7411,28 @@ pub enum PaidMedia {
     PaidMediaVideo(PaidMediaVideo),
 }
 
+impl<'de> Deserialize<'de> for PaidMedia {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["preview", "photo", "video"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("preview") => serde_json::from_str(raw.get()).map(Self::PaidMediaPreview),
+            Some("photo") => serde_json::from_str(raw.get()).map(Self::PaidMediaPhoto),
+            Some("video") => serde_json::from_str(raw.get()).map(Self::PaidMediaVideo),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Describes the paid media added to a message.
 /// https://core.telegram.org/bots/api#paidmediainfo
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4131,7 +7451,7 @@ pub struct PaidMediaPhoto {
     #[serde(rename = "type")]
     pub r#type: String,
     /// The photo
-    pub photo: Vec<PhotoSize>,
+    pub photo: ShortVec<PhotoSize, 4>,
 }
 
 /// The paid media isn't available before the payment.
@@ -4202,7 +7522,7 @@ pub struct PassportData {
 /// - PassportElementErrorTranslationFiles
 /// - PassportElementErrorUnspecified
 /// https://core.telegram.org/bots/api#passportelementerror
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum PassportElementError {
     PassportElementErrorDataField(PassportElementErrorDataField),
@@ -4216,6 +7536,61 @@ pub enum PassportElementError {
     PassportElementErrorUnspecified(PassportElementErrorUnspecified),
 }
 
+impl<'de> Deserialize<'de> for PassportElementError {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "data",
+            "front_side",
+            "reverse_side",
+            "selfie",
+            "file",
+            "files",
+            "translation_file",
+            "translation_files",
+            "unspecified",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(
+                rename = "source",
+                borrow,
+                default,
+                deserialize_with = "borrow_opt_str"
+            )]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("data") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorDataField)
+            }
+            Some("front_side") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorFrontSide)
+            }
+            Some("reverse_side") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorReverseSide)
+            }
+            Some("selfie") => serde_json::from_str(raw.get()).map(Self::PassportElementErrorSelfie),
+            Some("file") => serde_json::from_str(raw.get()).map(Self::PassportElementErrorFile),
+            Some("files") => serde_json::from_str(raw.get()).map(Self::PassportElementErrorFiles),
+            Some("translation_file") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorTranslationFile)
+            }
+            Some("translation_files") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorTranslationFiles)
+            }
+            Some("unspecified") => {
+                serde_json::from_str(raw.get()).map(Self::PassportElementErrorUnspecified)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("source")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Represents an issue in one of the data fields that was provided by the user. The error is considered resolved when the field's value changes.
 /// https://core.telegram.org/bots/api#passportelementerrordatafield
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4224,7 +7599,7 @@ pub struct PassportElementErrorDataField {
     pub source: String,
     /// The section of the user's Telegram Passport which has the error, one of "personal_details", "passport", "driver_license", "identity_card", "internal_passport", "address"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorDataFieldType,
     /// Name of the data field which has the error
     pub field_name: String,
     /// Base64-encoded data hash
@@ -4233,6 +7608,100 @@ pub struct PassportElementErrorDataField {
     pub message: String,
 }
 
+/// Values of `PassportElementErrorDataField.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PassportElementErrorDataFieldType {
+    /// `"personal_details"`
+    PersonalDetails,
+    /// `"passport"`
+    Passport,
+    /// `"driver_license"`
+    DriverLicense,
+    /// `"identity_card"`
+    IdentityCard,
+    /// `"internal_passport"`
+    InternalPassport,
+    /// `"address"`
+    Address,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PassportElementErrorDataFieldType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::PersonalDetails => "personal_details",
+            Self::Passport => "passport",
+            Self::DriverLicense => "driver_license",
+            Self::IdentityCard => "identity_card",
+            Self::InternalPassport => "internal_passport",
+            Self::Address => "address",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PassportElementErrorDataFieldType {
+    fn from(value: &str) -> Self {
+        match value {
+            "personal_details" => Self::PersonalDetails,
+            "passport" => Self::Passport,
+            "driver_license" => Self::DriverLicense,
+            "identity_card" => Self::IdentityCard,
+            "internal_passport" => Self::InternalPassport,
+            "address" => Self::Address,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PassportElementErrorDataFieldType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PassportElementErrorDataFieldType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PassportElementErrorDataFieldType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PassportElementErrorDataFieldType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PassportElementErrorDataFieldType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PassportElementErrorDataFieldType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<PassportElementErrorDataFieldType, E> {
+                Ok(PassportElementErrorDataFieldType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents an issue with a document scan. The error is considered resolved when the file with the document scan changes.
 /// https://core.telegram.org/bots/api#passportelementerrorfile
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4241,13 +7710,103 @@ pub struct PassportElementErrorFile {
     pub source: String,
     /// The section of the user's Telegram Passport which has the issue, one of "utility_bill", "bank_statement", "rental_agreement", "passport_registration", "temporary_registration"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorFileType,
     /// Base64-encoded file hash
     pub file_hash: String,
     /// Error message
     pub message: String,
 }
 
+/// Values of `PassportElementErrorFile.type`, `PassportElementErrorFiles.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PassportElementErrorFileType {
+    /// `"utility_bill"`
+    UtilityBill,
+    /// `"bank_statement"`
+    BankStatement,
+    /// `"rental_agreement"`
+    RentalAgreement,
+    /// `"passport_registration"`
+    PassportRegistration,
+    /// `"temporary_registration"`
+    TemporaryRegistration,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PassportElementErrorFileType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::UtilityBill => "utility_bill",
+            Self::BankStatement => "bank_statement",
+            Self::RentalAgreement => "rental_agreement",
+            Self::PassportRegistration => "passport_registration",
+            Self::TemporaryRegistration => "temporary_registration",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PassportElementErrorFileType {
+    fn from(value: &str) -> Self {
+        match value {
+            "utility_bill" => Self::UtilityBill,
+            "bank_statement" => Self::BankStatement,
+            "rental_agreement" => Self::RentalAgreement,
+            "passport_registration" => Self::PassportRegistration,
+            "temporary_registration" => Self::TemporaryRegistration,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PassportElementErrorFileType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PassportElementErrorFileType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PassportElementErrorFileType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PassportElementErrorFileType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PassportElementErrorFileType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PassportElementErrorFileType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<PassportElementErrorFileType, E> {
+                Ok(PassportElementErrorFileType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents an issue with a list of scans. The error is considered resolved when the list of files containing the scans changes.
 /// https://core.telegram.org/bots/api#passportelementerrorfiles
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4256,7 +7815,7 @@ pub struct PassportElementErrorFiles {
     pub source: String,
     /// The section of the user's Telegram Passport which has the issue, one of "utility_bill", "bank_statement", "rental_agreement", "passport_registration", "temporary_registration"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorFileType,
     /// List of base64-encoded file hashes
     pub file_hashes: Vec<String>,
     /// Error message
@@ -4271,13 +7830,99 @@ pub struct PassportElementErrorFrontSide {
     pub source: String,
     /// The section of the user's Telegram Passport which has the issue, one of "passport", "driver_license", "identity_card", "internal_passport"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorFrontSideType,
     /// Base64-encoded hash of the file with the front side of the document
     pub file_hash: String,
     /// Error message
     pub message: String,
 }
 
+/// Values of `PassportElementErrorFrontSide.type`, `PassportElementErrorSelfie.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PassportElementErrorFrontSideType {
+    /// `"passport"`
+    Passport,
+    /// `"driver_license"`
+    DriverLicense,
+    /// `"identity_card"`
+    IdentityCard,
+    /// `"internal_passport"`
+    InternalPassport,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PassportElementErrorFrontSideType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Passport => "passport",
+            Self::DriverLicense => "driver_license",
+            Self::IdentityCard => "identity_card",
+            Self::InternalPassport => "internal_passport",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PassportElementErrorFrontSideType {
+    fn from(value: &str) -> Self {
+        match value {
+            "passport" => Self::Passport,
+            "driver_license" => Self::DriverLicense,
+            "identity_card" => Self::IdentityCard,
+            "internal_passport" => Self::InternalPassport,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PassportElementErrorFrontSideType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PassportElementErrorFrontSideType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PassportElementErrorFrontSideType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PassportElementErrorFrontSideType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PassportElementErrorFrontSideType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PassportElementErrorFrontSideType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<PassportElementErrorFrontSideType, E> {
+                Ok(PassportElementErrorFrontSideType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents an issue with the reverse side of a document. The error is considered resolved when the file with reverse side of the document changes.
 /// https://core.telegram.org/bots/api#passportelementerrorreverseside
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4286,13 +7931,91 @@ pub struct PassportElementErrorReverseSide {
     pub source: String,
     /// The section of the user's Telegram Passport which has the issue, one of "driver_license", "identity_card"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorReverseSideType,
     /// Base64-encoded hash of the file with the reverse side of the document
     pub file_hash: String,
     /// Error message
     pub message: String,
 }
 
+/// Values of `PassportElementErrorReverseSide.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PassportElementErrorReverseSideType {
+    /// `"driver_license"`
+    DriverLicense,
+    /// `"identity_card"`
+    IdentityCard,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PassportElementErrorReverseSideType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::DriverLicense => "driver_license",
+            Self::IdentityCard => "identity_card",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PassportElementErrorReverseSideType {
+    fn from(value: &str) -> Self {
+        match value {
+            "driver_license" => Self::DriverLicense,
+            "identity_card" => Self::IdentityCard,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PassportElementErrorReverseSideType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PassportElementErrorReverseSideType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PassportElementErrorReverseSideType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PassportElementErrorReverseSideType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PassportElementErrorReverseSideType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PassportElementErrorReverseSideType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<PassportElementErrorReverseSideType, E> {
+                Ok(PassportElementErrorReverseSideType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents an issue with the selfie with a document. The error is considered resolved when the file with the selfie changes.
 /// https://core.telegram.org/bots/api#passportelementerrorselfie
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4301,7 +8024,7 @@ pub struct PassportElementErrorSelfie {
     pub source: String,
     /// The section of the user's Telegram Passport which has the issue, one of "passport", "driver_license", "identity_card", "internal_passport"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorFrontSideType,
     /// Base64-encoded hash of the file with the selfie
     pub file_hash: String,
     /// Error message
@@ -4316,13 +8039,119 @@ pub struct PassportElementErrorTranslationFile {
     pub source: String,
     /// Type of element of the user's Telegram Passport which has the issue, one of "passport", "driver_license", "identity_card", "internal_passport", "utility_bill", "bank_statement", "rental_agreement", "passport_registration", "temporary_registration"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorTranslationFileType,
     /// Base64-encoded file hash
     pub file_hash: String,
     /// Error message
     pub message: String,
 }
 
+/// Values of `PassportElementErrorTranslationFile.type`, `PassportElementErrorTranslationFiles.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PassportElementErrorTranslationFileType {
+    /// `"passport"`
+    Passport,
+    /// `"driver_license"`
+    DriverLicense,
+    /// `"identity_card"`
+    IdentityCard,
+    /// `"internal_passport"`
+    InternalPassport,
+    /// `"utility_bill"`
+    UtilityBill,
+    /// `"bank_statement"`
+    BankStatement,
+    /// `"rental_agreement"`
+    RentalAgreement,
+    /// `"passport_registration"`
+    PassportRegistration,
+    /// `"temporary_registration"`
+    TemporaryRegistration,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PassportElementErrorTranslationFileType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Passport => "passport",
+            Self::DriverLicense => "driver_license",
+            Self::IdentityCard => "identity_card",
+            Self::InternalPassport => "internal_passport",
+            Self::UtilityBill => "utility_bill",
+            Self::BankStatement => "bank_statement",
+            Self::RentalAgreement => "rental_agreement",
+            Self::PassportRegistration => "passport_registration",
+            Self::TemporaryRegistration => "temporary_registration",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PassportElementErrorTranslationFileType {
+    fn from(value: &str) -> Self {
+        match value {
+            "passport" => Self::Passport,
+            "driver_license" => Self::DriverLicense,
+            "identity_card" => Self::IdentityCard,
+            "internal_passport" => Self::InternalPassport,
+            "utility_bill" => Self::UtilityBill,
+            "bank_statement" => Self::BankStatement,
+            "rental_agreement" => Self::RentalAgreement,
+            "passport_registration" => Self::PassportRegistration,
+            "temporary_registration" => Self::TemporaryRegistration,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PassportElementErrorTranslationFileType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PassportElementErrorTranslationFileType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PassportElementErrorTranslationFileType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PassportElementErrorTranslationFileType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PassportElementErrorTranslationFileType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PassportElementErrorTranslationFileType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<PassportElementErrorTranslationFileType, E> {
+                Ok(PassportElementErrorTranslationFileType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Represents an issue with the translated version of a document. The error is considered resolved when a file with the document translation change.
 /// https://core.telegram.org/bots/api#passportelementerrortranslationfiles
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4331,7 +8160,7 @@ pub struct PassportElementErrorTranslationFiles {
     pub source: String,
     /// Type of element of the user's Telegram Passport which has the issue, one of "passport", "driver_license", "identity_card", "internal_passport", "utility_bill", "bank_statement", "rental_agreement", "passport_registration", "temporary_registration"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PassportElementErrorTranslationFileType,
     /// List of base64-encoded file hashes
     pub file_hashes: Vec<String>,
     /// Error message
@@ -4394,9 +8223,9 @@ pub struct Poll {
     pub question: String,
     /// Optional. Special entities that appear in the question. Currently, only custom emoji entities are allowed in poll questions
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub question_entities: Option<Vec<MessageEntity>>,
+    pub question_entities: Option<ShortVec<MessageEntity, 2>>,
     /// List of poll options
-    pub options: Vec<PollOption>,
+    pub options: ShortVec<PollOption, 4>,
     /// Total number of users that voted in the poll
     pub total_voter_count: i64,
     /// True, if the poll is closed
@@ -4405,7 +8234,7 @@ pub struct Poll {
     pub is_anonymous: bool,
     /// Poll type, currently can be "regular" or "quiz"
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: PollType,
     /// True, if the poll allows multiple answers
     pub allows_multiple_answers: bool,
     /// Optional. 0-based identifier of the correct answer option. Available only for polls in the quiz mode, which are closed, or was sent (not forwarded) by the bot or to the private chat with the bot.
@@ -4416,7 +8245,7 @@ pub struct Poll {
     pub explanation: Option<String>,
     /// Optional. Special entities like usernames, URLs, bot commands, etc. that appear in the explanation
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub explanation_entities: Option<Vec<MessageEntity>>,
+    pub explanation_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Amount of time in seconds the poll will be active after creation
     #[serde(skip_serializing_if = "Option::is_none")]
     pub open_period: Option<i64>,
@@ -4425,6 +8254,81 @@ pub struct Poll {
     pub close_date: Option<i64>,
 }
 
+/// Values of `Poll.type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum PollType {
+    /// `"regular"`
+    Regular,
+    /// `"quiz"`
+    Quiz,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl PollType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Regular => "regular",
+            Self::Quiz => "quiz",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for PollType {
+    fn from(value: &str) -> Self {
+        match value {
+            "regular" => Self::Regular,
+            "quiz" => Self::Quiz,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for PollType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for PollType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for PollType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for PollType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for PollType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = PollType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<PollType, E> {
+                Ok(PollType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object represents an answer of a user in a non-anonymous poll.
 /// https://core.telegram.org/bots/api#pollanswer
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4436,7 +8340,7 @@ pub struct PollAnswer {
     pub voter_chat: Option<Box<Chat>>,
     /// Optional. The user that changed the answer to the poll, if the voter isn't anonymous
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub user: Option<Box<User>>,
+    pub user: Option<User>,
     /// 0-based identifiers of chosen answer options. May be empty if the vote was retracted.
     pub option_ids: Vec<i64>,
 }
@@ -4449,7 +8353,7 @@ pub struct PollOption {
     pub text: String,
     /// Optional. Special entities that appear in the option text. Currently, only custom emoji entities are allowed in poll option texts
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub text_entities: Option<Vec<MessageEntity>>,
+    pub text_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Number of users that voted for this option
     pub voter_count: i64,
 }
@@ -4463,7 +8367,7 @@ pub struct PreCheckoutQuery {
     /// User who sent the query
     pub from: User,
     /// Three-letter ISO 4217 currency code, or "XTR" for payments in Telegram Stars
-    pub currency: String,
+    pub currency: ShortString,
     /// Total price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     pub total_amount: i64,
     /// Bot-specified invoice payload
@@ -4514,7 +8418,7 @@ pub struct ReactionCount {
 /// - ReactionTypeCustomEmoji
 /// - ReactionTypePaid
 /// https://core.telegram.org/bots/api#reactiontype
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum ReactionType {
     ReactionTypeEmoji(ReactionTypeEmoji),
@@ -4522,6 +8426,30 @@ pub enum ReactionType {
     ReactionTypePaid(ReactionTypePaid),
 }
 
+impl<'de> Deserialize<'de> for ReactionType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["emoji", "custom_emoji", "paid"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("emoji") => serde_json::from_str(raw.get()).map(Self::ReactionTypeEmoji),
+            Some("custom_emoji") => {
+                serde_json::from_str(raw.get()).map(Self::ReactionTypeCustomEmoji)
+            }
+            Some("paid") => serde_json::from_str(raw.get()).map(Self::ReactionTypePaid),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The reaction is based on a custom emoji.
 /// https://core.telegram.org/bots/api#reactiontypecustomemoji
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4530,7 +8458,7 @@ pub struct ReactionTypeCustomEmoji {
     #[serde(rename = "type")]
     pub r#type: String,
     /// Custom emoji identifier
-    pub custom_emoji_id: String,
+    pub custom_emoji_id: ShortString,
 }
 
 /// The reaction is based on an emoji.
@@ -4541,7 +8469,7 @@ pub struct ReactionTypeEmoji {
     #[serde(rename = "type")]
     pub r#type: String,
     /// Reaction emoji. Currently, it can be one of "❤", "👍", "👎", "🔥", "🥰", "👏", "😁", "🤔", "🤯", "😱", "🤬", "😢", "🎉", "🤩", "🤮", "💩", "🙏", "👌", "🕊", "🤡", "🥱", "🥴", "😍", "🐳", "❤‍🔥", "🌚", "🌭", "💯", "🤣", "⚡", "🍌", "🏆", "💔", "🤨", "😐", "🍓", "🍾", "💋", "🖕", "😈", "😴", "😭", "🤓", "👻", "👨‍💻", "👀", "🎃", "🙈", "😇", "😨", "🤝", "✍", "🤗", "🫡", "🎅", "🎄", "☃", "💅", "🤪", "🗿", "🆒", "💘", "🙉", "🦄", "😘", "💊", "🙊", "😎", "👾", "🤷‍♂", "🤷", "🤷‍♀", "😡"
-    pub emoji: String,
+    pub emoji: ShortString,
 }
 
 /// The reaction is paid.
@@ -4558,7 +8486,7 @@ pub struct ReactionTypePaid {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct RefundedPayment {
     /// Three-letter ISO 4217 currency code, or "XTR" for payments in Telegram Stars. Currently, always "XTR"
-    pub currency: String,
+    pub currency: ShortString,
     /// Total refunded price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45, total_amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     pub total_amount: i64,
     /// Bot-specified invoice payload
@@ -4624,7 +8552,7 @@ pub struct ReplyParameters {
     pub quote_parse_mode: Option<String>,
     /// Optional. A JSON-serialized list of special entities that appear in the quote. It can be specified instead of quote_parse_mode.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub quote_entities: Option<Vec<MessageEntity>>,
+    pub quote_entities: Option<ShortVec<MessageEntity, 2>>,
     /// Optional. Position of the quote in the original message in UTF-16 code units
     #[serde(skip_serializing_if = "Option::is_none")]
     pub quote_position: Option<i64>,
@@ -4650,7 +8578,7 @@ pub struct ResponseParameters {
 /// - RevenueWithdrawalStateSucceeded
 /// - RevenueWithdrawalStateFailed
 /// https://core.telegram.org/bots/api#revenuewithdrawalstate
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum RevenueWithdrawalState {
     RevenueWithdrawalStatePending(RevenueWithdrawalStatePending),
@@ -4658,6 +8586,34 @@ pub enum RevenueWithdrawalState {
     RevenueWithdrawalStateFailed(RevenueWithdrawalStateFailed),
 }
 
+impl<'de> Deserialize<'de> for RevenueWithdrawalState {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &["pending", "succeeded", "failed"];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("pending") => {
+                serde_json::from_str(raw.get()).map(Self::RevenueWithdrawalStatePending)
+            }
+            Some("succeeded") => {
+                serde_json::from_str(raw.get()).map(Self::RevenueWithdrawalStateSucceeded)
+            }
+            Some("failed") => {
+                serde_json::from_str(raw.get()).map(Self::RevenueWithdrawalStateFailed)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// The withdrawal failed and the transaction was refunded.
 /// https://core.telegram.org/bots/api#revenuewithdrawalstatefailed
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4715,7 +8671,7 @@ pub struct SharedUser {
     pub username: Option<String>,
     /// Optional. Available sizes of the chat photo, if the photo was requested by the bot
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub photo: Option<Vec<PhotoSize>>,
+    pub photo: Option<ShortVec<PhotoSize, 4>>,
 }
 
 /// This object represents a shipping address.
@@ -4723,7 +8679,7 @@ pub struct SharedUser {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct ShippingAddress {
     /// Two-letter ISO 3166-1 alpha-2 country code
-    pub country_code: String,
+    pub country_code: ShortString,
     /// State, if applicable
     pub state: String,
     /// City
@@ -4745,7 +8701,7 @@ pub struct ShippingOption {
     /// Option title
     pub title: String,
     /// List of price portions
-    pub prices: Vec<LabeledPrice>,
+    pub prices: ShortVec<LabeledPrice, 4>,
 }
 
 /// This object contains information about an incoming shipping query.
@@ -4812,7 +8768,7 @@ pub struct Sticker {
     pub file_unique_id: String,
     /// Type of the sticker, currently one of "regular", "mask", "custom_emoji". The type of the sticker is independent from its format, which is determined by the fields is_animated and is_video.
     #[serde(rename = "type")]
-    pub r#type: String,
+    pub r#type: StickerType,
     /// Sticker width
     pub width: i64,
     /// Sticker height
@@ -4835,10 +8791,10 @@ pub struct Sticker {
     pub premium_animation: Option<Box<File>>,
     /// Optional. For mask stickers, the position where the mask should be placed
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub mask_position: Option<Box<MaskPosition>>,
+    pub mask_position: Option<MaskPosition>,
     /// Optional. For custom emoji stickers, unique identifier of the custom emoji
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub custom_emoji_id: Option<String>,
+    pub custom_emoji_id: Option<ShortString>,
     /// Optional. True, if the sticker must be repainted to a text color in messages, the color of the Telegram Premium badge in emoji status, white color on chat photos, or another appropriate color in other places
     #[serde(skip_serializing_if = "Option::is_none")]
     pub needs_repainting: Option<bool>,
@@ -4847,6 +8803,85 @@ pub struct Sticker {
     pub file_size: Option<i64>,
 }
 
+/// Values of `Sticker.type`, `StickerSet.sticker_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum StickerType {
+    /// `"regular"`
+    Regular,
+    /// `"mask"`
+    Mask,
+    /// `"custom_emoji"`
+    CustomEmoji,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl StickerType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Regular => "regular",
+            Self::Mask => "mask",
+            Self::CustomEmoji => "custom_emoji",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for StickerType {
+    fn from(value: &str) -> Self {
+        match value {
+            "regular" => Self::Regular,
+            "mask" => Self::Mask,
+            "custom_emoji" => Self::CustomEmoji,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for StickerType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for StickerType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for StickerType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for StickerType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for StickerType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = StickerType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<StickerType, E> {
+                Ok(StickerType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object represents a sticker set.
 /// https://core.telegram.org/bots/api#stickerset
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4856,12 +8891,12 @@ pub struct StickerSet {
     /// Sticker set title
     pub title: String,
     /// Type of stickers in the set, currently one of "regular", "mask", "custom_emoji"
-    pub sticker_type: String,
+    pub sticker_type: StickerType,
     /// List of all set stickers
     pub stickers: Vec<Sticker>,
     /// Optional. Sticker set thumbnail in the .WEBP, .TGS, or .WEBM format
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail: Option<Box<PhotoSize>>,
+    pub thumbnail: Option<PhotoSize>,
 }
 
 /// This object represents a story.
@@ -4910,7 +8945,7 @@ pub struct StoryAreaPosition {
 /// - StoryAreaTypeWeather
 /// - StoryAreaTypeUniqueGift
 /// https://core.telegram.org/bots/api#storyareatype
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum StoryAreaType {
     StoryAreaTypeLocation(StoryAreaTypeLocation),
@@ -4920,6 +8955,40 @@ pub enum StoryAreaType {
     StoryAreaTypeUniqueGift(StoryAreaTypeUniqueGift),
 }
 
+impl<'de> Deserialize<'de> for StoryAreaType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "location",
+            "suggested_reaction",
+            "link",
+            "weather",
+            "unique_gift",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("location") => serde_json::from_str(raw.get()).map(Self::StoryAreaTypeLocation),
+            Some("suggested_reaction") => {
+                serde_json::from_str(raw.get()).map(Self::StoryAreaTypeSuggestedReaction)
+            }
+            Some("link") => serde_json::from_str(raw.get()).map(Self::StoryAreaTypeLink),
+            Some("weather") => serde_json::from_str(raw.get()).map(Self::StoryAreaTypeWeather),
+            Some("unique_gift") => {
+                serde_json::from_str(raw.get()).map(Self::StoryAreaTypeUniqueGift)
+            }
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Describes a story area pointing to an HTTP or tg:// link. Currently, a story can have up to 3 link areas.
 /// https://core.telegram.org/bots/api#storyareatypelink
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -4944,7 +9013,7 @@ pub struct StoryAreaTypeLocation {
     pub longitude: f64,
     /// Optional. Address of the location
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub address: Option<Box<LocationAddress>>,
+    pub address: Option<LocationAddress>,
 }
 
 /// Describes a story area pointing to a suggested reaction. Currently, a story can have up to 5 suggested reaction areas.
@@ -4995,7 +9064,7 @@ pub struct StoryAreaTypeWeather {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct SuccessfulPayment {
     /// Three-letter ISO 4217 currency code, or "XTR" for payments in Telegram Stars
-    pub currency: String,
+    pub currency: ShortString,
     /// Total price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     pub total_amount: i64,
     /// Bot-specified invoice payload
@@ -5041,7 +9110,7 @@ pub struct SuggestedPostApproved {
     pub suggested_post_message: Option<Box<Message>>,
     /// Optional. Amount paid for the post
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub price: Option<Box<SuggestedPostPrice>>,
+    pub price: Option<SuggestedPostPrice>,
     /// Date when the post will be published
     pub send_date: i64,
 }
@@ -5063,15 +9132,97 @@ pub struct SuggestedPostDeclined {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct SuggestedPostInfo {
     /// State of the suggested post. Currently, it can be one of "pending", "approved", "declined".
-    pub state: String,
+    pub state: SuggestedPostInfoState,
     /// Optional. Proposed price of the post. If the field is omitted, then the post is unpaid.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub price: Option<Box<SuggestedPostPrice>>,
+    pub price: Option<SuggestedPostPrice>,
     /// Optional. Proposed send date of the post. If the field is omitted, then the post can be published at any time within 30 days at the sole discretion of the user or administrator who approves it.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub send_date: Option<i64>,
 }
 
+/// Values of `SuggestedPostInfo.state`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum SuggestedPostInfoState {
+    /// `"pending"`
+    Pending,
+    /// `"approved"`
+    Approved,
+    /// `"declined"`
+    Declined,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl SuggestedPostInfoState {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Pending => "pending",
+            Self::Approved => "approved",
+            Self::Declined => "declined",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for SuggestedPostInfoState {
+    fn from(value: &str) -> Self {
+        match value {
+            "pending" => Self::Pending,
+            "approved" => Self::Approved,
+            "declined" => Self::Declined,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for SuggestedPostInfoState {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for SuggestedPostInfoState {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for SuggestedPostInfoState {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for SuggestedPostInfoState {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for SuggestedPostInfoState {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = SuggestedPostInfoState;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<SuggestedPostInfoState, E> {
+                Ok(SuggestedPostInfoState::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// Describes a service message about a successful payment for a suggested post.
 /// https://core.telegram.org/bots/api#suggestedpostpaid
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -5080,13 +9231,91 @@ pub struct SuggestedPostPaid {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub suggested_post_message: Option<Box<Message>>,
     /// Currency in which the payment was made. Currently, one of "XTR" for Telegram Stars or "TON" for toncoins
-    pub currency: String,
+    pub currency: SuggestedPostPaidCurrency,
     /// Optional. The amount of the currency that was received by the channel in nanotoncoins; for payments in toncoins only
     #[serde(skip_serializing_if = "Option::is_none")]
     pub amount: Option<i64>,
     /// Optional. The amount of Telegram Stars that was received by the channel; for payments in Telegram Stars only
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub star_amount: Option<Box<StarAmount>>,
+    pub star_amount: Option<StarAmount>,
+}
+
+/// Values of `SuggestedPostPaid.currency`, `SuggestedPostPrice.currency`, `UniqueGiftInfo.last_resale_currency`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum SuggestedPostPaidCurrency {
+    /// `"XTR"`
+    XTR,
+    /// `"TON"`
+    TON,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl SuggestedPostPaidCurrency {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::XTR => "XTR",
+            Self::TON => "TON",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for SuggestedPostPaidCurrency {
+    fn from(value: &str) -> Self {
+        match value {
+            "XTR" => Self::XTR,
+            "TON" => Self::TON,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for SuggestedPostPaidCurrency {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for SuggestedPostPaidCurrency {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for SuggestedPostPaidCurrency {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for SuggestedPostPaidCurrency {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for SuggestedPostPaidCurrency {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = SuggestedPostPaidCurrency;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<SuggestedPostPaidCurrency, E> {
+                Ok(SuggestedPostPaidCurrency::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
 }
 
 /// Contains parameters of a post that is being suggested by the bot.
@@ -5095,7 +9324,7 @@ pub struct SuggestedPostPaid {
 pub struct SuggestedPostParameters {
     /// Optional. Proposed price for the post. If the field is omitted, then the post is unpaid.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub price: Option<Box<SuggestedPostPrice>>,
+    pub price: Option<SuggestedPostPrice>,
     /// Optional. Proposed send date of the post. If specified, then the date must be between 300 second and 2678400 seconds (30 days) in the future. If the field is omitted, then the post can be published at any time within 30 days at the sole discretion of the user who approves it.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub send_date: Option<i64>,
@@ -5106,7 +9335,7 @@ pub struct SuggestedPostParameters {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct SuggestedPostPrice {
     /// Currency in which the post will be paid. Currently, must be one of "XTR" for Telegram Stars or "TON" for toncoins
-    pub currency: String,
+    pub currency: SuggestedPostPaidCurrency,
     /// The amount of the currency that will be paid for the post in the smallest units of the currency, i.e. Telegram Stars or nanotoncoins. Currently, price in Telegram Stars must be between 5 and 100000, and price in nanotoncoins must be between 10000000 and 10000000000000.
     pub amount: i64,
 }
@@ -5119,7 +9348,85 @@ pub struct SuggestedPostRefunded {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub suggested_post_message: Option<Box<Message>>,
     /// Reason for the refund. Currently, one of "post_deleted" if the post was deleted within 24 hours of being posted or removed from scheduled messages without being posted, or "payment_refunded" if the payer refunded their payment.
-    pub reason: String,
+    pub reason: SuggestedPostRefundedReason,
+}
+
+/// Values of `SuggestedPostRefunded.reason`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum SuggestedPostRefundedReason {
+    /// `"post_deleted"`
+    PostDeleted,
+    /// `"payment_refunded"`
+    PaymentRefunded,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl SuggestedPostRefundedReason {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::PostDeleted => "post_deleted",
+            Self::PaymentRefunded => "payment_refunded",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for SuggestedPostRefundedReason {
+    fn from(value: &str) -> Self {
+        match value {
+            "post_deleted" => Self::PostDeleted,
+            "payment_refunded" => Self::PaymentRefunded,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for SuggestedPostRefundedReason {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for SuggestedPostRefundedReason {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for SuggestedPostRefundedReason {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for SuggestedPostRefundedReason {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for SuggestedPostRefundedReason {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = SuggestedPostRefundedReason;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<SuggestedPostRefundedReason, E> {
+                Ok(SuggestedPostRefundedReason::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
 }
 
 /// This object represents an inline button that switches the current user to inline mode in a chosen chat, with an optional default inline query.
@@ -5151,7 +9458,7 @@ pub struct TextQuote {
     pub text: String,
     /// Optional. Special entities that appear in the quote. Currently, only bold, italic, underline, strikethrough, spoiler, and custom_emoji entities are kept in quotes.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub entities: Option<Vec<MessageEntity>>,
+    pub entities: Option<ShortVec<MessageEntity, 2>>,
     /// Approximate quote position in the original message in UTF-16 code units as specified by the sender
     pub position: i64,
     /// Optional. True, if the quote was chosen manually by the message sender. Otherwise, the quote was added automatically by the server.
@@ -5168,7 +9475,7 @@ pub struct TextQuote {
 /// - TransactionPartnerTelegramApi
 /// - TransactionPartnerOther
 /// https://core.telegram.org/bots/api#transactionpartner
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 #[serde(untagged)]
 pub enum TransactionPartner {
     TransactionPartnerUser(TransactionPartnerUser),
@@ -5180,6 +9487,48 @@ pub enum TransactionPartner {
     TransactionPartnerOther(TransactionPartnerOther),
 }
 
+impl<'de> Deserialize<'de> for TransactionPartner {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::Error;
+        let raw = Box::<RawValue>::deserialize(deserializer)?;
+        const TAGS: &[&str] = &[
+            "user",
+            "chat",
+            "affiliate_program",
+            "fragment",
+            "telegram_ads",
+            "telegram_api",
+            "other",
+        ];
+        #[derive(Deserialize)]
+        struct Tag<'a> {
+            #[serde(rename = "type", borrow, default, deserialize_with = "borrow_opt_str")]
+            tag: Option<Cow<'a, str>>,
+        }
+        let tag: Tag = serde_json::from_str(raw.get()).map_err(D::Error::custom)?;
+        match tag.tag.as_deref() {
+            Some("user") => serde_json::from_str(raw.get()).map(Self::TransactionPartnerUser),
+            Some("chat") => serde_json::from_str(raw.get()).map(Self::TransactionPartnerChat),
+            Some("affiliate_program") => {
+                serde_json::from_str(raw.get()).map(Self::TransactionPartnerAffiliateProgram)
+            }
+            Some("fragment") => {
+                serde_json::from_str(raw.get()).map(Self::TransactionPartnerFragment)
+            }
+            Some("telegram_ads") => {
+                serde_json::from_str(raw.get()).map(Self::TransactionPartnerTelegramAds)
+            }
+            Some("telegram_api") => {
+                serde_json::from_str(raw.get()).map(Self::TransactionPartnerTelegramApi)
+            }
+            Some("other") => serde_json::from_str(raw.get()).map(Self::TransactionPartnerOther),
+            Some(other) => return Err(D::Error::unknown_variant(other, TAGS)),
+            None => return Err(D::Error::missing_field("type")),
+        }
+        .map_err(D::Error::custom)
+    }
+}
+
 /// Describes the affiliate program that issued the affiliate commission received via this transaction.
 /// https://core.telegram.org/bots/api#transactionpartneraffiliateprogram
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -5189,7 +9538,7 @@ pub struct TransactionPartnerAffiliateProgram {
     pub r#type: String,
     /// Optional. Information about the bot that sponsored the affiliate program
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub sponsor_user: Option<Box<User>>,
+    pub sponsor_user: Option<User>,
     /// The number of Telegram Stars received by the bot for each 1000 Telegram Stars received by the affiliate program sponsor from referred users
     pub commission_per_mille: i64,
 }
@@ -5217,7 +9566,7 @@ pub struct TransactionPartnerFragment {
     pub r#type: String,
     /// Optional. State of the transaction if the transaction is outgoing
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub withdrawal_state: Option<Box<RevenueWithdrawalState>>,
+    pub withdrawal_state: Option<RevenueWithdrawalState>,
 }
 
 /// Describes a transaction with an unknown source or recipient.
@@ -5257,7 +9606,7 @@ pub struct TransactionPartnerUser {
     #[serde(rename = "type")]
     pub r#type: String,
     /// Type of the transaction, currently one of "invoice_payment" for payments via invoices, "paid_media_payment" for payments for paid media, "gift_purchase" for gifts sent by the bot, "premium_purchase" for Telegram Premium subscriptions gifted by the bot, "business_account_transfer" for direct transfers from managed business accounts
-    pub transaction_type: String,
+    pub transaction_type: TransactionPartnerUserTransactionType,
     /// Information about the user
     pub user: User,
     /// Optional. Information about the affiliate that received a commission via this transaction. Can be available only for "invoice_payment" and "paid_media_payment" transactions.
@@ -5283,6 +9632,96 @@ pub struct TransactionPartnerUser {
     pub premium_subscription_duration: Option<i64>,
 }
 
+/// Values of `TransactionPartnerUser.transaction_type`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum TransactionPartnerUserTransactionType {
+    /// `"invoice_payment"`
+    InvoicePayment,
+    /// `"paid_media_payment"`
+    PaidMediaPayment,
+    /// `"gift_purchase"`
+    GiftPurchase,
+    /// `"premium_purchase"`
+    PremiumPurchase,
+    /// `"business_account_transfer"`
+    BusinessAccountTransfer,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl TransactionPartnerUserTransactionType {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::InvoicePayment => "invoice_payment",
+            Self::PaidMediaPayment => "paid_media_payment",
+            Self::GiftPurchase => "gift_purchase",
+            Self::PremiumPurchase => "premium_purchase",
+            Self::BusinessAccountTransfer => "business_account_transfer",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for TransactionPartnerUserTransactionType {
+    fn from(value: &str) -> Self {
+        match value {
+            "invoice_payment" => Self::InvoicePayment,
+            "paid_media_payment" => Self::PaidMediaPayment,
+            "gift_purchase" => Self::GiftPurchase,
+            "premium_purchase" => Self::PremiumPurchase,
+            "business_account_transfer" => Self::BusinessAccountTransfer,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for TransactionPartnerUserTransactionType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for TransactionPartnerUserTransactionType {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for TransactionPartnerUserTransactionType {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for TransactionPartnerUserTransactionType {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for TransactionPartnerUserTransactionType {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = TransactionPartnerUserTransactionType;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<TransactionPartnerUserTransactionType, E> {
+                Ok(TransactionPartnerUserTransactionType::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object describes a unique gift that was upgraded from a regular gift.
 /// https://core.telegram.org/bots/api#uniquegift
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -5349,9 +9788,9 @@ pub struct UniqueGiftBackdropColors {
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct UniqueGiftColors {
     /// Custom emoji identifier of the unique gift's model
-    pub model_custom_emoji_id: String,
+    pub model_custom_emoji_id: ShortString,
     /// Custom emoji identifier of the unique gift's symbol
-    pub symbol_custom_emoji_id: String,
+    pub symbol_custom_emoji_id: ShortString,
     /// Main color used in light themes; RGB format
     pub light_theme_main_color: i64,
     /// List of 1-3 additional colors used in light themes; RGB format
@@ -5369,10 +9808,10 @@ pub struct UniqueGiftInfo {
     /// Information about the gift
     pub gift: UniqueGift,
     /// Origin of the gift. Currently, either "upgrade" for gifts upgraded from regular gifts, "transfer" for gifts transferred from other users or channels, "resale" for gifts bought from other users, "gifted_upgrade" for upgrades purchased after the gift was sent, or "offer" for gifts bought or sold through gift purchase offers
-    pub origin: String,
+    pub origin: UniqueGiftInfoOrigin,
     /// Optional. For gifts bought from other users, the currency in which the payment for the gift was done. Currently, one of "XTR" for Telegram Stars or "TON" for toncoins.
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub last_resale_currency: Option<String>,
+    pub last_resale_currency: Option<SuggestedPostPaidCurrency>,
     /// Optional. For gifts bought from other users, the price paid for the gift in either Telegram Stars or nanotoncoins
     #[serde(skip_serializing_if = "Option::is_none")]
     pub last_resale_amount: Option<i64>,
@@ -5387,6 +9826,96 @@ pub struct UniqueGiftInfo {
     pub next_transfer_date: Option<i64>,
 }
 
+/// Values of `UniqueGiftInfo.origin`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum UniqueGiftInfoOrigin {
+    /// `"upgrade"`
+    Upgrade,
+    /// `"transfer"`
+    Transfer,
+    /// `"resale"`
+    Resale,
+    /// `"gifted_upgrade"`
+    GiftedUpgrade,
+    /// `"offer"`
+    Offer,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl UniqueGiftInfoOrigin {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Upgrade => "upgrade",
+            Self::Transfer => "transfer",
+            Self::Resale => "resale",
+            Self::GiftedUpgrade => "gifted_upgrade",
+            Self::Offer => "offer",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for UniqueGiftInfoOrigin {
+    fn from(value: &str) -> Self {
+        match value {
+            "upgrade" => Self::Upgrade,
+            "transfer" => Self::Transfer,
+            "resale" => Self::Resale,
+            "gifted_upgrade" => Self::GiftedUpgrade,
+            "offer" => Self::Offer,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for UniqueGiftInfoOrigin {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for UniqueGiftInfoOrigin {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for UniqueGiftInfoOrigin {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for UniqueGiftInfoOrigin {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for UniqueGiftInfoOrigin {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = UniqueGiftInfoOrigin;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<UniqueGiftInfoOrigin, E> {
+                Ok(UniqueGiftInfoOrigin::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
+}
+
 /// This object describes the model of a unique gift.
 /// https://core.telegram.org/bots/api#uniquegiftmodel
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -5399,7 +9928,93 @@ pub struct UniqueGiftModel {
     pub rarity_per_mille: i64,
     /// Optional. Rarity of the model if it is a crafted model. Currently, can be "uncommon", "rare", "epic", or "legendary".
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub rarity: Option<String>,
+    pub rarity: Option<UniqueGiftModelRarity>,
+}
+
+/// Values of `UniqueGiftModel.rarity`.
+///
+/// Values added by later Bot API versions deserialise to `Other`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum UniqueGiftModelRarity {
+    /// `"uncommon"`
+    Uncommon,
+    /// `"rare"`
+    Rare,
+    /// `"epic"`
+    Epic,
+    /// `"legendary"`
+    Legendary,
+    /// A value not known to this version of the library.
+    Other(String),
+}
+
+impl UniqueGiftModelRarity {
+    /// The value as sent by the Bot API.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Self::Uncommon => "uncommon",
+            Self::Rare => "rare",
+            Self::Epic => "epic",
+            Self::Legendary => "legendary",
+            Self::Other(value) => value,
+        }
+    }
+}
+
+impl From<&str> for UniqueGiftModelRarity {
+    fn from(value: &str) -> Self {
+        match value {
+            "uncommon" => Self::Uncommon,
+            "rare" => Self::Rare,
+            "epic" => Self::Epic,
+            "legendary" => Self::Legendary,
+            _ => Self::Other(value.to_string()),
+        }
+    }
+}
+
+impl std::fmt::Display for UniqueGiftModelRarity {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl PartialEq<str> for UniqueGiftModelRarity {
+    fn eq(&self, other: &str) -> bool {
+        self.as_str() == other
+    }
+}
+
+impl PartialEq<&str> for UniqueGiftModelRarity {
+    fn eq(&self, other: &&str) -> bool {
+        self.as_str() == *other
+    }
+}
+
+impl Serialize for UniqueGiftModelRarity {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.serialize_str(self.as_str())
+    }
+}
+
+impl<'de> Deserialize<'de> for UniqueGiftModelRarity {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct Visitor;
+        impl<'de> serde::de::Visitor<'de> for Visitor {
+            type Value = UniqueGiftModelRarity;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("a string")
+            }
+            fn visit_str<E: serde::de::Error>(
+                self,
+                value: &str,
+            ) -> Result<UniqueGiftModelRarity, E> {
+                Ok(UniqueGiftModelRarity::from(value))
+            }
+        }
+        deserializer.deserialize_str(Visitor)
+    }
 }
 
 /// This object describes the symbol shown on the pattern of a unique gift.
@@ -5417,7 +10032,7 @@ pub struct UniqueGiftSymbol {
 /// This object represents an incoming update.
 /// At most one of the optional parameters can be present in any given update.
 /// https://core.telegram.org/bots/api#update
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Serialize, PartialEq)]
 pub struct Update {
     /// The update's unique identifier. Update identifiers start from a certain positive number and increase sequentially. This identifier becomes especially handy if you're using webhooks, since it allows you to ignore repeated updates or to restore the correct update sequence, should they get out of order. If there are no new updates for at least a week, then identifier of the next update will be chosen randomly instead of sequentially.
     pub update_id: i64,
@@ -5492,6 +10107,875 @@ pub struct Update {
     pub removed_chat_boost: Option<Box<ChatBoostRemoved>>,
 }
 
+impl<'de> Deserialize<'de> for Update {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::{Error, IgnoredAny, MapAccess, SeqAccess, Visitor};
+
+        const FIELDS: &[&str] = &[
+            "update_id",
+            "message",
+            "edited_message",
+            "channel_post",
+            "edited_channel_post",
+            "business_connection",
+            "business_message",
+            "edited_business_message",
+            "deleted_business_messages",
+            "message_reaction",
+            "message_reaction_count",
+            "inline_query",
+            "chosen_inline_result",
+            "callback_query",
+            "shipping_query",
+            "pre_checkout_query",
+            "purchased_paid_media",
+            "poll",
+            "poll_answer",
+            "my_chat_member",
+            "chat_member",
+            "chat_join_request",
+            "chat_boost",
+            "removed_chat_boost",
+        ];
+        const IGNORE: usize = usize::MAX;
+
+        fn field_index(name: &[u8]) -> usize {
+            match (name.len(), name.first()) {
+                (4, Some(b'p')) => match name {
+                    b"poll" => 17,
+                    _ => IGNORE,
+                },
+                (7, Some(b'm')) => match name {
+                    b"message" => 1,
+                    _ => IGNORE,
+                },
+                (9, Some(b'u')) => match name {
+                    b"update_id" => 0,
+                    _ => IGNORE,
+                },
+                (10, Some(b'c')) => match name {
+                    b"chat_boost" => 22,
+                    _ => IGNORE,
+                },
+                (11, Some(b'c')) => match name {
+                    b"chat_member" => 20,
+                    _ => IGNORE,
+                },
+                (11, Some(b'p')) => match name {
+                    b"poll_answer" => 18,
+                    _ => IGNORE,
+                },
+                (12, Some(b'c')) => match name {
+                    b"channel_post" => 3,
+                    _ => IGNORE,
+                },
+                (12, Some(b'i')) => match name {
+                    b"inline_query" => 11,
+                    _ => IGNORE,
+                },
+                (14, Some(b'c')) => match name {
+                    b"callback_query" => 13,
+                    _ => IGNORE,
+                },
+                (14, Some(b'e')) => match name {
+                    b"edited_message" => 2,
+                    _ => IGNORE,
+                },
+                (14, Some(b'm')) => match name {
+                    b"my_chat_member" => 19,
+                    _ => IGNORE,
+                },
+                (14, Some(b's')) => match name {
+                    b"shipping_query" => 14,
+                    _ => IGNORE,
+                },
+                (16, Some(b'b')) => match name {
+                    b"business_message" => 6,
+                    _ => IGNORE,
+                },
+                (16, Some(b'm')) => match name {
+                    b"message_reaction" => 9,
+                    _ => IGNORE,
+                },
+                (17, Some(b'c')) => match name {
+                    b"chat_join_request" => 21,
+                    _ => IGNORE,
+                },
+                (18, Some(b'p')) => match name {
+                    b"pre_checkout_query" => 15,
+                    _ => IGNORE,
+                },
+                (18, Some(b'r')) => match name {
+                    b"removed_chat_boost" => 23,
+                    _ => IGNORE,
+                },
+                (19, Some(b'b')) => match name {
+                    b"business_connection" => 5,
+                    _ => IGNORE,
+                },
+                (19, Some(b'e')) => match name {
+                    b"edited_channel_post" => 4,
+                    _ => IGNORE,
+                },
+                (20, Some(b'c')) => match name {
+                    b"chosen_inline_result" => 12,
+                    _ => IGNORE,
+                },
+                (20, Some(b'p')) => match name {
+                    b"purchased_paid_media" => 16,
+                    _ => IGNORE,
+                },
+                (22, Some(b'm')) => match name {
+                    b"message_reaction_count" => 10,
+                    _ => IGNORE,
+                },
+                (23, Some(b'e')) => match name {
+                    b"edited_business_message" => 7,
+                    _ => IGNORE,
+                },
+                (25, Some(b'd')) => match name {
+                    b"deleted_business_messages" => 8,
+                    _ => IGNORE,
+                },
+                _ => IGNORE,
+            }
+        }
+
+        struct Field(usize);
+        impl<'de> Deserialize<'de> for Field {
+            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+                struct FieldVisitor;
+                impl<'de> Visitor<'de> for FieldVisitor {
+                    type Value = Field;
+                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                        f.write_str("field identifier")
+                    }
+                    fn visit_u64<E: Error>(self, value: u64) -> Result<Field, E> {
+                        Ok(Field(if value < FIELDS.len() as u64 {
+                            value as usize
+                        } else {
+                            IGNORE
+                        }))
+                    }
+                    fn visit_str<E: Error>(self, value: &str) -> Result<Field, E> {
+                        Ok(Field(field_index(value.as_bytes())))
+                    }
+                    fn visit_bytes<E: Error>(self, value: &[u8]) -> Result<Field, E> {
+                        Ok(Field(field_index(value)))
+                    }
+                }
+                deserializer.deserialize_identifier(FieldVisitor)
+            }
+        }
+
+        struct StructVisitor;
+        impl<'de> Visitor<'de> for StructVisitor {
+            type Value = Update;
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("struct Update")
+            }
+
+            fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Update, A::Error> {
+                Ok(Update {
+                    update_id: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(0, &"struct Update with 24 elements")
+                    })?,
+                    message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(1, &"struct Update with 24 elements")
+                    })?,
+                    edited_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(2, &"struct Update with 24 elements")
+                    })?,
+                    channel_post: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(3, &"struct Update with 24 elements")
+                    })?,
+                    edited_channel_post: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(4, &"struct Update with 24 elements")
+                    })?,
+                    business_connection: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(5, &"struct Update with 24 elements")
+                    })?,
+                    business_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(6, &"struct Update with 24 elements")
+                    })?,
+                    edited_business_message: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(7, &"struct Update with 24 elements")
+                    })?,
+                    deleted_business_messages: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(8, &"struct Update with 24 elements")
+                    })?,
+                    message_reaction: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(9, &"struct Update with 24 elements")
+                    })?,
+                    message_reaction_count: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(10, &"struct Update with 24 elements")
+                    })?,
+                    inline_query: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(11, &"struct Update with 24 elements")
+                    })?,
+                    chosen_inline_result: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(12, &"struct Update with 24 elements")
+                    })?,
+                    callback_query: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(13, &"struct Update with 24 elements")
+                    })?,
+                    shipping_query: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(14, &"struct Update with 24 elements")
+                    })?,
+                    pre_checkout_query: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(15, &"struct Update with 24 elements")
+                    })?,
+                    purchased_paid_media: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(16, &"struct Update with 24 elements")
+                    })?,
+                    poll: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(17, &"struct Update with 24 elements")
+                    })?,
+                    poll_answer: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(18, &"struct Update with 24 elements")
+                    })?,
+                    my_chat_member: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(19, &"struct Update with 24 elements")
+                    })?,
+                    chat_member: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(20, &"struct Update with 24 elements")
+                    })?,
+                    chat_join_request: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(21, &"struct Update with 24 elements")
+                    })?,
+                    chat_boost: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(22, &"struct Update with 24 elements")
+                    })?,
+                    removed_chat_boost: seq.next_element()?.ok_or_else(|| {
+                        A::Error::invalid_length(23, &"struct Update with 24 elements")
+                    })?,
+                })
+            }
+
+            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Update, A::Error> {
+                let mut update_id: Option<i64> = None;
+                let mut message: Option<Option<Box<Message>>> = None;
+                let mut edited_message: Option<Option<Box<Message>>> = None;
+                let mut channel_post: Option<Option<Box<Message>>> = None;
+                let mut edited_channel_post: Option<Option<Box<Message>>> = None;
+                let mut business_connection: Option<Option<Box<BusinessConnection>>> = None;
+                let mut business_message: Option<Option<Box<Message>>> = None;
+                let mut edited_business_message: Option<Option<Box<Message>>> = None;
+                let mut deleted_business_messages: Option<Option<Box<BusinessMessagesDeleted>>> =
+                    None;
+                let mut message_reaction: Option<Option<Box<MessageReactionUpdated>>> = None;
+                let mut message_reaction_count: Option<Option<Box<MessageReactionCountUpdated>>> =
+                    None;
+                let mut inline_query: Option<Option<Box<InlineQuery>>> = None;
+                let mut chosen_inline_result: Option<Option<Box<ChosenInlineResult>>> = None;
+                let mut callback_query: Option<Option<Box<CallbackQuery>>> = None;
+                let mut shipping_query: Option<Option<Box<ShippingQuery>>> = None;
+                let mut pre_checkout_query: Option<Option<Box<PreCheckoutQuery>>> = None;
+                let mut purchased_paid_media: Option<Option<Box<PaidMediaPurchased>>> = None;
+                let mut poll: Option<Option<Box<Poll>>> = None;
+                let mut poll_answer: Option<Option<Box<PollAnswer>>> = None;
+                let mut my_chat_member: Option<Option<Box<ChatMemberUpdated>>> = None;
+                let mut chat_member: Option<Option<Box<ChatMemberUpdated>>> = None;
+                let mut chat_join_request: Option<Option<Box<ChatJoinRequest>>> = None;
+                let mut chat_boost: Option<Option<Box<ChatBoostUpdated>>> = None;
+                let mut removed_chat_boost: Option<Option<Box<ChatBoostRemoved>>> = None;
+                while let Some(Field(index)) = map.next_key()? {
+                    match index {
+                        0 => {
+                            if update_id.is_some() {
+                                return Err(A::Error::duplicate_field("update_id"));
+                            }
+                            update_id = Some(map.next_value()?);
+                        }
+                        1 => {
+                            if message.is_some() {
+                                return Err(A::Error::duplicate_field("message"));
+                            }
+                            message = Some(map.next_value()?);
+                        }
+                        2 => {
+                            if edited_message.is_some() {
+                                return Err(A::Error::duplicate_field("edited_message"));
+                            }
+                            edited_message = Some(map.next_value()?);
+                        }
+                        3 => {
+                            if channel_post.is_some() {
+                                return Err(A::Error::duplicate_field("channel_post"));
+                            }
+                            channel_post = Some(map.next_value()?);
+                        }
+                        4 => {
+                            if edited_channel_post.is_some() {
+                                return Err(A::Error::duplicate_field("edited_channel_post"));
+                            }
+                            edited_channel_post = Some(map.next_value()?);
+                        }
+                        5 => {
+                            if business_connection.is_some() {
+                                return Err(A::Error::duplicate_field("business_connection"));
+                            }
+                            business_connection = Some(map.next_value()?);
+                        }
+                        6 => {
+                            if business_message.is_some() {
+                                return Err(A::Error::duplicate_field("business_message"));
+                            }
+                            business_message = Some(map.next_value()?);
+                        }
+                        7 => {
+                            if edited_business_message.is_some() {
+                                return Err(A::Error::duplicate_field("edited_business_message"));
+                            }
+                            edited_business_message = Some(map.next_value()?);
+                        }
+                        8 => {
+                            if deleted_business_messages.is_some() {
+                                return Err(A::Error::duplicate_field("deleted_business_messages"));
+                            }
+                            deleted_business_messages = Some(map.next_value()?);
+                        }
+                        9 => {
+                            if message_reaction.is_some() {
+                                return Err(A::Error::duplicate_field("message_reaction"));
+                            }
+                            message_reaction = Some(map.next_value()?);
+                        }
+                        10 => {
+                            if message_reaction_count.is_some() {
+                                return Err(A::Error::duplicate_field("message_reaction_count"));
+                            }
+                            message_reaction_count = Some(map.next_value()?);
+                        }
+                        11 => {
+                            if inline_query.is_some() {
+                                return Err(A::Error::duplicate_field("inline_query"));
+                            }
+                            inline_query = Some(map.next_value()?);
+                        }
+                        12 => {
+                            if chosen_inline_result.is_some() {
+                                return Err(A::Error::duplicate_field("chosen_inline_result"));
+                            }
+                            chosen_inline_result = Some(map.next_value()?);
+                        }
+                        13 => {
+                            if callback_query.is_some() {
+                                return Err(A::Error::duplicate_field("callback_query"));
+                            }
+                            callback_query = Some(map.next_value()?);
+                        }
+                        14 => {
+                            if shipping_query.is_some() {
+                                return Err(A::Error::duplicate_field("shipping_query"));
+                            }
+                            shipping_query = Some(map.next_value()?);
+                        }
+                        15 => {
+                            if pre_checkout_query.is_some() {
+                                return Err(A::Error::duplicate_field("pre_checkout_query"));
+                            }
+                            pre_checkout_query = Some(map.next_value()?);
+                        }
+                        16 => {
+                            if purchased_paid_media.is_some() {
+                                return Err(A::Error::duplicate_field("purchased_paid_media"));
+                            }
+                            purchased_paid_media = Some(map.next_value()?);
+                        }
+                        17 => {
+                            if poll.is_some() {
+                                return Err(A::Error::duplicate_field("poll"));
+                            }
+                            poll = Some(map.next_value()?);
+                        }
+                        18 => {
+                            if poll_answer.is_some() {
+                                return Err(A::Error::duplicate_field("poll_answer"));
+                            }
+                            poll_answer = Some(map.next_value()?);
+                        }
+                        19 => {
+                            if my_chat_member.is_some() {
+                                return Err(A::Error::duplicate_field("my_chat_member"));
+                            }
+                            my_chat_member = Some(map.next_value()?);
+                        }
+                        20 => {
+                            if chat_member.is_some() {
+                                return Err(A::Error::duplicate_field("chat_member"));
+                            }
+                            chat_member = Some(map.next_value()?);
+                        }
+                        21 => {
+                            if chat_join_request.is_some() {
+                                return Err(A::Error::duplicate_field("chat_join_request"));
+                            }
+                            chat_join_request = Some(map.next_value()?);
+                        }
+                        22 => {
+                            if chat_boost.is_some() {
+                                return Err(A::Error::duplicate_field("chat_boost"));
+                            }
+                            chat_boost = Some(map.next_value()?);
+                        }
+                        23 => {
+                            if removed_chat_boost.is_some() {
+                                return Err(A::Error::duplicate_field("removed_chat_boost"));
+                            }
+                            removed_chat_boost = Some(map.next_value()?);
+                        }
+                        _ => {
+                            map.next_value::<IgnoredAny>()?;
+                        }
+                    }
+                }
+                Ok(Update {
+                    update_id: update_id.ok_or_else(|| A::Error::missing_field("update_id"))?,
+                    message: message.unwrap_or(None),
+                    edited_message: edited_message.unwrap_or(None),
+                    channel_post: channel_post.unwrap_or(None),
+                    edited_channel_post: edited_channel_post.unwrap_or(None),
+                    business_connection: business_connection.unwrap_or(None),
+                    business_message: business_message.unwrap_or(None),
+                    edited_business_message: edited_business_message.unwrap_or(None),
+                    deleted_business_messages: deleted_business_messages.unwrap_or(None),
+                    message_reaction: message_reaction.unwrap_or(None),
+                    message_reaction_count: message_reaction_count.unwrap_or(None),
+                    inline_query: inline_query.unwrap_or(None),
+                    chosen_inline_result: chosen_inline_result.unwrap_or(None),
+                    callback_query: callback_query.unwrap_or(None),
+                    shipping_query: shipping_query.unwrap_or(None),
+                    pre_checkout_query: pre_checkout_query.unwrap_or(None),
+                    purchased_paid_media: purchased_paid_media.unwrap_or(None),
+                    poll: poll.unwrap_or(None),
+                    poll_answer: poll_answer.unwrap_or(None),
+                    my_chat_member: my_chat_member.unwrap_or(None),
+                    chat_member: chat_member.unwrap_or(None),
+                    chat_join_request: chat_join_request.unwrap_or(None),
+                    chat_boost: chat_boost.unwrap_or(None),
+                    removed_chat_boost: removed_chat_boost.unwrap_or(None),
+                })
+            }
+        }
+
+        deserializer.deserialize_struct("Update", FIELDS, StructVisitor)
+    }
+}
+
+#[cfg(test)]
+mod update_deserialize_tests {
+    use super::*;
+
+    /// Update with the derived Deserialize impl (same name, so error messages match).
+    #[derive(Serialize, Deserialize)]
+    struct Update {
+        update_id: i64,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        message: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        edited_message: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        channel_post: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        edited_channel_post: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        business_connection: Option<Box<BusinessConnection>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        business_message: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        edited_business_message: Option<Box<Message>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        deleted_business_messages: Option<Box<BusinessMessagesDeleted>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        message_reaction: Option<Box<MessageReactionUpdated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        message_reaction_count: Option<Box<MessageReactionCountUpdated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        inline_query: Option<Box<InlineQuery>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chosen_inline_result: Option<Box<ChosenInlineResult>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        callback_query: Option<Box<CallbackQuery>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        shipping_query: Option<Box<ShippingQuery>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        pre_checkout_query: Option<Box<PreCheckoutQuery>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        purchased_paid_media: Option<Box<PaidMediaPurchased>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        poll: Option<Box<Poll>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        poll_answer: Option<Box<PollAnswer>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        my_chat_member: Option<Box<ChatMemberUpdated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_member: Option<Box<ChatMemberUpdated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_join_request: Option<Box<ChatJoinRequest>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        chat_boost: Option<Box<ChatBoostUpdated>>,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        removed_chat_boost: Option<Box<ChatBoostRemoved>>,
+    }
+
+    #[test]
+    fn matches_derived() {
+        for json in [
+            r##"{"update_id":1}"##,
+            r##"{"update_id":1,"message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"channel_post":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_channel_post":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"business_connection":{"id":"x","user":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1,"is_enabled":true},"business_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_business_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"deleted_business_messages":{"business_connection_id":"x","chat":{"id":1,"type":"private"},"message_ids":[1]},"message_reaction":{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"old_reaction":[{"type":"emoji","emoji":"x"}],"new_reaction":[{"type":"emoji","emoji":"x"}]},"message_reaction_count":{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"reactions":[{"type":{"type":"emoji","emoji":"x"},"total_count":1}]},"inline_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x","offset":"x"},"chosen_inline_result":{"result_id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x"},"callback_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"chat_instance":"x"},"shipping_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"invoice_payload":"x","shipping_address":{"country_code":"x","state":"x","city":"x","street_line1":"x","street_line2":"x","post_code":"x"}},"pre_checkout_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"currency":"x","total_amount":1,"invoice_payload":"x"},"purchased_paid_media":{"from":{"id":1,"is_bot":true,"first_name":"x"},"paid_media_payload":"x"},"poll":{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},"poll_answer":{"poll_id":"x","option_ids":[1]},"my_chat_member":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},"chat_member":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},"chat_join_request":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1},"chat_boost":{"chat":{"id":1,"type":"private"},"boost":{"boost_id":"x","add_date":1,"expiration_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}}},"removed_chat_boost":{"chat":{"id":1,"type":"private"},"boost_id":"x","remove_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}}}"##,
+            r##"{"update_id":1,"message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"channel_post":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_channel_post":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"business_connection":{"id":"x","user":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1,"is_enabled":true},"business_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"edited_business_message":{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},"deleted_business_messages":{"business_connection_id":"x","chat":{"id":1,"type":"private"},"message_ids":[1]},"message_reaction":{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"old_reaction":[{"type":"emoji","emoji":"x"}],"new_reaction":[{"type":"emoji","emoji":"x"}]},"message_reaction_count":{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"reactions":[{"type":{"type":"emoji","emoji":"x"},"total_count":1}]},"inline_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x","offset":"x"},"chosen_inline_result":{"result_id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x"},"callback_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"chat_instance":"x"},"shipping_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"invoice_payload":"x","shipping_address":{"country_code":"x","state":"x","city":"x","street_line1":"x","street_line2":"x","post_code":"x"}},"pre_checkout_query":{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"currency":"x","total_amount":1,"invoice_payload":"x"},"purchased_paid_media":{"from":{"id":1,"is_bot":true,"first_name":"x"},"paid_media_payload":"x"},"poll":{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},"poll_answer":{"poll_id":"x","option_ids":[1]},"my_chat_member":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},"chat_member":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},"chat_join_request":{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1},"chat_boost":{"chat":{"id":1,"type":"private"},"boost":{"boost_id":"x","add_date":1,"expiration_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}}},"removed_chat_boost":{"chat":{"id":1,"type":"private"},"boost_id":"x","remove_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}},"unknown_field":{"nested":[1,null]}}"##,
+            r##"{"update_id":1,"message":null,"edited_message":null,"channel_post":null,"edited_channel_post":null,"business_connection":null,"business_message":null,"edited_business_message":null,"deleted_business_messages":null,"message_reaction":null,"message_reaction_count":null,"inline_query":null,"chosen_inline_result":null,"callback_query":null,"shipping_query":null,"pre_checkout_query":null,"purchased_paid_media":null,"poll":null,"poll_answer":null,"my_chat_member":null,"chat_member":null,"chat_join_request":null,"chat_boost":null,"removed_chat_boost":null}"##,
+            r##"[]"##,
+            r##"[1,{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"id":"x","user":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1,"is_enabled":true},{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"message_id":1,"date":1,"chat":{"id":1,"type":"private"}},{"business_connection_id":"x","chat":{"id":1,"type":"private"},"message_ids":[1]},{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"old_reaction":[{"type":"emoji","emoji":"x"}],"new_reaction":[{"type":"emoji","emoji":"x"}]},{"chat":{"id":1,"type":"private"},"message_id":1,"date":1,"reactions":[{"type":{"type":"emoji","emoji":"x"},"total_count":1}]},{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x","offset":"x"},{"result_id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"query":"x"},{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"chat_instance":"x"},{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"invoice_payload":"x","shipping_address":{"country_code":"x","state":"x","city":"x","street_line1":"x","street_line2":"x","post_code":"x"}},{"id":"x","from":{"id":1,"is_bot":true,"first_name":"x"},"currency":"x","total_amount":1,"invoice_payload":"x"},{"from":{"id":1,"is_bot":true,"first_name":"x"},"paid_media_payload":"x"},{"id":"x","question":"x","options":[{"text":"x","voter_count":1}],"total_voter_count":1,"is_closed":true,"is_anonymous":true,"type":"regular","allows_multiple_answers":true},{"poll_id":"x","option_ids":[1]},{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"date":1,"old_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true},"new_chat_member":{"status":"creator","user":{"id":1,"is_bot":true,"first_name":"x"},"is_anonymous":true}},{"chat":{"id":1,"type":"private"},"from":{"id":1,"is_bot":true,"first_name":"x"},"user_chat_id":1,"date":1},{"chat":{"id":1,"type":"private"},"boost":{"boost_id":"x","add_date":1,"expiration_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}}},{"chat":{"id":1,"type":"private"},"boost_id":"x","remove_date":1,"source":{"source":"premium","user":{"id":1,"is_bot":true,"first_name":"x"}}}]"##,
+            r##"{}"##,
+            r##"{"update_id":1,"removed_chat_boost":{"chat": {"id": 1, "type": "private"}, "boost_id": "x", "remove_date": 1, "source": {"source": "premium", "user": {"id": 1, "is_bot": true, "first_name": "x"}}},"removed_chat_boost":{"chat": {"id": 1, "type": "private"}, "boost_id": "x", "remove_date": 1, "source": {"source": "premium", "user": {"id": 1, "is_bot": true, "first_name": "x"}}}}"##,
+            r##"{"removed_chat_boost":"##,
+        ] {
+            let fast = serde_json::from_str::<super::Update>(json)
+                .map(|v| serde_json::to_value(v).unwrap())
+                .map_err(|e| e.to_string());
+            let derived = serde_json::from_str::<Update>(json)
+                .map(|v| serde_json::to_value(v).unwrap())
+                .map_err(|e| e.to_string());
+            assert_eq!(fast, derived, "{}", json);
+        }
+    }
+}
+
+/// The payload kinds of an [`Update`], named as in `allowed_updates`.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+#[non_exhaustive]
+pub enum UpdateKind {
+    /// `message`
+    Message,
+    /// `edited_message`
+    EditedMessage,
+    /// `channel_post`
+    ChannelPost,
+    /// `edited_channel_post`
+    EditedChannelPost,
+    /// `business_connection`
+    BusinessConnection,
+    /// `business_message`
+    BusinessMessage,
+    /// `edited_business_message`
+    EditedBusinessMessage,
+    /// `deleted_business_messages`
+    DeletedBusinessMessages,
+    /// `message_reaction`
+    MessageReaction,
+    /// `message_reaction_count`
+    MessageReactionCount,
+    /// `inline_query`
+    InlineQuery,
+    /// `chosen_inline_result`
+    ChosenInlineResult,
+    /// `callback_query`
+    CallbackQuery,
+    /// `shipping_query`
+    ShippingQuery,
+    /// `pre_checkout_query`
+    PreCheckoutQuery,
+    /// `purchased_paid_media`
+    PurchasedPaidMedia,
+    /// `poll`
+    Poll,
+    /// `poll_answer`
+    PollAnswer,
+    /// `my_chat_member`
+    MyChatMember,
+    /// `chat_member`
+    ChatMember,
+    /// `chat_join_request`
+    ChatJoinRequest,
+    /// `chat_boost`
+    ChatBoost,
+    /// `removed_chat_boost`
+    RemovedChatBoost,
+}
+
+impl UpdateKind {
+    /// Every kind, in spec order.
+    pub const ALL: &'static [UpdateKind] = &[
+        Self::Message,
+        Self::EditedMessage,
+        Self::ChannelPost,
+        Self::EditedChannelPost,
+        Self::BusinessConnection,
+        Self::BusinessMessage,
+        Self::EditedBusinessMessage,
+        Self::DeletedBusinessMessages,
+        Self::MessageReaction,
+        Self::MessageReactionCount,
+        Self::InlineQuery,
+        Self::ChosenInlineResult,
+        Self::CallbackQuery,
+        Self::ShippingQuery,
+        Self::PreCheckoutQuery,
+        Self::PurchasedPaidMedia,
+        Self::Poll,
+        Self::PollAnswer,
+        Self::MyChatMember,
+        Self::ChatMember,
+        Self::ChatJoinRequest,
+        Self::ChatBoost,
+        Self::RemovedChatBoost,
+    ];
+
+    /// The field name, as used in `allowed_updates`.
+    pub fn as_str(self) -> &'static str {
+        match self {
+            Self::Message => "message",
+            Self::EditedMessage => "edited_message",
+            Self::ChannelPost => "channel_post",
+            Self::EditedChannelPost => "edited_channel_post",
+            Self::BusinessConnection => "business_connection",
+            Self::BusinessMessage => "business_message",
+            Self::EditedBusinessMessage => "edited_business_message",
+            Self::DeletedBusinessMessages => "deleted_business_messages",
+            Self::MessageReaction => "message_reaction",
+            Self::MessageReactionCount => "message_reaction_count",
+            Self::InlineQuery => "inline_query",
+            Self::ChosenInlineResult => "chosen_inline_result",
+            Self::CallbackQuery => "callback_query",
+            Self::ShippingQuery => "shipping_query",
+            Self::PreCheckoutQuery => "pre_checkout_query",
+            Self::PurchasedPaidMedia => "purchased_paid_media",
+            Self::Poll => "poll",
+            Self::PollAnswer => "poll_answer",
+            Self::MyChatMember => "my_chat_member",
+            Self::ChatMember => "chat_member",
+            Self::ChatJoinRequest => "chat_join_request",
+            Self::ChatBoost => "chat_boost",
+            Self::RemovedChatBoost => "removed_chat_boost",
+        }
+    }
+
+    /// The kind named `name`, or `None` if this version of the library does not know it.
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name {
+            "message" => Some(Self::Message),
+            "edited_message" => Some(Self::EditedMessage),
+            "channel_post" => Some(Self::ChannelPost),
+            "edited_channel_post" => Some(Self::EditedChannelPost),
+            "business_connection" => Some(Self::BusinessConnection),
+            "business_message" => Some(Self::BusinessMessage),
+            "edited_business_message" => Some(Self::EditedBusinessMessage),
+            "deleted_business_messages" => Some(Self::DeletedBusinessMessages),
+            "message_reaction" => Some(Self::MessageReaction),
+            "message_reaction_count" => Some(Self::MessageReactionCount),
+            "inline_query" => Some(Self::InlineQuery),
+            "chosen_inline_result" => Some(Self::ChosenInlineResult),
+            "callback_query" => Some(Self::CallbackQuery),
+            "shipping_query" => Some(Self::ShippingQuery),
+            "pre_checkout_query" => Some(Self::PreCheckoutQuery),
+            "purchased_paid_media" => Some(Self::PurchasedPaidMedia),
+            "poll" => Some(Self::Poll),
+            "poll_answer" => Some(Self::PollAnswer),
+            "my_chat_member" => Some(Self::MyChatMember),
+            "chat_member" => Some(Self::ChatMember),
+            "chat_join_request" => Some(Self::ChatJoinRequest),
+            "chat_boost" => Some(Self::ChatBoost),
+            "removed_chat_boost" => Some(Self::RemovedChatBoost),
+            _ => None,
+        }
+    }
+}
+
+impl std::fmt::Display for UpdateKind {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+impl Update {
+    /// Which payload this update carries.
+    pub fn kind(&self) -> Option<UpdateKind> {
+        if self.message.is_some() {
+            return Some(UpdateKind::Message);
+        }
+        if self.edited_message.is_some() {
+            return Some(UpdateKind::EditedMessage);
+        }
+        if self.channel_post.is_some() {
+            return Some(UpdateKind::ChannelPost);
+        }
+        if self.edited_channel_post.is_some() {
+            return Some(UpdateKind::EditedChannelPost);
+        }
+        if self.business_connection.is_some() {
+            return Some(UpdateKind::BusinessConnection);
+        }
+        if self.business_message.is_some() {
+            return Some(UpdateKind::BusinessMessage);
+        }
+        if self.edited_business_message.is_some() {
+            return Some(UpdateKind::EditedBusinessMessage);
+        }
+        if self.deleted_business_messages.is_some() {
+            return Some(UpdateKind::DeletedBusinessMessages);
+        }
+        if self.message_reaction.is_some() {
+            return Some(UpdateKind::MessageReaction);
+        }
+        if self.message_reaction_count.is_some() {
+            return Some(UpdateKind::MessageReactionCount);
+        }
+        if self.inline_query.is_some() {
+            return Some(UpdateKind::InlineQuery);
+        }
+        if self.chosen_inline_result.is_some() {
+            return Some(UpdateKind::ChosenInlineResult);
+        }
+        if self.callback_query.is_some() {
+            return Some(UpdateKind::CallbackQuery);
+        }
+        if self.shipping_query.is_some() {
+            return Some(UpdateKind::ShippingQuery);
+        }
+        if self.pre_checkout_query.is_some() {
+            return Some(UpdateKind::PreCheckoutQuery);
+        }
+        if self.purchased_paid_media.is_some() {
+            return Some(UpdateKind::PurchasedPaidMedia);
+        }
+        if self.poll.is_some() {
+            return Some(UpdateKind::Poll);
+        }
+        if self.poll_answer.is_some() {
+            return Some(UpdateKind::PollAnswer);
+        }
+        if self.my_chat_member.is_some() {
+            return Some(UpdateKind::MyChatMember);
+        }
+        if self.chat_member.is_some() {
+            return Some(UpdateKind::ChatMember);
+        }
+        if self.chat_join_request.is_some() {
+            return Some(UpdateKind::ChatJoinRequest);
+        }
+        if self.chat_boost.is_some() {
+            return Some(UpdateKind::ChatBoost);
+        }
+        if self.removed_chat_boost.is_some() {
+            return Some(UpdateKind::RemovedChatBoost);
+        }
+        None
+    }
+}
+
+/// An update whose payload is decoded on first access.
+///
+/// Deserialising one only reads `update_id` and the payload key; the JSON
+/// is kept and decoded into an [`Update`] by [`RawUpdate::update`] or
+/// [`RawUpdate::into_update`].
+#[derive(Debug)]
+pub struct RawUpdate {
+    /// The update's unique identifier.
+    pub update_id: i64,
+    /// The payload kind, `None` if this version of the library does not know it.
+    pub kind: Option<UpdateKind>,
+    json: Box<serde_json::value::RawValue>,
+    update: std::sync::OnceLock<Update>,
+}
+
+impl RawUpdate {
+    /// Read `update_id` and the payload kind of a JSON update.
+    pub fn from_slice(json: &[u8]) -> serde_json::Result<Self> {
+        serde_json::from_slice(json)
+    }
+
+    /// The update as received.
+    pub fn json(&self) -> &str {
+        self.json.get()
+    }
+
+    /// The decoded update; the JSON is decoded on the first call only.
+    pub fn update(&self) -> serde_json::Result<&Update> {
+        if let Some(update) = self.update.get() {
+            return Ok(update);
+        }
+        let update = serde_json::from_str(self.json.get())?;
+        Ok(self.update.get_or_init(|| update))
+    }
+
+    /// Decode the update, reusing it if it was already decoded.
+    pub fn into_update(self) -> serde_json::Result<Update> {
+        match self.update.into_inner() {
+            Some(update) => Ok(update),
+            None => serde_json::from_str(self.json.get()),
+        }
+    }
+}
+
+impl<'de> Deserialize<'de> for RawUpdate {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        use serde::de::{Error, IgnoredAny, MapAccess, Visitor};
+
+        enum Key {
+            UpdateId,
+            Kind(UpdateKind),
+            Other,
+        }
+        impl<'de> Deserialize<'de> for Key {
+            fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+                struct KeyVisitor;
+                impl<'de> Visitor<'de> for KeyVisitor {
+                    type Value = Key;
+                    fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                        f.write_str("a field name")
+                    }
+                    fn visit_str<E: Error>(self, name: &str) -> Result<Key, E> {
+                        Ok(match name {
+                            "update_id" => Key::UpdateId,
+                            _ => UpdateKind::from_name(name).map_or(Key::Other, Key::Kind),
+                        })
+                    }
+                }
+                deserializer.deserialize_identifier(KeyVisitor)
+            }
+        }
+
+        struct HeadVisitor;
+        impl<'de> Visitor<'de> for HeadVisitor {
+            type Value = (i64, Option<UpdateKind>);
+            fn expecting(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+                f.write_str("an Update object")
+            }
+            fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+                let mut update_id = None;
+                let mut kind = None;
+                while let Some(key) = map.next_key()? {
+                    match key {
+                        Key::UpdateId => update_id = Some(map.next_value()?),
+                        Key::Kind(k) => {
+                            kind = kind.or(Some(k));
+                            map.next_value::<IgnoredAny>()?;
+                        }
+                        Key::Other => {
+                            map.next_value::<IgnoredAny>()?;
+                        }
+                    }
+                }
+                let update_id = update_id.ok_or_else(|| A::Error::missing_field("update_id"))?;
+                Ok((update_id, kind))
+            }
+        }
+
+        let json = Box::<serde_json::value::RawValue>::deserialize(deserializer)?;
+        let mut peek = serde_json::Deserializer::from_str(json.get());
+        let (update_id, kind) = serde::Deserializer::deserialize_map(&mut peek, HeadVisitor)
+            .map_err(D::Error::custom)?;
+        Ok(RawUpdate {
+            update_id,
+            kind,
+            json,
+            update: std::sync::OnceLock::new(),
+        })
+    }
+}
+
 /// This object represents a Telegram user or bot.
 /// https://core.telegram.org/bots/api#user
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
@@ -5510,7 +10994,7 @@ pub struct User {
     pub username: Option<String>,
     /// Optional. IETF language tag of the user's language
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub language_code: Option<String>,
+    pub language_code: Option<ShortString>,
     /// Optional. True, if this user is a Telegram Premium user
     #[serde(skip_serializing_if = "Option::is_none")]
     pub is_premium: Option<bool>,
@@ -5590,7 +11074,7 @@ pub struct UsersShared {
     /// Identifier of the request
     pub request_id: i64,
     /// Information about users shared with the bot.
-    pub users: Vec<SharedUser>,
+    pub users: ShortVec<SharedUser, 1>,
 }
 
 /// This object represents a venue.
@@ -5636,7 +11120,7 @@ pub struct Video {
     pub thumbnail: Option<Box<PhotoSize>>,
     /// Optional. Available sizes of the cover of the video in the message
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub cover: Option<Vec<PhotoSize>>,
+    pub cover: Option<ShortVec<PhotoSize, 4>>,
     /// Optional. Timestamp in seconds from which the video will play in the message
     #[serde(skip_serializing_if = "Option::is_none")]
     pub start_timestamp: Option<i64>,
@@ -5697,7 +11181,7 @@ pub struct VideoNote {
     pub duration: i64,
     /// Optional. Video thumbnail
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub thumbnail: Option<Box<PhotoSize>>,
+    pub thumbnail: Option<PhotoSize>,
     /// Optional. File size in bytes
     #[serde(skip_serializing_if = "Option::is_none")]
     pub file_size: Option<i64>,
@@ -5802,3 +11286,304 @@ pub struct WriteAccessAllowed {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub from_attachment_menu: Option<bool>,
 }
+
+#[cfg(all(test, target_pointer_width = "64", not(feature = "small")))]
+mod layout_tests {
+    use super::*;
+
+    macro_rules! assert_sizes {
+        ($($t:ty => $size:expr,)*) => {
+            $(assert_eq!(std::mem::size_of::<$t>(), $size, stringify!($t));)*
+        };
+    }
+
+    /// Sizes codegen.py estimated (see type_layouts); a failure means the model is off.
+    #[test]
+    fn sizes_match_codegen() {
+        assert_sizes! {
+            AcceptedGiftTypes => 5,
+            AffiliateInfo => 160,
+            Animation => 216,
+            Audio => 248,
+            BackgroundFill => 56,
+            BackgroundFillFreeformGradient => 48,
+            BackgroundFillGradient => 48,
+            BackgroundFillSolid => 32,
+            BackgroundType => 288,
+            BackgroundTypeChatTheme => 48,
+            BackgroundTypeFill => 88,
+            BackgroundTypePattern => 288,
+            BackgroundTypeWallpaper => 232,
+            Birthdate => 32,
+            BotCommand => 48,
+            BotCommandScope => 56,
+            BotCommandScopeAllChatAdministrators => 24,
+            BotCommandScopeAllGroupChats => 24,
+            BotCommandScopeAllPrivateChats => 24,
+            BotCommandScopeChat => 48,
+            BotCommandScopeChatAdministrators => 48,
+            BotCommandScopeChatMember => 56,
+            BotCommandScopeDefault => 24,
+            BotDescription => 24,
+            BotName => 24,
+            BotShortDescription => 24,
+            BusinessBotRights => 14,
+            BusinessConnection => 176,
+            BusinessIntro => 56,
+            BusinessLocation => 104,
+            BusinessMessagesDeleted => 184,
+            BusinessOpeningHours => 48,
+            BusinessOpeningHoursInterval => 16,
+            CallbackGame => 0,
+            CallbackQuery => 248,
+            Chat => 136,
+            ChatAdministratorRights => 16,
+            ChatBackground => 288,
+            ChatBoost => 216,
+            ChatBoostAdded => 8,
+            ChatBoostRemoved => 344,
+            ChatBoostSource => 176,
+            ChatBoostSourceGiftCode => 144,
+            ChatBoostSourceGiveaway => 176,
+            ChatBoostSourcePremium => 144,
+            ChatBoostUpdated => 352,
+            ChatFullInfo => 624,
+            ChatInviteLink => 256,
+            ChatJoinRequest => 304,
+            ChatLocation => 104,
+            ChatMember => 192,
+            ChatMemberAdministrator => 192,
+            ChatMemberBanned => 152,
+            ChatMemberLeft => 144,
+            ChatMemberMember => 160,
+            ChatMemberOwner => 176,
+            ChatMemberRestricted => 168,
+            ChatMemberUpdated => 664,
+            ChatOwnerChanged => 120,
+            ChatOwnerLeft => 120,
+            ChatPermissions => 14,
+            ChatPhoto => 96,
+            ChatShared => 88,
+            Checklist => 80,
+            ChecklistTask => 200,
+            ChecklistTasksAdded => 32,
+            ChecklistTasksDone => 56,
+            ChosenInlineResult => 200,
+            Contact => 112,
+            CopyTextButton => 24,
+            Dice => 32,
+            DirectMessagePriceChanged => 24,
+            DirectMessagesTopic => 128,
+            Document => 192,
+            EncryptedCredentials => 72,
+            EncryptedPassportElement => 248,
+            ExternalReplyInfo => 416,
+            File => 88,
+            ForceReply => 32,
+            ForumTopic => 72,
+            ForumTopicClosed => 0,
+            ForumTopicCreated => 64,
+            ForumTopicEdited => 48,
+            ForumTopicReopened => 0,
+            Game => 128,
+            GameHighScore => 136,
+            GeneralForumTopicHidden => 0,
+            GeneralForumTopicUnhidden => 0,
+            Gift => 400,
+            GiftBackground => 24,
+            GiftInfo => 528,
+            Gifts => 24,
+            Giveaway => 128,
+            GiveawayCompleted => 40,
+            GiveawayCreated => 16,
+            GiveawayWinners => 280,
+            InaccessibleMessage => 152,
+            InlineKeyboardButton => 240,
+            InlineKeyboardMarkup => 24,
+            InlineQuery => 224,
+            InlineQueryResult => 472,
+            InlineQueryResultArticle => 472,
+            InlineQueryResultAudio => 240,
+            InlineQueryResultCachedAudio => 176,
+            InlineQueryResultCachedDocument => 224,
+            InlineQueryResultCachedGif => 208,
+            InlineQueryResultCachedMpeg4Gif => 208,
+            InlineQueryResultCachedPhoto => 232,
+            InlineQueryResultCachedSticker => 104,
+            InlineQueryResultCachedVideo => 232,
+            InlineQueryResultCachedVoice => 200,
+            InlineQueryResultContact => 232,
+            InlineQueryResultDocument => 288,
+            InlineQueryResultGame => 96,
+            InlineQueryResultGif => 288,
+            InlineQueryResultLocation => 240,
+            InlineQueryResultMpeg4Gif => 288,
+            InlineQueryResultPhoto => 272,
+            InlineQueryResultVenue => 280,
+            InlineQueryResultVideo => 312,
+            InlineQueryResultVoice => 216,
+            InlineQueryResultsButton => 72,
+            InputChecklist => 104,
+            InputChecklistTask => 80,
+            InputContactMessageContent => 96,
+            InputInvoiceMessageContent => 288,
+            InputLocationMessageContent => 80,
+            InputMediaAnimation => 200,
+            InputMediaAudio => 208,
+            InputMediaDocument => 152,
+            InputMediaPhoto => 128,
+            InputMediaVideo => 240,
+            InputMessageContent => 288,
+            InputPaidMedia => 168,
+            InputPaidMediaPhoto => 48,
+            InputPaidMediaVideo => 168,
+            InputPollOption => 72,
+            InputProfilePhoto => 64,
+            InputProfilePhotoAnimated => 64,
+            InputProfilePhotoStatic => 48,
+            InputSticker => 144,
+            InputStoryContent => 88,
+            InputStoryContentPhoto => 48,
+            InputStoryContentVideo => 88,
+            InputTextMessageContent => 104,
+            InputVenueMessageContent => 160,
+            Invoice => 104,
+            KeyboardButton => 208,
+            KeyboardButtonPollType => 24,
+            KeyboardButtonRequestChat => 48,
+            KeyboardButtonRequestUsers => 32,
+            LabeledPrice => 32,
+            LinkPreviewOptions => 32,
+            Location => 80,
+            LocationAddress => 96,
+            LoginUrl => 80,
+            MaskPosition => 48,
+            MaybeInaccessibleMessage => 1120,
+            MenuButton => 72,
+            MenuButtonCommands => 24,
+            MenuButtonDefault => 24,
+            MenuButtonWebApp => 72,
+            Message => 1120,
+            MessageAutoDeleteTimerChanged => 8,
+            MessageEntity => 232,
+            MessageId => 8,
+            MessageOrigin => 200,
+            MessageOriginChannel => 200,
+            MessageOriginChat => 192,
+            MessageOriginHiddenUser => 56,
+            MessageOriginUser => 152,
+            MessageReactionCountUpdated => 176,
+            MessageReactionUpdated => 216,
+            OrderInfo => 216,
+            OwnedGift => 856,
+            OwnedGiftRegular => 568,
+            OwnedGiftUnique => 856,
+            OwnedGifts => 56,
+            PaidMedia => 232,
+            PaidMediaInfo => 32,
+            PaidMediaPhoto => 48,
+            PaidMediaPreview => 72,
+            PaidMediaPurchased => 144,
+            PaidMediaVideo => 232,
+            PaidMessagePriceChanged => 8,
+            PassportData => 96,
+            PassportElementError => 120,
+            PassportElementErrorDataField => 120,
+            PassportElementErrorFile => 96,
+            PassportElementErrorFiles => 96,
+            PassportElementErrorFrontSide => 96,
+            PassportElementErrorReverseSide => 96,
+            PassportElementErrorSelfie => 96,
+            PassportElementErrorTranslationFile => 96,
+            PassportElementErrorTranslationFiles => 96,
+            PassportElementErrorUnspecified => 96,
+            PassportFile => 64,
+            PhotoSize => 80,
+            Poll => 232,
+            PollAnswer => 176,
+            PollOption => 56,
+            PreCheckoutQuery => 232,
+            PreparedInlineMessage => 32,
+            ProximityAlertTriggered => 248,
+            ReactionCount => 64,
+            ReactionType => 56,
+            ReactionTypeCustomEmoji => 48,
+            ReactionTypeEmoji => 48,
+            ReactionTypePaid => 24,
+            RefundedPayment => 104,
+            ReplyKeyboardMarkup => 56,
+            ReplyKeyboardRemove => 2,
+            ReplyParameters => 144,
+            ResponseParameters => 32,
+            RevenueWithdrawalState => 56,
+            RevenueWithdrawalStateFailed => 24,
+            RevenueWithdrawalStatePending => 24,
+            RevenueWithdrawalStateSucceeded => 56,
+            SentWebAppMessage => 24,
+            SharedUser => 104,
+            ShippingAddress => 144,
+            ShippingOption => 72,
+            ShippingQuery => 312,
+            StarAmount => 24,
+            StarTransaction => 72,
+            StarTransactions => 24,
+            Sticker => 248,
+            StickerSet => 176,
+            Story => 144,
+            StoryArea => 184,
+            StoryAreaPosition => 48,
+            StoryAreaType => 136,
+            StoryAreaTypeLink => 48,
+            StoryAreaTypeLocation => 136,
+            StoryAreaTypeSuggestedReaction => 88,
+            StoryAreaTypeUniqueGift => 48,
+            StoryAreaTypeWeather => 64,
+            SuccessfulPayment => 160,
+            SuggestedPostApprovalFailed => 40,
+            SuggestedPostApproved => 48,
+            SuggestedPostDeclined => 32,
+            SuggestedPostInfo => 72,
+            SuggestedPostPaid => 72,
+            SuggestedPostParameters => 48,
+            SuggestedPostPrice => 32,
+            SuggestedPostRefunded => 32,
+            SwitchInlineQueryChosenChat => 32,
+            TextQuote => 64,
+            TransactionPartner => 288,
+            TransactionPartnerAffiliateProgram => 152,
+            TransactionPartnerChat => 168,
+            TransactionPartnerFragment => 80,
+            TransactionPartnerOther => 24,
+            TransactionPartnerTelegramAds => 24,
+            TransactionPartnerTelegramApi => 32,
+            TransactionPartnerUser => 288,
+            UniqueGift => 752,
+            UniqueGiftBackdrop => 64,
+            UniqueGiftBackdropColors => 32,
+            UniqueGiftColors => 112,
+            UniqueGiftInfo => 872,
+            UniqueGiftModel => 304,
+            UniqueGiftSymbol => 280,
+            Update => 192,
+            User => 120,
+            UserChatBoosts => 24,
+            UserProfileAudios => 32,
+            UserProfilePhotos => 32,
+            UserRating => 40,
+            UsersShared => 32,
+            Venue => 224,
+            Video => 208,
+            VideoChatEnded => 8,
+            VideoChatParticipantsInvited => 24,
+            VideoChatScheduled => 8,
+            VideoChatStarted => 0,
+            VideoNote => 160,
+            VideoQuality => 104,
+            Voice => 96,
+            WebAppData => 48,
+            WebAppInfo => 24,
+            WebhookInfo => 160,
+            WriteAccessAllowed => 32,
+        }
+    }
+}
@@ -100,11 +100,17 @@ mod error;
 mod input_file;
 mod polling;
 mod reply_markup;
+mod small;
 pub mod types;
 
 pub mod gen_methods;
 mod gen_types;
 
+#[cfg(feature = "borrowed")]
+pub mod borrowed;
+#[cfg(feature = "borrowed")]
+mod gen_borrowed;
+
 #[cfg(feature = "webhook")]
 mod webhook;
 
@@ -114,6 +120,7 @@ pub use error::BotError;
 pub use input_file::{InputFile, InputFileOrString};
 pub use polling::{Poller, UpdateHandler};
 pub use reply_markup::ReplyMarkup;
+pub use small::{ShortString, ShortVec};
 pub use types::*;
 
 #[cfg(feature = "webhook")]
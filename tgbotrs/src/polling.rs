@@ -1,5 +1,5 @@
 use crate::gen_methods::GetUpdatesParams;
-use crate::types::Update;
+use crate::types::{RawUpdate, Update, UpdateKind};
 use crate::{Bot, BotError};
 use std::future::Future;
 use std::pin::Pin;
@@ -18,6 +18,8 @@ pub struct Poller {
     limit: i64,
     /// Update types to receive (empty = all).
     allowed_updates: Vec<String>,
+    /// Update kinds passed to the handler (empty = all).
+    kinds: Vec<UpdateKind>,
 }
 
 impl Poller {
@@ -29,6 +31,7 @@ impl Poller {
             timeout: 30,
             limit: 100,
             allowed_updates: vec![],
+            kinds: vec![],
         }
     }
 
@@ -50,6 +53,16 @@ impl Poller {
         self
     }
 
+    /// Only handle these kinds of update.
+    ///
+    /// Also sets `allowed_updates`, so Telegram sends just these kinds;
+    /// any other update that still arrives is dropped before it is decoded.
+    pub fn update_kinds(mut self, kinds: impl IntoIterator<Item = UpdateKind>) -> Self {
+        self.kinds = kinds.into_iter().collect();
+        self.allowed_updates = self.kinds.iter().map(|k| k.as_str().to_string()).collect();
+        self
+    }
+
     /// Start polling for updates, calling the handler for each one.
     /// Runs until the process exits or an unrecoverable error occurs.
     pub async fn start(self) -> Result<(), BotError> {
@@ -67,7 +80,8 @@ impl Poller {
                 params = params.allowed_updates(self.allowed_updates.clone());
             }
 
-            let updates = match self.bot.get_updates(Some(params)).await {
+            // Updates are decoded one by one, and only if they are handled.
+            let updates: Vec<RawUpdate> = match self.bot.call_api("getUpdates", &params).await {
                 Ok(u) => u,
                 Err(e) => {
                     eprintln!("[tgbotrs] getUpdates error: {}", e);
@@ -76,8 +90,19 @@ impl Poller {
                 }
             };
 
-            for update in updates {
-                offset = update.update_id + 1;
+            for raw in updates {
+                offset = raw.update_id + 1;
+                if !wants(&self.kinds, raw.kind) {
+                    continue;
+                }
+                let update_id = raw.update_id;
+                let update = match raw.into_update() {
+                    Ok(u) => u,
+                    Err(e) => {
+                        eprintln!("[tgbotrs] skipping update {}: {}", update_id, e);
+                        continue;
+                    }
+                };
                 let bot_clone = self.bot.clone();
                 let fut = (self.handler)(bot_clone, update);
                 tokio::spawn(fut);
@@ -86,6 +111,11 @@ impl Poller {
     }
 }
 
+/// Whether an update of `kind` passes a kind filter (empty = all).
+pub(crate) fn wants(kinds: &[UpdateKind], kind: Option<UpdateKind>) -> bool {
+    kinds.is_empty() || kind.map_or(false, |k| kinds.contains(&k))
+}
+
 fn log_info(msg: &str) {
     println!("[tgbotrs] {}", msg);
 }
@@ -0,0 +1,23 @@
+//! Field types of short arrays and strings (`small` feature).
+//!
+//! The generated types use [`ShortVec<T, N>`](ShortVec) for arrays that rarely
+//! hold more than `N` items (photo sizes, message entities, reactions) and
+//! [`ShortString`] for strings of a few bytes (language tags, currency codes,
+//! custom emoji ids). By default they are plain `Vec<T>` and `String`. With the
+//! `small` feature they become a `SmallVec` keeping up to `N` items inline and
+//! a `CompactString` keeping up to 24 bytes inline, so decoding a typical
+//! update allocates less. Both serialise exactly like `Vec` and `String`.
+
+/// `Vec<T>`, or with the `small` feature a `SmallVec` with `N` items inline.
+#[cfg(not(feature = "small"))]
+pub type ShortVec<T, const N: usize> = Vec<T>;
+/// `Vec<T>`, or with the `small` feature a `SmallVec` with `N` items inline.
+#[cfg(feature = "small")]
+pub type ShortVec<T, const N: usize> = smallvec::SmallVec<[T; N]>;
+
+/// `String`, or with the `small` feature a `CompactString`.
+#[cfg(not(feature = "small"))]
+pub type ShortString = String;
+/// `String`, or with the `small` feature a `CompactString`.
+#[cfg(feature = "small")]
+pub type ShortString = compact_str::CompactString;
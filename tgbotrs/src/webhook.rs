@@ -13,7 +13,9 @@
 //! 1. Calls `setWebhook` on Telegram with your public HTTPS URL.
 //! 2. Starts an `axum` HTTP server that receives `POST /your-path`.
 //! 3. Validates the `X-Telegram-Bot-Api-Secret-Token` header (if you set one).
-//! 4. Dispatches each [`Update`] to your [`UpdateHandler`] in a spawned task.
+//! 4. Reads the update's kind, drops it if you filtered that kind out, and
+//!    otherwise decodes and dispatches the [`Update`](crate::Update) to your
+//!    [`UpdateHandler`] in a spawned task.
 //! 5. Returns `200 OK` immediately — Telegram retries if we're slow.
 //!
 //! On drop / shutdown the webhook is **not** automatically removed; call
@@ -45,16 +47,18 @@
 //! ```
 
 use crate::gen_methods::SetWebhookParams;
-use crate::polling::UpdateHandler;
-use crate::types::Update;
+use crate::polling::{wants, UpdateHandler};
+use crate::types::{RawUpdate, UpdateKind};
 use crate::{Bot, BotError};
 
 use axum::{
+    body::Bytes,
     extract::State,
-    http::{HeaderMap, StatusCode},
+    http::{header, HeaderMap, StatusCode},
     routing::post,
-    Json, Router,
+    Router,
 };
+use serde_json::error::Category;
 use std::net::SocketAddr;
 use std::sync::Arc;
 
@@ -64,6 +68,7 @@ struct AppState {
     bot: Bot,
     handler: Arc<UpdateHandler>,
     secret_token: Option<String>,
+    kinds: Vec<UpdateKind>,
 }
 
 // ── WebhookServer ─────────────────────────────────────────────────────────────
@@ -106,6 +111,8 @@ pub struct WebhookServer {
     secret_token: Option<String>,
     /// Update types to receive (empty = all)
     allowed_updates: Vec<String>,
+    /// Update kinds passed to the handler (empty = all)
+    kinds: Vec<UpdateKind>,
     /// Max simultaneous HTTPS connections Telegram will open (1–100)
     max_connections: Option<i64>,
     /// Whether to drop pending updates on webhook registration
@@ -122,6 +129,7 @@ impl WebhookServer {
             path: "/webhook".to_string(),
             secret_token: None,
             allowed_updates: vec![],
+            kinds: vec![],
             max_connections: None,
             drop_pending_updates: false,
         }
@@ -173,6 +181,17 @@ impl WebhookServer {
         self
     }
 
+    /// Only handle these kinds of update.
+    ///
+    /// Also sets `allowed_updates`; any other update that still arrives (e.g.
+    /// queued before the webhook was re-registered) is acknowledged and
+    /// dropped without being decoded.
+    pub fn update_kinds(mut self, kinds: impl IntoIterator<Item = UpdateKind>) -> Self {
+        self.kinds = kinds.into_iter().collect();
+        self.allowed_updates = self.kinds.iter().map(|k| k.as_str().to_string()).collect();
+        self
+    }
+
     /// Set max simultaneous connections Telegram opens (1–100, default 40).
     pub fn max_connections(mut self, n: i64) -> Self {
         self.max_connections = Some(n);
@@ -220,6 +239,7 @@ impl WebhookServer {
             bot: self.bot,
             handler: Arc::new(self.handler),
             secret_token: self.secret_token,
+            kinds: self.kinds,
         });
 
         let app = Router::new()
@@ -247,8 +267,25 @@ impl WebhookServer {
 async fn handle_update(
     State(state): State<Arc<AppState>>,
     headers: HeaderMap,
-    Json(update): Json<Update>,
+    body: Bytes,
 ) -> StatusCode {
+    // Reject what axum's `Json` extractor rejects, with the same statuses.
+    if !is_json(&headers) {
+        eprintln!("[tgbotrs] ⚠️  Expected a JSON body — request rejected");
+        return StatusCode::UNSUPPORTED_MEDIA_TYPE;
+    }
+    // Only update_id and the payload kind are read here.
+    let raw = match RawUpdate::from_slice(&body) {
+        Ok(raw) => raw,
+        Err(e) => {
+            eprintln!("[tgbotrs] ⚠️  Malformed update — request rejected: {}", e);
+            return match e.classify() {
+                Category::Data => StatusCode::UNPROCESSABLE_ENTITY,
+                _ => StatusCode::BAD_REQUEST,
+            };
+        }
+    };
+
     // Validate secret token if configured
     if let Some(ref expected) = state.secret_token {
         let provided = headers
@@ -262,14 +299,40 @@ async fn handle_update(
         }
     }
 
+    if !wants(&state.kinds, raw.kind) {
+        return StatusCode::OK;
+    }
+
     // Spawn the handler so we return 200 immediately.
     // Telegram retries if we take too long or return non-2xx.
     let bot = state.bot.clone();
     let handler = Arc::clone(&state.handler);
 
     tokio::spawn(async move {
-        (handler)(bot, update).await;
+        let update_id = raw.update_id;
+        match raw.into_update() {
+            Ok(update) => (handler)(bot, update).await,
+            Err(e) => eprintln!("[tgbotrs] skipping update {}: {}", update_id, e),
+        }
     });
 
     StatusCode::OK
 }
+
+/// Whether the request has a JSON `Content-Type` (`application/json` or
+/// `application/*+json`), as axum's `Json` extractor requires.
+fn is_json(headers: &HeaderMap) -> bool {
+    let Some(content_type) = headers
+        .get(header::CONTENT_TYPE)
+        .and_then(|v| v.to_str().ok())
+    else {
+        return false;
+    };
+    let mime = content_type
+        .split(';')
+        .next()
+        .unwrap_or("")
+        .trim()
+        .to_ascii_lowercase();
+    mime == "application/json" || (mime.starts_with("application/") && mime.ends_with("+json"))
+}